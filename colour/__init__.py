@@ -161,10 +161,11 @@ from .volume import (
     OPTIMAL_COLOUR_STIMULI_ILLUMINANTS, RGB_colourspace_limits,
     RGB_colourspace_pointer_gamut_coverage_MonteCarlo,
     RGB_colourspace_visible_spectrum_coverage_MonteCarlo,
-    RGB_colourspace_volume_MonteCarlo,
-    RGB_colourspace_volume_coverage_MonteCarlo, is_within_macadam_limits,
+    RGB_colourspace_volume_MonteCarlo, RGB_colourspace_volume_analytic,
+    RGB_colourspace_volume_coverage_MonteCarlo,
+    RGB_colourspace_volume_coverage_analytic, is_within_macadam_limits,
     is_within_mesh_volume, is_within_pointer_gamut, is_within_visible_spectrum)
-from .graph import describe_conversion_path, convert
+from .graph import describe_conversion_path, convert, compile_conversion
 
 from colour.utilities import is_matplotlib_installed
 
@@ -325,12 +326,13 @@ __all__ += [
     'OPTIMAL_COLOUR_STIMULI_ILLUMINANTS', 'RGB_colourspace_limits',
     'RGB_colourspace_pointer_gamut_coverage_MonteCarlo',
     'RGB_colourspace_visible_spectrum_coverage_MonteCarlo',
-    'RGB_colourspace_volume_MonteCarlo',
-    'RGB_colourspace_volume_coverage_MonteCarlo', 'is_within_macadam_limits',
+    'RGB_colourspace_volume_MonteCarlo', 'RGB_colourspace_volume_analytic',
+    'RGB_colourspace_volume_coverage_MonteCarlo',
+    'RGB_colourspace_volume_coverage_analytic', 'is_within_macadam_limits',
     'is_within_mesh_volume', 'is_within_pointer_gamut',
     'is_within_visible_spectrum'
 ]
-__all__ += ['describe_conversion_path', 'convert']
+__all__ += ['describe_conversion_path', 'convert', 'compile_conversion']
 
 __application_name__ = 'Colour'
 
@@ -10,6 +10,9 @@ References
 """
 
 import numpy as np
+import os
+import shutil
+import tempfile
 import unittest
 
 from colour.algebra import LinearInterpolator
@@ -22,7 +25,7 @@ from colour.colorimetry import (
     sd_to_XYZ_tristimulus_weighting_factors_ASTME308, sd_to_XYZ_ASTME308,
     sd_to_XYZ, msds_to_XYZ_integration, msds_to_XYZ_ASTME308,
     wavelength_to_XYZ)
-from colour.utilities import domain_range_scale
+from colour.utilities import as_float_array, domain_range_scale
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2021 - Colour Developers'
@@ -1062,6 +1065,61 @@ class TestMsds_to_XYZ_integration(unittest.TestCase):
             TVS_D65_ARRAY_K1_INTEGRATION,
             decimal=7)
 
+    def test_msds_to_XYZ_integration_memmap(self):
+        """
+        Tests :func:`colour.colorimetry.tristimulus.msds_to_XYZ_integration`
+        definition with :class:`numpy.memmap` class instances.
+        """
+
+        cmfs = MSDS_CMFS['CIE 1931 2 Degree Standard Observer']
+        shape = SpectralShape(400, 700, 60)
+        directory = tempfile.mkdtemp()
+        try:
+            msds = np.memmap(
+                os.path.join(directory, 'msds.raw'),
+                dtype=np.float32,
+                mode='w+',
+                shape=DATA_TWO.shape)
+            msds[:] = DATA_TWO
+            msds.flush()
+
+            XYZ = np.memmap(
+                os.path.join(directory, 'XYZ.raw'),
+                dtype=np.float64,
+                mode='w+',
+                shape=DATA_TWO.shape[:-1] + (3, ))
+
+            self.assertIs(
+                msds_to_XYZ_integration(
+                    msds,
+                    cmfs,
+                    SDS_ILLUMINANTS['D65'],
+                    shape=shape,
+                    chunk_size=5,
+                    out=XYZ), XYZ)
+
+            np.testing.assert_almost_equal(
+                XYZ,
+                msds_to_XYZ_integration(
+                    msds.astype(np.float64),
+                    cmfs,
+                    SDS_ILLUMINANTS['D65'],
+                    shape=shape),
+                decimal=7)
+
+            self.assertRaises(
+                ValueError,
+                msds_to_XYZ_integration,
+                msds,
+                cmfs,
+                SDS_ILLUMINANTS['D65'],
+                shape=shape,
+                out=np.zeros([2, 3]))
+
+            del msds, XYZ
+        finally:
+            shutil.rmtree(directory)
+
     def test_domain_range_scale_msds_to_XYZ_integration(self):
         """
         Tests :func:`colour.colorimetry.tristimulus.msds_to_XYZ_integration`
@@ -1106,6 +1164,52 @@ class TestMsds_to_XYZ_ASTME308(unittest.TestCase):
             TVS_D65_ASTME308_K1_MSDS,
             decimal=7)
 
+    def test_msds_to_XYZ_ASTME308_array(self):
+        """
+        Tests :func:`colour.colorimetry.tristimulus.msds_to_XYZ_ASTME308`
+        definition with *array_like* multi-spectral distributions.
+        """
+
+        cmfs = MSDS_CMFS['CIE 1931 2 Degree Standard Observer']
+        for shape in (SpectralShape(400, 700, 1), SpectralShape(400, 700, 5),
+                      SpectralShape(340, 830, 10), SpectralShape(
+                          400, 700, 20)):
+            msds = MSDS_TWO.copy().align(shape)
+            XYZ = as_float_array([
+                sd_to_XYZ_ASTME308(sd, cmfs, SDS_ILLUMINANTS['D65'])
+                for sd in msds.to_sds()
+            ])
+
+            np.testing.assert_almost_equal(
+                msds_to_XYZ_ASTME308(
+                    np.transpose(msds.values),
+                    cmfs,
+                    SDS_ILLUMINANTS['D65'],
+                    shape=shape),
+                XYZ,
+                decimal=7)
+
+            np.testing.assert_almost_equal(
+                msds_to_XYZ_ASTME308(
+                    np.reshape(np.transpose(msds.values), (3, 4, -1)),
+                    cmfs,
+                    SDS_ILLUMINANTS['D65'],
+                    shape=shape,
+                    chunk_size=5),
+                np.reshape(XYZ, (3, 4, 3)),
+                decimal=7)
+
+        msds = MSDS_TWO.copy().align(SpectralShape(400, 700, 20))
+        np.testing.assert_almost_equal(
+            msds_to_XYZ_ASTME308(
+                np.transpose(msds.values),
+                cmfs,
+                SDS_ILLUMINANTS['D65'],
+                k=1,
+                shape=msds.shape),
+            TVS_D65_ASTME308_K1_MSDS,
+            decimal=7)
+
     def test_domain_range_scale_msds_to_XYZ_ASTME308(self):
         """
         Tests :func:`colour.colorimetry.tristimulus.msds_to_XYZ_ASTME308`
@@ -1131,6 +1235,12 @@ class TestMsds_to_XYZ_ASTME308(unittest.TestCase):
 
         self.assertRaises(ValueError, msds_to_XYZ_ASTME308, DATA_TWO)
 
+        self.assertRaises(
+            ValueError,
+            msds_to_XYZ_ASTME308,
+            DATA_TWO,
+            shape=SpectralShape(400, 700, 60))
+
 
 class TestWavelength_to_XYZ(unittest.TestCase):
     """
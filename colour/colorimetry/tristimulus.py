@@ -41,8 +41,8 @@ from colour.colorimetry import (SPECTRAL_SHAPE_DEFAULT,
                                 MultiSpectralDistributions, SpectralShape,
                                 MSDS_CMFS_STANDARD_OBSERVER, sd_ones)
 from colour.constants import DEFAULT_INT_DTYPE
-from colour.utilities import (CaseInsensitiveMapping, as_float_array,
-                              filter_kwargs, from_range_100,
+from colour.utilities import (CACHE_REGISTRY, CaseInsensitiveMapping,
+                              as_float_array, filter_kwargs, from_range_100,
                               get_domain_range_scale, runtime_warning, tsplit)
 
 __author__ = 'Colour Developers'
@@ -73,11 +73,16 @@ References
 SPECTRAL_SHAPE_ASTME308 : SpectralShape
 """
 
-_CACHE_LAGRANGE_INTERPOLATING_COEFFICIENTS = None
+_CACHE_LAGRANGE_INTERPOLATING_COEFFICIENTS = CACHE_REGISTRY.register_cache(
+    '{0}._CACHE_LAGRANGE_INTERPOLATING_COEFFICIENTS'.format(__name__),
+    maximum_size=64)
 
-_CACHE_TRISTIMULUS_WEIGHTING_FACTORS = None
+_CACHE_TRISTIMULUS_WEIGHTING_FACTORS = CACHE_REGISTRY.register_cache(
+    '{0}._CACHE_TRISTIMULUS_WEIGHTING_FACTORS'.format(__name__),
+    maximum_size=256)
 
-_CACHE_SD_TO_XYZ = None
+_CACHE_SD_TO_XYZ = CACHE_REGISTRY.register_cache(
+    '{0}._CACHE_SD_TO_XYZ'.format(__name__), maximum_size=8192)
 
 
 def lagrange_coefficients_ASTME2022(interval=10, interval_type='inner'):
@@ -129,13 +134,10 @@ def lagrange_coefficients_ASTME2022(interval=10, interval_type='inner'):
            [ 0.05...,  0.99..., -0.04...]])
     """
 
-    global _CACHE_LAGRANGE_INTERPOLATING_COEFFICIENTS
-    if _CACHE_LAGRANGE_INTERPOLATING_COEFFICIENTS is None:
-        _CACHE_LAGRANGE_INTERPOLATING_COEFFICIENTS = {}
-
     hash_key = tuple([hash(arg) for arg in (interval, interval_type)])
-    if hash_key in _CACHE_LAGRANGE_INTERPOLATING_COEFFICIENTS:
-        return np.copy(_CACHE_LAGRANGE_INTERPOLATING_COEFFICIENTS[hash_key])
+    lica = _CACHE_LAGRANGE_INTERPOLATING_COEFFICIENTS.get(hash_key)
+    if lica is not None:
+        return np.copy(lica)
 
     r_n = np.linspace(1 / interval, 1 - (1 / interval), interval - 1)
     d = 3
@@ -251,16 +253,13 @@ def tristimulus_weighting_factors_ASTME2022(cmfs, illuminant, shape, k=None):
         raise ValueError(
             '"{0}" shape "interval" must be 1!'.format(illuminant))
 
-    global _CACHE_TRISTIMULUS_WEIGHTING_FACTORS
-    if _CACHE_TRISTIMULUS_WEIGHTING_FACTORS is None:
-        _CACHE_TRISTIMULUS_WEIGHTING_FACTORS = {}
-
     hash_key = tuple([
         hash(arg) for arg in (cmfs, illuminant, shape, k,
                               get_domain_range_scale())
     ])
-    if hash_key in _CACHE_TRISTIMULUS_WEIGHTING_FACTORS:
-        return np.copy(_CACHE_TRISTIMULUS_WEIGHTING_FACTORS[hash_key])
+    W = _CACHE_TRISTIMULUS_WEIGHTING_FACTORS.get(hash_key)
+    if W is not None:
+        return np.copy(W)
 
     Y = cmfs.values
     S = illuminant.values
@@ -903,16 +902,13 @@ def sd_to_XYZ(
     array([ 10.8404805...,   9.6838697...,   6.2115722...])
     """
 
-    global _CACHE_SD_TO_XYZ
-    if _CACHE_SD_TO_XYZ is None:
-        _CACHE_SD_TO_XYZ = {}
-
     hash_key = tuple([
         hash(arg) for arg in (sd, cmfs, illuminant, k, method,
                               tuple(kwargs.items()), get_domain_range_scale())
     ])
-    if hash_key in _CACHE_SD_TO_XYZ:
-        return np.copy(_CACHE_SD_TO_XYZ[hash_key])
+    XYZ = _CACHE_SD_TO_XYZ.get(hash_key)
+    if XYZ is not None:
+        return np.copy(XYZ)
 
     function = SD_TO_XYZ_METHODS[method]
 
@@ -924,13 +920,68 @@ def sd_to_XYZ(
     return XYZ
 
 
+def _msds_to_XYZ_tiled(msds, W, chunk_size=None, out=None, preprocess=None):
+    """
+    Multiplies given multi-spectral distributions array with given weighting
+    factors by tiles of ``chunk_size`` spectra, optionally writing the
+    resulting *CIE XYZ* tristimulus values into given ``out`` array.
+
+    Parameters
+    ----------
+    msds : ndarray
+        Multi-spectral distributions array, the wavelengths are expected to be
+        in the last axis, e.g. a :class:`numpy.memmap` class instance.
+    W : ndarray
+        Weighting factors of shape (wavelengths, 3).
+    chunk_size : int, optional
+        Number of spectra processed at once. If *None*, all the spectra are
+        processed at once.
+    out : ndarray, optional
+        Array receiving the *CIE XYZ* tristimulus values, e.g. a writable
+        :class:`numpy.memmap` class instance.
+    preprocess : callable, optional
+        Callable applied to each tile of spectra before the multiplication.
+
+    Returns
+    -------
+    ndarray
+        *CIE XYZ* tristimulus values.
+    """
+
+    R = np.reshape(msds, (-1, msds.shape[-1]))
+    shape = msds.shape[:-1] + (3, )
+
+    if out is None:
+        out = np.empty(shape)
+    elif out.shape != shape:
+        raise ValueError(
+            '"out" array shape "{0}" is not compatible with "{1}" tristimulus '
+            'values shape!'.format(out.shape, shape))
+
+    XYZ = np.reshape(out, (-1, 3))
+    if not np.may_share_memory(XYZ, out):
+        raise ValueError('"out" array must be contiguous!')
+
+    chunk_size = max(R.shape[0] if chunk_size is None else chunk_size, 1)
+    for i in range(0, R.shape[0], chunk_size):
+        R_c = as_float_array(R[i:i + chunk_size])
+        if preprocess is not None:
+            R_c = preprocess(R_c)
+
+        XYZ[i:i + chunk_size] = from_range_100(np.dot(R_c, W))
+
+    return out
+
+
 def msds_to_XYZ_integration(
         msds,
         cmfs=MSDS_CMFS_STANDARD_OBSERVER['CIE 1931 2 Degree Standard Observer']
         .copy().trim(SPECTRAL_SHAPE_DEFAULT),
         illuminant=sd_ones(),
         k=None,
-        shape=SPECTRAL_SHAPE_DEFAULT):
+        shape=SPECTRAL_SHAPE_DEFAULT,
+        chunk_size=None,
+        out=None):
     """
     Converts given multi-spectral distributions to *CIE XYZ* tristimulus values
     using given colour matching functions and illuminant. The multi-spectral
@@ -943,7 +994,9 @@ def msds_to_XYZ_integration(
     msds : MultiSpectralDistributions or array_like
         Multi-spectral distributions, if an *array_like* the wavelengths are
         expected to be in the last axis, e.g. for a 512x384 multi-spectral
-        image with 77 bins, ``msds`` shape should be (384, 512, 77).
+        image with 77 bins, ``msds`` shape should be (384, 512, 77). A
+        :class:`numpy.memmap` class instance, e.g. a band interleaved by pixel
+        raw file, is read by tiles of ``chunk_size`` spectra.
     cmfs : XYZ_ColourMatchingFunctions
         Standard observer colour matching functions.
     illuminant : SpectralDistribution, optional
@@ -966,6 +1019,12 @@ def msds_to_XYZ_integration(
     shape : SpectralShape, optional
         Spectral shape of the multi-spectral distributions, ``cmfs`` and
         ``illuminant`` will be aligned to it.
+    chunk_size : int, optional
+        Number of spectra processed at once, bounding the memory used by the
+        intermediate arrays. If *None*, all the spectra are processed at once.
+    out : ndarray, optional
+        Contiguous array, e.g. a writable :class:`numpy.memmap` class instance,
+        receiving the *CIE XYZ* tristimulus values.
 
     Returns
     -------
@@ -989,6 +1048,11 @@ def msds_to_XYZ_integration(
         illuminant to the given spectral shape while the latter favours
         precision by aligning the multi-spectral distributions to the colour
         matching functions.
+    -   With the *array_like* code path, the colour matching functions and
+        illuminant product is computed once and the spectra are integrated by
+        tiles of ``chunk_size`` spectra: hyperspectral cubes larger than the
+        available memory can be converted by passing a :class:`numpy.memmap`
+        class instance for both ``msds`` and ``out``.
 
     References
     ----------
@@ -1069,7 +1133,8 @@ def msds_to_XYZ_integration(
             for sd in msds.to_sds()
         ])
     else:
-        msds = as_float_array(msds)
+        if not isinstance(msds, np.ndarray):
+            msds = as_float_array(msds)
 
         msd_shape_m_1, shape_wl_count = msds.shape[-1], len(shape.range())
         assert msd_shape_m_1 == shape_wl_count, (
@@ -1088,18 +1153,14 @@ def msds_to_XYZ_integration(
             illuminant = illuminant.copy().align(shape)
 
         S = illuminant.values
-        x_bar, y_bar, z_bar = tsplit(cmfs.values)
+        y_bar = cmfs.values[..., 1]
         dw = cmfs.shape.interval
 
         k = 100 / (np.sum(y_bar * S) * dw) if k is None else k
 
-        X_p = msds * x_bar * S * dw
-        Y_p = msds * y_bar * S * dw
-        Z_p = msds * z_bar * S * dw
-
-        XYZ = k * np.sum(np.array([X_p, Y_p, Z_p]), axis=-1)
+        W = k * cmfs.values * S[..., np.newaxis] * dw
 
-        return from_range_100(np.rollaxis(XYZ, 0, msds.ndim))
+        return _msds_to_XYZ_tiled(msds, W, chunk_size, out)
 
 
 def msds_to_XYZ_ASTME308(
@@ -1110,16 +1171,23 @@ def msds_to_XYZ_ASTME308(
         use_practice_range=True,
         mi_5nm_omission_method=True,
         mi_20nm_interpolation_method=True,
-        k=None):
+        k=None,
+        shape=SPECTRAL_SHAPE_ASTME308,
+        chunk_size=None,
+        out=None):
     """
     Converts given multi-spectral distributions to *CIE XYZ* tristimulus values
     using given colour matching functions and illuminant according to practise
-    *ASTM E308-15* method.
+    *ASTM E308-15* method. The multi-spectral distributions can be either a
+    :class:`colour.MultiSpectralDistributions` class instance or an
+    *array_like* in which case the ``shape`` must be passed.
 
     Parameters
     ----------
     msds : MultiSpectralDistributions or array_like
-        Multi-spectral distributions.
+        Multi-spectral distributions, if an *array_like* the wavelengths are
+        expected to be in the last axis, e.g. for 100000 spectra with 31 bins,
+        ``msds`` shape should be (100000, 31).
     cmfs : XYZ_ColourMatchingFunctions
         Standard observer colour matching functions.
     illuminant : SpectralDistribution, optional
@@ -1152,13 +1220,21 @@ def msds_to_XYZ_ASTME308(
         be the spectral concentration of the radiometric quantity corresponding
         to the photometric quantity required.
     shape : SpectralShape, optional
-        Spectral shape of the multi-spectral distributions, ``cmfs`` and
-        ``illuminant`` will be aligned to it.
+        Spectral shape of the multi-spectral distributions array
+        :math:`msds`, ignored if ``msds`` is a
+        :class:`colour.MultiSpectralDistributions` class instance.
+    chunk_size : int, optional
+        Number of spectra processed at once, bounding the memory used by the
+        intermediate arrays. If *None*, all the spectra are processed at once.
+    out : ndarray, optional
+        Contiguous array, e.g. a writable :class:`numpy.memmap` class instance,
+        receiving the *CIE XYZ* tristimulus values.
 
     Returns
     -------
     array_like
-        *CIE XYZ* tristimulus values.
+        *CIE XYZ* tristimulus values, for 100000 spectra with 31 bins, the
+        output shape will be (100000, 3).
 
     Notes
     -----
@@ -1169,17 +1245,19 @@ def msds_to_XYZ_ASTME308(
     | ``XYZ``   | [0, 100]              | [0, 1]        |
     +-----------+-----------------------+---------------+
 
-    -   The code path using the *array_like* multi-spectral distributions
-        produces results different to the code path using a
-        :class:`colour.MultiSpectralDistributions` class instance: the former
-        favours execution speed by aligning the colour matching functions and
-        illuminant to the given spectral shape while the latter favours
-        precision by aligning the multi-spectral distributions to the colour
-        matching functions.
+    -   The *array_like* multi-spectral distributions are converted in a
+        single pass: the spectral data are trimmed, extrapolated and
+        interpolated with array operations before being multiplied with the
+        table of tristimulus weighting factors, or the colour matching
+        functions and illuminant product, computed once for all the spectra.
+    -   Uniformly spaced :class:`colour.MultiSpectralDistributions` class
+        instances are converted using the *array_like* code path, producing
+        the same results than :func:`colour.colorimetry.sd_to_XYZ_ASTME308`
+        definition applied to each spectral distribution.
 
     References
     ----------
-    :cite:`Wyszecki2000bf`
+    :cite:`ASTMInternational2015b`
 
     Examples
     --------
@@ -1219,15 +1297,134 @@ def msds_to_XYZ_ASTME308(
     """
 
     if isinstance(msds, MultiSpectralDistributions):
-        return as_float_array([
-            sd_to_XYZ_ASTME308(sd, cmfs, illuminant, use_practice_range,
-                               mi_5nm_omission_method,
-                               mi_20nm_interpolation_method, k)
-            for sd in msds.to_sds()
-        ])
+        if not msds.is_uniform():
+            return as_float_array([
+                sd_to_XYZ_ASTME308(sd, cmfs, illuminant, use_practice_range,
+                                   mi_5nm_omission_method,
+                                   mi_20nm_interpolation_method, k)
+                for sd in msds.to_sds()
+            ])
+
+        shape = msds.shape
+        msds = np.transpose(msds.values)
+    elif not isinstance(msds, np.ndarray):
+        msds = as_float_array(msds)
+
+    msd_shape_m_1, shape_wl_count = msds.shape[-1], len(shape.range())
+    if msd_shape_m_1 != shape_wl_count:
+        raise ValueError(
+            'Multi-spectral distributions array with {0} wavelengths '
+            'is not compatible with spectral shape with {1} wavelengths!'.
+            format(msd_shape_m_1, shape_wl_count))
+
+    if shape.interval not in (1, 5, 10, 20):
+        raise ValueError(
+            'Tristimulus values conversion from spectral data according to '
+            'practise "ASTM E308-15" should be performed on spectral data '
+            'with measurement interval of 1, 5, 10 or 20nm!')
+
+    if use_practice_range:
+        cmfs = cmfs.copy().trim(SPECTRAL_SHAPE_ASTME308)
+
+    if (shape.interval == 1 or
+            (shape.interval == 5 and mi_5nm_omission_method)):
+        if cmfs.shape.interval != shape.interval:
+            cmfs = cmfs.copy().interpolate(
+                SpectralShape(interval=shape.interval))
+
+        if illuminant.shape != cmfs.shape:
+            runtime_warning(
+                'Aligning "{0}" illuminant shape to "{1}" colour matching '
+                'functions shape.'.format(illuminant.name, cmfs.name))
+            illuminant = illuminant.copy().align(cmfs.shape)
+
+        # Indexes of the spectral data aligned to the colour matching
+        # functions shape using constant extrapolation.
+        indexes = (cmfs.wavelengths - shape.start) / shape.interval
+        if not np.allclose(indexes, np.around(indexes)):
+            raise ValueError(
+                '"{0}" spectral shape is not compatible with "{1}" colour '
+                'matching functions shape!'.format(shape, cmfs.shape))
+        indexes = np.clip(
+            np.around(indexes).astype(DEFAULT_INT_DTYPE), 0,
+            shape_wl_count - 1)
+
+        S = illuminant.values
+        y_bar = cmfs.values[..., 1]
+        dw = cmfs.shape.interval
+
+        k = 100 / (np.sum(y_bar * S) * dw) if k is None else k
+
+        W = k * cmfs.values * S[..., np.newaxis] * dw
+
+        def preprocess(R):
+            """
+            Aligns given spectral data to the colour matching functions.
+            """
+
+            return R[..., indexes]
     else:
-        raise ValueError('"ASTM E308-15" method does not support "array_like" '
-                         'multi-spectral distributions!')
+        if cmfs.shape.interval != 1:
+            runtime_warning('Interpolating "{0}" cmfs to 1nm interval.'.format(
+                cmfs.name))
+            cmfs = cmfs.copy().interpolate(SpectralShape(interval=1))
+
+        if illuminant.shape != cmfs.shape:
+            runtime_warning(
+                'Aligning "{0}" illuminant shape to "{1}" colour matching '
+                'functions shape.'.format(illuminant.name, cmfs.name))
+            illuminant = illuminant.copy().align(cmfs.shape)
+
+        wavelengths = shape.range()
+        indexes = np.where(
+            np.logical_and(wavelengths >= cmfs.shape.start,
+                           wavelengths <= cmfs.shape.end))[0]
+        start, end = wavelengths[indexes[0]], wavelengths[indexes[-1]]
+        interval = shape.interval
+
+        interpolate = interval == 20 and mi_20nm_interpolation_method
+        if interpolate:
+            interval = 10
+
+        W = tristimulus_weighting_factors_ASTME2022(
+            cmfs, illuminant,
+            SpectralShape(cmfs.shape.start, cmfs.shape.end, interval), k)
+        start_w = cmfs.shape.start
+        end_w = cmfs.shape.start + interval * (W.shape[0] - 1)
+        W = adjust_tristimulus_weighting_factors_ASTME308(
+            W, SpectralShape(start_w, end_w, interval),
+            SpectralShape(start, end, interval))
+
+        def preprocess(R):
+            """
+            Trims given spectral data to the colour matching functions and
+            interpolates it to 10 nm if required.
+            """
+
+            R = R[..., indexes]
+
+            if not interpolate:
+                return R
+
+            # Extrapolation of additional 20nm padding intervals.
+            R_p = np.concatenate(
+                [
+                    3 * R[..., 0:1] - 3 * R[..., 1:2] + R[..., 2:3],
+                    R,
+                    R[..., -3:-2] - 3 * R[..., -2:-1] + 3 * R[..., -1:],
+                ],
+                axis=-1)
+
+            R_i = np.empty(R.shape[:-1] + (R.shape[-1] * 2 - 1, ))
+            R_i[..., ::2] = R
+            # Interpolating every odd numbered values.
+            R_i[..., 1::2] = (
+                -0.0625 * R_p[..., :-3] + 0.5625 * R_p[..., 1:-2] +
+                0.5625 * R_p[..., 2:-1] - 0.0625 * R_p[..., 3:])
+
+            return R_i
+
+    return _msds_to_XYZ_tiled(msds, W, chunk_size, out, preprocess)
 
 
 MSDS_TO_XYZ_METHODS = CaseInsensitiveMapping({
@@ -1263,10 +1460,10 @@ def msds_to_XYZ(
         **kwargs):
     """
     Converts given multi-spectral distributions to *CIE XYZ* tristimulus values
-    using given colour matching functions and illuminant. For the *Integration*
-    method, the multi-spectral distributions can be either a
-    :class:`colour.MultiSpectralDistributions` class instance or an
-    *array_like* in which case the ``shape`` must be passed.
+    using given colour matching functions and illuminant. The multi-spectral
+    distributions can be either a :class:`colour.MultiSpectralDistributions`
+    class instance or an *array_like* in which case the ``shape`` must be
+    passed.
 
     Parameters
     ----------
@@ -1315,9 +1512,19 @@ def msds_to_XYZ(
         tristimulus values will use a dedicated interpolation method instead
         of a table of tristimulus weighting factors.
     shape : SpectralShape, optional
-        {:func:`colour.colorimetry.msds_to_XYZ_integration`},
-        Spectral shape of the multi-spectral distributions array :math:`msds`,
-        ``cmfs`` and ``illuminant`` will be aligned to it.
+        {:func:`colour.colorimetry.msds_to_XYZ_integration`,
+        :func:`colour.colorimetry.msds_to_XYZ_ASTME308`},
+        Spectral shape of the multi-spectral distributions array :math:`msds`.
+    chunk_size : int, optional
+        {:func:`colour.colorimetry.msds_to_XYZ_integration`,
+        :func:`colour.colorimetry.msds_to_XYZ_ASTME308`},
+        Number of spectra processed at once, bounding the memory used by the
+        intermediate arrays.
+    out : ndarray, optional
+        {:func:`colour.colorimetry.msds_to_XYZ_integration`,
+        :func:`colour.colorimetry.msds_to_XYZ_ASTME308`},
+        Contiguous array, e.g. a writable :class:`numpy.memmap` class instance,
+        receiving the *CIE XYZ* tristimulus values.
 
     Returns
     -------
@@ -1416,8 +1623,8 @@ def msds_to_XYZ(
 
     function = MSDS_TO_XYZ_METHODS[method]
 
-    return function(msds, cmfs, illuminant, k,
-                    **filter_kwargs(function, **kwargs))
+    return function(
+        msds, cmfs, illuminant, k=k, **filter_kwargs(function, **kwargs))
 
 
 def wavelength_to_XYZ(wavelength,
@@ -6,8 +6,9 @@ Showcases RGB colourspace volume computations.
 import colour
 from colour.utilities import message_box
 
-# NOTE: Because the MonteCarlo methods use multiprocessing, it is recommended
-# to wrap the execution in a definition or a *__main__* block.
+# NOTE: Because the MonteCarlo methods use the "Colour" executor which
+# defaults to multiprocessing, it is recommended to wrap the execution in a
+# definition or a *__main__* block.
 if __name__ == '__main__':
     message_box('RGB Colourspace Volume Computations')
 
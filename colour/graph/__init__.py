@@ -1,9 +1,16 @@
 # -*- coding: utf-8 -*-
 
-from .conversion import (CONVERSION_GRAPH, CONVERSION_GRAPH_NODE_LABELS,
-                         describe_conversion_path, convert)
+from .conversion import (
+    CONVERSION_GRAPH, CONVERSION_GRAPH_NODE_LABELS,
+    CONVERSION_GRAPH_EDGE_COSTS, PATH_CONVERSION_ROUTING_TABLES,
+    build_conversion_routing_table, write_conversion_routing_tables,
+    describe_conversion_path, convert, Conversion_Pipeline, compile_conversion,
+    calibrate_conversion_graph_costs)
 
 __all__ = [
     'CONVERSION_GRAPH', 'CONVERSION_GRAPH_NODE_LABELS',
-    'describe_conversion_path', 'convert'
+    'CONVERSION_GRAPH_EDGE_COSTS', 'PATH_CONVERSION_ROUTING_TABLES',
+    'build_conversion_routing_table', 'write_conversion_routing_tables',
+    'describe_conversion_path', 'convert', 'Conversion_Pipeline',
+    'compile_conversion', 'calibrate_conversion_graph_costs'
 ]
@@ -7,15 +7,26 @@ Defines the automatic colour conversion graph objects:
 
 -   :func:`colour.describe_conversion_path`
 -   :func:`colour.convert`
+-   :func:`colour.compile_conversion`
+-   :func:`colour.graph.calibrate_conversion_graph_costs`
+-   :func:`colour.graph.build_conversion_routing_table`
+-   :func:`colour.graph.write_conversion_routing_tables`
 """
 
+import hashlib
+import heapq
 import inspect
+import json
+import numpy as np
+import os
 import textwrap
+import timeit
 from collections import namedtuple
 from copy import copy
 from functools import partial
 from pprint import pformat
 
+from colour.characterisation import SDS_COLOURCHECKERS
 from colour.colorimetry import (CCS_ILLUMINANTS, SDS_ILLUMINANTS,
                                 TVS_ILLUMINANTS_HUNTERLAB)
 from colour.colorimetry import (colorimetric_purity, complementary_wavelength,
@@ -54,8 +65,9 @@ from colour.appearance import (
     XYZ_to_LLAB, XYZ_to_Nayatani95, XYZ_to_RLAB)
 from colour.appearance.ciecam02 import CAM_KWARGS_CIECAM02_sRGB
 from colour.temperature import CCT_to_uv, uv_to_CCT
-from colour.utilities import (domain_range_scale, filter_kwargs, message_box,
-                              required, tsplit, tstack, usage_warning)
+from colour.utilities import (CACHE_REGISTRY, domain_range_scale,
+                              filter_kwargs, message_box, required, tsplit,
+                              tstack, usage_warning, vector_dot)
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2021 - Colour Developers'
@@ -69,8 +81,11 @@ __all__ = [
     'JMh_CIECAM02_to_CIECAM02', 'CAM16_to_JMh_CAM16', 'JMh_CAM16_to_CAM16',
     'XYZ_to_luminance', 'RGB_luminance_to_RGB',
     'CONVERSION_SPECIFICATIONS_DATA', 'CONVERSION_GRAPH_NODE_LABELS',
-    'CONVERSION_SPECIFICATIONS', 'CONVERSION_GRAPH',
-    'describe_conversion_path', 'convert'
+    'CONVERSION_SPECIFICATIONS', 'CONVERSION_GRAPH_EDGE_COSTS',
+    'CONVERSION_GRAPH', 'describe_conversion_path', 'convert',
+    'PATH_CONVERSION_ROUTING_TABLES', 'build_conversion_routing_table',
+    'write_conversion_routing_tables', 'Conversion_Pipeline',
+    'compile_conversion', 'calibrate_conversion_graph_costs'
 ]
 
 
@@ -552,6 +567,62 @@ CONVERSION_GRAPH_NODE_LABELS.update({
 })
 
 
+CONVERSION_GRAPH_EDGE_COSTS = {
+    ('cie xyz', 'spectral distribution'): 10000,
+    ('cie xyy', 'munsell colour'): 1000,
+    ('munsell colour', 'cie xyy'): 50,
+    ('osa ucs', 'cie xyz'): 200,
+    ('cie ucs uv', 'cct'): 1000,
+    ('cct', 'cie ucs uv'): 50,
+}
+"""
+Automatic colour conversion graph edges costs, i.e. the relative cost of a
+conversion function call, the conversion from *CIE XYZ* tristimulus values to
+*CIE L\\*a\\*b\\** colourspace having a unit cost. The edges not listed
+have a unit cost. The declared costs can be replaced with locally measured
+costs using the :func:`colour.graph.calibrate_conversion_graph_costs`
+definition.
+
+The routing tables are cached: when the costs or the conversion
+specifications are modified directly, the
+*colour.graph.conversion._CACHE_CONVERSION_ROUTING_TABLES* cache must be
+cleared with the :meth:`colour.utilities.CacheRegistry.clear_cache` method of
+:attr:`colour.utilities.CACHE_REGISTRY` attribute.
+
+CONVERSION_GRAPH_EDGE_COSTS : dict
+"""
+
+_LINEAR_CONVERSION_FUNCTIONS = {
+    XYZ_to_RGB: {
+        'cctf_encoding': None
+    },
+    RGB_to_XYZ: {
+        'cctf_decoding': None
+    },
+    RGB_to_RGB: {
+        'apply_cctf_decoding': False,
+        'apply_cctf_encoding': False
+    },
+    XYZ_to_sRGB: {
+        'apply_cctf_encoding': False
+    },
+    sRGB_to_XYZ: {
+        'apply_cctf_decoding': False
+    },
+    XYZ_to_UCS: {},
+    UCS_to_XYZ: {},
+    RGB_to_YCoCg: {},
+    YCoCg_to_RGB: {},
+}
+"""
+Conversion functions that are linear, i.e. a 3x3 matrix multiplication, under
+the **'1'** domain-range scale, and the keyword arguments values they require
+to remain linear.
+
+_LINEAR_CONVERSION_FUNCTIONS : dict
+"""
+
+
 @required('NetworkX')
 def _build_graph():
     """
@@ -571,7 +642,9 @@ def _build_graph():
         graph.add_edge(
             specification.source,
             specification.target,
-            conversion_function=specification.conversion_function)
+            conversion_function=specification.conversion_function,
+            cost=CONVERSION_GRAPH_EDGE_COSTS.get(
+                (specification.source, specification.target), 1))
 
     return graph
 
@@ -584,8 +657,388 @@ CONVERSION_GRAPH : DiGraph
 """
 
 
-@required('NetworkX')
-def _conversion_path(source, target):
+def _conversion_graph():
+    """
+    Returns the automatic colour conversion graph, building it if required.
+
+    Returns
+    -------
+    DiGraph
+         Automatic colour conversion graph.
+    """
+
+    import colour
+
+    global CONVERSION_GRAPH
+
+    if CONVERSION_GRAPH is None:
+        # Updating the :attr:`CONVERSION_GRAPH` attributes.
+        colour.graph.CONVERSION_GRAPH = CONVERSION_GRAPH = _build_graph()
+
+    return CONVERSION_GRAPH
+
+
+PATH_CONVERSION_ROUTING_TABLES = os.path.join(
+    os.path.dirname(__file__), 'resources', 'conversion_routing_tables.json')
+"""
+Path to the precomputed automatic colour conversion graph routing tables.
+
+PATH_CONVERSION_ROUTING_TABLES : unicode
+"""
+
+_CACHE_CONVERSION_ROUTING_TABLES = CACHE_REGISTRY.register_cache(
+    '{0}._CACHE_CONVERSION_ROUTING_TABLES'.format(__name__))
+
+
+def _conversion_edges(weighted=False):
+    """
+    Returns the automatic colour conversion graph edges, i.e. (source, target,
+    cost) tuples, and their conversion functions.
+
+    Parameters
+    ----------
+    weighted : bool, optional
+        Whether to use the edges costs, i.e.
+        :attr:`colour.graph.CONVERSION_GRAPH_EDGE_COSTS` attribute, instead of
+        unit costs.
+
+    Returns
+    -------
+    tuple
+        Edges and conversion functions mapping keyed on (source, target)
+        tuples.
+    """
+
+    conversion_functions = {}
+    for specification in CONVERSION_SPECIFICATIONS:
+        conversion_functions[specification.source,
+                             specification.target] = (
+                                 specification.conversion_function)
+
+    edges = [(source, target, CONVERSION_GRAPH_EDGE_COSTS.get(
+        (source, target), 1) if weighted else 1)
+             for source, target in conversion_functions]
+
+    return edges, conversion_functions
+
+
+def _routing_table_signature(edges):
+    """
+    Returns the signature of given automatic colour conversion graph edges,
+    used to validate a routing table.
+
+    Parameters
+    ----------
+    edges : list
+        Edges, i.e. (source, target, cost) tuples.
+
+    Returns
+    -------
+    unicode
+        Edges signature.
+    """
+
+    return hashlib.sha256(json.dumps(edges).encode('utf-8')).hexdigest()
+
+
+def _shortest_path_unweighted(successors, predecessors, source, target):
+    """
+    Returns the path with the fewest edges from given source node to given
+    target node with a bidirectional breadth-first search, breaking the ties
+    as :func:`networkx.bidirectional_shortest_path` definition does.
+
+    Parameters
+    ----------
+    successors : list
+        Successor node indexes of every node in the edges insertion order.
+    predecessors : list
+        Predecessor node indexes of every node in the edges insertion order.
+    source : int
+        Source node index.
+    target : int
+        Target node index.
+
+    Returns
+    -------
+    list
+        Path node indexes from the source node to the target node or *None* if
+        no path exists.
+    """
+
+    if source == target:
+        return [source]
+
+    forward, reverse = {source: None}, {target: None}
+    forward_fringe, reverse_fringe = [source], [target]
+
+    def path(node):
+        """
+        Returns the path joining the forward and reverse searches at given
+        node.
+        """
+
+        path = []
+        while node is not None:
+            path.append(node)
+            node = forward[node]
+        path.reverse()
+
+        node = reverse[path[-1]]
+        while node is not None:
+            path.append(node)
+            node = reverse[node]
+
+        return path
+
+    while forward_fringe and reverse_fringe:
+        if len(forward_fringe) <= len(reverse_fringe):
+            level, forward_fringe = forward_fringe, []
+            for node in level:
+                for neighbour in successors[node]:
+                    if neighbour not in forward:
+                        forward_fringe.append(neighbour)
+                        forward[neighbour] = node
+                    if neighbour in reverse:
+                        return path(neighbour)
+        else:
+            level, reverse_fringe = reverse_fringe, []
+            for node in level:
+                for neighbour in predecessors[node]:
+                    if neighbour not in reverse:
+                        reverse[neighbour] = node
+                        reverse_fringe.append(neighbour)
+                    if neighbour in forward:
+                        return path(neighbour)
+
+    return None
+
+
+def _shortest_path_weighted(adjacency, reverse_adjacency, source, target):
+    """
+    Returns the path with the lowest cost from given source node to given
+    target node with a bidirectional *Dijkstra* algorithm, breaking the ties
+    as :func:`networkx.bidirectional_dijkstra` definition does.
+
+    Parameters
+    ----------
+    adjacency : list
+        Successor node indexes and edges costs of every node in the edges
+        insertion order.
+    reverse_adjacency : list
+        Predecessor node indexes and edges costs of every node in the edges
+        insertion order.
+    source : int
+        Source node index.
+    target : int
+        Target node index.
+
+    Returns
+    -------
+    list
+        Path node indexes from the source node to the target node or *None* if
+        no path exists.
+    """
+
+    if source == target:
+        return [source]
+
+    neighbours = [adjacency, reverse_adjacency]
+    distances = [{}, {}]
+    paths = [{source: [source]}, {target: [target]}]
+    seen = [{source: 0}, {target: 0}]
+    heaps = [[(0, 0, source)], [(0, 1, target)]]
+    counter = 2
+    final_distance, final_path = None, None
+    direction = 1
+    while heaps[0] and heaps[1]:
+        direction = 1 - direction
+
+        distance, _counter, node = heapq.heappop(heaps[direction])
+        if node in distances[direction]:
+            continue
+
+        distances[direction][node] = distance
+        if node in distances[1 - direction]:
+            return final_path
+
+        for neighbour, cost in neighbours[direction][node]:
+            candidate = distance + cost
+            if neighbour in distances[direction]:
+                continue
+
+            if (neighbour not in seen[direction] or
+                    candidate < seen[direction][neighbour]):
+                seen[direction][neighbour] = candidate
+                heapq.heappush(heaps[direction],
+                               (candidate, counter, neighbour))
+                counter += 1
+                paths[direction][neighbour] = (
+                    paths[direction][node] + [neighbour])
+                if neighbour in seen[0] and neighbour in seen[1]:
+                    total_distance = seen[0][neighbour] + seen[1][neighbour]
+                    if (final_path is None or
+                            final_distance > total_distance):
+                        final_distance = total_distance
+                        final_path = (paths[0][neighbour] +
+                                      paths[1][neighbour][-2::-1])
+
+    return None
+
+
+def build_conversion_routing_table(weighted=False):
+    """
+    Builds the automatic colour conversion graph routing table, i.e. the
+    all-pairs shortest conversion paths.
+
+    The routing table is built with a bidirectional breadth-first search or
+    a bidirectional *Dijkstra* algorithm and does not require
+    `NetworkX <https://networkx.github.io/>`__: the paths are those that
+    :func:`networkx.shortest_path` definition returns for the automatic colour
+    conversion graph.
+
+    Parameters
+    ----------
+    weighted : bool, optional
+        Whether to find the paths with the lowest cost according to the edges
+        costs, i.e. :attr:`colour.graph.CONVERSION_GRAPH_EDGE_COSTS` attribute,
+        instead of the paths with the fewest edges.
+
+    Returns
+    -------
+    dict
+        Serialisable routing table with the edges signature, the nodes and the
+        paths table: the node indexes of the path from the source node to the
+        target node, i.e. ``paths[source][target]``, or *None* if no path
+        exists.
+
+    Examples
+    --------
+    >>> table = build_conversion_routing_table()
+    >>> nodes = table['nodes']
+    >>> path = table['paths'][nodes.index('cie lab')][nodes.index('cct')]
+    >>> [nodes[node] for node in path]
+    ['cie lab', 'cie xyz', 'cie ucs', 'cie ucs uv', 'cct']
+    """
+
+    edges, _conversion_functions = _conversion_edges(weighted)
+
+    nodes = sorted(
+        set([source for source, _target, _cost in edges] +
+            [target for _source, target, _cost in edges]))
+    indexes = {node: i for i, node in enumerate(nodes)}
+
+    adjacency = [[] for _node in nodes]
+    reverse_adjacency = [[] for _node in nodes]
+    for source, target, cost in edges:
+        adjacency[indexes[source]].append((indexes[target], cost))
+        reverse_adjacency[indexes[target]].append((indexes[source], cost))
+
+    if weighted:
+        shortest_path = partial(_shortest_path_weighted, adjacency,
+                                reverse_adjacency)
+    else:
+        shortest_path = partial(
+            _shortest_path_unweighted,
+            [[node for node, _cost in nodes_i] for nodes_i in adjacency],
+            [[node for node, _cost in nodes_i]
+             for nodes_i in reverse_adjacency])
+
+    paths = [[shortest_path(source, target) for target in range(len(nodes))]
+             for source in range(len(nodes))]
+
+    return {
+        'signature': _routing_table_signature(edges),
+        'nodes': nodes,
+        'paths': paths,
+    }
+
+
+def write_conversion_routing_tables(path=PATH_CONVERSION_ROUTING_TABLES):
+    """
+    Writes the automatic colour conversion graph routing tables, i.e. the
+    unweighted and weighted routing tables, to given *JSON* file.
+
+    Parameters
+    ----------
+    path : unicode, optional
+        *JSON* file path, the default path is that of the precomputed routing
+        tables loaded by :func:`colour.convert` definition.
+
+    Returns
+    -------
+    bool
+        Definition success.
+
+    Examples
+    --------
+    >>> import os
+    >>> import tempfile
+    >>> path = os.path.join(tempfile.mkdtemp(), 'routing_tables.json')
+    >>> write_conversion_routing_tables(path)
+    True
+    """
+
+    with open(path, 'w') as json_file:
+        json.dump(
+            {
+                'unweighted': build_conversion_routing_table(False),
+                'weighted': build_conversion_routing_table(True),
+            },
+            json_file,
+            separators=(',', ':'))
+
+    return True
+
+
+def _routing_table(weighted=False):
+    """
+    Returns the automatic colour conversion graph routing table.
+
+    The precomputed routing tables are loaded from
+    :attr:`colour.graph.conversion.PATH_CONVERSION_ROUTING_TABLES` attribute
+    path and used if their signature matches the current edges, otherwise the
+    routing table is built. The routing table is then cached with the
+    conversion functions of the edges, the edges signature is only computed
+    when the cache is empty, i.e. on first use and after the edges costs
+    calibration.
+
+    Parameters
+    ----------
+    weighted : bool, optional
+        Whether to return the weighted routing table.
+
+    Returns
+    -------
+    dict
+        Routing table.
+    """
+
+    key = 'weighted' if weighted else 'unweighted'
+
+    table = _CACHE_CONVERSION_ROUTING_TABLES.get(key)
+    if table is not None:
+        return table
+
+    edges, conversion_functions = _conversion_edges(weighted)
+    signature = _routing_table_signature(edges)
+
+    if os.path.exists(PATH_CONVERSION_ROUTING_TABLES):
+        with open(PATH_CONVERSION_ROUTING_TABLES) as json_file:
+            table = json.load(json_file).get(key)
+
+    if (table is None or table['signature'] != signature or
+            'paths' not in table):
+        table = build_conversion_routing_table(weighted)
+
+    table['indexes'] = {node: i for i, node in enumerate(table['nodes'])}
+    table['conversion_functions'] = conversion_functions
+
+    _CACHE_CONVERSION_ROUTING_TABLES[key] = table
+
+    return table
+
+
+def _conversion_path(source, target, weighted=False):
     """
     Returns the conversion path from the source node to the target node in the
     automatic colour conversion graph.
@@ -596,6 +1049,10 @@ def _conversion_path(source, target):
         Source node.
     target : unicode
         Target node.
+    weighted : bool, optional
+        Whether to find the path with the lowest cost according to the edges
+        costs, i.e. :attr:`colour.graph.CONVERSION_GRAPH_EDGE_COSTS` attribute,
+        instead of the path with the fewest edges.
 
     Returns
     -------
@@ -603,6 +1060,12 @@ def _conversion_path(source, target):
         Conversion path from the source node to the target node, i.e. a list of
         conversion function callables.
 
+    Raises
+    ------
+    ValueError
+        If the source or target node does not exist or if there is no path
+        between them.
+
     Examples
     --------
     >>> _conversion_path('cie lab', 'cct')
@@ -611,19 +1074,25 @@ def _conversion_path(source, target):
 <function UCS_to_uv at 0x...>, <function uv_to_CCT at 0x...>]
     """
 
-    import colour
-    import networkx as nx
+    table = _routing_table(weighted)
+    indexes = table['indexes']
 
-    global CONVERSION_GRAPH
+    for node in (source, target):
+        if node not in indexes:
+            raise ValueError(
+                '"{0}" node is not in the automatic colour conversion graph!'.
+                format(node))
 
-    if CONVERSION_GRAPH is None:
-        # Updating the :attr:`CONVERSION_GRAPH` attributes.
-        colour.graph.CONVERSION_GRAPH = CONVERSION_GRAPH = _build_graph()
+    path = table['paths'][indexes[source]][indexes[target]]
+    if path is None:
+        raise ValueError('No conversion path exists from "{0}" to "{1}"!'.
+                         format(source, target))
 
-    path = nx.shortest_path(CONVERSION_GRAPH, source, target)
+    conversion_functions = table['conversion_functions']
+    nodes = table['nodes']
 
     return [
-        CONVERSION_GRAPH.get_edge_data(a, b)['conversion_function']
+        conversion_functions[nodes[a], nodes[b]]
         for a, b in zip(path[:-1], path[1:])
     ]
 
@@ -648,12 +1117,46 @@ def _lower_order_function(callable_):
     return callable_.func if isinstance(callable_, partial) else callable_
 
 
+def _filter_conversion_kwargs(conversion_function, **kwargs):
+    """
+    Filters the keyword arguments compatible with given conversion function.
+
+    Parameters
+    ----------
+    conversion_function : callable
+        Conversion function to filter the keyword arguments for.
+
+    Other Parameters
+    ----------------
+    \\**kwargs : dict, optional
+        {:func:`colour.convert`},
+        Please refer to the documentation of the previously listed definition.
+
+    Returns
+    -------
+    dict
+        Filtered keyword arguments.
+    """
+
+    # Filtering compatible keyword arguments passed directly and
+    # irrespective of any conversion function name.
+    filtered_kwargs = filter_kwargs(conversion_function, **kwargs)
+
+    # Filtering keyword arguments passed as dictionary with the
+    # conversion function name.
+    filtered_kwargs.update(
+        kwargs.get(_lower_order_function(conversion_function).__name__, {}))
+
+    return filtered_kwargs
+
+
 def describe_conversion_path(source,
                              target,
                              mode='Short',
                              width=79,
                              padding=3,
                              print_callable=print,
+                             weighted=False,
                              **kwargs):
     """
     Describes the conversion path from source colour representation to target
@@ -678,6 +1181,9 @@ def describe_conversion_path(source,
         Padding on each sides of the message.
     print_callable : callable, optional
         Callable used to print the message box.
+    weighted : bool, optional
+        Whether to describe the conversion path with the lowest cost according
+        to the edges costs instead of the path with the fewest edges.
 
     Other Parameters
     ----------------
@@ -705,7 +1211,7 @@ def describe_conversion_path(source,
     source, target, mode = source.lower(), target.lower(), mode.lower()
     width = (79 + 2 + 2 * 3 - 4) if mode == 'extended' else width
 
-    conversion_path = _conversion_path(source, target)
+    conversion_path = _conversion_path(source, target, weighted)
 
     message_box(
         '[ Conversion Path ]\n\n{0}'.format(' --> '.join([
@@ -715,16 +1221,8 @@ def describe_conversion_path(source,
         ])), width, padding, print_callable)
 
     for conversion_function in conversion_path:
-        conversion_function_name = _lower_order_function(
-            conversion_function).__name__
-
-        # Filtering compatible keyword arguments passed directly and
-        # irrespective of any conversion function name.
-        filtered_kwargs = filter_kwargs(conversion_function, **kwargs)
-
-        # Filtering keyword arguments passed as dictionary with the
-        # conversion function name.
-        filtered_kwargs.update(kwargs.get(conversion_function_name, {}))
+        filtered_kwargs = _filter_conversion_kwargs(conversion_function,
+                                                    **kwargs)
 
         return_value = filtered_kwargs.pop('return', None)
 
@@ -756,13 +1254,16 @@ def describe_conversion_path(source,
 
 
 @domain_range_scale('1')
-def convert(a, source, target, **kwargs):
+def convert(a, source, target, weighted=False, **kwargs):
     """
     Converts given object :math:`a` from source colour representation to target
     colour representation using the automatic colour conversion graph.
 
-    The conversion is performed by finding the shortest path in a
-    `NetworkX <https://networkx.github.io/>`__ :class:`DiGraph` class instance.
+    The conversion is performed by following the shortest path in the
+    precomputed automatic colour conversion graph routing table, see
+    :func:`colour.graph.build_conversion_routing_table` definition.
+    Unless verbose is enabled, the conversion path is compiled with
+    :func:`colour.compile_conversion` definition and cached.
 
     The conversion path adopts the **'1'** domain-range scale and the object
     :math:`a` is expected to be *soft* normalised accordingly. For example,
@@ -794,6 +1295,11 @@ def convert(a, source, target, **kwargs):
     target : unicode
         Target colour representation, i.e. the target node in the automatic
         colour conversion graph.
+    weighted : bool, optional
+        Whether to use the conversion path with the lowest cost according to
+        the edges costs, i.e.
+        :attr:`colour.graph.CONVERSION_GRAPH_EDGE_COSTS` attribute, instead of
+        the path with the fewest edges.
 
     Other Parameters
     ----------------
@@ -959,20 +1465,18 @@ verbose={'mode': 'Long'})
 
     source, target = source.lower(), target.lower()
 
-    conversion_path = _conversion_path(source, target)
+    if 'verbose' not in kwargs:
+        return _compile_conversion(source, target, weighted, **kwargs)(a)
+
+    conversion_path = _conversion_path(source, target, weighted)
 
     verbose_kwargs = copy(kwargs)
     for conversion_function in conversion_path:
         conversion_function_name = _lower_order_function(
             conversion_function).__name__
 
-        # Filtering compatible keyword arguments passed directly and
-        # irrespective of any conversion function name.
-        filtered_kwargs = filter_kwargs(conversion_function, **kwargs)
-
-        # Filtering keyword arguments passed as dictionary with the
-        # conversion function name.
-        filtered_kwargs.update(kwargs.get(conversion_function_name, {}))
+        filtered_kwargs = _filter_conversion_kwargs(conversion_function,
+                                                    **kwargs)
 
         a = conversion_function(a, **filtered_kwargs)
 
@@ -983,6 +1487,496 @@ verbose={'mode': 'Long'})
 
     if 'verbose' in verbose_kwargs:
         verbose_kwargs.update(verbose_kwargs.pop('verbose'))
-        describe_conversion_path(source, target, **verbose_kwargs)
+        describe_conversion_path(
+            source, target, weighted=weighted, **verbose_kwargs)
 
     return a
+
+
+class Conversion_Pipeline:
+    """
+    Defines a compiled conversion pipeline, i.e. a callable applying the
+    conversion functions of a resolved automatic colour conversion graph path
+    with their keyword arguments already bound.
+
+    Parameters
+    ----------
+    source : unicode
+        Source colour representation.
+    target : unicode
+        Target colour representation.
+    steps : list
+        Conversion steps, i.e. a list of (name, callable) tuples where the
+        callables only expect the object to convert.
+
+    Attributes
+    ----------
+    -   :attr:`~colour.graph.Conversion_Pipeline.source`
+    -   :attr:`~colour.graph.Conversion_Pipeline.target`
+    -   :attr:`~colour.graph.Conversion_Pipeline.steps`
+
+    Methods
+    -------
+    -   :meth:`~colour.graph.Conversion_Pipeline.__init__`
+    -   :meth:`~colour.graph.Conversion_Pipeline.__call__`
+    -   :meth:`~colour.graph.Conversion_Pipeline.__repr__`
+
+    Examples
+    --------
+    >>> pipeline = Conversion_Pipeline(
+    ...     'cie xyz', 'cie xy', [('XYZ_to_xy', XYZ_to_xy)])
+    >>> pipeline(np.array([0.20654008, 0.12197225, 0.05136952]))
+    ... # doctest: +ELLIPSIS
+    array([ 0.5436955...,  0.3210794...])
+    """
+
+    def __init__(self, source, target, steps):
+        self._source = source
+        self._target = target
+        self._steps = list(steps)
+
+    @property
+    def source(self):
+        """
+        Getter property for the source colour representation.
+
+        Returns
+        -------
+        unicode
+            Source colour representation.
+        """
+
+        return self._source
+
+    @property
+    def target(self):
+        """
+        Getter property for the target colour representation.
+
+        Returns
+        -------
+        unicode
+            Target colour representation.
+        """
+
+        return self._target
+
+    @property
+    def steps(self):
+        """
+        Getter property for the conversion steps.
+
+        Returns
+        -------
+        list
+            Conversion steps.
+        """
+
+        return self._steps
+
+    def __call__(self, a):
+        """
+        Converts given object :math:`a` using the conversion pipeline.
+
+        Parameters
+        ----------
+        a : array_like or numeric or SpectralDistribution
+            Object :math:`a` to convert.
+
+        Returns
+        -------
+        ndarray or numeric or SpectralDistribution
+            Converted object :math:`a`.
+        """
+
+        with domain_range_scale('1'):
+            for _name, step in self._steps:
+                a = step(a)
+
+        return a
+
+    def __repr__(self):
+        """
+        Returns an evaluable string representation of the conversion pipeline.
+
+        Returns
+        -------
+        unicode
+            Evaluable string representation.
+        """
+
+        return '{0}({1!r}, {2!r}, [{3}])'.format(
+            self.__class__.__name__, self._source, self._target,
+            ', '.join(['{0!r}'.format(name) for name, _step in self._steps]))
+
+
+_CACHE_CONVERSION_PIPELINES = CACHE_REGISTRY.register_cache(
+    '{0}._CACHE_CONVERSION_PIPELINES'.format(__name__), maximum_size=128)
+
+
+def _freeze(value):
+    """
+    Returns a hashable representation of given value for use as a cache key.
+
+    Parameters
+    ----------
+    value : object
+        Value to freeze.
+
+    Returns
+    -------
+    object
+        Hashable representation of the value.
+
+    Raises
+    ------
+    TypeError
+        If the value cannot be frozen.
+
+    Examples
+    --------
+    >>> _freeze({'b': [1, 2], 'a': np.array([0.5, 0.5])})
+    ... # doctest: +ELLIPSIS
+    (('a', ('ndarray', '<f8', (2,), b'...')), ('b', (1, 2)))
+    """
+
+    if isinstance(value, dict):
+        return tuple(
+            sorted((key, _freeze(item)) for key, item in value.items()))
+    elif isinstance(value, (list, tuple)):
+        return tuple(_freeze(item) for item in value)
+    elif isinstance(value, np.ndarray):
+        return ('ndarray', value.dtype.str, value.shape, value.tobytes())
+
+    hash(value)
+
+    return value
+
+
+def compile_conversion(source, target, weighted=False, **kwargs):
+    """
+    Compiles the conversion from source colour representation to target colour
+    representation into a reusable callable.
+
+    The conversion path is resolved once in the automatic colour conversion
+    graph and the keyword arguments are filtered and bound for each conversion
+    function of the path. The compiled pipelines are kept in a least recently
+    used cache keyed on the source, the target and the keyword arguments so
+    that repeated compilations skip the graph search and the signatures
+    introspection entirely.
+
+    Parameters
+    ----------
+    source : unicode
+        Source colour representation, i.e. the source node in the automatic
+        colour conversion graph.
+    target : unicode
+        Target colour representation, i.e. the target node in the automatic
+        colour conversion graph.
+    weighted : bool, optional
+        Whether to use the conversion path with the lowest cost according to
+        the edges costs instead of the path with the fewest edges.
+
+    Other Parameters
+    ----------------
+    \\**kwargs : dict, optional
+        {:func:`colour.convert`},
+        Please refer to the documentation of the previously listed definition.
+
+    Returns
+    -------
+    Conversion_Pipeline
+        Compiled conversion pipeline.
+
+    Warnings
+    --------
+    The domain-range scale is **'1'** and cannot be changed.
+
+    Notes
+    -----
+    -   The keyword arguments that cannot be hashed, e.g. objects without a
+        :meth:`__hash__` method, prevent the compiled pipeline from being
+        cached, it is compiled anew on each call.
+    -   The keyword arguments are bound at compilation time, mutating objects
+        hashed by identity, e.g. :class:`colour.RGB_Colourspace` class
+        instances, is not reflected by the cached pipelines.
+    -   Consecutive linear conversion steps, e.g. *CIE XYZ* tristimulus values
+        to *RGB* colourspace array without any colour component transfer
+        function, are fused into a single matrix multiplication.
+
+    Examples
+    --------
+    >>> from colour import SDS_COLOURCHECKERS
+    >>> sd = SDS_COLOURCHECKERS['ColorChecker N Ohta']['dark skin']
+    >>> pipeline = compile_conversion('Spectral Distribution', 'sRGB')
+    >>> pipeline
+    Conversion_Pipeline('spectral distribution', 'srgb', \
+['sd_to_XYZ', 'XYZ_to_sRGB'])
+    >>> pipeline(sd)  # doctest: +ELLIPSIS
+    array([ 0.4567579...,  0.3098698...,  0.2486192...])
+    >>> compile_conversion('Spectral Distribution', 'sRGB') is pipeline
+    True
+    """
+
+    # TODO: Remove the following warning whenever the automatic colour
+    # conversion graph implementation is considered stable.
+    usage_warning(
+        'The "Automatic Colour Conversion Graph" is a beta feature, be '
+        'mindful of this when using it. Please report any unexpected '
+        'behaviour and do not hesitate to ask any questions should they arise.'
+        '\nThis warning can be disabled with the '
+        '"colour.utilities.suppress_warnings" context manager as follows:\n'
+        'with colour.utilities.suppress_warnings(colour_usage_warnings=True): '
+        '\n    compile_conversion(*args, **kwargs)')
+
+    return _compile_conversion(source, target, weighted, **kwargs)
+
+
+def _linear_step_matrix(step):
+    """
+    Returns the matrix of given conversion step if it is linear.
+
+    Parameters
+    ----------
+    step : partial
+        Conversion step, i.e. a conversion function with its keyword arguments
+        bound.
+
+    Returns
+    -------
+    ndarray or None
+        Conversion step matrix or *None* if the conversion step is not linear.
+
+    Examples
+    --------
+    >>> _linear_step_matrix(partial(XYZ_to_UCS))
+    array([[ 0.66666667,  0.        ,  0.        ],
+           [ 0.        ,  1.        ,  0.        ],
+           [-0.5       ,  1.5       ,  0.5       ]])
+    >>> _linear_step_matrix(partial(XYZ_to_Lab)) is None
+    True
+    """
+
+    requirements = _LINEAR_CONVERSION_FUNCTIONS.get(step.func)
+
+    if requirements is None:
+        return None
+
+    parameters = inspect.signature(step.func).parameters
+    for name, value in requirements.items():
+        if step.keywords.get(name, parameters[name].default) is not value:
+            return None
+
+    # The rows of the converted identity matrix are the conversion images
+    # of the basis vectors, i.e. the columns of the conversion matrix.
+    with domain_range_scale('1'):
+        return np.transpose(step(np.identity(3)))
+
+
+def _fuse_linear_steps(steps):
+    """
+    Fuses the consecutive linear steps of given conversion steps into single
+    matrix multiplications.
+
+    Parameters
+    ----------
+    steps : list
+        Conversion steps, i.e. a list of (name, partial) tuples.
+
+    Returns
+    -------
+    list
+        Fused conversion steps.
+
+    Examples
+    --------
+    >>> steps = [('XYZ_to_UCS', partial(XYZ_to_UCS)),
+    ...          ('UCS_to_XYZ', partial(UCS_to_XYZ)),
+    ...          ('XYZ_to_Lab', partial(XYZ_to_Lab))]
+    >>> [name for name, _step in _fuse_linear_steps(steps)]
+    ['XYZ_to_UCS --> UCS_to_XYZ', 'XYZ_to_Lab']
+    """
+
+    fused_steps, names, matrix = [], [], None
+    for name, step in steps + [(None, None)]:
+        step_matrix = None if step is None else _linear_step_matrix(step)
+
+        if step_matrix is not None:
+            names.append(name)
+            matrix = (step_matrix
+                      if matrix is None else np.dot(step_matrix, matrix))
+            continue
+
+        if matrix is not None:
+            fused_steps.append((' --> '.join(names),
+                                partial(vector_dot, matrix)))
+            names, matrix = [], None
+
+        if step is not None:
+            fused_steps.append((name, step))
+
+    return fused_steps
+
+
+def _compile_conversion(source, target, weighted=False, **kwargs):
+    """
+    Compiles the conversion from source colour representation to target colour
+    representation into a reusable callable, using the compiled conversion
+    pipelines cache.
+
+    Parameters
+    ----------
+    source : unicode
+        Source colour representation, i.e. the source node in the automatic
+        colour conversion graph.
+    target : unicode
+        Target colour representation, i.e. the target node in the automatic
+        colour conversion graph.
+    weighted : bool, optional
+        Whether to use the conversion path with the lowest cost according to
+        the edges costs instead of the path with the fewest edges.
+
+    Other Parameters
+    ----------------
+    \\**kwargs : dict, optional
+        {:func:`colour.convert`},
+        Please refer to the documentation of the previously listed definition.
+
+    Returns
+    -------
+    Conversion_Pipeline
+        Compiled conversion pipeline.
+    """
+
+    source, target = source.lower(), target.lower()
+
+    try:
+        key = (source, target, weighted, _freeze(kwargs))
+    except TypeError:
+        key = None
+
+    if key is not None:
+        pipeline = _CACHE_CONVERSION_PIPELINES.get(key)
+        if pipeline is not None:
+            return pipeline
+
+    steps = []
+    for conversion_function in _conversion_path(source, target, weighted):
+        conversion_function_name = _lower_order_function(
+            conversion_function).__name__
+
+        filtered_kwargs = _filter_conversion_kwargs(conversion_function,
+                                                    **kwargs)
+
+        steps.append((conversion_function_name,
+                      partial(conversion_function, **filtered_kwargs)))
+
+    pipeline = Conversion_Pipeline(source, target, _fuse_linear_steps(steps))
+
+    if key is not None:
+        _CACHE_CONVERSION_PIPELINES[key] = pipeline
+
+    return pipeline
+
+
+def calibrate_conversion_graph_costs(edges=None, number=1, repeat=3):
+    """
+    Calibrates the automatic colour conversion graph edges costs by
+    benchmarking the conversion functions locally.
+
+    Each conversion function is called with a sample of its source colour
+    representation, obtained by converting a reference spectral distribution,
+    and the best timing is expressed relatively to the timing of the
+    conversion from *CIE XYZ* tristimulus values to *CIE L\\*a\\*b\\**
+    colourspace. The costs are stored in the
+    :attr:`colour.graph.CONVERSION_GRAPH_EDGE_COSTS` attribute, the weighted
+    routing table is rebuilt accordingly.
+
+    Parameters
+    ----------
+    edges : array_like, optional
+        Edges, i.e. (source, target) tuples, to calibrate, all the edges are
+        calibrated if not given.
+    number : int, optional
+        Number of calls of the conversion functions per timing.
+    repeat : int, optional
+        Number of timings per conversion function, the best timing is used.
+
+    Returns
+    -------
+    dict
+        Calibrated edges costs.
+
+    Notes
+    -----
+    -   The edges whose source colour representation cannot be reached from
+        the reference spectral distribution keep their current cost.
+    -   The routing tables and compiled conversion pipelines caches are
+        cleared as the conversion paths might change.
+
+    Examples
+    --------
+    >>> costs = calibrate_conversion_graph_costs(
+    ...     [('CIE xyY', 'Munsell Colour')])  # doctest: +SKIP
+    >>> costs  # doctest: +SKIP
+    {('cie xyy', 'munsell colour'): 812.3453946...}
+    """
+
+    _edges, conversion_functions = _conversion_edges()
+
+    reference = ('cie xyz', 'cie lab')
+    if edges is None:
+        edges = list(conversion_functions.keys())
+    else:
+        edges = [(source.lower(), target.lower()) for source, target in edges]
+
+    sd = SDS_COLOURCHECKERS['ColorChecker N Ohta']['dark skin']
+    samples = {'spectral distribution': sd}
+
+    def _timing(edge):
+        """
+        Returns the best timing of given edge conversion function or *None*
+        if its source colour representation cannot be sampled.
+        """
+
+        source, target = edge
+
+        if source not in samples:
+            try:
+                samples[source] = _compile_conversion('spectral distribution',
+                                                      source)(sd)
+            except ValueError:
+                samples[source] = None
+
+        if samples[source] is None:
+            return None
+
+        conversion_function = conversion_functions[edge]
+
+        with domain_range_scale('1'):
+            return min(
+                timeit.repeat(
+                    partial(conversion_function, samples[source]),
+                    number=number,
+                    repeat=repeat)) / number
+
+    reference_timing = _timing(reference)
+
+    costs = {}
+    for edge in edges:
+        timing = _timing(edge)
+
+        if timing is None:
+            continue
+
+        costs[edge] = timing / reference_timing
+
+        if CONVERSION_GRAPH is not None:
+            CONVERSION_GRAPH.edges[edge]['cost'] = costs[edge]
+
+    CONVERSION_GRAPH_EDGE_COSTS.update(costs)
+
+    _CACHE_CONVERSION_ROUTING_TABLES.clear()
+    _CACHE_CONVERSION_PIPELINES.clear()
+
+    return costs
@@ -3,13 +3,27 @@
 Defines unit tests for :mod:`colour.graph.conversion` module.
 """
 
+import json
 import numpy as np
 import unittest
+try:
+    from unittest import mock
+except ImportError:  # pragma: no cover
+    import mock
+
+import colour.graph.conversion
 
 from colour.characterisation import SDS_COLOURCHECKERS
 from colour.colorimetry import CCS_ILLUMINANTS, SDS_ILLUMINANTS
-from colour.models import COLOURSPACE_MODELS, RGB_COLOURSPACE_ACES2065_1
-from colour.graph import describe_conversion_path, convert
+from colour.models import (COLOURSPACE_MODELS, RGB_COLOURSPACE_ACES2065_1,
+                           RGB_COLOURSPACE_sRGB, RGB_to_RGB, XYZ_to_RGB,
+                           eotf_inverse_sRGB)
+from colour.graph import (CONVERSION_GRAPH_EDGE_COSTS,
+                          PATH_CONVERSION_ROUTING_TABLES,
+                          build_conversion_routing_table,
+                          describe_conversion_path, convert,
+                          compile_conversion, calibrate_conversion_graph_costs)
+from colour.utilities import is_networkx_installed
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2021 - Colour Developers'
@@ -18,7 +32,10 @@ __maintainer__ = 'Colour Developers'
 __email__ = 'colour-developers@colour-science.org'
 __status__ = 'Production'
 
-__all__ = ['TestDescribeConversionPath', 'TestConvert']
+__all__ = [
+    'TestDescribeConversionPath', 'TestConvert', 'TestCompileConversion',
+    'TestBuildConversionRoutingTable', 'TestCalibrateConversionGraphCosts'
+]
 
 
 class TestDescribeConversionPath(unittest.TestCase):
@@ -132,6 +149,253 @@ class TestConvert(unittest.TestCase):
             'Spectral Distribution', 'sRGB',
             illuminant=tuple(illuminant)))
 
+    def test_convert_weighted(self):
+        """
+        Tests :func:`colour.graph.conversion.convert` definition behaviour with
+        weighted conversion path.
+        """
+
+        a = np.array([0.20654008, 0.12197225, 0.05136952])
+        np.testing.assert_almost_equal(
+            convert(a, 'CIE XYZ', 'CIE UCS uv', weighted=True),
+            convert(a, 'CIE XYZ', 'CIE UCS uv'),
+            decimal=7)
+
+        costs = dict(CONVERSION_GRAPH_EDGE_COSTS)
+        try:
+            CONVERSION_GRAPH_EDGE_COSTS['cie xyz', 'cie xy'] = 1000
+            colour.graph.conversion._CACHE_CONVERSION_PIPELINES.clear()
+            self.assertListEqual([
+                name for name, _step in compile_conversion(
+                    'CIE XYZ', 'CIE Luv uv', weighted=True).steps
+            ], ['XYZ_to_Luv', 'Luv_to_uv'])
+        finally:
+            CONVERSION_GRAPH_EDGE_COSTS.clear()
+            CONVERSION_GRAPH_EDGE_COSTS.update(costs)
+            colour.graph.conversion._CACHE_CONVERSION_PIPELINES.clear()
+
+
+class TestCompileConversion(unittest.TestCase):
+    """
+    Defines :func:`colour.graph.conversion.compile_conversion` definition unit
+    tests methods.
+    """
+
+    def test_compile_conversion(self):
+        """
+        Tests :func:`colour.graph.conversion.compile_conversion` definition.
+        """
+
+        sd = SDS_COLOURCHECKERS['ColorChecker N Ohta']['dark skin']
+        np.testing.assert_almost_equal(
+            compile_conversion('Spectral Distribution', 'sRGB')(sd),
+            convert(sd, 'Spectral Distribution', 'sRGB'),
+            decimal=7)
+
+        a = np.array([0.20654008, 0.12197225, 0.05136952])
+        illuminant = CCS_ILLUMINANTS['CIE 1931 2 Degree Standard Observer'][
+            'D50']
+        np.testing.assert_almost_equal(
+            compile_conversion('CIE XYZ', 'CIE Lab', illuminant=illuminant)(a),
+            convert(a, 'CIE XYZ', 'CIE Lab', illuminant=illuminant),
+            decimal=7)
+
+        np.testing.assert_almost_equal(
+            compile_conversion(
+                'RGB',
+                'Scene-Referred RGB',
+                RGB_to_RGB={'output_colourspace': RGB_COLOURSPACE_ACES2065_1
+                            })(a),
+            convert(
+                a,
+                'RGB',
+                'Scene-Referred RGB',
+                RGB_to_RGB={'output_colourspace': RGB_COLOURSPACE_ACES2065_1}),
+            decimal=7)
+
+        a = np.tile(a, (4, 3, 1))
+        np.testing.assert_almost_equal(
+            compile_conversion('CIE XYZ', 'CAM16UCS')(a),
+            convert(a, 'CIE XYZ', 'CAM16UCS'),
+            decimal=7)
+
+    def test_compile_conversion_cache(self):
+        """
+        Tests :func:`colour.graph.conversion.compile_conversion` definition
+        cache.
+        """
+
+        illuminant = CCS_ILLUMINANTS['CIE 1931 2 Degree Standard Observer'][
+            'D50']
+
+        self.assertIs(
+            compile_conversion('CIE XYZ', 'CIE Lab', illuminant=illuminant),
+            compile_conversion(
+                'CIE XYZ', 'CIE Lab', illuminant=np.copy(illuminant)))
+
+        self.assertIsNot(
+            compile_conversion('CIE XYZ', 'CIE Lab', illuminant=illuminant),
+            compile_conversion(
+                'CIE XYZ', 'CIE Lab', illuminant=illuminant * 0.99))
+
+        self.assertIsNot(
+            compile_conversion('CIE XYZ', 'CIE Lab', illuminant=set()),
+            compile_conversion('CIE XYZ', 'CIE Lab', illuminant=set()))
+
+    def test_compile_conversion_linear_steps_fusion(self):
+        """
+        Tests :func:`colour.graph.conversion.compile_conversion` definition
+        linear steps fusion.
+        """
+
+        XYZ = np.reshape(np.linspace(0, 1, 4 * 3 * 3), (4, 3, 3))
+
+        pipeline = compile_conversion(
+            'CIE XYZ',
+            'Scene-Referred RGB',
+            RGB_to_RGB={'output_colourspace': RGB_COLOURSPACE_ACES2065_1})
+        self.assertListEqual([name for name, _step in pipeline.steps],
+                             ['XYZ_to_RGB --> RGB_to_RGB'])
+        np.testing.assert_almost_equal(
+            pipeline(XYZ),
+            RGB_to_RGB(
+                XYZ_to_RGB(XYZ, RGB_COLOURSPACE_sRGB.whitepoint,
+                           RGB_COLOURSPACE_sRGB.whitepoint,
+                           RGB_COLOURSPACE_sRGB.matrix_XYZ_to_RGB),
+                RGB_COLOURSPACE_sRGB, RGB_COLOURSPACE_ACES2065_1),
+            decimal=12)
+
+        pipeline = compile_conversion(
+            'CIE XYZ', 'Scene-Referred RGB', cctf_encoding=eotf_inverse_sRGB)
+        self.assertListEqual([name for name, _step in pipeline.steps],
+                             ['XYZ_to_RGB', 'RGB_to_RGB'])
+
+
+class TestBuildConversionRoutingTable(unittest.TestCase):
+    """
+    Defines :func:`colour.graph.conversion.build_conversion_routing_table`
+    definition unit tests methods.
+    """
+
+    def test_build_conversion_routing_table(self):
+        """
+        Tests :func:`colour.graph.conversion.build_conversion_routing_table`
+        definition.
+        """
+
+        table = build_conversion_routing_table()
+        nodes, paths = table['nodes'], table['paths']
+
+        self.assertSetEqual(
+            set(nodes), set(colour.graph.CONVERSION_GRAPH_NODE_LABELS))
+
+        path = paths[nodes.index('cie lab')][nodes.index('cct')]
+        self.assertListEqual([nodes[node] for node in path], [
+            'cie lab', 'cie xyz', 'cie ucs', 'cie ucs uv', 'cct'
+        ])
+
+        self.assertIsNone(
+            paths[nodes.index('cie xyz')][nodes.index('wavelength')])
+
+    def test_networkx_shortest_paths(self):
+        """
+        Tests whether the paths of
+        :func:`colour.graph.conversion.build_conversion_routing_table`
+        definition are those of :func:`networkx.shortest_path` definition.
+        """
+
+        if not is_networkx_installed():  # pragma: no cover
+            return
+
+        import networkx as nx
+
+        graph = colour.graph.conversion._build_graph()
+        for weighted in (False, True):
+            table = build_conversion_routing_table(weighted)
+            nodes = table['nodes']
+            for i, source in enumerate(nodes):
+                for j, target in enumerate(nodes):
+                    try:
+                        path = nx.shortest_path(
+                            graph, source, target,
+                            'cost' if weighted else None)
+                    except nx.NetworkXNoPath:
+                        path = None
+
+                    path_t = table['paths'][i][j]
+                    if path_t is not None:
+                        path_t = [nodes[node] for node in path_t]
+
+                    self.assertEqual(path_t, path)
+
+    def test_routing_table_cache(self):
+        """
+        Tests :func:`colour.graph.conversion.build_conversion_routing_table`
+        definition routing tables cache.
+        """
+
+        table = colour.graph.conversion._routing_table()
+
+        # The edges are neither listed nor hashed on cached lookups.
+        with mock.patch(
+                'colour.graph.conversion._routing_table_signature') as hashing:
+            self.assertIs(colour.graph.conversion._routing_table(), table)
+            describe_conversion_path(
+                'CIE Lab', 'CCT', print_callable=lambda x: x)
+            hashing.assert_not_called()
+
+    def test_shipped_conversion_routing_tables(self):
+        """
+        Tests whether the shipped routing tables, i.e.
+        :attr:`colour.graph.conversion.PATH_CONVERSION_ROUTING_TABLES`
+        attribute, are up to date.
+        """
+
+        with open(PATH_CONVERSION_ROUTING_TABLES) as json_file:
+            tables = json.load(json_file)
+
+        self.assertDictEqual(tables['unweighted'],
+                             build_conversion_routing_table())
+        self.assertDictEqual(tables['weighted'],
+                             build_conversion_routing_table(True))
+
+
+class TestCalibrateConversionGraphCosts(unittest.TestCase):
+    """
+    Defines :func:`colour.graph.conversion.calibrate_conversion_graph_costs`
+    definition unit tests methods.
+    """
+
+    def test_calibrate_conversion_graph_costs(self):
+        """
+        Tests :func:`colour.graph.conversion.calibrate_conversion_graph_costs`
+        definition.
+        """
+
+        costs = dict(CONVERSION_GRAPH_EDGE_COSTS)
+        try:
+            signature = colour.graph.conversion._routing_table(
+                True)['signature']
+
+            calibrated_costs = calibrate_conversion_graph_costs(
+                [('CIE xyY', 'CIE XYZ'), ('Wavelength', 'CIE XYZ')])
+
+            self.assertListEqual(
+                list(calibrated_costs.keys()), [('cie xyy', 'cie xyz')])
+            self.assertGreater(calibrated_costs['cie xyy', 'cie xyz'], 0)
+            self.assertEqual(CONVERSION_GRAPH_EDGE_COSTS['cie xyy', 'cie xyz'],
+                             calibrated_costs['cie xyy', 'cie xyz'])
+
+            # The weighted routing table is rebuilt with the calibrated costs.
+            self.assertNotEqual(
+                colour.graph.conversion._routing_table(True)['signature'],
+                signature)
+        finally:
+            CONVERSION_GRAPH_EDGE_COSTS.clear()
+            CONVERSION_GRAPH_EDGE_COSTS.update(costs)
+            colour.graph.conversion._CACHE_CONVERSION_ROUTING_TABLES.clear()
+            colour.graph.conversion._CACHE_CONVERSION_PIPELINES.clear()
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -12,42 +12,51 @@ References
     https://sourceforge.net/projects/cinespacelutlib/
 """
 
+import hashlib
+import numpy as np
 import os
+import tempfile
+import zipfile
 
-from colour.utilities import CaseInsensitiveMapping, filter_kwargs
+from colour.utilities import (CaseInsensitiveMapping, filter_kwargs,
+                              usage_warning)
 from .lut import (AbstractLUTSequenceOperator, LUT1D, LUT3x1D, LUT3D,
-                  LUTSequence, LUT_to_LUT)
+                  LUTSequence_BakingReport, LUTSequence, LUT_to_LUT)
 from .iridas_cube import read_LUT_IridasCube, write_LUT_IridasCube
 from .resolve_cube import read_LUT_ResolveCube, write_LUT_ResolveCube
 from .sony_spi1d import read_LUT_SonySPI1D, write_LUT_SonySPI1D
 from .sony_spi3d import read_LUT_SonySPI3D, write_LUT_SonySPI3D
 from .cinespace_csp import read_LUT_Cinespace, write_LUT_Cinespace
+from .colour_binary import read_LUT_ColourBinary, write_LUT_ColourBinary
 
 __all__ = [
-    'AbstractLUTSequenceOperator', 'LUT1D', 'LUT3x1D', 'LUT3D', 'LUTSequence',
-    'LUT_to_LUT'
+    'AbstractLUTSequenceOperator', 'LUT1D', 'LUT3x1D', 'LUT3D',
+    'LUTSequence_BakingReport', 'LUTSequence', 'LUT_to_LUT'
 ]
 __all__ += ['read_LUT_IridasCube', 'write_LUT_IridasCube']
 __all__ += ['read_LUT_ResolveCube', 'write_LUT_ResolveCube']
 __all__ += ['read_LUT_SonySPI1D', 'write_LUT_SonySPI1D']
 __all__ += ['read_LUT_SonySPI3D', 'write_LUT_SonySPI3D']
 __all__ += ['read_LUT_Cinespace', 'write_LUT_Cinespace']
+__all__ += ['read_LUT_ColourBinary', 'write_LUT_ColourBinary']
 
 EXTENSION_TO_LUT_FORMAT_MAPPING = CaseInsensitiveMapping({
     '.cube': 'Iridas Cube',
     '.spi1d': 'Sony SPI1D',
     '.spi3d': 'Sony SPI3D',
-    '.csp': 'Cinespace'
+    '.csp': 'Cinespace',
+    '.lutb': 'Colour Binary',
 })
 """
 Extension to *LUT* format.
 
 EXTENSION_TO_LUT_FORMAT_MAPPING : CaseInsensitiveMapping
-    **{'.cube', '.spi1d'}**
+    **{'.cube', '.spi1d', '.spi3d', '.csp', '.lutb'}**
 """
 
 LUT_READ_METHODS = CaseInsensitiveMapping({
     'Cinespace': read_LUT_Cinespace,
+    'Colour Binary': read_LUT_ColourBinary,
     'Iridas Cube': read_LUT_IridasCube,
     'Resolve Cube': read_LUT_ResolveCube,
     'Sony SPI1D': read_LUT_SonySPI1D,
@@ -61,12 +70,120 @@ References
 :cite:`AdobeSystems2013b`, :cite:`Chamberlain2015`
 
 LUT_READ_METHODS : CaseInsensitiveMapping
-    **{'Cinespace', 'Iridas Cube', 'Resolve Cube', 'Sony SPI1D',
-    'Sony SPI3D'}**
+    **{'Cinespace', 'Colour Binary', 'Iridas Cube', 'Resolve Cube',
+    'Sony SPI1D', 'Sony SPI3D'}**
 """
 
 
-def read_LUT(path, method=None, **kwargs):
+LUT_CACHE_EXTENSION = '.npz'
+"""
+Extension appended to a *LUT* path to build its binary cache path.
+
+LUT_CACHE_EXTENSION : unicode
+"""
+
+_LUT_CACHE_CLASSES = {
+    LUT.__name__: LUT
+    for LUT in (LUT1D, LUT3x1D, LUT3D)
+}
+
+
+def _LUT_file_digest(path):
+    """
+    Returns the *SHA-1* hash of given *LUT* file.
+    """
+
+    with open(path, 'rb') as LUT_file:
+        return hashlib.sha1(LUT_file.read()).hexdigest()
+
+
+def _read_LUT_cache(path, stat, options, LUT_path):
+    """
+    Reads the *LUT* stored in given binary cache file if it has been written
+    with given reading options and given *LUT* file modification time and size
+    or, if they differ, the same *LUT* file *SHA-1* hash, returns *None*
+    otherwise.
+    """
+
+    if not os.path.exists(path):
+        return None
+
+    try:
+        with np.load(path, allow_pickle=False) as cache:
+            if str(cache['options']) != options:
+                return None
+
+            # The *LUT* file is only hashed when its modification time or size
+            # differ, e.g. if it has been copied or touched.
+            if (int(cache['mtime']) != stat.st_mtime_ns or
+                    int(cache['size']) != stat.st_size):
+                if (int(cache['size']) != stat.st_size or
+                        str(cache['digest']) != _LUT_file_digest(LUT_path)):
+                    return None
+
+            LUTs = []
+            for i in range(int(cache['count'])):
+                LUTs.append(_LUT_CACHE_CLASSES[str(cache['class_{0}'.format(
+                    i)])](
+                        cache['table_{0}'.format(i)],
+                        str(cache['name_{0}'.format(i)]),
+                        cache['domain_{0}'.format(i)],
+                        comments=list(cache['comments_{0}'.format(i)])))
+
+            is_sequence = bool(cache['sequence'])
+    except (OSError, ValueError, KeyError, EOFError,
+            zipfile.BadZipFile) as error:
+        usage_warning('"{0}" binary "LUT" cache could not be read: '
+                      '{1}'.format(path, error))
+
+        return None
+
+    return LUTSequence(*LUTs) if is_sequence else LUTs[0]
+
+
+def _write_LUT_cache(LUT, path, stat, options, LUT_path):
+    """
+    Writes given *LUT* to given binary cache file along with given reading
+    options and given *LUT* file modification time, size and *SHA-1* hash, the
+    file is replaced atomically so that concurrent readers never read a
+    partially written file.
+    """
+
+    LUTs = LUT.sequence if isinstance(LUT, LUTSequence) else [LUT]
+
+    arrays = {
+        'options': options,
+        'mtime': stat.st_mtime_ns,
+        'size': stat.st_size,
+        'digest': _LUT_file_digest(LUT_path),
+        'count': len(LUTs),
+        'sequence': int(isinstance(LUT, LUTSequence)),
+    }
+    for i, LUT_i in enumerate(LUTs):
+        arrays['class_{0}'.format(i)] = LUT_i.__class__.__name__
+        arrays['table_{0}'.format(i)] = LUT_i.table
+        arrays['name_{0}'.format(i)] = LUT_i.name
+        arrays['domain_{0}'.format(i)] = LUT_i.domain
+        arrays['comments_{0}'.format(i)] = np.array(
+            LUT_i.comments, dtype=np.unicode_)
+
+    path_temporary = None
+    try:
+        file_descriptor, path_temporary = tempfile.mkstemp(
+            '.tmp', os.path.basename(path), os.path.dirname(path) or None)
+        with os.fdopen(file_descriptor, 'wb') as cache_file:
+            np.savez(cache_file, **arrays)
+
+        os.replace(path_temporary, path)
+    except OSError as error:
+        if path_temporary is not None and os.path.exists(path_temporary):
+            os.remove(path_temporary)
+
+        usage_warning('"{0}" binary "LUT" cache could not be written: '
+                      '{1}'.format(path, error))
+
+
+def read_LUT(path, method=None, cache=False, **kwargs):
     """
     Reads given *LUT* file using given method.
 
@@ -75,14 +192,25 @@ def read_LUT(path, method=None, **kwargs):
     path : unicode
         *LUT* path.
     method : unicode, optional
-        **{None, 'Cinespace', 'Iridas Cube', 'Resolve Cube', 'Sony SPI1D',
-        'Sony SPI3D'}**, Reading method, if *None*, the method will be
-        auto-detected according to extension.
+        **{None, 'Cinespace', 'Colour Binary', 'Iridas Cube',
+        'Resolve Cube', 'Sony SPI1D', 'Sony SPI3D'}**, Reading method, if
+        *None*, the method will be auto-detected according to extension.
+    cache : bool, optional
+        Whether to use a sidecar binary cache file, i.e. ``path`` with
+        :attr:`colour.io.luts.LUT_CACHE_EXTENSION` extension appended: if the
+        cache file exists and has been written with the same reading method
+        and keyword arguments for the *LUT* file with the same modification
+        time and size, or if they differ, the same hash, the *LUT* is read
+        from the cache file, otherwise the *LUT* file is parsed and the cache
+        file is written. *Colour Binary* *LUT* files are never cached as they
+        are already read as a shared read-only :class:`numpy.memmap` class
+        instance table.
 
     Returns
     -------
-    LUT1D or LUT3x1D or LUT3D
-        :class:`LUT1D`, :class:`LUT3x1D` or :class:`LUT3D` class instance.
+    LUT1D or LUT3x1D or LUT3D or LUTSequence
+        :class:`LUT1D`, :class:`LUT3x1D`, :class:`LUT3D` or
+        :class:`LUTSequence` class instance.
 
     References
     ----------
@@ -134,11 +262,35 @@ def read_LUT(path, method=None, **kwargs):
                   [ 1.  1.  1.]]
     Size       : (4, 4, 4, 3)
     Comment 01 : Adapted from a LUT generated by Foundry::LUT.
+
+    Reading a 3D *Sony* *.spi3d* *LUT* using a binary cache:
+
+    >>> print(read_LUT(path, cache=True))  # doctest: +SKIP
+    LUT3D - Colour Correct
+    ----------------------
+    <BLANKLINE>
+    Dimensions : 3
+    Domain     : [[ 0.  0.  0.]
+                  [ 1.  1.  1.]]
+    Size       : (4, 4, 4, 3)
+    Comment 01 : Adapted from a LUT generated by Foundry::LUT.
     """
 
     if method is None:
         method = EXTENSION_TO_LUT_FORMAT_MAPPING[os.path.splitext(path)[-1]]
 
+    if cache and method.lower() != 'colour binary':
+        cache_path = path + LUT_CACHE_EXTENSION
+        stat = os.stat(path)
+        options = repr((method.lower(), sorted(kwargs.items())))
+
+        LUT = _read_LUT_cache(cache_path, stat, options, path)
+        if LUT is None:
+            LUT = read_LUT(path, method, **kwargs)
+            _write_LUT_cache(LUT, cache_path, stat, options, path)
+
+        return LUT
+
     function = LUT_READ_METHODS[method]
 
     try:
@@ -159,6 +311,7 @@ LUT_WRITE_METHODS = CaseInsensitiveMapping({
     'Sony SPI1D': write_LUT_SonySPI1D,
     'Sony SPI3D': write_LUT_SonySPI3D,
     'Cinespace': write_LUT_Cinespace,
+    'Colour Binary': write_LUT_ColourBinary,
 })
 LUT_WRITE_METHODS.__doc__ = """
 Supported *LUT* reading methods.
@@ -168,8 +321,8 @@ References
 :cite:`AdobeSystems2013b`, :cite:`Chamberlain2015`
 
 LUT_WRITE_METHODS : CaseInsensitiveMapping
-    **{'Cinespace', 'Iridas Cube', 'Resolve Cube', 'Sony SPI1D',
-    'Sony SPI3D'}**
+    **{'Cinespace', 'Colour Binary', 'Iridas Cube', 'Resolve Cube',
+    'Sony SPI1D', 'Sony SPI3D'}**
 """
 
 
@@ -187,9 +340,9 @@ def write_LUT(LUT, path, decimals=7, method=None, **kwargs):
     decimals : int, optional
         Formatting decimals.
     method : unicode, optional
-        **{None, 'Cinespace', 'Iridas Cube', 'Resolve Cube', 'Sony SPI1D',
-        'Sony SPI3D'}**, Writing method, if *None*, the method will be
-        auto-detected according to extension.
+        **{None, 'Cinespace', 'Colour Binary', 'Iridas Cube',
+        'Resolve Cube', 'Sony SPI1D', 'Sony SPI3D'}**, Writing method, if
+        *None*, the method will be auto-detected according to extension.
 
     Returns
     -------
@@ -245,4 +398,7 @@ def write_LUT(LUT, path, decimals=7, method=None, **kwargs):
     return function(LUT, path, decimals, **filter_kwargs(function, **kwargs))
 
 
-__all__ += ['LUT_READ_METHODS', 'read_LUT', 'LUT_WRITE_METHODS', 'write_LUT']
+__all__ += [
+    'LUT_READ_METHODS', 'LUT_CACHE_EXTENSION', 'read_LUT', 'LUT_WRITE_METHODS',
+    'write_LUT'
+]
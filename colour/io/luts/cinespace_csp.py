@@ -19,6 +19,7 @@ References
 import numpy as np
 
 from colour.io.luts import LUT1D, LUT3x1D, LUT3D, LUTSequence
+from colour.io.luts.common import parse_table
 from colour.utilities import tsplit, tstack, as_float_array, as_int_array
 
 __author__ = 'Colour Developers'
@@ -121,7 +122,7 @@ def read_LUT_Cinespace(path):
         """
 
         size = as_int_array(lines[0].split())
-        table = as_float_array([line.split() for line in lines[1:]])
+        table = parse_table(lines[1:])
 
         return size, table
 
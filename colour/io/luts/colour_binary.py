@@ -0,0 +1,225 @@
+# -*- coding: utf-8 -*-
+"""
+Colour Binary .lutb LUT Format Input / Output Utilities
+=======================================================
+
+Defines *Colour* *Binary* *.lutb* *LUT* Format related input / output
+utilities objects.
+
+-   :func:`colour.io.read_LUT_ColourBinary`
+-   :func:`colour.io.write_LUT_ColourBinary`
+
+The *Colour* *Binary* *.lutb* *LUT* Format stores the *LUT* table as raw
+values so that it can be opened as a read-only :class:`numpy.memmap` class
+instance: reading is independent of the table size and the operating system
+page cache shares a single copy of the table across all the processes reading
+the same file. A file is laid out as follows:
+
+-   The magic string ``\\x93COLOURLUT`` followed by the format major and minor
+    version bytes.
+-   The header length as a little-endian *uint32*.
+-   The *ASCII* *JSON* header describing the *LUT* class, name, domain,
+    comments and the table shape and dtype, padded with spaces and
+    terminated by a newline so that the table is aligned on
+    :attr:`colour.io.luts.colour_binary.ALIGNMENT_COLOUR_BINARY` bytes.
+-   The raw *C-contiguous* table.
+"""
+
+import json
+import numpy as np
+import struct
+
+from colour.io.luts import LUT1D, LUT3x1D, LUT3D, LUTSequence
+from colour.utilities import usage_warning
+
+__author__ = 'Colour Developers'
+__copyright__ = 'Copyright (C) 2013-2021 - Colour Developers'
+__license__ = 'New BSD License - https://opensource.org/licenses/BSD-3-Clause'
+__maintainer__ = 'Colour Developers'
+__email__ = 'colour-developers@colour-science.org'
+__status__ = 'Production'
+
+__all__ = [
+    'MAGIC_COLOUR_BINARY', 'VERSION_COLOUR_BINARY', 'ALIGNMENT_COLOUR_BINARY',
+    'read_LUT_ColourBinary', 'write_LUT_ColourBinary'
+]
+
+MAGIC_COLOUR_BINARY = b'\x93COLOURLUT'
+"""
+*Colour* *Binary* *.lutb* *LUT* Format magic string.
+
+MAGIC_COLOUR_BINARY : bytes
+"""
+
+VERSION_COLOUR_BINARY = (1, 0)
+"""
+*Colour* *Binary* *.lutb* *LUT* Format major and minor version.
+
+VERSION_COLOUR_BINARY : tuple
+"""
+
+ALIGNMENT_COLOUR_BINARY = 64
+"""
+*Colour* *Binary* *.lutb* *LUT* Format table alignment in bytes.
+
+ALIGNMENT_COLOUR_BINARY : int
+"""
+
+_LUT_CLASSES_COLOUR_BINARY = {
+    LUT.__name__: LUT
+    for LUT in (LUT1D, LUT3x1D, LUT3D)
+}
+
+
+def read_LUT_ColourBinary(path, mmap_mode='r'):
+    """
+    Reads given *Colour* *Binary* *.lutb* *LUT* file.
+
+    Parameters
+    ----------
+    path : unicode
+        *LUT* path.
+    mmap_mode : unicode, optional
+        **{'r', 'c', None}**, Memory-mapping mode of the table, *None* reads
+        the table in memory, see :class:`numpy.memmap` class for the other
+        modes.
+
+    Returns
+    -------
+    LUT1D or LUT3x1D or LUT3D
+        :class:`LUT1D`, :class:`LUT3x1D` or :class:`LUT3D` class instance.
+
+    Raises
+    ------
+    ValueError
+        If the file is not a *Colour* *Binary* *.lutb* *LUT* file or if its
+        major version is unsupported.
+
+    Notes
+    -----
+    -   With the default read-only ``mmap_mode``, the table is a
+        :class:`numpy.memmap` class instance that cannot be modified in place,
+        the arithmetical operations on the *LUT* return a new *LUT* as usual.
+
+    Examples
+    --------
+    >>> import os
+    >>> path = os.path.join(
+    ...     os.path.dirname(__file__), 'tests', 'resources', 'colour_binary',
+    ...     'Colour_Correct.lutb')
+    >>> print(read_LUT_ColourBinary(path))
+    LUT3D - Colour Correct
+    ----------------------
+    <BLANKLINE>
+    Dimensions : 3
+    Domain     : [[ 0.  0.  0.]
+                  [ 1.  1.  1.]]
+    Size       : (4, 4, 4, 3)
+    Comment 01 : Adapted from a LUT generated by Foundry::LUT.
+    """
+
+    with open(path, 'rb') as lutb_file:
+        magic = lutb_file.read(len(MAGIC_COLOUR_BINARY))
+        if magic != MAGIC_COLOUR_BINARY:
+            raise ValueError(
+                '"{0}" is not a "Colour Binary" "LUT" file!'.format(path))
+
+        version = tuple(lutb_file.read(2))
+        if version[0] != VERSION_COLOUR_BINARY[0]:
+            raise ValueError(
+                '"{0}" "Colour Binary" "LUT" file version "{1}" is '
+                'unsupported!'.format(path, '.'.join(map(str, version))))
+
+        header_length = struct.unpack('<I', lutb_file.read(4))[0]
+        header = json.loads(lutb_file.read(header_length).decode('ascii'))
+        offset = lutb_file.tell()
+
+        shape = tuple(header['shape'])
+        dtype = np.dtype(header['dtype'])
+        if mmap_mode is None:
+            table = np.fromfile(
+                lutb_file, dtype, int(np.prod(shape))).reshape(shape)
+
+    if mmap_mode is not None:
+        table = np.memmap(path, dtype, mmap_mode, offset, shape)
+
+    return _LUT_CLASSES_COLOUR_BINARY[header['class']](
+        table,
+        header['name'],
+        np.array(header['domain']),
+        comments=header['comments'])
+
+
+def write_LUT_ColourBinary(LUT, path, decimals=7, dtype=np.float32):
+    """
+    Writes given *LUT* to given *Colour* *Binary* *.lutb* *LUT* file.
+
+    Parameters
+    ----------
+    LUT : LUT1D or LUT3x1D or LUT3D or LUTSequence
+        :class:`LUT1D`, :class:`LUT3x1D`, :class:`LUT3D` or
+        :class:`LUTSequence` class instance to write at given path.
+    path : unicode
+        *LUT* path.
+    decimals : int, optional
+        Unused, the table values are stored as raw values.
+    dtype : type, optional
+        Floating point dtype the table is stored with.
+
+    Returns
+    -------
+    bool
+        Definition success.
+
+    Warnings
+    --------
+    -   If a :class:`LUTSequence` class instance is passed as ``LUT``, the
+        first *LUT* in the *LUT* sequence will be used.
+
+    Examples
+    --------
+    >>> from colour.algebra import spow
+    >>> domain = np.array([[-0.1, -0.2, -0.4], [1.5, 3.0, 6.0]])
+    >>> LUT = LUT3D(
+    ...     spow(LUT3D.linear_table(16, domain), 1 / 2.2),
+    ...     'My LUT',
+    ...     domain,
+    ...     comments=['A first comment.', 'A second comment.'])
+    >>> write_LUT_ColourBinary(LUT, 'My_LUT.lutb')  # doctest: +SKIP
+    """
+
+    if isinstance(LUT, LUTSequence):
+        LUT = LUT[0]
+        usage_warning('"LUT" is a "LUTSequence" instance was passed, '
+                      'using first sequence "LUT":\n'
+                      '{0}'.format(LUT))
+
+    assert isinstance(LUT, (LUT1D, LUT3x1D, LUT3D)), (
+        '"LUT" must be a 1D, 3x1D or 3D "LUT"!')
+
+    dtype = np.dtype(dtype).newbyteorder('<')
+    assert dtype.kind == 'f', '"dtype" must be a floating point dtype!'
+
+    table = np.ascontiguousarray(LUT.table, dtype)
+
+    header = json.dumps({
+        'class': LUT.__class__.__name__,
+        'name': LUT.name,
+        'domain': LUT.domain.tolist(),
+        'comments': list(LUT.comments),
+        'shape': table.shape,
+        'dtype': dtype.str,
+    }).encode('ascii')
+
+    preamble_length = len(MAGIC_COLOUR_BINARY) + 2 + 4
+    padding = -(preamble_length + len(header) + 1) % ALIGNMENT_COLOUR_BINARY
+    header += b' ' * padding + b'\n'
+
+    with open(path, 'wb') as lutb_file:
+        lutb_file.write(MAGIC_COLOUR_BINARY)
+        lutb_file.write(bytes(VERSION_COLOUR_BINARY))
+        lutb_file.write(struct.pack('<I', len(header)))
+        lutb_file.write(header)
+        lutb_file.write(table.tobytes())
+
+    return True
@@ -7,9 +7,12 @@ Defines LUT Processing common utilities objects that don't fall in any specific
 category.
 """
 
+import numpy as np
 import os
 import re
 
+from colour.constants import DEFAULT_FLOAT_DTYPE
+
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2021 - Colour Developers'
 __license__ = 'New BSD License - https://opensource.org/licenses/BSD-3-Clause'
@@ -17,7 +20,7 @@ __maintainer__ = 'Colour Developers'
 __email__ = 'colour-developers@colour-science.org'
 __status__ = 'Production'
 
-__all__ = ['path_to_title']
+__all__ = ['path_to_title', 'parse_table']
 
 
 def path_to_title(path):
@@ -43,3 +46,46 @@ def path_to_title(path):
     """
 
     return re.sub('_|-|\\.', ' ', os.path.splitext(os.path.basename(path))[0])
+
+
+def parse_table(lines, columns=3):
+    """
+    Converts given lines of whitespace separated numbers to a table in a
+    single pass.
+
+    The lines are joined and converted at once by *Numpy* instead of being
+    split and converted individually, which is significantly faster for large
+    *LUT* files.
+
+    Parameters
+    ----------
+    lines : array_like
+        Lines of whitespace separated numbers.
+    columns : int, optional
+        Table columns count.
+
+    Returns
+    -------
+    ndarray
+        Table of shape (N, ``columns``).
+
+    Raises
+    ------
+    ValueError
+        If the lines contain non-numeric tokens or if the numbers count is not
+        a multiple of the columns count.
+
+    Examples
+    --------
+    >>> parse_table(['0.0 0.5 1.0', '1.0 0.5 0.0'])
+    array([[ 0. ,  0.5,  1. ],
+           [ 1. ,  0.5,  0. ]])
+    """
+
+    table = np.array(' '.join(lines).split(), dtype=DEFAULT_FLOAT_DTYPE)
+
+    if table.size % columns != 0:
+        raise ValueError(
+            'Table numbers count is not a multiple of "{0}"!'.format(columns))
+
+    return table.reshape([-1, columns])
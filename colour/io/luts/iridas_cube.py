@@ -18,7 +18,7 @@ import numpy as np
 
 from colour.constants import DEFAULT_INT_DTYPE
 from colour.io.luts import LUT1D, LUT3x1D, LUT3D, LUTSequence
-from colour.io.luts.common import path_to_title
+from colour.io.luts.common import path_to_title, parse_table
 from colour.utilities import as_float_array, usage_warning
 
 __author__ = 'Colour Developers'
@@ -115,6 +115,11 @@ def read_LUT_IridasCube(path):
                 comments.append(line[1:].strip())
                 continue
 
+            # Table lines are converted at once after the file is read.
+            if not line[0].isalpha():
+                table.append(line)
+                continue
+
             tokens = line.split()
             if tokens[0] == 'TITLE':
                 title = ' '.join(tokens[1:])[1:-1]
@@ -129,9 +134,9 @@ def read_LUT_IridasCube(path):
                 dimensions = 3
                 size = DEFAULT_INT_DTYPE(tokens[1])
             else:
-                table.append(tokens)
+                table.append(line)
 
-    table = as_float_array(table)
+    table = parse_table(table)
     if dimensions == 2:
         return LUT3x1D(
             table,
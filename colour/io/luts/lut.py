@@ -9,19 +9,27 @@ Defines the classes and definitions handling *LUT* processing:
 -   :class:`colour.LUT3x1D`
 -   :class:`colour.LUT3D`
 -   :class:`colour.LUTSequence`
+-   :class:`colour.io.LUTSequence_BakingReport`
 -   :class:`colour.io.LUT_to_LUT`
 """
 
 import numpy as np
 import re
 from abc import ABC, abstractmethod
+from collections import namedtuple
 from collections.abc import MutableSequence
+from concurrent.futures import ThreadPoolExecutor
 from copy import deepcopy
+from functools import partial
 from operator import (add, mul, pow, sub, truediv, iadd, imul, ipow, isub,
                       itruediv)
+from scipy.spatial import cKDTree
 
-from colour.algebra import LinearInterpolator, table_interpolation_trilinear
-from colour.constants import DEFAULT_INT_DTYPE
+from colour.algebra import (LinearInterpolator, TABLE_INTERPOLATION_METHODS,
+                            random_triplet_generator,
+                            table_interpolation_trilinear,
+                            table_interpolation_tetrahedral)
+from colour.constants import DEFAULT_FLOAT_DTYPE, DEFAULT_INT_DTYPE
 from colour.utilities import (as_float_array, is_numeric, is_iterable,
                               is_string, full, linear_conversion,
                               runtime_warning, tsplit, tstack, usage_warning)
@@ -35,10 +43,306 @@ __status__ = 'Production'
 
 __all__ = [
     'AbstractLUT', 'LUT1D', 'LUT3x1D', 'LUT3D', 'LUT_to_LUT',
-    'AbstractLUTSequenceOperator', 'LUTSequence'
+    'AbstractLUTSequenceOperator', 'LUTSequence_BakingReport', 'LUTSequence'
 ]
 
 
+_TILE_SIZE_LUT3D_APPLY = 2 ** 14
+"""
+Number of pixels processed at once by :meth:`colour.LUT3D.apply` method
+optimised engine, chosen so that the per-tile temporary arrays fit in the
+processor cache.
+
+_TILE_SIZE_LUT3D_APPLY : int
+"""
+
+
+def _vertices_flat_indexes(V_xyz, size, strides):
+    """
+    Computes the flattened table index of the lower vertex encompassing given
+    normalised :math:`V_{xyz}` values, the per-axis flattened offsets to the
+    upper vertex and the relative :math:`V_{xyzr}` coordinates.
+
+    Parameters
+    ----------
+    V_xyz : ndarray
+        Normalised and clipped :math:`V_{xyz}` values of shape (N, 3).
+    size : ndarray
+        Table size on each axis.
+    strides : ndarray
+        Flattened table strides on each axis.
+
+    Returns
+    -------
+    tuple
+        Lower vertex flattened indexes, upper vertex per-axis offsets and
+        relative :math:`V_{xyzr}` coordinates.
+    """
+
+    i_m = size - 1
+    V_xyzr = V_xyz * i_m.astype(V_xyz.dtype)
+
+    # The lower vertex index is clamped to the last vertex so that
+    # "V_xyz == 1" yields null relative coordinates, "nan" values are mapped
+    # to the first vertex and propagated through the relative coordinates.
+    i_f = np.minimum(np.nan_to_num(V_xyzr).astype(np.intp), i_m)
+    V_xyzr -= i_f
+
+    offsets = (i_f < i_m) * strides
+
+    return np.dot(i_f, strides), offsets, V_xyzr
+
+
+def _table_interpolation_trilinear_flat(V_xyz, table, size, strides, out):
+    """
+    Performs trilinear interpolation of given normalised :math:`V_{xyz}`
+    values using given flattened interpolation table.
+
+    Parameters
+    ----------
+    V_xyz : ndarray
+        Normalised and clipped :math:`V_{xyz}` values of shape (N, 3).
+    table : ndarray
+        Flattened interpolation table of shape (M, 3).
+    size : ndarray
+        Table size on each axis.
+    strides : ndarray
+        Flattened table strides on each axis.
+    out : ndarray
+        Array of shape (N, 3) receiving the interpolated values, the table
+        vertices are cast to its dtype once fetched.
+    """
+
+    i, offsets, V_xyzr = _vertices_flat_indexes(V_xyz, size, strides)
+    d_x, d_y, d_z = offsets.T
+    x, y, z = V_xyzr.T[..., np.newaxis]
+
+    def lerp(a, b, t):
+        """
+        Linearly interpolates between given arrays inplace.
+        """
+
+        b -= a
+        b *= t
+        b += a
+
+        return b
+
+    def vertex(index):
+        """
+        Returns the table vertices at given flattened indexes.
+        """
+
+        return np.take(table, index, axis=0, mode='clip').astype(
+            out.dtype, copy=False)
+
+    V_00 = lerp(vertex(i), vertex(i + d_z), z)
+    V_01 = lerp(vertex(i + d_y), vertex(i + d_y + d_z), z)
+    V_10 = lerp(vertex(i + d_x), vertex(i + d_x + d_z), z)
+    V_11 = lerp(vertex(i + d_x + d_y), vertex(i + d_x + d_y + d_z), z)
+
+    out[...] = lerp(lerp(V_00, V_01, y), lerp(V_10, V_11, y), x)
+
+
+def _table_interpolation_tetrahedral_flat(V_xyz, table, size, strides, out):
+    """
+    Performs tetrahedral interpolation of given normalised :math:`V_{xyz}`
+    values using given flattened interpolation table.
+
+    Parameters
+    ----------
+    V_xyz : ndarray
+        Normalised and clipped :math:`V_{xyz}` values of shape (N, 3).
+    table : ndarray
+        Flattened interpolation table of shape (M, 3).
+    size : ndarray
+        Table size on each axis.
+    strides : ndarray
+        Flattened table strides on each axis.
+    out : ndarray
+        Array of shape (N, 3) receiving the interpolated values, the table
+        vertices are cast to its dtype once fetched.
+
+    Notes
+    -----
+    -   The tetrahedron encompassing a given :math:`V_{xyz}` value is selected
+        by sorting its relative coordinates in descending order, only its 4
+        vertices are fetched from the table.
+    """
+
+    i, offsets, V_xyzr = _vertices_flat_indexes(V_xyz, size, strides)
+
+    order = np.argsort(-V_xyzr, axis=-1)
+    r_1, r_2, r_3 = np.take_along_axis(V_xyzr, order, -1).T[..., np.newaxis]
+    o_1, o_2, o_3 = np.cumsum(
+        np.take_along_axis(offsets, order, -1), axis=-1).T + i
+
+    V = np.take(table, i, axis=0, mode='clip').astype(out.dtype, copy=False)
+    V *= 1 - r_1
+    V += np.take(table, o_1, axis=0, mode='clip') * (r_1 - r_2)
+    V += np.take(table, o_2, axis=0, mode='clip') * (r_2 - r_3)
+    V += np.take(table, o_3, axis=0, mode='clip') * r_3
+
+    out[...] = V
+
+
+_TABLE_INTERPOLATION_FLAT_KERNELS = {
+    table_interpolation_trilinear: _table_interpolation_trilinear_flat,
+    table_interpolation_tetrahedral: _table_interpolation_tetrahedral_flat,
+}
+"""
+Table interpolation methods supported by :meth:`colour.LUT3D.apply` method
+optimised engine and their flattened table kernels.
+
+_TABLE_INTERPOLATION_FLAT_KERNELS : dict
+"""
+
+
+def _as_table_array(table):
+    """
+    Converts given table to an array of *float* dtype, tables memory-mapped
+    to a file are returned as is so that they are neither copied nor cast and
+    keep being shared with the other processes mapping the same file.
+
+    Parameters
+    ----------
+    table : array_like
+        Table to convert.
+
+    Returns
+    -------
+    ndarray
+        Converted table.
+    """
+
+    if isinstance(table, np.memmap) and table.filename is not None:
+        return table
+
+    return as_float_array(table)
+
+
+def _invert_monotonic_table(samples, table, size, interpolator,
+                            interpolator_kwargs):
+    """
+    Inverts given monotonic 1D table sampled at given samples by reverse
+    interpolation.
+
+    Parameters
+    ----------
+    samples : array_like
+        Samples the table is defined at.
+    table : array_like
+        Monotonic table to invert.
+    size : int
+        Inverse table size.
+    interpolator : object
+        Interpolator class type to use as interpolating function.
+    interpolator_kwargs : dict_like
+        Arguments to use when instantiating the interpolating function.
+
+    Returns
+    -------
+    tuple
+        Inverse table domain and inverse table sampled regularly across it.
+
+    Raises
+    ------
+    ValueError
+        If the table is not monotonic.
+    """
+
+    samples, table = as_float_array(samples), as_float_array(table)
+
+    delta = np.diff(table)
+    if (not (np.all(delta >= 0) or np.all(delta <= 0)) or
+            table[0] == table[-1]):
+        raise ValueError('"LUT" table must be monotonic to be inverted!')
+
+    if table[-1] < table[0]:
+        samples, table = samples[::-1], table[::-1]
+
+    domain = np.array([table[0], table[-1]])
+
+    return domain, interpolator(table, samples, **interpolator_kwargs)(
+        np.linspace(domain[0], domain[1], size))
+
+
+def _apply_by_row_tiles(function, RGB, workers=None, out=None):
+    """
+    Applies given function to given *RGB* colourspace array by tiles of rows
+    processed concurrently by a pool of threads writing into a shared output
+    array.
+
+    Parameters
+    ----------
+    function : callable
+        Point-wise function to apply, it must return an array with the same
+        shape than its input.
+    RGB : array_like
+        *RGB* colourspace array to apply the function onto.
+    workers : int, optional
+        Number of threads, if *None* or 1, the function is applied serially.
+    out : ndarray, optional
+        Array with the same shape than the *RGB* colourspace array receiving
+        the processed values.
+
+    Returns
+    -------
+    ndarray
+        Processed *RGB* colourspace array.
+
+    Notes
+    -----
+    -   *Numpy* releases the *GIL* for most of the array operations performed
+        on large arrays, allowing the threads to run in parallel.
+    -   As the function is point-wise, the results are identical to those of
+        the serial code path.
+    """
+
+    RGB = np.asarray(RGB)
+
+    if out is not None and out.shape != RGB.shape:
+        raise ValueError(
+            '"out" array shape "{0}" is not compatible with "{1}" "RGB" '
+            'colourspace array shape!'.format(out.shape, RGB.shape))
+
+    rows = RGB.shape[0] if RGB.ndim > 1 else 1
+    if workers is None or workers <= 1 or rows == 1:
+        RGB_o = function(RGB)
+
+        if out is None:
+            return RGB_o
+
+        out[...] = RGB_o
+
+        return out
+
+    bounds = np.linspace(0, rows, min(rows, workers * 4) + 1)
+    tiles = [
+        slice(start, end) for start, end in zip(
+            bounds[:-1].astype(DEFAULT_INT_DTYPE),
+            bounds[1:].astype(DEFAULT_INT_DTYPE))
+    ]
+
+    RGB_o = function(RGB[tiles[0]])
+    if out is None:
+        out = np.empty(RGB.shape, RGB_o.dtype)
+    out[tiles[0]] = RGB_o
+
+    def apply_tile(tile):
+        """
+        Applies the function to given tile of rows.
+        """
+
+        out[tile] = function(RGB[tile])
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        # Consuming the iterator to propagate the exceptions.
+        list(executor.map(apply_tile, tiles[1:]))
+
+    return out
+
+
 class AbstractLUT(ABC):
     """
     Defines the base class for *LUT*.
@@ -94,6 +398,7 @@ class AbstractLUT(ABC):
     -   :meth:`~colour.io.luts.lut.AbstractLUT.is_domain_explicit`
     -   :meth:`~colour.io.luts.lut.AbstractLUT.linear_table`
     -   :meth:`~colour.io.luts.lut.AbstractLUT.apply`
+    -   :meth:`~colour.io.luts.lut.AbstractLUT.invert`
     -   :meth:`~colour.io.luts.lut.AbstractLUT.copy`
     -   :meth:`~colour.io.luts.lut.AbstractLUT.as_LUT`
     """
@@ -710,6 +1015,25 @@ class AbstractLUT(ABC):
 
         return deepcopy(self)
 
+    @abstractmethod
+    def invert(self, **kwargs):
+        """
+        Computes and returns an inverse copy of the *LUT*.
+
+        Other Parameters
+        ----------------
+        \\**kwargs : dict, optional
+            Keywords arguments, e.g. the inverse *LUT* size, please refer to
+            the documentation of the sub-classes.
+
+        Returns
+        -------
+        AbstractLUT
+            Inverse *LUT* class instance.
+        """
+
+        pass
+
     @abstractmethod
     def as_LUT(self, cls, force_conversion, **kwargs):
         """
@@ -775,6 +1099,7 @@ class LUT1D(AbstractLUT):
     -   :meth:`~colour.LUT1D.is_domain_explicit`
     -   :meth:`~colour.LUT1D.linear_table`
     -   :meth:`~colour.LUT1D.apply`
+    -   :meth:`~colour.LUT1D.invert`
     -   :meth:`~colour.LUT1D.as_LUT`
 
     Examples
@@ -845,7 +1170,7 @@ class LUT1D(AbstractLUT):
             Validated table as a :class:`ndarray` instance.
         """
 
-        table = as_float_array(table)
+        table = _as_table_array(table)
 
         assert len(table.shape) == 1, 'The table must be a 1D array!'
 
@@ -942,7 +1267,8 @@ class LUT1D(AbstractLUT):
     def apply(self,
               RGB,
               interpolator=LinearInterpolator,
-              interpolator_kwargs=None):
+              interpolator_kwargs=None,
+              workers=None):
         """
         Applies the *LUT* to given *RGB* colourspace array using given method.
 
@@ -954,6 +1280,10 @@ class LUT1D(AbstractLUT):
             Interpolator class type to use as interpolating function.
         interpolator_kwargs : dict_like, optional
             Arguments to use when instantiating the interpolating function.
+        workers : int, optional
+            Number of threads applying the *LUT* concurrently to tiles of rows
+            of the *RGB* colourspace array, if *None* or 1, the *LUT* is
+            applied serially.
 
         Returns
         -------
@@ -968,6 +1298,13 @@ class LUT1D(AbstractLUT):
         array([ 0.4529220...,  0.4529220...,  0.4529220...])
         """
 
+        if workers is not None and workers > 1:
+            return _apply_by_row_tiles(
+                partial(
+                    self.apply,
+                    interpolator=interpolator,
+                    interpolator_kwargs=interpolator_kwargs), RGB, workers)
+
         if interpolator_kwargs is None:
             interpolator_kwargs = {}
 
@@ -983,6 +1320,68 @@ class LUT1D(AbstractLUT):
 
         return RGB_interpolator(RGB)
 
+    def invert(self,
+               size=None,
+               interpolator=LinearInterpolator,
+               interpolator_kwargs=None):
+        """
+        Computes and returns an inverse copy of the *LUT* by reverse
+        interpolation of its monotonic table.
+
+        Parameters
+        ----------
+        size : int, optional
+            Inverse *LUT* size, default to the *LUT* size.
+        interpolator : object, optional
+            Interpolator class type to use as interpolating function.
+        interpolator_kwargs : dict_like, optional
+            Arguments to use when instantiating the interpolating function.
+
+        Returns
+        -------
+        LUT1D
+            Inverse *LUT* class instance whose domain is the *LUT* table
+            range.
+
+        Raises
+        ------
+        ValueError
+            If the *LUT* table is not monotonic.
+
+        Examples
+        --------
+        >>> LUT = LUT1D(LUT1D.linear_table(16) ** 2, 'My LUT')
+        >>> print(LUT.invert())
+        LUT1D - My LUT - Inverse
+        ------------------------
+        <BLANKLINE>
+        Dimensions : 1
+        Domain     : [ 0.  1.]
+        Size       : (16,)
+        >>> LUT.apply(LUT.invert(32).table[8])  # doctest: +ELLIPSIS
+        0.2580645...
+        """
+
+        if interpolator_kwargs is None:
+            interpolator_kwargs = {}
+
+        if self.is_domain_explicit():
+            samples = self.domain
+        else:
+            domain_min, domain_max = self.domain
+
+            samples = np.linspace(domain_min, domain_max, self._table.size)
+
+        domain, table = _invert_monotonic_table(
+            samples, self._table, self._table.size if size is None else size,
+            interpolator, interpolator_kwargs)
+
+        return LUT1D(
+            table,
+            '{0} - Inverse'.format(self.name),
+            domain,
+            comments=self.comments)
+
     def as_LUT(self, cls, force_conversion=False, **kwargs):
         """
         Converts the *LUT* to given ``cls`` class instance.
@@ -1074,6 +1473,7 @@ class LUT3x1D(AbstractLUT):
     -   :meth:`~colour.LUT3x1D.is_domain_explicit`
     -   :meth:`~colour.LUT3x1D.linear_table`
     -   :meth:`~colour.LUT3x1D.apply`
+    -   :meth:`~colour.LUT3x1D.invert`
     -   :meth:`~colour.LUT3x1D.as_LUT`
 
     Examples
@@ -1148,7 +1548,7 @@ class LUT3x1D(AbstractLUT):
             Validated table as a :class:`ndarray` instance.
         """
 
-        table = as_float_array(table)
+        table = _as_table_array(table)
 
         assert len(table.shape) == 2, 'The table must be a 2D array!'
 
@@ -1304,7 +1704,8 @@ class LUT3x1D(AbstractLUT):
     def apply(self,
               RGB,
               interpolator=LinearInterpolator,
-              interpolator_kwargs=None):
+              interpolator_kwargs=None,
+              workers=None):
         """
         Applies the *LUT* to given *RGB* colourspace array using given method.
 
@@ -1316,6 +1717,10 @@ class LUT3x1D(AbstractLUT):
             Interpolator class type to use as interpolating function.
         interpolator_kwargs : dict_like, optional
             Arguments to use when instantiating the interpolating function.
+        workers : int, optional
+            Number of threads applying the *LUT* concurrently to tiles of rows
+            of the *RGB* colourspace array, if *None* or 1, the *LUT* is
+            applied serially.
 
         Returns
         -------
@@ -1347,6 +1752,13 @@ class LUT3x1D(AbstractLUT):
         array([ 0.2996370..., -0.0901332..., -0.3949770...])
         """
 
+        if workers is not None and workers > 1:
+            return _apply_by_row_tiles(
+                partial(
+                    self.apply,
+                    interpolator=interpolator,
+                    interpolator_kwargs=interpolator_kwargs), RGB, workers)
+
         if interpolator_kwargs is None:
             interpolator_kwargs = {}
 
@@ -1380,6 +1792,83 @@ class LUT3x1D(AbstractLUT):
 
         return tstack(RGB_i)
 
+    def invert(self,
+               size=None,
+               interpolator=LinearInterpolator,
+               interpolator_kwargs=None):
+        """
+        Computes and returns an inverse copy of the *LUT* by reverse
+        interpolation of its monotonic table channels.
+
+        Parameters
+        ----------
+        size : int, optional
+            Inverse *LUT* size, default to the *LUT* size.
+        interpolator : object, optional
+            Interpolator class type to use as interpolating function.
+        interpolator_kwargs : dict_like, optional
+            Arguments to use when instantiating the interpolating function.
+
+        Returns
+        -------
+        LUT3x1D
+            Inverse *LUT* class instance whose domain is the *LUT* table
+            channels range.
+
+        Raises
+        ------
+        ValueError
+            If any of the *LUT* table channels is not monotonic.
+
+        Examples
+        --------
+        >>> LUT = LUT3x1D(LUT3x1D.linear_table(16) ** (1, 2, 3), 'My LUT')
+        >>> print(LUT.invert())
+        LUT3x1D - My LUT - Inverse
+        --------------------------
+        <BLANKLINE>
+        Dimensions : 2
+        Domain     : [[ 0.  0.  0.]
+                      [ 1.  1.  1.]]
+        Size       : (16, 3)
+        >>> LUT.apply(LUT.invert(32).table[8])  # doctest: +ELLIPSIS
+        array([ 0.2580645...,  0.2580645...,  0.2580645...])
+        """
+
+        if interpolator_kwargs is None:
+            interpolator_kwargs = {}
+
+        if self.is_domain_explicit():
+            samples = [
+                axes[:(~np.isnan(axes)).cumsum().argmax() + 1]
+                for axes in np.transpose(self.domain)
+            ]
+            tables = [
+                axes[:len(samples[i])]
+                for i, axes in enumerate(np.transpose(self._table))
+            ]
+        else:
+            domain_min, domain_max = self.domain
+            samples = [
+                np.linspace(domain_min[i], domain_max[i],
+                            self._table.shape[0]) for i in range(3)
+            ]
+            tables = tsplit(self._table)
+
+        if size is None:
+            size = max(len(table) for table in tables)
+
+        domains, tables = zip(*[
+            _invert_monotonic_table(samples[i], tables[i], size, interpolator,
+                                    interpolator_kwargs) for i in range(3)
+        ])
+
+        return LUT3x1D(
+            tstack(tables),
+            '{0} - Inverse'.format(self.name),
+            tstack(domains),
+            comments=self.comments)
+
     def as_LUT(self, cls, force_conversion=False, **kwargs):
         """
         Converts the *LUT* to given ``cls`` class instance.
@@ -1471,6 +1960,7 @@ class LUT3D(AbstractLUT):
     -   :meth:`~colour.LUT3D.is_domain_explicit`
     -   :meth:`~colour.LUT3D.linear_table`
     -   :meth:`~colour.LUT3D.apply`
+    -   :meth:`~colour.LUT3D.invert`
     -   :meth:`~colour.LUT3D.as_LUT`
 
     Examples
@@ -1527,6 +2017,8 @@ class LUT3D(AbstractLUT):
         if domain is None:
             domain = np.array([[0, 0, 0], [1, 1, 1]])
 
+        self._table_flat = None
+
         super(LUT3D, self).__init__(table, name, 3, domain, size, comments)
 
     def _validate_table(self, table):
@@ -1544,7 +2036,7 @@ class LUT3D(AbstractLUT):
             Validated table as a :class:`ndarray` instance.
         """
 
-        table = as_float_array(table)
+        table = _as_table_array(table)
 
         assert len(table.shape) == 4, 'The table must be a 4D array!'
 
@@ -1770,10 +2262,39 @@ class LUT3D(AbstractLUT):
 
         return table
 
+    def _flattened_table(self):
+        """
+        Returns the flattened underlying *LUT* table along with its size and
+        strides on each axis, they are computed once and reused as long as the
+        underlying *LUT* table is not replaced.
+
+        Returns
+        -------
+        tuple
+            Flattened table, table size and table strides.
+        """
+
+        if (self._table_flat is not None and
+                self._table_flat[0] is self._table):
+            return self._table_flat[1:]
+
+        size = np.array(self._table.shape[:-1])
+        strides = np.array([size[1] * size[2], size[2], 1])
+        table_flat = (np.reshape(self._table, (-1, 3)), size, strides)
+
+        # Non-contiguous tables are copied when flattened and thus cannot be
+        # reused as they would not reflect in-place modifications.
+        if self._table.flags.c_contiguous:
+            self._table_flat = (self._table, ) + table_flat
+
+        return table_flat
+
     def apply(self,
               RGB,
               interpolator=table_interpolation_trilinear,
-              interpolator_kwargs=None):
+              interpolator_kwargs=None,
+              out=None,
+              workers=None):
         """
         Applies the *LUT* to given *RGB* colourspace array using given method.
 
@@ -1785,12 +2306,30 @@ class LUT3D(AbstractLUT):
             Interpolator object to use as interpolating function.
         interpolator_kwargs : dict_like, optional
             Arguments to use when calling the interpolating function.
+        out : ndarray, optional
+            Contiguous array with the same shape than the *RGB* colourspace
+            array receiving the interpolated values.
+        workers : int, optional
+            Number of threads applying the *LUT* concurrently to tiles of rows
+            of the *RGB* colourspace array, if *None* or 1, the *LUT* is
+            applied serially.
 
         Returns
         -------
         ndarray
             Interpolated *RGB* colourspace array.
 
+        Notes
+        -----
+        -   With the :func:`colour.algebra.table_interpolation_trilinear` and
+            :func:`colour.algebra.table_interpolation_tetrahedral`
+            interpolators and no interpolator arguments, an optimised engine
+            is used: the *RGB* colourspace array is processed by tiles small
+            enough to stay in the processor cache, each vertex is fetched from
+            the flattened *LUT* table with a single indexing operation and the
+            computations are performed in single precision if the *RGB*
+            colourspace array is single precision.
+
         Examples
         --------
         >>> LUT = LUT3D(LUT3D.linear_table() ** (1 / 2.2))
@@ -1810,11 +2349,17 @@ class LUT3D(AbstractLUT):
         array([ 0.2996370..., -0.0901332..., -0.3949770...])
         """
 
+        if workers is not None and workers > 1:
+            return _apply_by_row_tiles(
+                partial(
+                    self.apply,
+                    interpolator=interpolator,
+                    interpolator_kwargs=interpolator_kwargs), RGB, workers,
+                out)
+
         if interpolator_kwargs is None:
             interpolator_kwargs = {}
 
-        R, G, B = tsplit(RGB)
-
         if self.is_domain_explicit():
             domain_min = self.domain[0, ...]
             domain_max = [
@@ -1829,12 +2374,247 @@ class LUT3D(AbstractLUT):
         else:
             domain_min, domain_max = self.domain
 
-        RGB_l = [
-            linear_conversion(j, (domain_min[i], domain_max[i]), (0, 1))
-            for i, j in enumerate((R, G, B))
-        ]
+        kernel = _TABLE_INTERPOLATION_FLAT_KERNELS.get(interpolator)
+        if kernel is None or interpolator_kwargs:
+            R, G, B = tsplit(RGB)
+
+            RGB_l = [
+                linear_conversion(j, (domain_min[i], domain_max[i]), (0, 1))
+                for i, j in enumerate((R, G, B))
+            ]
+
+            RGB_i = interpolator(
+                tstack(RGB_l), self._table, **interpolator_kwargs)
+
+            if out is None:
+                return RGB_i
+
+            out[...] = RGB_i
+
+            return out
+
+        RGB = np.asarray(RGB)
+        dtype = (np.float32
+                 if RGB.dtype == np.float32 else DEFAULT_FLOAT_DTYPE)
+
+        if out is None:
+            out = np.empty(RGB.shape, dtype)
+        elif out.shape != RGB.shape:
+            raise ValueError(
+                '"out" array shape "{0}" is not compatible with "{1}" "RGB" '
+                'colourspace array shape!'.format(out.shape, RGB.shape))
+
+        RGB_f, out_f = np.reshape(RGB, (-1, 3)), np.reshape(out, (-1, 3))
+        if out.size != 0 and not np.may_share_memory(out_f, out):
+            raise ValueError('"out" array must be contiguous!')
+
+        # The table is never cast as a whole, e.g. a single precision
+        # memory-mapped table stays shared, only the fetched vertices are.
+        table, size, strides = self._flattened_table()
+        domain_min = np.asarray(domain_min, dtype)
+        domain_range = np.asarray(domain_max, dtype) - domain_min
+
+        for i in range(0, RGB_f.shape[0], _TILE_SIZE_LUT3D_APPLY):
+            V_xyz = RGB_f[i:i + _TILE_SIZE_LUT3D_APPLY].astype(dtype)
+            V_xyz -= domain_min
+            V_xyz /= domain_range
+            np.clip(V_xyz, 0, 1, out=V_xyz)
+
+            kernel(V_xyz, table, size, strides,
+                   out_f[i:i + _TILE_SIZE_LUT3D_APPLY])
+
+        return out
+
+    def invert(self,
+               size=None,
+               domain=None,
+               interpolator=table_interpolation_trilinear,
+               extrapolate=False,
+               query_size=4,
+               iterations=16,
+               tolerance=1e-10):
+        """
+        Computes and returns an inverse copy of the *LUT*.
+
+        The *LUT* table is treated as scattered data: the inverse table samples
+        are initialised with the inverse distance weighted mean of the input
+        samples whose *LUT* table points are the nearest to them, found with a
+        *KD-tree*, and then refined with *Gauss-Newton* iterations on the
+        *LUT* function.
+
+        Parameters
+        ----------
+        size : int, optional
+            Inverse *LUT* size, default to the *LUT* size.
+        domain : array_like, optional
+            Inverse *LUT* domain, default to the *LUT* table bounding box.
+        interpolator : callable, optional
+            Interpolator used to apply the *LUT* while refining the inverse
+            table samples.
+        extrapolate : bool, optional
+            Whether to linearly extrapolate the *LUT* by one cell beyond its
+            domain, allowing the inverse table samples to exceed it, e.g. for
+            the inverse domain points outside the *LUT* table gamut.
+        query_size : int, optional
+            Number of nearest *LUT* table points used to initialise the
+            inverse table samples.
+        iterations : int, optional
+            Maximum number of *Gauss-Newton* iterations.
+        tolerance : numeric, optional
+            Residual error under which an inverse table sample is deemed to
+            have converged.
+
+        Returns
+        -------
+        LUT3D
+            Inverse *LUT* class instance.
+
+        Raises
+        ------
+        ValueError
+            If the *LUT* explicit domain nodes count does not match the *LUT*
+            table size on every axis.
+
+        Notes
+        -----
+        -   The inverse domain points outside the *LUT* table gamut converge
+            toward the input samples minimising the residual error, i.e. the
+            inverse is clipped to the *LUT* domain or its extrapolated
+            cell.
+        -   With an explicit domain, the *LUT* is inverted as the piecewise
+            linear function through its domain nodes.
+
+        Examples
+        --------
+        >>> LUT = LUT3D(LUT3D.linear_table(9) ** (1 / 2.2), 'My LUT')
+        >>> print(LUT.invert())
+        LUT3D - My LUT - Inverse
+        ------------------------
+        <BLANKLINE>
+        Dimensions : 3
+        Domain     : [[ 0.  0.  0.]
+                      [ 1.  1.  1.]]
+        Size       : (9, 9, 9, 3)
+        >>> RGB = np.array([0.18, 0.18, 0.18])
+        >>> LUT.invert(33).apply(LUT.apply(RGB))  # doctest: +ELLIPSIS
+        array([ 0.18...,  0.18...,  0.18...])
+        """
+
+        shape = np.array(self._table.shape[:-1])
+
+        if self.is_domain_explicit():
+            nodes = [
+                axes[:(~np.isnan(axes)).cumsum().argmax() + 1]
+                for axes in np.transpose(self.domain)
+            ]
+            if [len(axes) for axes in nodes] != list(shape):
+                raise ValueError(
+                    '"LUT" explicit domain does not define the nodes of its '
+                    'table, it cannot be inverted!')
+        else:
+            nodes = [
+                np.linspace(self.domain[0, i], self.domain[1, i], shape[i])
+                for i in range(3)
+            ]
+
+        # The inverse table samples are computed in the "LUT" table index
+        # space, i.e. on a uniform domain, and then mapped to the "LUT"
+        # domain nodes, so that explicit non-uniform domains are supported.
+        domain_f = np.vstack([np.zeros(3), shape - 1])
+        table_f = self._table
+
+        if extrapolate:
+            domain_f = domain_f + [[-1], [1]]
+            table_f = np.pad(
+                table_f, [(1, 1), (1, 1), (1, 1), (0, 0)],
+                mode='reflect',
+                reflect_type='odd')
+            shape = shape + 2
+
+        LUT_f = LUT3D(table_f, domain=domain_f)
+
+        if size is None:
+            size = self.size
+
+        if domain is None:
+            table = np.reshape(self._table, (-1, 3))
+            domain = np.vstack([np.min(table, 0), np.max(table, 0)])
+
+        domain = as_float_array(domain)
 
-        return interpolator(tstack(RGB_l), self._table, **interpolator_kwargs)
+        samples = np.reshape(LUT_f.linear_table(shape, domain_f), (-1, 3))
+        points = np.reshape(LUT3D.linear_table(size, domain), (-1, 3))
+
+        tree = cKDTree(
+            np.reshape(table_f, (-1, 3)),
+            balanced_tree=False,
+            compact_nodes=False)
+        distances, indexes = tree.query(points, query_size)
+        distances = np.reshape(distances, (points.shape[0], -1))
+        indexes = np.reshape(indexes, (points.shape[0], -1))
+        weights = 1 / np.maximum(distances, np.finfo(DEFAULT_FLOAT_DTYPE).eps)
+        weights /= np.sum(weights, -1)[..., np.newaxis]
+
+        RGB = np.einsum('...i,...ij->...j', weights, samples[indexes])
+
+        # The "Jacobian" of the "LUT" function is estimated with finite
+        # differences taken inward of the domain.
+        h = (domain_f[1] - domain_f[0]) * 1e-6
+        active = np.arange(points.shape[0])
+        for _i in range(iterations):
+            RGB_a = RGB[active]
+            residual = LUT_f.apply(RGB_a, interpolator) - points[active]
+
+            converged = np.max(np.abs(residual), -1) < tolerance
+            active, RGB_a, residual = (active[~converged], RGB_a[~converged],
+                                       residual[~converged])
+
+            if active.size == 0:
+                break
+
+            RGB_e = residual + points[active]
+            J = np.empty(RGB_a.shape + (3, ))
+            for j in range(3):
+                h_j = np.where(RGB_a[..., j] + h[j] > domain_f[1, j], -h[j],
+                               h[j])
+                RGB_h = np.copy(RGB_a)
+                RGB_h[..., j] += h_j
+                J[..., j] = ((LUT_f.apply(RGB_h, interpolator) - RGB_e) /
+                             h_j[..., np.newaxis])
+
+            # Solving the damped normal equations keeps the steps finite
+            # where the "LUT" function is flat, e.g. clipped.
+            J_T = np.swapaxes(J, -1, -2)
+            delta = np.linalg.solve(
+                np.matmul(J_T, J) + np.identity(3) * 1e-12,
+                np.matmul(J_T, residual[..., np.newaxis]))[..., 0]
+
+            RGB_n = np.clip(RGB_a - delta, domain_f[0], domain_f[1])
+            RGB[active] = RGB_n
+
+            # Samples that do not move anymore, typically those for points
+            # outside the "LUT" table gamut, are not refined further.
+            active = active[np.max(np.abs(RGB_n - RGB_a), -1) >= tolerance]
+
+            if active.size == 0:
+                break
+
+        # The index space samples are mapped to the "LUT" domain nodes, the
+        # extrapolated cell is mapped linearly from the outermost nodes.
+        for i, axes in enumerate(nodes):
+            index = RGB[..., i]
+            RGB[..., i] = np.where(
+                index < 0, axes[0] + index * (axes[1] - axes[0]),
+                np.where(index > len(axes) - 1,
+                         axes[-1] + (index - len(axes) + 1) *
+                         (axes[-1] - axes[-2]),
+                         np.interp(index, np.arange(len(axes)), axes)))
+
+        return LUT3D(
+            np.reshape(RGB, [size, size, size, 3]),
+            '{0} - Inverse'.format(self.name),
+            domain,
+            comments=self.comments)
 
     def as_LUT(self, cls, force_conversion=False, **kwargs):
         """
@@ -2060,6 +2840,26 @@ class AbstractLUTSequenceOperator(ABC):
         pass
 
 
+class LUTSequence_BakingReport(
+        namedtuple('LUTSequence_BakingReport',
+                   ('samples', 'maximum_error', 'mean_error', 'rms_error'))):
+    """
+    Defines the error report of a *LUT* sequence baked with
+    :meth:`colour.LUTSequence.bake` method against the exact *LUT* sequence.
+
+    Parameters
+    ----------
+    samples : int
+        Number of *RGB* colourspace array samples used to compute the errors.
+    maximum_error : numeric
+        Maximum absolute error.
+    mean_error : numeric
+        Mean absolute error.
+    rms_error : numeric
+        Root mean square error.
+    """
+
+
 class LUTSequence(MutableSequence):
     """
     Defines the base class for a *LUT* sequence, i.e. a series of *LUTs*.
@@ -2090,6 +2890,7 @@ class LUTSequence(MutableSequence):
     -   :meth:`~colour.LUTSequence.__ne__`
     -   :meth:`~colour.LUTSequence.insert`
     -   :meth:`~colour.LUTSequence.apply`
+    -   :meth:`~colour.LUTSequence.bake`
     -   :meth:`~colour.LUTSequence.copy`
 
     Examples
@@ -2338,7 +3139,8 @@ class LUTSequence(MutableSequence):
               interpolator_1D=LinearInterpolator,
               interpolator_1D_kwargs=None,
               interpolator_3D=table_interpolation_trilinear,
-              interpolator_3D_kwargs=None):
+              interpolator_3D_kwargs=None,
+              workers=None):
         """
         Applies the *LUT* sequence sequentially to given *RGB* colourspace
         array.
@@ -2362,12 +3164,22 @@ class LUTSequence(MutableSequence):
         interpolator_3D_kwargs : dict_like, optional
             Arguments to use when calling the interpolating function for
             :class:`colour.LUT3D` class instances.
+        workers : int, optional
+            Number of threads applying the *LUT* sequence concurrently to
+            tiles of rows of the *RGB* colourspace array, if *None* or 1, the
+            *LUT* sequence is applied serially.
 
         Returns
         -------
         ndarray
             Processed *RGB* colourspace array.
 
+        Notes
+        -----
+        -   With ``workers``, each tile of rows goes through the whole *LUT*
+            sequence at once, the operators are thus expected to be
+            point-wise.
+
         Examples
         --------
         >>> LUT_1 = LUT1D(LUT1D.linear_table(16) + 0.125)
@@ -2384,6 +3196,16 @@ class LUTSequence(MutableSequence):
                [ 0.75     ...,  0.75     ...,  0.75     ...]])
         """
 
+        if workers is not None and workers > 1:
+            return _apply_by_row_tiles(
+                partial(
+                    self.apply,
+                    interpolator_1D=interpolator_1D,
+                    interpolator_1D_kwargs=interpolator_1D_kwargs,
+                    interpolator_3D=interpolator_3D,
+                    interpolator_3D_kwargs=interpolator_3D_kwargs), RGB,
+                workers)
+
         for operation in self:
             if isinstance(operation, (LUT1D, LUT3x1D)):
                 RGB = operation.apply(RGB, interpolator_1D,
@@ -2396,6 +3218,154 @@ class LUTSequence(MutableSequence):
 
         return RGB
 
+    def bake(self,
+             size=33,
+             domain=None,
+             method='Trilinear',
+             shaper=None,
+             samples=65536,
+             additional_data=False,
+             **kwargs):
+        """
+        Bakes the *LUT* sequence into a single :class:`colour.LUT3D` class
+        instance by sampling the whole *LUT* sequence at its vertices,
+        optionally preceded by a shaper :class:`colour.LUT3x1D` class instance.
+
+        Parameters
+        ----------
+        size : int, optional
+            Size of the baked 3D *LUT*.
+        domain : array_like, optional
+            Domain of the baked 3D *LUT*, ignored if ``shaper`` is given as
+            the baked 3D *LUT* domain is then the shaper *LUT* range.
+        method : unicode, optional
+            **{'Trilinear', 'Tetrahedral'}**,
+            Interpolation method the baked 3D *LUT* is meant to be applied
+            with, used to compute the error report.
+        shaper : LUT3x1D, optional
+            Shaper *LUT*, e.g. a logarithmic encoding for scene-referred or
+            *HDR* input, with a monotonically increasing table. The baked 3D
+            *LUT* is sampled uniformly in the shaper *LUT* output space.
+        samples : int, optional
+            Number of random *RGB* colourspace array samples, taken within the
+            input domain, used to compute the error report.
+        additional_data : bool, optional
+            Whether to output the error report.
+
+        Other Parameters
+        ----------------
+        \\**kwargs : dict, optional
+            Keywords arguments for :meth:`colour.LUTSequence.apply` method
+            used to sample the *LUT* sequence.
+
+        Returns
+        -------
+        LUT3D or LUTSequence or tuple
+            Baked 3D *LUT*, *LUT* sequence of the shaper *LUT* and baked 3D
+            *LUT* if ``shaper`` is given, and the
+            :class:`colour.io.LUTSequence_BakingReport` class instance if
+            ``additional_data`` is *True*.
+
+        Raises
+        ------
+        ValueError
+            If the shaper *LUT* table is not monotonically increasing.
+
+        Examples
+        --------
+        >>> LUT_1 = LUT1D(LUT1D.linear_table(16) + 0.125)
+        >>> LUT_2 = LUT3D(LUT3D.linear_table(16) ** (1 / 2.2))
+        >>> LUT_3 = LUT3x1D(LUT3x1D.linear_table(16) * 0.750)
+        >>> LUT_sequence = LUTSequence(LUT_1, LUT_2, LUT_3)
+        >>> LUT, report = LUT_sequence.bake(additional_data=True)
+        >>> print(LUT)
+        LUT3D - Baked LUT1D ---> LUT3D ---> LUT3x1D
+        -------------------------------------------
+        <BLANKLINE>
+        Dimensions : 3
+        Domain     : [[ 0.  0.  0.]
+                      [ 1.  1.  1.]]
+        Size       : (33, 33, 33, 3)
+        >>> report.maximum_error  # doctest: +ELLIPSIS
+        0.0018673...
+        >>> samples = np.linspace(0, 1, 5)
+        >>> RGB = tstack([samples, samples, samples])
+        >>> LUT.apply(RGB)  # doctest: +ELLIPSIS
+        array([[ 0.2899886...,  0.2899886...,  0.2899886...],
+               [ 0.4797662...,  0.4797662...,  0.4797662...],
+               [ 0.6055328...,  0.6055328...,  0.6055328...],
+               [ 0.7057779...,  0.7057779...,  0.7057779...],
+               [ 0.75     ...,  0.75     ...,  0.75     ...]])
+        """
+
+        name = 'Baked {0}'.format(' ---> '.join(
+            [LUT.__class__.__name__ for LUT in self]))
+
+        if shaper is None:
+            if domain is None:
+                domain = np.array([[0, 0, 0], [1, 1, 1]])
+
+            domain = as_float_array(domain)
+            LUT = LUT3D(
+                self.apply(LUT3D.linear_table(size, domain), **kwargs), name,
+                domain)
+            domain_i = domain
+        else:
+            table = shaper.table
+            if np.any(np.diff(table, axis=0) <= 0):
+                raise ValueError('"{0}" shaper "LUT" table must be '
+                                 'monotonically increasing!'.format(
+                                     shaper.name))
+
+            domain = np.vstack(
+                [np.min(table, axis=0),
+                 np.max(table, axis=0)])
+
+            if shaper.is_domain_explicit():
+                samples_s = [
+                    axes[:(~np.isnan(axes)).cumsum().argmax() + 1]
+                    for axes in np.transpose(shaper.domain)
+                ]
+            else:
+                samples_s = [
+                    np.linspace(shaper.domain[0, i], shaper.domain[-1, i],
+                                table.shape[0]) for i in range(3)
+                ]
+            domain_i = np.vstack(
+                [[axes[0] for axes in samples_s],
+                 [axes[-1] for axes in samples_s]])
+
+            # Sampling the *LUT* sequence at the shaper *LUT* pre-image of the
+            # baked 3D *LUT* vertices.
+            V_xyz = LUT3D.linear_table(size, domain)
+            RGB = tstack([
+                np.interp(V_xyz[..., i], table[:len(samples_s[i]), i],
+                          samples_s[i]) for i in range(3)
+            ])
+
+            LUT = LUTSequence(shaper,
+                              LUT3D(self.apply(RGB, **kwargs), name, domain))
+
+        if not additional_data:
+            return LUT
+
+        RGB = random_triplet_generator(
+            samples,
+            np.transpose(domain_i),
+            random_state=np.random.RandomState(4))
+
+        interpolator = TABLE_INTERPOLATION_METHODS[method]
+        if shaper is None:
+            RGB_b = LUT.apply(RGB, interpolator)
+        else:
+            RGB_b = LUT.apply(RGB, interpolator_3D=interpolator)
+
+        error = RGB_b - self.apply(RGB, **kwargs)
+
+        return LUT, LUTSequence_BakingReport(
+            samples, np.max(np.abs(error)), np.mean(np.abs(error)),
+            np.sqrt(np.mean(error ** 2)))
+
     def copy(self):
         """
         Returns a copy of the *LUT* sequence.
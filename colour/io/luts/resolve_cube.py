@@ -19,7 +19,7 @@ References
 import numpy as np
 
 from colour.io.luts import LUT1D, LUT3x1D, LUT3D, LUTSequence
-from colour.io.luts.common import path_to_title
+from colour.io.luts.common import path_to_title, parse_table
 from colour.utilities import as_float_array, tstack
 
 __author__ = 'Colour Developers'
@@ -152,6 +152,11 @@ def read_LUT_ResolveCube(path):
                 comments.append(line[1:].strip())
                 continue
 
+            # Table lines are converted at once after the file is read.
+            if not line[0].isalpha():
+                table.append(line)
+                continue
+
             tokens = line.split()
             if tokens[0] == 'TITLE':
                 title = ' '.join(tokens[1:])[1:-1]
@@ -168,9 +173,9 @@ def read_LUT_ResolveCube(path):
                 has_3D = True
                 size_3D = np.int_(tokens[1])
             else:
-                table.append(tokens)
+                table.append(line)
 
-    table = as_float_array(table)
+    table = parse_table(table)
     if has_3x1D and has_3D:
         LUT[0].name = '{0} - Shaper'.format(title)
         LUT[1].name = '{0} - Cube'.format(title)
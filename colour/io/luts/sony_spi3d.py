@@ -13,8 +13,8 @@ import numpy as np
 
 from colour.constants import DEFAULT_INT_DTYPE
 from colour.io.luts import LUT3D, LUTSequence
-from colour.io.luts.common import path_to_title
-from colour.utilities import as_int_array, usage_warning, as_float_array
+from colour.io.luts.common import path_to_title, parse_table
+from colour.utilities import as_int_array, usage_warning
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2021 - Colour Developers'
@@ -74,7 +74,6 @@ def read_LUT_SonySPI3D(path):
     title = path_to_title(path)
     domain_min, domain_max = np.array([0, 0, 0]), np.array([1, 1, 1])
     size = 2
-    indexes = []
     table = []
     comments = []
 
@@ -85,6 +84,12 @@ def read_LUT_SonySPI3D(path):
                 comments.append(line[1:].strip())
                 continue
 
+            # Once the header is parsed, the remaining lines are table lines
+            # converted at once after the file is read.
+            if len(table) != 0:
+                table.append(line)
+                continue
+
             tokens = line.split()
             if len(tokens) == 3:
                 assert len(set(tokens)) == 1, (
@@ -92,10 +97,10 @@ def read_LUT_SonySPI3D(path):
 
                 size = DEFAULT_INT_DTYPE(tokens[0])
             if len(tokens) == 6:
-                indexes.append(as_int_array(tokens[:3]))
-                table.append(as_float_array(tokens[3:]))
+                table.append(line)
 
-    indexes = as_int_array(indexes)
+    table = parse_table(table, 6)
+    indexes = as_int_array(table[:, :3])
     sorting_indexes = np.lexsort((indexes[:, 2], indexes[:, 1], indexes[:, 0]))
 
     assert np.array_equal(
@@ -104,7 +109,7 @@ def read_LUT_SonySPI3D(path):
             LUT3D.linear_table(size) * (size - 1))).reshape(
                 (-1, 3))), 'Indexes do not match expected "LUT3D" indexes!'
 
-    table = as_float_array(table)[sorting_indexes].reshape(
+    table = table[sorting_indexes, 3:].reshape(
         [size, size, size, 3])
 
     return LUT3D(
@@ -8,8 +8,15 @@ import os
 import shutil
 import tempfile
 import unittest
+try:
+    from unittest import mock
+except ImportError:  # pragma: no cover
+    import mock
 
-from colour.io import LUTSequence, read_LUT, write_LUT
+from colour.io import (LUTSequence, read_LUT, read_LUT_SonySPI3D,
+                       write_LUT)
+from colour.io.luts import LUT_CACHE_EXTENSION, LUT_READ_METHODS
+from colour.utilities import ColourUsageWarning
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2021 - Colour Developers'
@@ -29,6 +36,20 @@ class TestReadLUT(unittest.TestCase):
     methods.
     """
 
+    def setUp(self):
+        """
+        Initialises common tests attributes.
+        """
+
+        self._temporary_directory = tempfile.mkdtemp()
+
+    def tearDown(self):
+        """
+        After tests actions.
+        """
+
+        shutil.rmtree(self._temporary_directory)
+
     def test_read_LUT(self):
         """
         Tests :func:`colour.io.luts.__init__.read_LUT` definition.
@@ -79,6 +100,124 @@ class TestReadLUT(unittest.TestCase):
         )
         self.assertEqual(LUT_2[1].size, 4)
 
+    def test_read_LUT_cache(self):
+        """
+        Tests :func:`colour.io.luts.__init__.read_LUT` definition binary
+        cache.
+        """
+
+        for directory, name in (('sony_spi3d', 'Colour_Correct.spi3d'),
+                                ('resolve_cube', 'LogC_Video.cube')):
+            path = os.path.join(self._temporary_directory, name)
+            shutil.copyfile(os.path.join(LUTS_DIRECTORY, directory, name),
+                            path)
+            cache_path = path + LUT_CACHE_EXTENSION
+
+            LUT = read_LUT(path)
+            self.assertFalse(os.path.exists(cache_path))
+
+            self.assertEqual(read_LUT(path, cache=True), LUT)
+            self.assertTrue(os.path.exists(cache_path))
+
+            LUT_c = read_LUT(path, cache=True)
+            self.assertEqual(LUT_c, LUT)
+            self.assertEqual(type(LUT_c), type(LUT))
+            self.assertEqual(str(LUT_c), str(LUT))
+
+        write_LUT(LUT_c[1], path)
+        self.assertEqual(read_LUT(path, cache=True), LUT_c[1])
+
+        # *Colour Binary* *LUT* files are not cached.
+        path = os.path.join(self._temporary_directory, 'Colour_Correct.lutb')
+        shutil.copyfile(
+            os.path.join(LUTS_DIRECTORY, 'colour_binary',
+                         'Colour_Correct.lutb'), path)
+
+        for _ in range(2):
+            LUT = read_LUT(path, cache=True)
+            self.assertIsInstance(LUT.table, np.memmap)
+            self.assertFalse(os.path.exists(path + LUT_CACHE_EXTENSION))
+
+    def test_read_LUT_cache_key(self):
+        """
+        Tests :func:`colour.io.luts.__init__.read_LUT` definition binary
+        cache key.
+        """
+
+        path = os.path.join(self._temporary_directory, 'Colour_Correct.spi3d')
+        shutil.copyfile(
+            os.path.join(LUTS_DIRECTORY, 'sony_spi3d', 'Colour_Correct.spi3d'),
+            path)
+
+        def read_LUT_SonySPI3D_scaled(path, scale=1):
+            """
+            Reads given *Sony* *.spi3d* *LUT* file and scales its table.
+            """
+
+            return read_LUT_SonySPI3D(path) * scale
+
+        with mock.patch.dict(LUT_READ_METHODS,
+                             {'Sony SPI3D': read_LUT_SonySPI3D_scaled}):
+            LUT = read_LUT(path, cache=True)
+            self.assertEqual(read_LUT(path, cache=True, scale=2), LUT * 2)
+            self.assertEqual(read_LUT(path, cache=True), LUT)
+
+        # The reading method is part of the key.
+        self.assertRaises(ValueError, read_LUT, path, 'Sony SPI1D', True)
+
+        # The *LUT* file is only hashed if its modification time or size
+        # differ.
+        read_LUT(path, cache=True)
+        with mock.patch('colour.io.luts.hashlib.sha1') as sha1:
+            self.assertEqual(read_LUT(path, cache=True), LUT)
+            sha1.assert_not_called()
+
+        stat = os.stat(path)
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10 ** 9))
+        read_LUT_SonySPI3D_m = mock.Mock(side_effect=read_LUT_SonySPI3D)
+        with mock.patch.dict(LUT_READ_METHODS,
+                             {'Sony SPI3D': read_LUT_SonySPI3D_m}):
+            self.assertEqual(read_LUT(path, cache=True), LUT)
+            read_LUT_SonySPI3D_m.assert_not_called()
+
+            with open(path, 'a') as spi3d_file:
+                spi3d_file.write('\n')
+            self.assertEqual(read_LUT(path, cache=True), LUT)
+            read_LUT_SonySPI3D_m.assert_called_once()
+
+    def test_read_LUT_cache_corrupted(self):
+        """
+        Tests :func:`colour.io.luts.__init__.read_LUT` definition with a
+        corrupted binary cache.
+        """
+
+        path = os.path.join(self._temporary_directory, 'Colour_Correct.spi3d')
+        shutil.copyfile(
+            os.path.join(LUTS_DIRECTORY, 'sony_spi3d', 'Colour_Correct.spi3d'),
+            path)
+        cache_path = path + LUT_CACHE_EXTENSION
+
+        LUT = read_LUT(path, cache=True)
+        with open(cache_path, 'rb') as cache_file:
+            content = cache_file.read()
+
+        for corrupted in (content[:len(content) // 2], b''):
+            with open(cache_path, 'wb') as cache_file:
+                cache_file.write(corrupted)
+
+            with self.assertWarns(ColourUsageWarning):
+                self.assertEqual(read_LUT(path, cache=True), LUT)
+
+            # The cache file is written again.
+            self.assertEqual(read_LUT(path, cache=True), LUT)
+            with open(cache_path, 'rb') as cache_file:
+                self.assertEqual(len(cache_file.read()), len(content))
+
+        self.assertListEqual(
+            sorted(os.listdir(self._temporary_directory)),
+            ['Colour_Correct.spi3d', 'Colour_Correct.spi3d' +
+             LUT_CACHE_EXTENSION])
+
     def test_raise_exception_read_LUT(self):
         """
         Tests :func:`colour.io.luts.__init__.read_LUT` definition raised
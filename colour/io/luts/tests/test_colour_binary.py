@@ -0,0 +1,134 @@
+# -*- coding: utf-8 -*-
+"""
+Defines unit tests for :mod:`colour.io.luts.colour_binary` module.
+"""
+
+import numpy as np
+import os
+import shutil
+import tempfile
+import unittest
+
+from colour.io import (LUT1D, LUT3x1D, LUT3D, LUTSequence,
+                       read_LUT_ColourBinary, read_LUT_SonySPI3D,
+                       write_LUT_ColourBinary)
+
+__author__ = 'Colour Developers'
+__copyright__ = 'Copyright (C) 2013-2021 - Colour Developers'
+__license__ = 'New BSD License - https://opensource.org/licenses/BSD-3-Clause'
+__maintainer__ = 'Colour Developers'
+__email__ = 'colour-developers@colour-science.org'
+__status__ = 'Production'
+
+__all__ = [
+    'LUTS_DIRECTORY', 'TestReadLUTColourBinary', 'TestWriteLUTColourBinary'
+]
+
+LUTS_DIRECTORY = os.path.join(os.path.dirname(__file__), 'resources')
+
+
+class TestReadLUTColourBinary(unittest.TestCase):
+    """
+    Defines :func:`colour.io.luts.colour_binary.read_LUT_ColourBinary`
+    definition unit tests methods.
+    """
+
+    def test_read_LUT_ColourBinary(self):
+        """
+        Tests :func:`colour.io.luts.colour_binary.read_LUT_ColourBinary`
+        definition.
+        """
+
+        LUT_r = read_LUT_SonySPI3D(
+            os.path.join(LUTS_DIRECTORY, 'sony_spi3d', 'Colour_Correct.spi3d'))
+
+        LUT_t = read_LUT_ColourBinary(
+            os.path.join(LUTS_DIRECTORY, 'colour_binary',
+                         'Colour_Correct.lutb'))
+
+        self.assertIsInstance(LUT_t, LUT3D)
+        self.assertIsInstance(LUT_t.table, np.memmap)
+        self.assertEqual(LUT_t.table.dtype, np.float32)
+        self.assertFalse(LUT_t.table.flags.writeable)
+        np.testing.assert_allclose(LUT_t.table, LUT_r.table, atol=1e-7)
+        self.assertEqual(LUT_t.name, LUT_r.name)
+        np.testing.assert_array_equal(LUT_t.domain, LUT_r.domain)
+        self.assertListEqual(LUT_t.comments, LUT_r.comments)
+
+        np.testing.assert_allclose(
+            LUT_t.apply(np.array([0.25, 0.5, 0.75])),
+            LUT_r.apply(np.array([0.25, 0.5, 0.75])),
+            atol=1e-7)
+
+        LUT_t = read_LUT_ColourBinary(
+            os.path.join(LUTS_DIRECTORY, 'colour_binary',
+                         'Colour_Correct.lutb'),
+            mmap_mode=None)
+
+        self.assertNotIsInstance(LUT_t.table, np.memmap)
+        np.testing.assert_allclose(LUT_t.table, LUT_r.table, atol=1e-7)
+
+    def test_raise_exception_read_LUT_ColourBinary(self):
+        """
+        Tests :func:`colour.io.luts.colour_binary.read_LUT_ColourBinary`
+        definition raised exception.
+        """
+
+        self.assertRaises(
+            ValueError, read_LUT_ColourBinary,
+            os.path.join(LUTS_DIRECTORY, 'sony_spi3d', 'Colour_Correct.spi3d'))
+
+
+class TestWriteLUTColourBinary(unittest.TestCase):
+    """
+    Defines :func:`colour.io.luts.colour_binary.write_LUT_ColourBinary`
+    definition unit tests methods.
+    """
+
+    def setUp(self):
+        """
+        Initialises common tests attributes.
+        """
+
+        self._temporary_directory = tempfile.mkdtemp()
+
+    def tearDown(self):
+        """
+        After tests actions.
+        """
+
+        shutil.rmtree(self._temporary_directory)
+
+    def test_write_LUT_ColourBinary(self):
+        """
+        Tests :func:`colour.io.luts.colour_binary.write_LUT_ColourBinary`
+        definition.
+        """
+
+        for LUT in (LUT1D(LUT1D.linear_table(16) ** 2, 'LUT1D',
+                          np.array([-0.1, 1.5]), comments=['A comment.']),
+                    LUT3x1D(LUT3x1D.linear_table(16) ** 2, 'LUT3x1D'),
+                    LUT3D(LUT3D.linear_table(9) ** 2, 'LUT3D')):
+            path = os.path.join(self._temporary_directory,
+                                '{0}.lutb'.format(LUT.name))
+            write_LUT_ColourBinary(LUT, path, dtype=np.float64)
+            LUT_t = read_LUT_ColourBinary(path)
+
+            self.assertEqual(LUT_t, LUT)
+            self.assertEqual(type(LUT_t), type(LUT))
+            self.assertEqual(LUT_t.name, LUT.name)
+            self.assertListEqual(LUT_t.comments, LUT.comments)
+
+            # The table is aligned within the file.
+            self.assertEqual(LUT_t.table.offset % 64, 0)
+
+        path = os.path.join(self._temporary_directory, 'LUTSequence.lutb')
+        write_LUT_ColourBinary(LUTSequence(LUT), path)
+        LUT_t = read_LUT_ColourBinary(path)
+
+        self.assertEqual(LUT_t.table.dtype, np.float32)
+        np.testing.assert_allclose(LUT_t.table, LUT.table, atol=1e-7)
+
+
+if __name__ == '__main__':
+    unittest.main()
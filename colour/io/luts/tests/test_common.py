@@ -3,9 +3,10 @@
 Defines unit tests for :mod:`colour.io.luts.common` module.
 """
 
+import numpy as np
 import unittest
 
-from colour.io.luts.common import path_to_title
+from colour.io.luts.common import path_to_title, parse_table
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2021 - Colour Developers'
@@ -14,7 +15,7 @@ __maintainer__ = 'Colour Developers'
 __email__ = 'colour-developers@colour-science.org'
 __status__ = 'Production'
 
-__all__ = ['TestPathToTitle']
+__all__ = ['TestPathToTitle', 'TestParseTable']
 
 
 class TestPathToTitle(unittest.TestCase):
@@ -34,5 +35,37 @@ class TestPathToTitle(unittest.TestCase):
             'RGB 1 0 5 0 25')
 
 
+class TestParseTable(unittest.TestCase):
+    """
+    Defines :func:`colour.io.luts.common.parse_table` definition unit tests
+    methods.
+    """
+
+    def test_parse_table(self):
+        """
+        Tests :func:`colour.io.luts.common.parse_table` definition.
+        """
+
+        np.testing.assert_array_equal(
+            parse_table(['0 0.5 1', '  1.0  -0.5\t1e-1 ']),
+            np.array([[0.0, 0.5, 1.0], [1.0, -0.5, 0.1]]))
+
+        np.testing.assert_array_equal(
+            parse_table(['0 0 0 0.1 0.2 0.3'], 6),
+            np.array([[0.0, 0.0, 0.0, 0.1, 0.2, 0.3]]))
+
+        self.assertTupleEqual(parse_table([]).shape, (0, 3))
+
+    def test_raise_exception_parse_table(self):
+        """
+        Tests :func:`colour.io.luts.common.parse_table` definition raised
+        exception.
+        """
+
+        self.assertRaises(ValueError, parse_table, ['0 0.5'])
+
+        self.assertRaises(ValueError, parse_table, ['LUT_3D_SIZE 3'])
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -5,10 +5,15 @@ Defines unit tests for :mod:`colour.io.luts.lut` module.
 
 import numpy as np
 import os
+import shutil
+import tempfile
 import textwrap
+import tracemalloc
 import unittest
 
-from colour.algebra import random_triplet_generator, spow
+from colour.algebra import (random_triplet_generator, spow,
+                            table_interpolation_trilinear,
+                            table_interpolation_tetrahedral)
 from colour.io.luts.lut import AbstractLUT
 from colour.io.luts import (AbstractLUTSequenceOperator, LUT1D, LUT3x1D, LUT3D,
                             LUTSequence, LUT_to_LUT)
@@ -61,11 +66,46 @@ class TestAbstractLUT(unittest.TestCase):
                             '__isub__', '__mul__', '__imul__', '__div__',
                             '__idiv__', '__pow__', '__ipow__',
                             'arithmetical_operation', 'is_domain_explicit',
-                            'linear_table', 'apply', 'copy', 'as_LUT')
+                            'linear_table', 'apply', 'copy', 'invert',
+                            'as_LUT')
 
         for method in required_methods:
             self.assertIn(method, dir(AbstractLUT))
 
+    def test_invert(self):
+        """
+        Tests :meth:`colour.io.luts.lut.AbstractLUT.invert` abstract
+        method.
+        """
+
+        class LUT(AbstractLUT):
+            """
+            :class:`AbstractLUT` sub-class not implementing the *LUT*
+            inversion.
+            """
+
+            def _validate_table(self, table):
+                return table
+
+            def _validate_domain(self, domain):
+                return domain
+
+            def is_domain_explicit(self):
+                return False
+
+            @staticmethod
+            def linear_table(size=None, domain=None):
+                return np.linspace(0, 1, 2)
+
+            def apply(self, RGB, *args, **kwargs):
+                return RGB
+
+            def as_LUT(self, cls, force_conversion=False, **kwargs):
+                return self
+
+        self.assertIn('invert', AbstractLUT.__abstractmethods__)
+        self.assertRaises(TypeError, LUT, np.linspace(0, 1, 2))
+
 
 class TestLUT(unittest.TestCase):
     """
@@ -110,7 +150,7 @@ class TestLUT(unittest.TestCase):
         """
 
         required_methods = ('__init__', 'is_domain_explicit', 'linear_table',
-                            'apply', 'as_LUT')
+                            'apply', 'invert', 'as_LUT')
 
         for class_ in (LUT1D, LUT3x1D, LUT3D):
             for method in required_methods:
@@ -489,6 +529,85 @@ class TestLUT(unittest.TestCase):
         np.testing.assert_almost_equal(
             LUT_3.apply(RANDOM_TRIPLETS), self._applied_3, decimal=7)
 
+    def test_apply_workers(self):
+        """
+        Tests :class:`colour.io.luts.lut.LUT1D.apply`,
+        :class:`colour.io.luts.lut.LUT3x1D.apply` and
+        :class:`colour.io.luts.lut.LUT3D.apply` methods with multiple workers.
+        """
+
+        if self._LUT_factory is None:
+            return
+
+        RGB = np.reshape(
+            random_triplet_generator(
+                1024, random_state=np.random.RandomState(4)), (32, 32, 3))
+
+        # pylint: disable=E1102
+        LUT = self._LUT_factory(self._table_2)
+
+        np.testing.assert_equal(LUT.apply(RGB, workers=3), LUT.apply(RGB))
+
+        np.testing.assert_equal(
+            LUT.apply(RANDOM_TRIPLETS[0, 0], workers=3),
+            LUT.apply(RANDOM_TRIPLETS[0, 0]))
+
+    def test_invert(self):
+        """
+        Tests :class:`colour.io.luts.lut.LUT1D.invert`,
+        :class:`colour.io.luts.lut.LUT3x1D.invert` and
+        :class:`colour.io.luts.lut.LUT3D.invert` methods.
+        """
+
+        if self._LUT_factory is None:
+            return
+
+        # pylint: disable=E1102
+        LUT = self._LUT_factory(domain=self._domain_2, comments=['Comment'])
+        LUT.table = spow(LUT.table, 1 / 2.2)
+
+        LUT_i = LUT.invert()
+
+        self.assertIsInstance(LUT_i, self._LUT_factory)
+        self.assertEqual(LUT_i.name, '{0} - Inverse'.format(LUT.name))
+        self.assertListEqual(LUT_i.comments, ['Comment'])
+        self.assertEqual(LUT_i.size, LUT.size)
+        np.testing.assert_almost_equal(
+            LUT_i.domain,
+            np.array([np.min(LUT.table.reshape([-1, 3]), 0),
+                      np.max(LUT.table.reshape([-1, 3]), 0)])
+            if self._dimensions != 1 else
+            np.array([np.min(LUT.table), np.max(LUT.table)]))
+        np.testing.assert_almost_equal(
+            LUT.apply(LUT_i.table),
+            LUT_i.linear_table(LUT_i.size, LUT_i.domain),
+            decimal=7)
+
+        self.assertEqual(LUT.invert(size=5).size, 5)
+
+        # pylint: disable=E1102
+        LUT = self._LUT_factory(LUT.table[::-1])
+
+        np.testing.assert_almost_equal(
+            LUT.apply(LUT.invert().table),
+            LUT.invert().linear_table(LUT.size, LUT.invert().domain),
+            decimal=7)
+
+    def test_raise_exception_invert(self):
+        """
+        Tests :class:`colour.io.luts.lut.LUT1D.invert` and
+        :class:`colour.io.luts.lut.LUT3x1D.invert` methods raised exception.
+        """
+
+        if self._LUT_factory is None or self._dimensions == 3:
+            return
+
+        # pylint: disable=E1102
+        LUT = self._LUT_factory()
+        LUT.table = np.sin(LUT.table * np.pi)
+
+        self.assertRaises(ValueError, LUT.invert)
+
     def test_copy(self):
         """
         Tests :class:`colour.io.luts.lut.LUT1D.copy`,
@@ -774,6 +893,184 @@ class TestLUT3D(TestLUT):
              [0.02408419, 0.81991814, 0.94597809]],
         ])
 
+    def test_apply_engine(self):
+        """
+        Tests :class:`colour.io.luts.lut.LUT3D.apply` method optimised engine.
+        """
+
+        RGB = random_triplet_generator(
+            1024,
+            np.array([[-0.2, 1.2], [-0.2, 1.2], [-0.2, 3.2]]),
+            random_state=np.random.RandomState(4))
+        RGB = np.reshape(np.vstack([RGB, np.identity(3), np.ones([1, 3])]),
+                         (4, 257, 3))
+
+        for domain in (self._domain_1, self._domain_2):
+            LUT = LUT3D(self._table_2, domain=domain)
+            domain_min, domain_max = LUT.domain
+            V_xyz = np.clip((RGB - domain_min) / (domain_max - domain_min), 0,
+                            1)
+
+            for interpolator in (table_interpolation_trilinear,
+                                 table_interpolation_tetrahedral):
+                RGB_i = interpolator(V_xyz, LUT.table)
+
+                np.testing.assert_almost_equal(
+                    LUT.apply(RGB, interpolator), RGB_i, decimal=7)
+
+                out = np.zeros(RGB.shape)
+                self.assertIs(LUT.apply(RGB, interpolator, out=out), out)
+                np.testing.assert_almost_equal(out, RGB_i, decimal=7)
+
+                RGB_f32 = LUT.apply(RGB.astype(np.float32), interpolator)
+                self.assertEqual(RGB_f32.dtype, np.float32)
+                np.testing.assert_almost_equal(RGB_f32, RGB_i, decimal=5)
+
+        LUT = LUT3D(self._table_2)
+        LUT.apply(RGB)
+        LUT.table[...] = 0
+        np.testing.assert_equal(LUT.apply(RGB), np.zeros(RGB.shape))
+
+        self.assertRaises(ValueError, LUT.apply, RGB, out=np.zeros([4, 3]))
+        self.assertRaises(
+            ValueError,
+            LUT.apply,
+            RGB,
+            out=np.zeros([3, 257, 4]).transpose([2, 1, 0]))
+
+    def test_apply_engine_table_dtype(self):
+        """
+        Tests :class:`colour.io.luts.lut.LUT3D.apply` method optimised engine
+        with a single precision memory-mapped table.
+        """
+
+        temporary_directory = tempfile.mkdtemp()
+        try:
+            path = os.path.join(temporary_directory, 'table.bin')
+            table = np.memmap(path, np.float32, 'w+', shape=(33, 33, 33, 3))
+            table[...] = LUT3D.linear_table(33) ** (1 / 2.2)
+            table.flush()
+            table = np.memmap(path, np.float32, 'r', shape=(33, 33, 33, 3))
+
+            LUT = LUT3D(table)
+            LUT_r = LUT3D(np.array(table, np.float64))
+            RGB = random_triplet_generator(
+                1024, random_state=np.random.RandomState(4))
+
+            for interpolator in (table_interpolation_trilinear,
+                                 table_interpolation_tetrahedral):
+                RGB_i = LUT.apply(RGB, interpolator)
+                self.assertEqual(RGB_i.dtype, np.float64)
+                np.testing.assert_allclose(
+                    RGB_i, LUT_r.apply(RGB, interpolator), atol=1e-12)
+
+            # The table is not cast as a whole.
+            tracemalloc.start()
+            LUT.apply(RGB[:1])
+            _current, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+            self.assertLess(peak, table.nbytes)
+
+            del table, LUT
+        finally:
+            shutil.rmtree(temporary_directory)
+
+    def test_apply_engine_RGB_dtype(self):
+        """
+        Tests :class:`colour.io.luts.lut.LUT3D.apply` method optimised engine
+        with a single precision *RGB* colourspace array and an output array.
+        """
+
+        LUT = LUT3D(LUT3D.linear_table(33) ** (1 / 2.2))
+        RGB = random_triplet_generator(
+            2 ** 20, random_state=np.random.RandomState(4)).astype(np.float32)
+        out = np.empty(RGB.shape, np.float32)
+
+        RGB_i = LUT.apply(RGB)
+        self.assertEqual(RGB_i.dtype, np.float32)
+
+        # The *RGB* colourspace array is neither upcast nor copied as a whole.
+        tracemalloc.start()
+        self.assertIs(LUT.apply(RGB, out=out), out)
+        _current, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        self.assertLess(peak, RGB.nbytes)
+
+        np.testing.assert_equal(out, RGB_i)
+
+    def test_invert_gamut(self):
+        """
+        Tests :class:`colour.io.luts.lut.LUT3D.invert` method with a *LUT*
+        whose table gamut does not fill its bounding box.
+        """
+
+        M = np.array([
+            [0.80, 0.15, 0.05],
+            [0.10, 0.80, 0.10],
+            [0.05, 0.15, 0.80],
+        ])
+        LUT = LUT3D(
+            np.einsum('ij,...j->...i', M, LUT3D.linear_table(17)) ** (1 / 2.2))
+
+        RGB = random_triplet_generator(
+            1024, random_state=np.random.RandomState(4))
+
+        for extrapolate, interpolator in (
+            (False, table_interpolation_trilinear),
+            (True, table_interpolation_trilinear),
+            (False, table_interpolation_tetrahedral),
+        ):
+            LUT_i = LUT.invert(
+                33, extrapolate=extrapolate, interpolator=interpolator)
+
+            self.assertEqual(LUT_i.size, 33)
+
+            if extrapolate:
+                self.assertLess(np.min(LUT_i.table), 0)
+                self.assertGreaterEqual(np.min(LUT_i.table), -1 / 16)
+                self.assertLessEqual(np.max(LUT_i.table), 1 + 1 / 16)
+            else:
+                self.assertGreaterEqual(np.min(LUT_i.table), 0)
+                self.assertLessEqual(np.max(LUT_i.table), 1)
+
+            self.assertLess(
+                np.mean(np.abs(
+                    LUT_i.apply(LUT.apply(RGB, interpolator)) - RGB)), 1e-3)
+
+        np.testing.assert_almost_equal(
+            LUT.invert(domain=np.array([[0.2, 0.2, 0.2], [0.8, 0.8, 0.8]]))
+            .domain, np.array([[0.2, 0.2, 0.2], [0.8, 0.8, 0.8]]))
+
+    def test_invert_explicit_domain(self):
+        """
+        Tests :class:`colour.io.luts.lut.LUT3D.invert` method with a *LUT*
+        defined with an explicit non-uniform domain.
+        """
+
+        nodes = np.array([0.5, 1.0, 2.0])
+        domain = np.transpose([nodes, nodes, nodes])
+        table = np.stack(np.meshgrid(nodes, nodes, nodes, indexing='ij'), -1)
+
+        for extrapolate in (False, True):
+            LUT_i = LUT3D(table, domain=domain).invert(
+                5, extrapolate=extrapolate)
+
+            np.testing.assert_almost_equal(
+                LUT_i.domain, np.array([[0.5, 0.5, 0.5], [2.0, 2.0, 2.0]]))
+            np.testing.assert_almost_equal(
+                LUT_i.apply(np.reshape(table, (-1, 3))),
+                np.reshape(table, (-1, 3)),
+                decimal=7)
+
+        LUT_i = LUT3D(table ** 2, domain=domain).invert(65)
+        np.testing.assert_allclose(
+            LUT_i.apply(table[:, 1, 2] ** 2), table[:, 1, 2], atol=0.005)
+
+        nodes = np.array([0.5, 1.0, 2.0, 4.0])
+        self.assertRaises(
+            ValueError,
+            LUT3D(table, domain=np.transpose([nodes, nodes, nodes])).invert)
+
 
 class TestAbstractLUTSequenceOperator(unittest.TestCase):
     """
@@ -828,7 +1125,8 @@ class TestLUTSequence(unittest.TestCase):
 
         required_methods = ('__init__', '__getitem__', '__setitem__',
                             '__delitem__', '__len__', '__str__', '__repr__',
-                            '__eq__', '__ne__', 'insert', 'apply', 'copy')
+                            '__eq__', '__ne__', 'insert', 'apply', 'bake',
+                            'copy')
 
         for method in required_methods:
             self.assertIn(method, dir(LUTSequence))
@@ -1222,6 +1520,55 @@ class TestLUTSequence(unittest.TestCase):
                 [0.75000000, 0.75000000, 0.75000000],
             ]))
 
+        RGB = np.reshape(
+            random_triplet_generator(
+                1024, random_state=np.random.RandomState(4)), (32, 32, 3))
+
+        np.testing.assert_equal(
+            LUT_sequence.apply(RGB, workers=3), LUT_sequence.apply(RGB))
+
+    def test_bake(self):
+        """
+        Tests :class:`colour.io.luts.lut.LUTSequence.bake` method.
+        """
+
+        LUT = self._LUT_sequence.bake()
+        self.assertIsInstance(LUT, LUT3D)
+        self.assertEqual(LUT.size, 33)
+        np.testing.assert_almost_equal(
+            LUT.apply(self._RGB),
+            self._LUT_sequence.apply(self._RGB),
+            decimal=7)
+
+        LUT, report = self._LUT_sequence.bake(
+            17, method='Tetrahedral', samples=1024, additional_data=True)
+        self.assertEqual(LUT.size, 17)
+        self.assertEqual(report.samples, 1024)
+        self.assertLess(report.maximum_error, 0.01)
+        self.assertLessEqual(report.mean_error, report.rms_error)
+        self.assertLessEqual(report.rms_error, report.maximum_error)
+
+        domain = np.array([[0, 0, 0], [16, 16, 16]])
+        shaper = LUT3x1D(
+            np.log2(LUT3x1D.linear_table(4096, domain) + 1) / 4,
+            domain=domain)
+        LUT_sequence = LUTSequence(
+            LUT3x1D(LUT3x1D.linear_table(1024, domain) / 16, domain=domain),
+            LUT3D(LUT3D.linear_table(33) ** (1 / 2.2)))
+        LUT, report = LUT_sequence.bake(
+            shaper=shaper, samples=1024, additional_data=True)
+        self.assertIsInstance(LUT, LUTSequence)
+        self.assertIs(LUT[0], shaper)
+        np.testing.assert_almost_equal(
+            LUT[1].domain,
+            np.array([np.zeros(3), np.full(3, np.log2(17) / 4)]))
+        self.assertLess(report.maximum_error, 0.01)
+
+        self.assertRaises(
+            ValueError,
+            LUT_sequence.bake,
+            shaper=LUT3x1D(LUT3x1D.linear_table(16) * -1))
+
 
 class TestLUT_to_LUT(unittest.TestCase):
     """
@@ -17,7 +17,7 @@ References
 import numpy as np
 
 from colour.algebra import Extrapolator, LinearInterpolator
-from colour.utilities import from_range_1, to_domain_1
+from colour.utilities import CACHE_REGISTRY, from_range_1, to_domain_1
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2021 - Colour Developers'
@@ -86,7 +86,9 @@ def log_encoding_FilmicPro6(t):
     return from_range_1(y)
 
 
-_LOG_DECODING_FILMICPRO_INTERPOLATOR_CACHE = None
+_CACHE_LOG_DECODING_FILMICPRO_INTERPOLATOR = CACHE_REGISTRY.register_cache(
+    '{0}._CACHE_LOG_DECODING_FILMICPRO_INTERPOLATOR'.format(__name__),
+    maximum_size=1)
 
 
 def _log_decoding_FilmicPro6_interpolator():
@@ -101,14 +103,16 @@ def _log_decoding_FilmicPro6_interpolator():
         function interpolator.
     """
 
-    global _LOG_DECODING_FILMICPRO_INTERPOLATOR_CACHE
+    interpolator = _CACHE_LOG_DECODING_FILMICPRO_INTERPOLATOR.get('All')
 
-    t = np.arange(0, 1, 0.0001)
-    if _LOG_DECODING_FILMICPRO_INTERPOLATOR_CACHE is None:
-        _LOG_DECODING_FILMICPRO_INTERPOLATOR_CACHE = Extrapolator(
+    if interpolator is None:
+        t = np.arange(0, 1, 0.0001)
+        interpolator = Extrapolator(
             LinearInterpolator(log_encoding_FilmicPro6(t), t))
 
-    return _LOG_DECODING_FILMICPRO_INTERPOLATOR_CACHE
+        _CACHE_LOG_DECODING_FILMICPRO_INTERPOLATOR['All'] = interpolator
+
+    return interpolator
 
 
 def log_decoding_FilmicPro6(y):
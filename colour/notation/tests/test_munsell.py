@@ -4,7 +4,14 @@ Defines unit tests for :mod:`colour.notation.munsell` module.
 """
 
 import numpy as np
+import os
+import shutil
+import tempfile
 import unittest
+try:
+    from unittest import mock
+except ImportError:  # pragma: no cover
+    import mock
 from itertools import permutations
 
 from colour.notation.munsell import (CCS_ILLUMINANT_MUNSELL)
@@ -31,8 +38,8 @@ from colour.notation import (
     munsell_value_Priest1920, munsell_value_Munsell1933,
     munsell_value_Moon1943, munsell_value_Saunderson1944,
     munsell_value_Ladd1955, munsell_value_McCamy1987, munsell_value_ASTMD1535)
-from colour.utilities import (as_float_array, domain_range_scale,
-                              ignore_numpy_errors, tstack)
+from colour.utilities import (ColourUsageWarning, as_float_array,
+                              domain_range_scale, ignore_numpy_errors, tstack)
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2021 - Colour Developers'
@@ -1469,6 +1476,12 @@ class TestxyY_to_munsell_specification(unittest.TestCase):
             rtol=0.00001,
             atol=0.00001)
 
+        np.testing.assert_allclose(
+            xyY_to_munsell_specification(xyY, method='Inverse Grid'),
+            specification,
+            rtol=0.00001,
+            atol=0.00001)
+
         specification, xyY = (
             as_float_array(list(MUNSELL_GREYS_SPECIFICATIONS[..., 0])),
             as_float_array(list(MUNSELL_GREYS_SPECIFICATIONS[..., 1])),
@@ -1484,6 +1497,76 @@ class TestxyY_to_munsell_specification(unittest.TestCase):
             rtol=0.00001,
             atol=0.00001)
 
+        np.testing.assert_allclose(
+            xyY_to_munsell_specification(xyY, method='Inverse Grid'),
+            specification,
+            rtol=0.00001,
+            atol=0.00001)
+
+    def test_inverse_grid_xyY_to_munsell_specification(self):
+        """
+        Tests :func:`colour.notation.munsell.xyY_to_munsell_specification`
+        definition *Inverse Grid* method.
+        """
+
+        xyY = as_float_array(list(MUNSELL_SPECIFICATIONS[..., 1]))
+
+        # The *CIE xyY* colourspace arrays that cannot be converted are
+        # returned as *NaN*.
+        specification = xyY_to_munsell_specification(
+            np.vstack([xyY[:2], [0.90615118, 0.57945103, 0.91984064]]),
+            method='Inverse Grid')
+        np.testing.assert_allclose(
+            specification[:2],
+            xyY_to_munsell_specification(xyY[:2]),
+            rtol=0.00001,
+            atol=0.00001)
+        self.assertTrue(np.all(np.isnan(specification[2])))
+
+        temporary_directory = tempfile.mkdtemp()
+        try:
+            # The grid cached in memory without a path does not prevent the
+            # grid from being written to the given path.
+            specification = xyY_to_munsell_specification(
+                xyY, method='Inverse Grid')
+            path = os.path.join(temporary_directory, 'Munsell.npz')
+            np.testing.assert_equal(
+                xyY_to_munsell_specification(
+                    xyY, method='Inverse Grid', grid_path=path),
+                specification)
+            self.assertTrue(os.path.exists(path))
+
+            with mock.patch.dict(
+                    'colour.notation.munsell._CACHE_MUNSELL_INVERSE_GRID',
+                    clear=True):
+                np.testing.assert_equal(
+                    xyY_to_munsell_specification(
+                        xyY, method='Inverse Grid', grid_path=path),
+                    specification)
+
+            # A grid built with a different grid size or bounds is ignored
+            # and rebuilt.
+            with open(path, 'wb') as npz_file:
+                np.savez(
+                    npz_file,
+                    key='8, [[0.0, 0.0], [1.0, 1.0]]',
+                    bounds=np.array([[0.0, 0.0], [1.0, 1.0]]),
+                    grid=np.zeros([10, 8, 8, 2]))
+
+            with mock.patch.dict(
+                    'colour.notation.munsell._CACHE_MUNSELL_INVERSE_GRID',
+                    clear=True):
+                with self.assertWarns(ColourUsageWarning):
+                    np.testing.assert_equal(
+                        xyY_to_munsell_specification(
+                            xyY, method='Inverse Grid', grid_path=path),
+                        specification)
+
+            with np.load(path, allow_pickle=False) as npz_file:
+                self.assertNotEqual(npz_file['grid'].shape[1], 8)
+        finally:
+            shutil.rmtree(temporary_directory)
+
     def test_n_dimensional_xyY_to_munsell_specification(self):
         """
         Tests :func:`colour.notation.munsell.xyY_to_munsell_specification`
@@ -1503,6 +1586,12 @@ class TestxyY_to_munsell_specification(unittest.TestCase):
         np.testing.assert_almost_equal(
             xyY_to_munsell_specification(xyY), specification, decimal=7)
 
+        np.testing.assert_allclose(
+            xyY_to_munsell_specification(xyY, method='Inverse Grid'),
+            specification,
+            rtol=0.00001,
+            atol=0.00001)
+
     def test_raise_exception_xyY_to_munsell_specification(self):
         """
         Tests :func:`colour.notation.munsell.xyY_to_munsell_specification`
@@ -1512,6 +1601,12 @@ class TestxyY_to_munsell_specification(unittest.TestCase):
         self.assertRaises(RuntimeError, xyY_to_munsell_specification,
                           np.array([0.90615118, 0.57945103, 0.91984064]))
 
+        self.assertRaises(
+            ValueError,
+            xyY_to_munsell_specification,
+            np.array([0.38736945, 0.35751656, 0.59362000]),
+            method='Undefined')
+
     def test_domain_range_scale_xyY_to_munsell_specification(self):
         """
         Tests :func:`colour.notation.munsell.xyY_to_munsell_specification`
@@ -1533,6 +1628,12 @@ class TestxyY_to_munsell_specification(unittest.TestCase):
                     specification * factor_b,
                     rtol=0.00001,
                     atol=0.00001)
+                np.testing.assert_allclose(
+                    xyY_to_munsell_specification(
+                        xyY * factor_a, method='Inverse Grid'),
+                    specification * factor_b,
+                    rtol=0.00001,
+                    atol=0.00001)
 
     @ignore_numpy_errors
     def test_nan_xyY_to_munsell_specification(self):
@@ -1550,6 +1651,9 @@ class TestxyY_to_munsell_specification(unittest.TestCase):
             except (AssertionError, TypeError, ValueError):
                 pass
 
+        xyY_to_munsell_specification(
+            np.array(list(cases)), method='Inverse Grid')
+
 
 class TestxyY_to_munsell_colour(unittest.TestCase):
     """
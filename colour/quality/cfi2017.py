@@ -25,7 +25,7 @@ from colour.colorimetry import (
     sd_blackbody, MSDS_CMFS, sd_ones, sd_CIE_illuminant_D_series)
 from colour.models import XYZ_to_UCS, UCS_to_uv, JMh_CIECAM02_to_CAM02UCS
 from colour.temperature import uv_to_CCT_Ohno2013, CCT_to_xy_CIE_D
-from colour.utilities import as_int, lerp, usage_warning
+from colour.utilities import CACHE_REGISTRY, as_int, lerp, usage_warning
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2021 - Colour Developers'
@@ -58,7 +58,8 @@ RESOURCES_DIRECTORY_CIE2017 = os.path.join(
 RESOURCES_DIRECTORY_CIE2017 : unicode
 """
 
-_CACHE_TCS_CIE2017 = {}
+_CACHE_TCS_CIE2017 = CACHE_REGISTRY.register_cache(
+    '{0}._CACHE_TCS_CIE2017'.format(__name__), maximum_size=4)
 
 
 class TCS_ColorimetryData_CIE2017(
@@ -207,8 +208,6 @@ def load_TCS_CIE2017(shape):
     99
     """
 
-    global _CACHE_TCS_CIE2017
-
     interval = shape.interval
 
     assert interval in (1, 5), (
@@ -216,8 +215,9 @@ def load_TCS_CIE2017(shape):
 
     filename = 'tcs_cfi2017_{0}_nm.csv.gz'.format(as_int(interval))
 
-    if filename in _CACHE_TCS_CIE2017:
-        return _CACHE_TCS_CIE2017[filename]
+    tcs = _CACHE_TCS_CIE2017.get(filename)
+    if tcs is not None:
+        return tcs
 
     data = np.genfromtxt(
         str(os.path.join(RESOURCES_DIRECTORY_CIE2017, filename)),
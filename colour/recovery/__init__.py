@@ -25,24 +25,32 @@ from colour.utilities import (CaseInsensitiveMapping, as_float_array,
 from .datasets import *  # noqa
 from . import datasets
 from .jakob2019 import (sd_Jakob2019, find_coefficients_Jakob2019,
+                        find_coefficients_batch_Jakob2019,
                         XYZ_to_sd_Jakob2019, LUT3D_Jakob2019)
 from .mallett2019 import (spectral_primary_decomposition_Mallett2019,
+                          RGB_to_reflectances_Mallett2019,
                           RGB_to_sd_Mallett2019)
-from .meng2015 import XYZ_to_sd_Meng2015
-from .otsu2018 import Dataset_Otsu2018, NodeTree_Otsu2018, XYZ_to_sd_Otsu2018
-from .smits1999 import RGB_to_sd_Smits1999
+from .meng2015 import XYZ_to_reflectances_Meng2015, XYZ_to_sd_Meng2015
+from .otsu2018 import (Dataset_Otsu2018, NodeTree_Otsu2018,
+                       XYZ_to_reflectances_Otsu2018, XYZ_to_sd_Otsu2018)
+from .smits1999 import RGB_to_reflectances_Smits1999, RGB_to_sd_Smits1999
 __all__ = []
 __all__ += datasets.__all__
 __all__ += [
-    'sd_Jakob2019', 'find_coefficients_Jakob2019', 'XYZ_to_sd_Jakob2019',
+    'sd_Jakob2019', 'find_coefficients_Jakob2019',
+    'find_coefficients_batch_Jakob2019', 'XYZ_to_sd_Jakob2019',
     'LUT3D_Jakob2019'
 ]
 __all__ += [
-    'spectral_primary_decomposition_Mallett2019', 'RGB_to_sd_Mallett2019'
+    'spectral_primary_decomposition_Mallett2019',
+    'RGB_to_reflectances_Mallett2019', 'RGB_to_sd_Mallett2019'
 ]
-__all__ += ['XYZ_to_sd_Meng2015']
-__all__ += ['Dataset_Otsu2018', 'NodeTree_Otsu2018', 'XYZ_to_sd_Otsu2018']
-__all__ += ['RGB_to_sd_Smits1999']
+__all__ += ['XYZ_to_reflectances_Meng2015', 'XYZ_to_sd_Meng2015']
+__all__ += [
+    'Dataset_Otsu2018', 'NodeTree_Otsu2018', 'XYZ_to_reflectances_Otsu2018',
+    'XYZ_to_sd_Otsu2018'
+]
+__all__ += ['RGB_to_reflectances_Smits1999', 'RGB_to_sd_Smits1999']
 
 XYZ_TO_SD_METHODS = CaseInsensitiveMapping({
     'Jakob 2019': XYZ_to_sd_Jakob2019,
@@ -324,49 +332,49 @@ def XYZ_to_sd(XYZ, method='Meng 2015', **kwargs):
     ...     XYZ, method='Meng 2015', cmfs=cmfs, illuminant=illuminant)
     >>> with numpy_print_options(suppress=True):
     ...     sd  # doctest: +ELLIPSIS
-    SpectralDistribution([[ 360.        ,    0.0765153...],
-                          [ 370.        ,    0.0764771...],
-                          [ 380.        ,    0.0764286...],
-                          [ 390.        ,    0.0764329...],
-                          [ 400.        ,    0.0765863...],
-                          [ 410.        ,    0.0764339...],
-                          [ 420.        ,    0.0757213...],
-                          [ 430.        ,    0.0733091...],
-                          [ 440.        ,    0.0676493...],
-                          [ 450.        ,    0.0577616...],
-                          [ 460.        ,    0.0440805...],
-                          [ 470.        ,    0.0284802...],
-                          [ 480.        ,    0.0138019...],
-                          [ 490.        ,    0.0033557...],
+    SpectralDistribution([[ 360.        ,    0.0767224...],
+                          [ 370.        ,    0.0767208...],
+                          [ 380.        ,    0.0767169...],
+                          [ 390.        ,    0.0767034...],
+                          [ 400.        ,    0.0766588...],
+                          [ 410.        ,    0.0764524...],
+                          [ 420.        ,    0.0757057...],
+                          [ 430.        ,    0.0732750...],
+                          [ 440.        ,    0.0676762...],
+                          [ 450.        ,    0.0577821...],
+                          [ 460.        ,    0.0440818...],
+                          [ 470.        ,    0.0284495...],
+                          [ 480.        ,    0.0137818...],
+                          [ 490.        ,    0.0033713...],
                           [ 500.        ,    0.       ...],
                           [ 510.        ,    0.       ...],
                           [ 520.        ,    0.       ...],
                           [ 530.        ,    0.       ...],
-                          [ 540.        ,    0.0055360...],
-                          [ 550.        ,    0.0317335...],
-                          [ 560.        ,    0.075457 ...],
-                          [ 570.        ,    0.1314930...],
-                          [ 580.        ,    0.1938219...],
-                          [ 590.        ,    0.2559747...],
-                          [ 600.        ,    0.3122869...],
-                          [ 610.        ,    0.3584363...],
-                          [ 620.        ,    0.3927112...],
-                          [ 630.        ,    0.4158866...],
-                          [ 640.        ,    0.4305832...],
-                          [ 650.        ,    0.4391142...],
-                          [ 660.        ,    0.4439484...],
-                          [ 670.        ,    0.4464121...],
-                          [ 680.        ,    0.4475718...],
-                          [ 690.        ,    0.4481182...],
-                          [ 700.        ,    0.4483734...],
-                          [ 710.        ,    0.4484743...],
-                          [ 720.        ,    0.4485753...],
-                          [ 730.        ,    0.4486474...],
-                          [ 740.        ,    0.4486629...],
-                          [ 750.        ,    0.4486995...],
-                          [ 760.        ,    0.4486925...],
-                          [ 770.        ,    0.4486794...],
-                          [ 780.        ,    0.4486982...]],
+                          [ 540.        ,    0.0055721...],
+                          [ 550.        ,    0.0317156...],
+                          [ 560.        ,    0.0754224...],
+                          [ 570.        ,    0.1315141...],
+                          [ 580.        ,    0.1938343...],
+                          [ 590.        ,    0.2559532...],
+                          [ 600.        ,    0.3122551...],
+                          [ 610.        ,    0.3584594...],
+                          [ 620.        ,    0.3927618...],
+                          [ 630.        ,    0.4159217...],
+                          [ 640.        ,    0.4306059...],
+                          [ 650.        ,    0.4391117...],
+                          [ 660.        ,    0.4437919...],
+                          [ 670.        ,    0.4462138...],
+                          [ 680.        ,    0.4473995...],
+                          [ 690.        ,    0.4479532...],
+                          [ 700.        ,    0.4482346...],
+                          [ 710.        ,    0.4483734...],
+                          [ 720.        ,    0.4484363...],
+                          [ 730.        ,    0.4484697...],
+                          [ 740.        ,    0.4484838...],
+                          [ 750.        ,    0.4484903...],
+                          [ 760.        ,    0.4484937...],
+                          [ 770.        ,    0.4484968...],
+                          [ 780.        ,    0.4484983...]],
                          interpolator=SpragueInterpolator,
                          interpolator_kwargs={},
                          extrapolator=Extrapolator,
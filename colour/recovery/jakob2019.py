@@ -8,6 +8,7 @@ Defines objects for reflectance recovery, i.e. spectral upsampling, using
 
 -   :func:`colour.recovery.sd_Jakob2019`
 -   :func:`colour.recovery.find_coefficients_Jakob2019`
+-   :func:`colour.recovery.find_coefficients_batch_Jakob2019`
 -   :func:`colour.recovery.XYZ_to_sd_Jakob2019`
 -   :class:`colour.recovery.LUT3D_Jakob2019`
 
@@ -18,8 +19,12 @@ References
     38(2), 147-155. doi:10.1111/cgf.13626
 """
 
+import hashlib
 import numpy as np
+import os
 import struct
+from concurrent.futures import FIRST_COMPLETED, wait
+from functools import partial
 from scipy.optimize import minimize
 from scipy.interpolate import RegularGridInterpolator
 
@@ -30,9 +35,10 @@ from colour.colorimetry import (
     intermediate_lightness_function_CIE1976, sd_to_XYZ)
 from colour.difference import JND_CIE1976
 from colour.models import XYZ_to_xy, XYZ_to_Lab, RGB_to_XYZ
-from colour.utilities import (as_float_array, domain_range_scale, full,
-                              index_along_last_axis, is_tqdm_installed,
-                              message_box, to_domain_1, runtime_warning, zeros)
+from colour.utilities import (
+    as_float, as_float_array, domain_range_scale, full, get_executor,
+    ignore_numpy_errors, index_along_last_axis, is_tqdm_installed,
+    message_box, to_domain_1, runtime_warning, tsplit, usage_warning, zeros)
 try:
     from unittest import mock
 except ImportError:  # pragma: no cover
@@ -52,7 +58,8 @@ __status__ = 'Production'
 __all__ = [
     'SPECTRAL_SHAPE_JAKOB2019', 'StopMinimizationEarly', 'sd_Jakob2019',
     'error_function', 'dimensionalise_coefficients', 'lightness_scale',
-    'find_coefficients_Jakob2019', 'XYZ_to_sd_Jakob2019', 'LUT3D_Jakob2019'
+    'find_coefficients_Jakob2019', 'find_coefficients_batch_Jakob2019',
+    'XYZ_to_sd_Jakob2019', 'LUT3D_Jakob2019'
 ]
 
 SPECTRAL_SHAPE_JAKOB2019 = SpectralShape(360, 780, 5)
@@ -63,6 +70,17 @@ SPECTRAL_SHAPE_JAKOB2019 : SpectralShape
 """
 
 
+_TILE_SIZE_JAKOB2019 = 2 ** 12
+"""
+Number of pixels processed at once by
+:meth:`colour.recovery.LUT3D_Jakob2019.RGB_to_reflectances` method, chosen so
+that the per-tile temporary arrays fit in the processor cache for the typical
+spectral shapes.
+
+_TILE_SIZE_JAKOB2019 : int
+"""
+
+
 class StopMinimizationEarly(Exception):
     """
     The exception used to stop :func:`scipy.optimize.minimize` once the
@@ -108,6 +126,21 @@ class StopMinimizationEarly(Exception):
         return self._error
 
 
+def _coefficients_to_reflectances_Jakob2019(coefficients, wavelengths):
+    """
+    Returns the spectral reflectances of given dimensionful coefficients for
+    *Jakob and Hanika (2019)* reflectance spectral model at given wavelengths
+    along a new last axis.
+    """
+
+    c_0, c_1, c_2 = tsplit(coefficients)
+
+    U = (c_0[..., np.newaxis] * wavelengths ** 2 +
+         c_1[..., np.newaxis] * wavelengths + c_2[..., np.newaxis])
+
+    return 1 / 2 + U / (2 * np.sqrt(1 + U ** 2))
+
+
 def sd_Jakob2019(coefficients, shape=SPECTRAL_SHAPE_JAKOB2019):
     """
     Returns a spectral distribution following the spectral model given by
@@ -158,16 +191,86 @@ def sd_Jakob2019(coefficients, shape=SPECTRAL_SHAPE_JAKOB2019):
                          extrapolator_kwargs={...})
     """
 
-    c_0, c_1, c_2 = as_float_array(coefficients)
     wl = shape.range()
-    U = c_0 * wl ** 2 + c_1 * wl + c_2
-    R = 1 / 2 + U / (2 * np.sqrt(1 + U ** 2))
+    R = _coefficients_to_reflectances_Jakob2019(coefficients, wl)
 
     name = '{0} (COEFF) - Jakob (2019)'.format(coefficients)
 
     return SpectralDistribution(R, wl, name=name)
 
 
+def _weights_Jakob2019(cmfs, illuminant):
+    """
+    Returns the normalised wavelengths, the weights converting a spectral
+    reflectance to *CIE XYZ* tristimulus values and the normalised
+    illuminant *CIE XYZ* tristimulus values for given colour matching
+    functions and illuminant.
+    """
+
+    wv = np.linspace(0, 1, len(cmfs.shape))
+
+    dw = cmfs.wavelengths[1] - cmfs.wavelengths[0]
+    k = 1 / (np.sum(cmfs.values[:, 1] * illuminant.values) * dw)
+
+    weights = k * illuminant.values[..., np.newaxis] * cmfs.values * dw
+
+    XYZ_n = sd_to_XYZ(illuminant, cmfs)
+    XYZ_n /= XYZ_n[1]
+
+    return wv, weights, XYZ_n
+
+
+def _coefficients_to_Lab_Jakob2019(coefficients, wv, weights, XYZ_n):
+    """
+    Converts given dimensionless coefficients to *CIE L\\*a\\*b\\**
+    colourspace arrays and returns the spectral reflectances, the *CIE XYZ*
+    tristimulus values, the *CIE L\\*a\\*b\\** colourspace arrays and
+    their Jacobian matrices, i.e. the first derivatives of the
+    *CIE L\\*a\\*b\\** colourspace arrays with respect to the
+    coefficients along the last axis.
+    """
+
+    c_0, c_1, c_2 = tsplit(coefficients)
+
+    U = (c_0[..., np.newaxis] * wv ** 2 + c_1[..., np.newaxis] * wv +
+         c_2[..., np.newaxis])
+    t1 = np.sqrt(1 + U ** 2)
+    R = 1 / 2 + U / (2 * t1)
+
+    t2 = 1 / (2 * t1) - U ** 2 / (2 * t1 ** 3)
+    dR = np.stack([wv ** 2 * t2, wv * t2, t2], axis=-2)
+
+    XYZ = np.matmul(R, weights)
+    dXYZ = np.swapaxes(np.matmul(dR, weights), -1, -2)
+
+    XYZ_XYZ_n = XYZ / XYZ_n
+
+    XYZ_f = intermediate_lightness_function_CIE1976(XYZ, XYZ_n)
+    dXYZ_f = np.where(
+        XYZ_XYZ_n[..., np.newaxis] > (24 / 116) ** 3,
+        1 / (3 * spow(XYZ_n[..., np.newaxis], 1 / 3) * spow(
+            XYZ[..., np.newaxis], 2 / 3)) * dXYZ,
+        (841 / 108) * dXYZ / XYZ_n[..., np.newaxis],
+    )
+
+    def intermediate_XYZ_to_Lab(XYZ_i, axis, offset=16):
+        """
+        Returns the final intermediate value for the *CIE Lab* to *CIE XYZ*
+        conversion.
+        """
+
+        X_i, Y_i, Z_i = np.moveaxis(XYZ_i, axis, 0)
+
+        return np.stack(
+            [116 * Y_i - offset, 500 * (X_i - Y_i), 200 * (Y_i - Z_i)],
+            axis=axis)
+
+    Lab = intermediate_XYZ_to_Lab(XYZ_f, -1)
+    dLab = intermediate_XYZ_to_Lab(dXYZ_f, -2, 0)
+
+    return R, XYZ, Lab, dLab
+
+
 def error_function(coefficients,
                    target,
                    cmfs,
@@ -216,50 +319,10 @@ def error_function(coefficients,
         Raised when the error is below ``max_error``.
     """
 
-    c_0, c_1, c_2 = as_float_array(coefficients)
-    wv = np.linspace(0, 1, len(cmfs.shape))
-
-    U = c_0 * wv ** 2 + c_1 * wv + c_2
-    t1 = np.sqrt(1 + U ** 2)
-    R = 1 / 2 + U / (2 * t1)
-
-    t2 = 1 / (2 * t1) - U ** 2 / (2 * t1 ** 3)
-    dR = np.array([wv ** 2 * t2, wv * t2, t2])
-
-    E = illuminant.values * R
-    dE = illuminant.values * dR
+    wv, weights, XYZ_n = _weights_Jakob2019(cmfs, illuminant)
 
-    dw = cmfs.wavelengths[1] - cmfs.wavelengths[0]
-    k = 1 / (np.sum(cmfs.values[:, 1] * illuminant.values) * dw)
-
-    XYZ = k * np.dot(E, cmfs.values) * dw
-    dXYZ = np.transpose(k * np.dot(dE, cmfs.values) * dw)
-
-    XYZ_n = sd_to_XYZ(illuminant, cmfs)
-    XYZ_n /= XYZ_n[1]
-    XYZ_XYZ_n = XYZ / XYZ_n
-
-    XYZ_f = intermediate_lightness_function_CIE1976(XYZ, XYZ_n)
-    dXYZ_f = np.where(
-        XYZ_XYZ_n[..., np.newaxis] > (24 / 116) ** 3,
-        1 / (3 * spow(XYZ_n[..., np.newaxis], 1 / 3) * spow(
-            XYZ[..., np.newaxis], 2 / 3)) * dXYZ,
-        (841 / 108) * dXYZ / XYZ_n[..., np.newaxis],
-    )
-
-    def intermediate_XYZ_to_Lab(XYZ_i, offset=16):
-        """
-        Returns the final intermediate value for the *CIE Lab* to *CIE XYZ*
-        conversion.
-        """
-
-        return np.array([
-            116 * XYZ_i[1] - offset, 500 * (XYZ_i[0] - XYZ_i[1]),
-            200 * (XYZ_i[1] - XYZ_i[2])
-        ])
-
-    Lab_i = intermediate_XYZ_to_Lab(XYZ_f)
-    dLab_i = intermediate_XYZ_to_Lab(dXYZ_f, 0)
+    R, XYZ, Lab_i, dLab_i = _coefficients_to_Lab_Jakob2019(
+        as_float_array(coefficients), wv, weights, XYZ_n)
 
     error = np.sqrt(np.sum((Lab_i - target) ** 2))
     if max_error is not None and error <= max_error:
@@ -454,6 +517,158 @@ def find_coefficients_Jakob2019(
     return coefficients, error
 
 
+@ignore_numpy_errors
+def find_coefficients_batch_Jakob2019(
+        XYZ,
+        cmfs=MSDS_CMFS_STANDARD_OBSERVER['CIE 1931 2 Degree Standard Observer']
+        .copy().align(SPECTRAL_SHAPE_JAKOB2019),
+        illuminant=SDS_ILLUMINANTS['D65'].copy().align(
+            SPECTRAL_SHAPE_JAKOB2019),
+        coefficients_0=None,
+        max_error=JND_CIE1976 / 100,
+        iterations=30,
+        dimensionalise=True):
+    """
+    Computes the coefficients for *Jakob and Hanika (2019)* reflectance
+    spectral model of given array of *CIE XYZ* tristimulus values
+    simultaneously using a damped *Gauss-Newton* method, i.e. the
+    *Levenberg-Marquardt* method, with the analytical Jacobian matrices of the
+    *CIE L\\*a\\*b\\** colourspace arrays.
+
+    Parameters
+    ----------
+    XYZ : array_like, (..., 3)
+        *CIE XYZ* tristimulus values to find the coefficients for.
+    cmfs : XYZ_ColourMatchingFunctions
+        Standard observer colour matching functions.
+    illuminant : SpectralDistribution
+        Illuminant spectral distribution.
+    coefficients_0 : array_like, (..., 3), optional
+        Dimensionless starting coefficients for the solver, e.g. the
+        coefficients of neighbouring colours. If *None*, the solver starts
+        from zero coefficients, i.e. a 50% grey.
+    max_error : float, optional
+        Maximal acceptable error, the coefficients reaching it are not
+        iterated further. If *None*, the solver runs all the iterations.
+    iterations : int, optional
+        Maximum iterations count.
+    dimensionalise : bool, optional
+        If *True*, returned coefficients are dimensionful and will not work
+        correctly if fed back as ``coefficients_0``. The default is *True*.
+
+    Returns
+    -------
+    coefficients : ndarray, (..., 3)
+        Computed coefficients that best fit the given colours.
+    error : ndarray
+        :math:`\\Delta E_{76}` between the target colours and the colours
+        corresponding to the computed coefficients.
+
+    Notes
+    -----
+    -   Contrary to the :func:`colour.recovery.find_coefficients_Jakob2019`
+        definition, the solver does not progress from a 50% grey to the
+        target colours: very dark or saturated colours might not converge
+        from zero coefficients and should be started from the coefficients of
+        less extreme neighbouring colours. The error of such colours is
+        greater than ``max_error``.
+    -   Only the steps decreasing the error of the coefficients are
+        accepted, thus, the returned error is the smallest one reached.
+
+    References
+    ----------
+    :cite:`Jakob2019`
+
+    Examples
+    --------
+    >>> XYZ = np.array([[0.20654008, 0.12197225, 0.05136952],
+    ...                 [0.14222010, 0.23042768, 0.10495772]])
+    >>> coefficients, error = find_coefficients_batch_Jakob2019(XYZ)
+    >>> coefficients  # doctest: +ELLIPSIS
+    array([[  1.3728690...e-04,  -1.3519436...e-01,   3.0850758...e+01],
+           [ -1.6527164...e-04,   1.7750768...e-01,  -4.8063157...e+01]])
+    >>> error  # doctest: +ELLIPSIS
+    array([ 0.0002464...,  0.0001012...])
+    """
+
+    XYZ = as_float_array(XYZ)
+
+    shape = cmfs.shape
+
+    if illuminant.shape != shape:
+        runtime_warning(
+            'Aligning "{0}" illuminant shape to "{1}" colour matching '
+            'functions shape.'.format(illuminant.name, cmfs.name))
+        illuminant = illuminant.copy().align(cmfs.shape)
+
+    wv, weights, XYZ_n = _weights_Jakob2019(cmfs, illuminant)
+
+    target = np.reshape(XYZ_to_Lab(XYZ, XYZ_to_xy(XYZ_n)), [-1, 3])
+
+    if coefficients_0 is None:
+        coefficients = zeros(target.shape)
+    else:
+        coefficients = np.reshape(
+            np.array(np.broadcast_to(coefficients_0, XYZ.shape),
+                     dtype=np.float64), [-1, 3])
+
+    max_error = 0 if max_error is None else max_error
+
+    _R, _XYZ, Lab, dLab = _coefficients_to_Lab_Jakob2019(
+        coefficients, wv, weights, XYZ_n)
+    residual = Lab - target
+    error = np.linalg.norm(residual, axis=-1)
+    damping = full(target.shape[0], 1e-3)
+
+    for _i in range(iterations):
+        # Indexes of the coefficients still being solved.
+        indexes = np.where(error > max_error)[0]
+        if len(indexes) == 0:
+            break
+
+        J = dLab[indexes]
+        J_T = np.swapaxes(J, -1, -2)
+        J_T_J = np.matmul(J_T, J)
+        A = J_T_J + damping[indexes, np.newaxis, np.newaxis] * (
+            J_T_J * np.identity(3))
+        b = np.matmul(J_T, residual[indexes, ..., np.newaxis])
+
+        try:
+            delta = np.linalg.solve(A, b)
+        except np.linalg.LinAlgError:
+            delta = np.matmul(np.linalg.pinv(A), b)
+
+        coefficients_i = coefficients[indexes] - delta[..., 0]
+
+        _R, _XYZ, Lab_i, dLab_i = _coefficients_to_Lab_Jakob2019(
+            coefficients_i, wv, weights, XYZ_n)
+        residual_i = Lab_i - target[indexes]
+        error_i = np.linalg.norm(residual_i, axis=-1)
+
+        # Only the steps decreasing the error are accepted, the damping is
+        # decreased for them so that the solver tends toward the
+        # "Gauss-Newton" method and increased for the others so that it
+        # tends toward the gradient descent method. The steps reaching
+        # saturated reflectances, i.e. non-finite errors, are rejected.
+        accepted = error_i < error[indexes]
+        indexes_a = indexes[accepted]
+
+        coefficients[indexes_a] = coefficients_i[accepted]
+        dLab[indexes_a] = dLab_i[accepted]
+        residual[indexes_a] = residual_i[accepted]
+        error[indexes_a] = error_i[accepted]
+
+        damping[indexes_a] /= 10
+        damping[indexes[~accepted]] *= 10
+
+    if dimensionalise:
+        coefficients = np.transpose(
+            dimensionalise_coefficients(np.transpose(coefficients), shape))
+
+    return (np.reshape(coefficients, XYZ.shape),
+            as_float(np.reshape(error, XYZ.shape[:-1])))
+
+
 def XYZ_to_sd_Jakob2019(
         XYZ,
         cmfs=MSDS_CMFS_STANDARD_OBSERVER['CIE 1931 2 Degree Standard Observer']
@@ -575,6 +790,117 @@ def XYZ_to_sd_Jakob2019(
         return sd
 
 
+def _optimise_slice_Jakob2019(chromas, lightness_scale, matrix_RGB_to_XYZ,
+                              whitepoint, xy_n, cmfs, illuminant):
+    """
+    Optimises the coefficients of given fully bright *RGB* colourspace chromas
+    along the lightness scale, i.e. a slice of a face of the lookup table
+    colour cube. The chromas are solved simultaneously with the
+    :func:`colour.recovery.find_coefficients_batch_Jakob2019` definition and
+    the coefficients of each lightness step are used as starting coefficients
+    for the next step.
+    """
+
+    lightness_steps = len(lightness_scale)
+    coefficients = np.empty([len(chromas), lightness_steps, 3])
+
+    def optimize(L, coefficients_0):
+        """
+        Solves for a specific lightness and stores the results in the
+        appropriate cells.
+        """
+
+        RGB = lightness_scale[L] * chromas
+
+        XYZ = RGB_to_XYZ(RGB, whitepoint, xy_n, matrix_RGB_to_XYZ)
+
+        coefficients_L, _error = find_coefficients_batch_Jakob2019(
+            XYZ, cmfs, illuminant, coefficients_0, dimensionalise=False)
+
+        coefficients[:, L] = np.transpose(
+            dimensionalise_coefficients(
+                np.transpose(coefficients_L), cmfs.shape))
+
+        return coefficients_L
+
+    # Starts from somewhere in the middle, similarly to how feedback works in
+    # "colour.recovery.find_coefficients_Jakob2019" definition.
+    L_middle = lightness_steps // 3
+    coefficients_middle = optimize(L_middle, None)
+
+    # Goes down the lightness scale.
+    coefficients_0 = coefficients_middle
+    for L in reversed(range(0, L_middle)):
+        coefficients_0 = optimize(L, coefficients_0)
+
+    # Goes up the lightness scale.
+    coefficients_0 = coefficients_middle
+    for L in range(L_middle + 1, lightness_steps):
+        coefficients_0 = optimize(L, coefficients_0)
+
+    return coefficients
+
+
+def _checkpoint_key_Jakob2019(size, matrix_RGB_to_XYZ, whitepoint, cmfs,
+                              illuminant):
+    """
+    Returns the checkpoint key of given lookup table generation inputs, i.e.
+    their *SHA-1* hash.
+    """
+
+    sha1 = hashlib.sha1()
+    for array in (size, matrix_RGB_to_XYZ, whitepoint, cmfs.wavelengths,
+                  cmfs.values, illuminant.values):
+        sha1.update(np.ascontiguousarray(array, np.float64).tobytes())
+
+    return sha1.hexdigest()
+
+
+def _read_checkpoint_Jakob2019(path, key):
+    """
+    Reads the coefficients and the mask of the optimised slices stored in
+    given checkpoint file if its key matches given key, returns *None*
+    otherwise.
+    """
+
+    if path is None or not os.path.exists(path):
+        return None
+
+    try:
+        with np.load(path, allow_pickle=False) as checkpoint:
+            if str(checkpoint['key']) != key:
+                usage_warning(
+                    '"{0}" checkpoint was generated with different inputs '
+                    'and is ignored!'.format(path))
+
+                return None
+
+            return checkpoint['coefficients'], checkpoint['optimised']
+    except (OSError, ValueError, KeyError) as error:
+        usage_warning('"{0}" checkpoint could not be read: {1}'.format(
+            path, error))
+
+        return None
+
+
+def _write_checkpoint_Jakob2019(path, key, coefficients, optimised):
+    """
+    Writes given coefficients and mask of the optimised slices to given
+    checkpoint file with given key, the file is replaced atomically so that
+    an interruption cannot corrupt it.
+    """
+
+    path_temporary = '{0}.tmp'.format(path)
+    with open(path_temporary, 'wb') as checkpoint_file:
+        np.savez(
+            checkpoint_file,
+            key=key,
+            coefficients=coefficients,
+            optimised=optimised)
+
+    os.replace(path_temporary, path)
+
+
 class LUT3D_Jakob2019:
     """
     Class for working with pre-computed lookup tables for the
@@ -601,6 +927,7 @@ class LUT3D_Jakob2019:
     -   :meth:`~colour.recovery.LUT3D_Jakob2019.generate`
     -   :meth:`~colour.recovery.LUT3D_Jakob2019.RGB_to_coefficients`
     -   :meth:`~colour.recovery.LUT3D_Jakob2019.RGB_to_sd`
+    -   :meth:`~colour.recovery.LUT3D_Jakob2019.RGB_to_reflectances`
     -   :meth:`~colour.recovery.LUT3D_Jakob2019.read`
     -   :meth:`~colour.recovery.LUT3D_Jakob2019.write`
 
@@ -628,49 +955,49 @@ class LUT3D_Jakob2019:
     >>> RGB = np.array([0.70573936, 0.19248266, 0.22354169])
     >>> with numpy_print_options(suppress=True):
     ...     LUT.RGB_to_sd(RGB, cmfs.shape)  # doctest: +ELLIPSIS
-    SpectralDistribution([[ 360.        ,    0.7666362...],
-                          [ 370.        ,    0.6251086...],
-                          [ 380.        ,    0.4584017...],
-                          [ 390.        ,    0.3161559...],
-                          [ 400.        ,    0.2196213...],
-                          [ 410.        ,    0.1596688...],
-                          [ 420.        ,    0.1225656...],
-                          [ 430.        ,    0.0989919...],
-                          [ 440.        ,    0.0835916...],
-                          [ 450.        ,    0.0733669...],
-                          [ 460.        ,    0.0666183...],
-                          [ 470.        ,    0.0623707...],
-                          [ 480.        ,    0.0600743...],
-                          [ 490.        ,    0.0594537...],
-                          [ 500.        ,    0.0604370...],
-                          [ 510.        ,    0.0631385...],
-                          [ 520.        ,    0.0678869...],
-                          [ 530.        ,    0.0753101...],
-                          [ 540.        ,    0.0865126...],
-                          [ 550.        ,    0.1034213...],
-                          [ 560.        ,    0.1294488...],
-                          [ 570.        ,    0.1706888...],
-                          [ 580.        ,    0.2375459...],
-                          [ 590.        ,    0.3441276...],
-                          [ 600.        ,    0.4952667...],
-                          [ 610.        ,    0.660606 ...],
-                          [ 620.        ,    0.7915809...],
-                          [ 630.        ,    0.8739343...],
-                          [ 640.        ,    0.9213543...],
-                          [ 650.        ,    0.9487058...],
-                          [ 660.        ,    0.9650651...],
-                          [ 670.        ,    0.9752897...],
-                          [ 680.        ,    0.9819535...],
-                          [ 690.        ,    0.9864608...],
-                          [ 700.        ,    0.9896088...],
-                          [ 710.        ,    0.9918690...],
-                          [ 720.        ,    0.9935308...],
-                          [ 730.        ,    0.9947782...],
-                          [ 740.        ,    0.9957315...],
-                          [ 750.        ,    0.9964717...],
-                          [ 760.        ,    0.9970544...],
-                          [ 770.        ,    0.9975191...],
-                          [ 780.        ,    0.9978937...]],
+    SpectralDistribution([[ 360.        ,    0.7676938...],
+                          [ 370.        ,    0.6264643...],
+                          [ 380.        ,    0.4596449...],
+                          [ 390.        ,    0.3169873...],
+                          [ 400.        ,    0.2200906...],
+                          [ 410.        ,    0.1599189...],
+                          [ 420.        ,    0.1226959...],
+                          [ 430.        ,    0.0990566...],
+                          [ 440.        ,    0.0836192...],
+                          [ 450.        ,    0.0733722...],
+                          [ 460.        ,    0.0666096...],
+                          [ 470.        ,    0.0623522...],
+                          [ 480.        ,    0.0600487...],
+                          [ 490.        ,    0.0594222...],
+                          [ 500.        ,    0.0604001...],
+                          [ 510.        ,    0.0630962...],
+                          [ 520.        ,    0.0678389...],
+                          [ 530.        ,    0.0752556...],
+                          [ 540.        ,    0.0864506...],
+                          [ 550.        ,    0.1033514...],
+                          [ 560.        ,    0.1293718...],
+                          [ 570.        ,    0.1706109...],
+                          [ 580.        ,    0.2374875...],
+                          [ 590.        ,    0.3441360...],
+                          [ 600.        ,    0.4953974...],
+                          [ 610.        ,    0.6608334...],
+                          [ 620.        ,    0.7918067...],
+                          [ 630.        ,    0.8741072...],
+                          [ 640.        ,    0.9214756...],
+                          [ 650.        ,    0.9487899...],
+                          [ 660.        ,    0.9651244...],
+                          [ 670.        ,    0.9753326...],
+                          [ 680.        ,    0.9819853...],
+                          [ 690.        ,    0.9864849...],
+                          [ 700.        ,    0.9896274...],
+                          [ 710.        ,    0.9918837...],
+                          [ 720.        ,    0.9935426...],
+                          [ 730.        ,    0.9947878...],
+                          [ 740.        ,    0.9957393...],
+                          [ 750.        ,    0.9964782...],
+                          [ 760.        ,    0.9970599...],
+                          [ 770.        ,    0.9975237...],
+                          [ 780.        ,    0.9978976...]],
                          interpolator=SpragueInterpolator,
                          interpolator_kwargs={},
                          extrapolator=Extrapolator,
@@ -758,11 +1085,17 @@ class LUT3D_Jakob2019:
                  illuminant=SDS_ILLUMINANTS['D65'].copy().align(
                      SPECTRAL_SHAPE_JAKOB2019),
                  size=64,
-                 print_callable=print):
+                 print_callable=print,
+                 checkpoint_path=None):
         """
         Generates the lookup table data for given *RGB* colourspace, colour
         matching functions, illuminant and given size.
 
+        The optimisation is split in slices of the faces of the colour cube,
+        each slice being optimised along the lightness scale, and distributed
+        with the *Colour* executor, see :func:`colour.utilities.get_executor`
+        definition.
+
         Parameters
         ----------
         colourspace: RGB_Colourspace
@@ -777,6 +1110,11 @@ class LUT3D_Jakob2019:
             *\\*.coeff* files have a resolution of 64.
         print_callable : callable, optional
             Callable used to print progress and diagnostic information.
+        checkpoint_path : unicode, optional
+            Path of the *\\*.npz* checkpoint file the optimised slices are
+            written to as they complete. An interrupted generation called
+            again with the same path and inputs resumes from the optimised
+            slices, a checkpoint generated with different inputs is ignored.
 
         Examples
         --------
@@ -827,68 +1165,89 @@ class LUT3D_Jakob2019:
         self._coefficients = np.empty(
             [3, chroma_steps, chroma_steps, lightness_steps, 3])
 
-        cube_indexes = np.ndindex(3, chroma_steps, chroma_steps)
         total_coefficients = chroma_steps ** 2 * 3
 
         # First, create a list of all the fully bright colours with the order
-        # matching cube_indexes.
+        # matching the cube indexes, i.e. "np.ndindex(3, chroma_steps,
+        # chroma_steps)", then split it in slices of "chroma_steps" colours.
         samples = np.linspace(0, 1, chroma_steps)
         ij = np.meshgrid(*[[1], samples, samples], indexing='ij')
         ij = np.transpose(ij).reshape(-1, 3)
         chromas = np.concatenate(
             [ij, np.roll(ij, 1, axis=1),
-             np.roll(ij, 2, axis=1)])
+             np.roll(ij, 2, axis=1)]).reshape(3, chroma_steps, chroma_steps, 3)
+
+        # Each slice "(i, j)" is stored at "self._coefficients[i, :, j]" and
+        # tracked in the "optimised" mask for the checkpoint.
+        optimised = np.zeros([3, chroma_steps], dtype=np.bool_)
+
+        key = _checkpoint_key_Jakob2019(size, colourspace.matrix_RGB_to_XYZ,
+                                        colourspace.whitepoint, cmfs,
+                                        illuminant)
+        checkpoint = _read_checkpoint_Jakob2019(checkpoint_path, key)
 
         message_box(
             '"Jakob et al. (2018)" LUT Optimisation',
             print_callable=print_callable)
 
+        if checkpoint is not None:
+            self._coefficients[...], optimised[...] = checkpoint
+
+            print_callable('\nResuming from "{0}" checkpoint with {1} '
+                           'optimised coefficients.'.format(
+                               checkpoint_path,
+                               np.sum(optimised) * chroma_steps))
+
         print_callable(
             '\nOptimising {0} coefficients...\n'.format(total_coefficients))
 
-        def optimize(ijkL, coefficients_0):
+        optimise_slice = partial(
+            _optimise_slice_Jakob2019,
+            lightness_scale=self._lightness_scale,
+            matrix_RGB_to_XYZ=colourspace.matrix_RGB_to_XYZ,
+            whitepoint=colourspace.whitepoint,
+            xy_n=xy_n,
+            cmfs=cmfs,
+            illuminant=illuminant)
+
+        executor = get_executor()
+        # The slices are submitted lazily so that the *Serial* executor
+        # reports progress and writes the checkpoint after each slice.
+        in_flight = 2 * executor.workers if executor.workers > 1 else 1
+
+        def collect(futures):
             """
-            Solves for a specific lightness and stores the result in the
-            appropriate cell.
+            Stores the coefficients of given completed slices futures and
+            writes the checkpoint.
             """
 
-            i, j, k, L = ijkL
-
-            RGB = self._lightness_scale[L] * chroma
-
-            XYZ = RGB_to_XYZ(RGB, colourspace.whitepoint, xy_n,
-                             colourspace.matrix_RGB_to_XYZ)
-
-            coefficients, _error = find_coefficients_Jakob2019(
-                XYZ, cmfs, illuminant, coefficients_0, dimensionalise=False)
-
-            self._coefficients[i, L, j, k, :] = dimensionalise_coefficients(
-                coefficients, shape)
-
-            return coefficients
-
-        with tqdm(total=total_coefficients) as progress:
-            for ijk, chroma in zip(cube_indexes, chromas):
-                progress.update()
-
-                # Starts from somewhere in the middle, similarly to how
-                # feedback works in "colour.recovery.\
-                # find_coefficients_Jakob2019" definition.
-                L_middle = lightness_steps // 3
-                coefficients_middle = optimize(
-                    np.hstack([ijk, L_middle]), zeros(3))
-
-                # Goes down the lightness scale.
-                coefficients_0 = coefficients_middle
-                for L in reversed(range(0, L_middle)):
-                    coefficients_0 = optimize(
-                        np.hstack([ijk, L]), coefficients_0)
-
-                # Goes up the lightness scale.
-                coefficients_0 = coefficients_middle
-                for L in range(L_middle + 1, lightness_steps):
-                    coefficients_0 = optimize(
-                        np.hstack([ijk, L]), coefficients_0)
+            for future in futures:
+                i, j = slices[future]
+                self._coefficients[i, :, j] = np.transpose(
+                    future.result(), [1, 0, 2])
+                optimised[i, j] = True
+                progress.update(chroma_steps)
+
+            if checkpoint_path is not None:
+                _write_checkpoint_Jakob2019(checkpoint_path, key,
+                                            self._coefficients, optimised)
+
+        slices, pending = {}, set()
+        with tqdm(
+                total=total_coefficients,
+                initial=np.sum(optimised) * chroma_steps) as progress:
+            for i, j in zip(*np.where(~optimised)):
+                future = executor.submit(optimise_slice, chromas[i, j])
+                slices[future] = (i, j)
+                pending.add(future)
+
+                if len(pending) >= in_flight:
+                    done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    collect(done)
+
+            while pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                collect(done)
 
         self._size = size
         self._create_interpolator()
@@ -900,12 +1259,12 @@ class LUT3D_Jakob2019:
 
         Parameters
         ----------
-        RGB : ndarray, (3,)
-            *RGB* colourspace array.
+        RGB : ndarray, (..., 3)
+            *RGB* colourspace array, e.g. an image.
 
         Returns
         -------
-        coefficients : ndarray, (3,)
+        coefficients : ndarray, (..., 3)
             Corresponding coefficients that can be passed to
             :func:`colour.recovery.jakob2019.sd_Jakob2019` to obtain a spectral
             distribution.
@@ -922,7 +1281,7 @@ class LUT3D_Jakob2019:
         ...     RGB_COLOURSPACE_sRGB, cmfs, illuminant, 3, lambda x: x)
         >>> RGB = np.array([0.70573936, 0.19248266, 0.22354169])
         >>> LUT.RGB_to_coefficients(RGB)  # doctest: +ELLIPSIS
-        array([  1.5012557...e-04,  -1.4678661...e-01,   3.4017293...e+01])
+        array([  1.5028938...e-04,  -1.4695738...e-01,   3.4061042...e+01])
         """
 
         RGB = as_float_array(RGB)
@@ -937,7 +1296,7 @@ class LUT3D_Jakob2019:
 
         indexes = np.stack([i_m, i_1, i_2, i_3], axis=-1)
 
-        return self._interpolator(indexes).squeeze()
+        return np.reshape(self._interpolator(indexes), RGB.shape)
 
     def RGB_to_sd(self, RGB, shape=SPECTRAL_SHAPE_JAKOB2019):
         """
@@ -971,49 +1330,49 @@ class LUT3D_Jakob2019:
         >>> RGB = np.array([0.70573936, 0.19248266, 0.22354169])
         >>> with numpy_print_options(suppress=True):
         ...     LUT.RGB_to_sd(RGB, cmfs.shape)  # doctest: +ELLIPSIS
-        SpectralDistribution([[ 360.        ,    0.7666362...],
-                              [ 370.        ,    0.6251086...],
-                              [ 380.        ,    0.4584017...],
-                              [ 390.        ,    0.3161559...],
-                              [ 400.        ,    0.2196213...],
-                              [ 410.        ,    0.1596688...],
-                              [ 420.        ,    0.1225656...],
-                              [ 430.        ,    0.0989919...],
-                              [ 440.        ,    0.0835916...],
-                              [ 450.        ,    0.0733669...],
-                              [ 460.        ,    0.0666183...],
-                              [ 470.        ,    0.0623707...],
-                              [ 480.        ,    0.0600743...],
-                              [ 490.        ,    0.0594537...],
-                              [ 500.        ,    0.0604370...],
-                              [ 510.        ,    0.0631385...],
-                              [ 520.        ,    0.0678869...],
-                              [ 530.        ,    0.0753101...],
-                              [ 540.        ,    0.0865126...],
-                              [ 550.        ,    0.1034213...],
-                              [ 560.        ,    0.1294488...],
-                              [ 570.        ,    0.1706888...],
-                              [ 580.        ,    0.2375459...],
-                              [ 590.        ,    0.3441276...],
-                              [ 600.        ,    0.4952667...],
-                              [ 610.        ,    0.660606 ...],
-                              [ 620.        ,    0.7915809...],
-                              [ 630.        ,    0.8739343...],
-                              [ 640.        ,    0.9213543...],
-                              [ 650.        ,    0.9487058...],
-                              [ 660.        ,    0.9650651...],
-                              [ 670.        ,    0.9752897...],
-                              [ 680.        ,    0.9819535...],
-                              [ 690.        ,    0.9864608...],
-                              [ 700.        ,    0.9896088...],
-                              [ 710.        ,    0.9918690...],
-                              [ 720.        ,    0.9935308...],
-                              [ 730.        ,    0.9947782...],
-                              [ 740.        ,    0.9957315...],
-                              [ 750.        ,    0.9964717...],
-                              [ 760.        ,    0.9970544...],
-                              [ 770.        ,    0.9975191...],
-                              [ 780.        ,    0.9978937...]],
+        SpectralDistribution([[ 360.        ,    0.7676938...],
+                              [ 370.        ,    0.6264643...],
+                              [ 380.        ,    0.4596449...],
+                              [ 390.        ,    0.3169873...],
+                              [ 400.        ,    0.2200906...],
+                              [ 410.        ,    0.1599189...],
+                              [ 420.        ,    0.1226959...],
+                              [ 430.        ,    0.0990566...],
+                              [ 440.        ,    0.0836192...],
+                              [ 450.        ,    0.0733722...],
+                              [ 460.        ,    0.0666096...],
+                              [ 470.        ,    0.0623522...],
+                              [ 480.        ,    0.0600487...],
+                              [ 490.        ,    0.0594222...],
+                              [ 500.        ,    0.0604001...],
+                              [ 510.        ,    0.0630962...],
+                              [ 520.        ,    0.0678389...],
+                              [ 530.        ,    0.0752556...],
+                              [ 540.        ,    0.0864506...],
+                              [ 550.        ,    0.1033514...],
+                              [ 560.        ,    0.1293718...],
+                              [ 570.        ,    0.1706109...],
+                              [ 580.        ,    0.2374875...],
+                              [ 590.        ,    0.3441360...],
+                              [ 600.        ,    0.4953974...],
+                              [ 610.        ,    0.6608334...],
+                              [ 620.        ,    0.7918067...],
+                              [ 630.        ,    0.8741072...],
+                              [ 640.        ,    0.9214756...],
+                              [ 650.        ,    0.9487899...],
+                              [ 660.        ,    0.9651244...],
+                              [ 670.        ,    0.9753326...],
+                              [ 680.        ,    0.9819853...],
+                              [ 690.        ,    0.9864849...],
+                              [ 700.        ,    0.9896274...],
+                              [ 710.        ,    0.9918837...],
+                              [ 720.        ,    0.9935426...],
+                              [ 730.        ,    0.9947878...],
+                              [ 740.        ,    0.9957393...],
+                              [ 750.        ,    0.9964782...],
+                              [ 760.        ,    0.9970599...],
+                              [ 770.        ,    0.9975237...],
+                              [ 780.        ,    0.9978976...]],
                              interpolator=SpragueInterpolator,
                              interpolator_kwargs={},
                              extrapolator=Extrapolator,
@@ -1025,6 +1384,90 @@ class LUT3D_Jakob2019:
 
         return sd
 
+    def RGB_to_reflectances(self,
+                            RGB,
+                            shape=SPECTRAL_SHAPE_JAKOB2019,
+                            tile_size=None,
+                            out=None):
+        """
+        Looks up a given *RGB* colourspace array, e.g. an image, and returns
+        the corresponding spectral reflectances as an array without creating
+        spectral distributions.
+
+        The *RGB* colourspace array is processed by tiles of pixels so that
+        the temporary arrays memory is bounded by the tile size, the output
+        array can be a :class:`numpy.memmap` class instance.
+
+        Parameters
+        ----------
+        RGB : array_like, (..., 3)
+            *RGB* colourspace array.
+        shape : SpectralShape, optional
+            Shape used by the spectral reflectances.
+        tile_size : int, optional
+            Number of pixels processed at once, if *None*,
+            :attr:`colour.recovery.jakob2019._TILE_SIZE_JAKOB2019` attribute
+            value is used.
+        out : ndarray, optional
+            *C-contiguous* array of shape (..., bands) receiving the spectral
+            reflectances.
+
+        Returns
+        -------
+        ndarray, (..., bands)
+            Spectral reflectances sampled at the wavelengths of given spectral
+            shape along the last axis.
+
+        Raises
+        ------
+        ValueError
+            If the ``out`` array shape is not compatible with the *RGB*
+            colourspace array shape and the spectral shape, or if the ``out``
+            array is not contiguous.
+
+        Examples
+        --------
+        >>> from colour.models import RGB_COLOURSPACE_sRGB
+        >>> cmfs = MSDS_CMFS_STANDARD_OBSERVER[
+        ...         'CIE 1931 2 Degree Standard Observer'].copy().align(
+        ...             SpectralShape(360, 780, 10))
+        >>> illuminant = SDS_ILLUMINANTS['D65'].copy().align(cmfs.shape)
+        >>> LUT = LUT3D_Jakob2019()
+        >>> LUT.generate(
+        ...     RGB_COLOURSPACE_sRGB, cmfs, illuminant, 3, lambda x: x)
+        >>> RGB = np.array([[[0.70573936, 0.19248266, 0.22354169],
+        ...                  [0.50000000, 0.50000000, 0.50000000]]])
+        >>> LUT.RGB_to_reflectances(RGB, SpectralShape(400, 700, 100))
+        ... # doctest: +ELLIPSIS
+        array([[[ 0.2200906...,  0.0604001...,  0.4953974...,  0.9896274...],
+                [ 0.5       ,  0.5       ,  0.5       ,  0.5       ]]])
+        """
+
+        RGB = as_float_array(RGB)
+        wavelengths = shape.range()
+
+        shape_o = RGB.shape[:-1] + wavelengths.shape
+        if out is None:
+            out = np.empty(shape_o)
+        elif out.shape != shape_o:
+            raise ValueError(
+                '"out" array shape "{0}" is not compatible with "{1}" "RGB" '
+                'colourspace array shape and "{2}" spectral shape!'.format(
+                    out.shape, RGB.shape, shape))
+
+        RGB_f = np.reshape(RGB, [-1, 3])
+        out_f = np.reshape(out, [-1, len(wavelengths)])
+        if out.size != 0 and not np.may_share_memory(out_f, out):
+            raise ValueError('"out" array must be contiguous!')
+
+        tile_size = _TILE_SIZE_JAKOB2019 if tile_size is None else tile_size
+        for i in range(0, RGB_f.shape[0], tile_size):
+            tile = slice(i, i + tile_size)
+            out_f[tile] = _coefficients_to_reflectances_Jakob2019(
+                self.RGB_to_coefficients(RGB_f[tile]), wavelengths)
+
+        return out
+
     def read(self, path):
         """
         Loads a lookup table from a *\\*.coeff* file.
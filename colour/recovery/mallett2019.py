@@ -7,6 +7,7 @@ Defines objects for reflectance recovery, i.e. spectral upsampling, using
 *Mallett and Yuksel (2019)* method:
 
 -   :func:`colour.recovery.spectral_primary_decomposition_Mallett2019`
+-   :func:`colour.recovery.RGB_to_reflectances_Mallett2019`
 -   :func:`colour.recovery.RGB_to_sd_Mallett2019`
 
 References
@@ -23,8 +24,9 @@ from scipy.optimize import Bounds, LinearConstraint, minimize
 from colour.colorimetry import (SpectralDistribution,
                                 MultiSpectralDistributions,
                                 MSDS_CMFS_STANDARD_OBSERVER, SDS_ILLUMINANTS)
+from colour.constants import DEFAULT_FLOAT_DTYPE
 from colour.recovery import MSDS_BASIS_FUNCTIONS_sRGB_MALLETT2019
-from colour.utilities import to_domain_1, runtime_warning
+from colour.utilities import CACHE_REGISTRY, to_domain_1, runtime_warning
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2021 - Colour Developers'
@@ -35,9 +37,23 @@ __status__ = 'Production'
 
 __all__ = [
     'spectral_primary_decomposition_Mallett2019',
+    'RGB_to_reflectances_Mallett2019',
     'RGB_to_sd_Mallett2019',
 ]
 
+_CACHE_SPECTRAL_PRIMARY_DECOMPOSITION_MALLETT2019 = (
+    CACHE_REGISTRY.register_cache(
+        '{0}._CACHE_SPECTRAL_PRIMARY_DECOMPOSITION_MALLETT2019'.format(
+            __name__)))
+
+_TILE_SIZE_MALLETT2019 = 2 ** 16
+"""
+Number of pixels processed at once by
+:func:`colour.recovery.RGB_to_reflectances_Mallett2019` definition.
+
+_TILE_SIZE_MALLETT2019 : int
+"""
+
 
 def spectral_primary_decomposition_Mallett2019(
         colourspace,
@@ -90,6 +106,8 @@ def spectral_primary_decomposition_Mallett2019(
         than BT.709. Of these, only *Pal/Secam* produces a feasible basis,
         which is relatively unsurprising since it is very similar to *BT.709*,
         whereas the others are significantly larger.
+    -   The basis functions are cached per *RGB* colourspace, colour matching
+        functions, illuminant and optimisation settings.
 
     Examples
     --------
@@ -153,6 +171,14 @@ def spectral_primary_decomposition_Mallett2019(
      [ 780.            0.3475263...    0.3262331...    0.3262404...]]
     """
 
+    hash_key = (colourspace.name, colourspace.matrix_XYZ_to_RGB.tobytes(),
+                hash(cmfs), hash(illuminant), metric, repr(metric_args),
+                repr(optimisation_kwargs))
+    basis_functions = _CACHE_SPECTRAL_PRIMARY_DECOMPOSITION_MALLETT2019.get(
+        hash_key)
+    if basis_functions is not None:
+        return basis_functions.copy()
+
     if illuminant.shape != cmfs.shape:
         runtime_warning(
             'Aligning "{0}" illuminant shape to "{1}" colour matching '
@@ -194,14 +220,116 @@ def spectral_primary_decomposition_Mallett2019(
     result = minimize(
         metric, args=metric_args, x0=np.zeros(3 * N), **optimisation_settings)
 
-    basis_functions = np.transpose(result.x.reshape(3, N))
-
-    return MultiSpectralDistributions(
-        basis_functions,
+    basis_functions = MultiSpectralDistributions(
+        np.transpose(result.x.reshape(3, N)),
         cmfs.shape.range(),
         name='Basis Functions - {0} - Mallett (2019)'.format(colourspace.name),
         labels=('red', 'green', 'blue'))
 
+    _CACHE_SPECTRAL_PRIMARY_DECOMPOSITION_MALLETT2019[hash_key] = (
+        basis_functions.copy())
+
+    return basis_functions
+
+
+def RGB_to_reflectances_Mallett2019(
+        RGB,
+        basis_functions=MSDS_BASIS_FUNCTIONS_sRGB_MALLETT2019,
+        tile_size=None,
+        out=None,
+        dtype=None):
+    """
+    Recovers the spectral reflectances of given *RGB* colourspace array, e.g.
+    an image, using *Mallett and Yuksel (2019)* method and returns them as an
+    array without creating spectral distributions.
+
+    The spectral reflectances are the product of the *RGB* colourspace array
+    with the basis functions, computed by tiles of pixels so that the
+    temporary arrays memory is bounded by the tile size, the output array can
+    be a :class:`numpy.memmap` class instance.
+
+    Parameters
+    ----------
+    RGB : array_like, (..., 3)
+        *RGB* colourspace array.
+    basis_functions : MultiSpectralDistributions
+        Basis functions for the method. The default is to use the built-in
+        *sRGB* basis functions, i.e.
+        :attr:`colour.recovery.MSDS_BASIS_FUNCTIONS_sRGB_MALLETT2019`.
+    tile_size : int, optional
+        Number of pixels processed at once, if *None*,
+        :attr:`colour.recovery.mallett2019._TILE_SIZE_MALLETT2019` attribute
+        value is used.
+    out : ndarray, optional
+        *C-contiguous* array of shape (..., bands) receiving the spectral
+        reflectances, its dtype supersedes ``dtype``.
+    dtype : type, optional
+        {:class:`numpy.float16`, :class:`numpy.float32`,
+        :class:`numpy.float64`, :class:`numpy.float128`},
+        Floating point dtype of the spectral reflectances, if *None*,
+        :attr:`colour.constants.DEFAULT_FLOAT_DTYPE` attribute value is used.
+
+    Returns
+    -------
+    ndarray, (..., bands)
+        Spectral reflectances sampled at the basis functions wavelengths along
+        the last axis.
+
+    Raises
+    ------
+    ValueError
+        If the ``out`` array shape is not compatible with the *RGB* colourspace
+        array shape and the basis functions, or if the ``out`` array is not
+        contiguous.
+
+    Notes
+    -----
+
+    +------------+-----------------------+---------------+
+    | **Domain** | **Scale - Reference** | **Scale - 1** |
+    +============+=======================+===============+
+    | ``RGB``    | [0, 1]                | [0, 1]        |
+    +------------+-----------------------+---------------+
+
+    References
+    ----------
+    :cite:`Mallett2019`
+
+    Examples
+    --------
+    >>> RGB = np.array([[[0.70573936, 0.19248266, 0.22354169],
+    ...                  [0.25000000, 0.50000000, 0.75000000]]])
+    >>> RGB_to_reflectances_Mallett2019(RGB)[..., ::27]  # doctest: +ELLIPSIS
+    array([[[ 0.3711335...,  0.1968108...,  0.6577704...],
+            [ 0.5033058...,  0.5085691...,  0.2818384...]]])
+    """
+
+    RGB = to_domain_1(RGB)
+
+    shape_o = RGB.shape[:-1] + basis_functions.wavelengths.shape
+    if out is None:
+        out = np.empty(
+            shape_o, DEFAULT_FLOAT_DTYPE if dtype is None else dtype)
+    elif out.shape != shape_o:
+        raise ValueError(
+            '"out" array shape "{0}" is not compatible with "{1}" "RGB" '
+            'colourspace array shape and "{2}" basis functions!'.format(
+                out.shape, RGB.shape, basis_functions.name))
+
+    basis = np.transpose(basis_functions.values).astype(out.dtype)
+
+    RGB_f = np.reshape(RGB, [-1, 3])
+    out_f = np.reshape(out, [-1, basis.shape[-1]])
+    if out.size != 0 and not np.may_share_memory(out_f, out):
+        raise ValueError('"out" array must be contiguous!')
+
+    tile_size = _TILE_SIZE_MALLETT2019 if tile_size is None else tile_size
+    for i in range(0, RGB_f.shape[0], tile_size):
+        tile = slice(i, i + tile_size)
+        np.dot(RGB_f[tile].astype(out.dtype), basis, out=out_f[tile])
+
+    return out
+
 
 def RGB_to_sd_Mallett2019(
         RGB, basis_functions=MSDS_BASIS_FUNCTIONS_sRGB_MALLETT2019):
@@ -344,11 +472,9 @@ def RGB_to_sd_Mallett2019(
     array([ 0.2065436...,  0.1219996...,  0.0513764...])
     """
 
-    RGB = to_domain_1(RGB)
-
     sd = SpectralDistribution(
-        np.dot(RGB, np.transpose(basis_functions.values)),
+        RGB_to_reflectances_Mallett2019(RGB, basis_functions),
         basis_functions.wavelengths)
-    sd.name = '{0} (RGB) - Mallett (2019)'.format(RGB)
+    sd.name = '{0} (RGB) - Mallett (2019)'.format(to_domain_1(RGB))
 
     return sd
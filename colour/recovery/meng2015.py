@@ -6,6 +6,7 @@ Meng et al. (2015) - Reflectance Recovery
 Defines objects for reflectance recovery using *Meng, Simon and Hanika (2015)*
 method:
 
+-   :func:`colour.recovery.XYZ_to_reflectances_Meng2015`
 -   :func:`colour.recovery.XYZ_to_sd_Meng2015`
 
 References
@@ -16,12 +17,15 @@ References
 """
 
 import numpy as np
+from functools import partial
+from scipy.linalg import solve
 from scipy.optimize import minimize
+from scipy.spatial import cKDTree
 
 from colour.colorimetry import (MSDS_CMFS_STANDARD_OBSERVER, SDS_ILLUMINANTS,
-                                SpectralDistribution, SpectralShape, sd_ones,
-                                sd_to_XYZ_integration)
-from colour.utilities import to_domain_1, from_range_100, runtime_warning
+                                SpectralDistribution, SpectralShape)
+from colour.utilities import (get_executor, to_domain_1, runtime_warning,
+                              tsplit)
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2021 - Colour Developers'
@@ -30,7 +34,10 @@ __maintainer__ = 'Colour Developers'
 __email__ = 'colour-developers@colour-science.org'
 __status__ = 'Production'
 
-__all__ = ['SPECTRAL_SHAPE_MENG2015', 'XYZ_to_sd_Meng2015']
+__all__ = [
+    'SPECTRAL_SHAPE_MENG2015', 'XYZ_to_reflectances_Meng2015',
+    'XYZ_to_sd_Meng2015'
+]
 
 SPECTRAL_SHAPE_MENG2015 = SpectralShape(360, 780, 5)
 """
@@ -40,6 +47,265 @@ of 5.
 SPECTRAL_SHAPE_MENG2015 : SpectralShape
 """
 
+_CHUNK_SIZE_MENG2015 = 256
+"""
+Number of *CIE XYZ* tristimulus values recovered per chunk by
+:func:`colour.recovery.XYZ_to_reflectances_Meng2015` definition, the
+warm-starts are chained within a chunk only so that the recovered reflectances
+do not depend on the executor.
+
+_CHUNK_SIZE_MENG2015 : int
+"""
+
+
+def _XYZ_to_reflectances_Meng2015(XYZ, matrix_XYZ, optimisation_kwargs):
+    """
+    Recovers the reflectances of given *CIE XYZ* tristimulus values in closed
+    form if within bounds, then one after the other, warm-starting every
+    optimisation from the reflectance of the nearest *CIE XYZ* tristimulus
+    values already recovered.
+
+    Parameters
+    ----------
+    XYZ : ndarray, (n, 3)
+        *CIE XYZ* tristimulus values to recover the reflectances from.
+    matrix_XYZ : ndarray, (3, m)
+        Matrix converting the reflectances to *CIE XYZ* tristimulus values,
+        i.e. the Jacobian of the optimisation constraint.
+    optimisation_kwargs : dict_like
+        Parameters for :func:`scipy.optimize.minimize` definition.
+
+    Returns
+    -------
+    ndarray, (n, m)
+        Recovered reflectances.
+    """
+
+    bins = matrix_XYZ.shape[1]
+
+    def objective_function(a):
+        """
+        Objective function.
+        """
+
+        return np.sum(np.diff(a) ** 2)
+
+    def objective_function_gradient(a):
+        """
+        Gradient of the objective function.
+        """
+
+        gradient = np.zeros(bins)
+        gradient[:-1] -= 2 * np.diff(a)
+        gradient[1:] += 2 * np.diff(a)
+
+        return gradient
+
+    reflectances = np.zeros([XYZ.shape[0], bins])
+    bounds = np.tile(np.array([0, 1000]), (bins, 1))
+
+    solved = []
+    overrides = set(optimisation_kwargs or {})
+    if not overrides & {'method', 'bounds', 'constraints'}:
+        # The *Karush-Kuhn-Tucker* system of the optimisation without bounds is
+        # factorised once: its solutions are linear in the tristimulus values
+        # and optimal if they are within bounds.
+        D = np.diff(np.identity(bins), axis=0)
+        KKT = np.block([[2 * np.dot(np.transpose(D), D),
+                         np.transpose(matrix_XYZ)],
+                        [matrix_XYZ, np.zeros([3, 3])]])
+        M = solve(
+            KKT,
+            np.vstack([np.zeros([bins, 3]), np.identity(3)]),
+            assume_a='sym')[:bins]
+
+        reflectances = np.dot(XYZ, np.transpose(M))
+        within_bounds = np.all(
+            np.logical_and(reflectances >= bounds[:, 0],
+                           reflectances <= bounds[:, 1]),
+            axis=-1)
+        reflectances[~within_bounds] = 0
+        solved = list(np.where(within_bounds)[0])
+
+    # The solved tristimulus values are indexed by a *KD-Tree* rebuilt every
+    # time their count doubles, those solved since are searched exhaustively.
+    tree, tree_size = None, 0
+    if solved:
+        tree, tree_size = cKDTree(XYZ[solved]), len(solved)
+
+    for i in np.setdiff1d(np.arange(XYZ.shape[0]), solved):
+        XYZ_i = XYZ[i]
+        a_0 = np.ones(bins)
+        if solved:
+            recent = np.array(solved[tree_size:], dtype=np.int_)
+            distances = np.linalg.norm(XYZ[recent] - XYZ_i, axis=-1)
+            j = np.argmin(distances) if len(recent) else None
+            distance, nearest = ((distances[j], recent[j])
+                                 if j is not None else (np.inf, None))
+            if tree is not None:
+                distance_t, j_t = tree.query(XYZ_i)
+                if distance_t < distance:
+                    distance, nearest = distance_t, solved[j_t]
+
+            if distance == 0:
+                reflectances[i] = reflectances[nearest]
+                solved.append(i)
+                continue
+
+            a_0 = reflectances[nearest]
+
+        optimisation_settings = {
+            'method': 'SLSQP',
+            'jac': objective_function_gradient,
+            'constraints': {
+                'type': 'eq',
+                'fun': lambda a, XYZ_i=XYZ_i: np.dot(matrix_XYZ, a) - XYZ_i,
+                'jac': lambda a: matrix_XYZ,
+            },
+            'bounds': bounds,
+            'options': {
+                'ftol': 1e-10,
+            },
+        }
+        if optimisation_kwargs is not None:
+            optimisation_settings.update(optimisation_kwargs)
+
+        result = minimize(objective_function, a_0, **optimisation_settings)
+
+        if not result.success:
+            raise RuntimeError(
+                'Optimization failed for {0} after {1} iterations: "{2}".'.
+                format(XYZ_i, result.nit, result.message))
+
+        reflectances[i] = result.x
+        solved.append(i)
+
+        if len(solved) >= 2 * tree_size:
+            tree, tree_size = cKDTree(XYZ[solved]), len(solved)
+
+    return reflectances
+
+
+def XYZ_to_reflectances_Meng2015(
+        XYZ,
+        cmfs=MSDS_CMFS_STANDARD_OBSERVER['CIE 1931 2 Degree Standard Observer']
+        .copy().align(SPECTRAL_SHAPE_MENG2015),
+        illuminant=SDS_ILLUMINANTS['D65'].copy().align(
+            SPECTRAL_SHAPE_MENG2015),
+        optimisation_kwargs=None):
+    """
+    Recovers the reflectances of given *CIE XYZ* tristimulus values array
+    using *Meng et al. (2015)* method.
+
+    Parameters
+    ----------
+    XYZ : array_like, (..., 3)
+        *CIE XYZ* tristimulus values to recover the reflectances from.
+    cmfs : XYZ_ColourMatchingFunctions
+        Standard observer colour matching functions. The wavelength
+        :math:`\\lambda_{i}` range interval of the colour matching functions
+        affects directly the time the computations take. The current default
+        interval of 5 is a good compromise between precision and time spent.
+    illuminant : SpectralDistribution, optional
+        Illuminant spectral distribution.
+    optimisation_kwargs : dict_like, optional
+        Parameters for :func:`scipy.optimize.minimize` definition.
+
+    Returns
+    -------
+    ndarray, (..., m)
+        Recovered reflectances sampled at the wavelengths of the ``cmfs``
+        shape.
+
+    Raises
+    ------
+    RuntimeError
+        If the optimisation fails for any of the *CIE XYZ* tristimulus
+        values.
+
+    Notes
+    -----
+
+    +------------+-----------------------+---------------+
+    | **Domain** | **Scale - Reference** | **Scale - 1** |
+    +============+=======================+===============+
+    | ``XYZ``    | [0, 1]                | [0, 1]        |
+    +------------+-----------------------+---------------+
+
+    -   This definition is the array-oriented counterpart of the
+        :func:`colour.recovery.XYZ_to_sd_Meng2015` definition: the constraint
+        being linear, its Jacobian is computed once from the colour matching
+        functions and illuminant and shared by all the optimisations.
+    -   The *Karush-Kuhn-Tucker* system of the optimisation without bounds is
+        factorised once and the reflectances within bounds it yields are
+        returned as is, unless the ``method``, ``bounds`` or ``constraints``
+        parameters are given in ``optimisation_kwargs``.
+    -   The remaining optimisations are warm-started from the reflectance of
+        the nearest *CIE XYZ* tristimulus values already recovered, as found
+        by a *KD-Tree*, the duplicate *CIE XYZ* tristimulus values are
+        recovered once.
+    -   The *CIE XYZ* tristimulus values are split in contiguous chunks of
+        :attr:`colour.recovery.meng2015._CHUNK_SIZE_MENG2015` attribute size
+        recovered concurrently by the *Colour* executor, see
+        :func:`colour.utilities.get_executor` definition. The chunks size does
+        not depend on the executor so that the recovered reflectances do not
+        either.
+
+    References
+    ----------
+    :cite:`Meng2015c`
+
+    Examples
+    --------
+    >>> from colour.utilities import numpy_print_options
+    >>> XYZ = np.array([[0.20654008, 0.12197225, 0.05136952],
+    ...                 [0.20654008, 0.12197225, 0.05136952]])
+    >>> cmfs = (
+    ...     MSDS_CMFS_STANDARD_OBSERVER['CIE 1931 2 Degree Standard Observer'].
+    ...     copy().align(SpectralShape(360, 780, 10))
+    ... )
+    >>> illuminant = SDS_ILLUMINANTS['D65'].copy().align(cmfs.shape)
+    >>> reflectances = XYZ_to_reflectances_Meng2015(XYZ, cmfs, illuminant)
+    >>> with numpy_print_options(suppress=True):
+    ...     reflectances[:, ::21]  # doctest: +ELLIPSIS
+    array([[ 0.0767224...,  0.1315141...,  0.4484983...],
+           [ 0.0767224...,  0.1315141...,  0.4484983...]])
+    """
+
+    XYZ = to_domain_1(XYZ)
+
+    if illuminant.shape != cmfs.shape:
+        runtime_warning(
+            'Aligning "{0}" illuminant shape to "{1}" colour matching '
+            'functions shape.'.format(illuminant.name, cmfs.name))
+        illuminant = illuminant.copy().align(cmfs.shape)
+
+    # The constraint Jacobian is that of
+    # :func:`colour.colorimetry.sd_to_XYZ_integration` definition in
+    # domain-range scale "1" so that the reflectances are optimised
+    # independently of the current domain-range scale.
+    S = illuminant.values
+    x_bar, y_bar, z_bar = tsplit(cmfs.values)
+    dw = cmfs.shape.interval
+    k = 1 / (np.sum(y_bar * S) * dw)
+    matrix_XYZ = k * np.array([x_bar, y_bar, z_bar]) * S * dw
+
+    XYZ_f = np.reshape(XYZ, [-1, 3])
+
+    reflectances = np.concatenate(
+        [np.zeros([0, matrix_XYZ.shape[1]])] + get_executor().map(
+            partial(
+                _XYZ_to_reflectances_Meng2015,
+                matrix_XYZ=matrix_XYZ,
+                optimisation_kwargs=optimisation_kwargs),
+            [
+                XYZ_f[i:i + _CHUNK_SIZE_MENG2015]
+                for i in range(0, len(XYZ_f), _CHUNK_SIZE_MENG2015)
+            ],
+            chunk_size=1))
+
+    return np.reshape(reflectances, XYZ.shape[:-1] + (-1, ))
+
 
 def XYZ_to_sd_Meng2015(
         XYZ,
@@ -92,6 +358,7 @@ def XYZ_to_sd_Meng2015(
 
     Examples
     --------
+    >>> from colour.colorimetry import sd_to_XYZ_integration
     >>> from colour.utilities import numpy_print_options
     >>> XYZ = np.array([0.20654008, 0.12197225, 0.05136952])
     >>> cmfs = (
@@ -102,49 +369,49 @@ def XYZ_to_sd_Meng2015(
     >>> sd = XYZ_to_sd_Meng2015(XYZ, cmfs, illuminant)
     >>> with numpy_print_options(suppress=True):
     ...     sd  # doctest: +ELLIPSIS
-    SpectralDistribution([[ 360.        ,    0.0765153...],
-                          [ 370.        ,    0.0764771...],
-                          [ 380.        ,    0.0764286...],
-                          [ 390.        ,    0.0764329...],
-                          [ 400.        ,    0.0765863...],
-                          [ 410.        ,    0.0764339...],
-                          [ 420.        ,    0.0757213...],
-                          [ 430.        ,    0.0733091...],
-                          [ 440.        ,    0.0676493...],
-                          [ 450.        ,    0.0577616...],
-                          [ 460.        ,    0.0440805...],
-                          [ 470.        ,    0.0284802...],
-                          [ 480.        ,    0.0138019...],
-                          [ 490.        ,    0.0033557...],
+    SpectralDistribution([[ 360.        ,    0.0767224...],
+                          [ 370.        ,    0.0767208...],
+                          [ 380.        ,    0.0767169...],
+                          [ 390.        ,    0.0767034...],
+                          [ 400.        ,    0.0766588...],
+                          [ 410.        ,    0.0764524...],
+                          [ 420.        ,    0.0757057...],
+                          [ 430.        ,    0.0732750...],
+                          [ 440.        ,    0.0676762...],
+                          [ 450.        ,    0.0577821...],
+                          [ 460.        ,    0.0440818...],
+                          [ 470.        ,    0.0284495...],
+                          [ 480.        ,    0.0137818...],
+                          [ 490.        ,    0.0033713...],
                           [ 500.        ,    0.       ...],
                           [ 510.        ,    0.       ...],
                           [ 520.        ,    0.       ...],
                           [ 530.        ,    0.       ...],
-                          [ 540.        ,    0.0055360...],
-                          [ 550.        ,    0.0317335...],
-                          [ 560.        ,    0.075457 ...],
-                          [ 570.        ,    0.1314930...],
-                          [ 580.        ,    0.1938219...],
-                          [ 590.        ,    0.2559747...],
-                          [ 600.        ,    0.3122869...],
-                          [ 610.        ,    0.3584363...],
-                          [ 620.        ,    0.3927112...],
-                          [ 630.        ,    0.4158866...],
-                          [ 640.        ,    0.4305832...],
-                          [ 650.        ,    0.4391142...],
-                          [ 660.        ,    0.4439484...],
-                          [ 670.        ,    0.4464121...],
-                          [ 680.        ,    0.4475718...],
-                          [ 690.        ,    0.4481182...],
-                          [ 700.        ,    0.4483734...],
-                          [ 710.        ,    0.4484743...],
-                          [ 720.        ,    0.4485753...],
-                          [ 730.        ,    0.4486474...],
-                          [ 740.        ,    0.4486629...],
-                          [ 750.        ,    0.4486995...],
-                          [ 760.        ,    0.4486925...],
-                          [ 770.        ,    0.4486794...],
-                          [ 780.        ,    0.4486982...]],
+                          [ 540.        ,    0.0055721...],
+                          [ 550.        ,    0.0317156...],
+                          [ 560.        ,    0.0754224...],
+                          [ 570.        ,    0.1315141...],
+                          [ 580.        ,    0.1938343...],
+                          [ 590.        ,    0.2559532...],
+                          [ 600.        ,    0.3122551...],
+                          [ 610.        ,    0.3584594...],
+                          [ 620.        ,    0.3927618...],
+                          [ 630.        ,    0.4159217...],
+                          [ 640.        ,    0.4306059...],
+                          [ 650.        ,    0.4391117...],
+                          [ 660.        ,    0.4437919...],
+                          [ 670.        ,    0.4462138...],
+                          [ 680.        ,    0.4473995...],
+                          [ 690.        ,    0.4479532...],
+                          [ 700.        ,    0.4482346...],
+                          [ 710.        ,    0.4483734...],
+                          [ 720.        ,    0.4484363...],
+                          [ 730.        ,    0.4484697...],
+                          [ 740.        ,    0.4484838...],
+                          [ 750.        ,    0.4484903...],
+                          [ 760.        ,    0.4484937...],
+                          [ 770.        ,    0.4484968...],
+                          [ 780.        ,    0.4484983...]],
                          interpolator=SpragueInterpolator,
                          interpolator_kwargs={},
                          extrapolator=Extrapolator,
@@ -153,57 +420,10 @@ def XYZ_to_sd_Meng2015(
     array([ 0.2065400...,  0.1219722...,  0.0513695...])
     """
 
-    XYZ = to_domain_1(XYZ)
-
-    if illuminant.shape != cmfs.shape:
-        runtime_warning(
-            'Aligning "{0}" illuminant shape to "{1}" colour matching '
-            'functions shape.'.format(illuminant.name, cmfs.name))
-        illuminant = illuminant.copy().align(cmfs.shape)
-
-    sd = sd_ones(cmfs.shape)
-
-    def objective_function(a):
-        """
-        Objective function.
-        """
-
-        return np.sum(np.diff(a) ** 2)
-
-    def constraint_function(a):
-        """
-        Function defining the constraint.
-        """
-
-        sd[:] = a
-        return sd_to_XYZ_integration(
-            sd, cmfs=cmfs, illuminant=illuminant) - XYZ
-
-    wavelengths = sd.wavelengths
-    bins = wavelengths.size
-
-    optimisation_settings = {
-        'method': 'SLSQP',
-        'constraints': {
-            'type': 'eq',
-            'fun': constraint_function
-        },
-        'bounds': np.tile(np.array([0, 1000]), (bins, 1)),
-        'options': {
-            'ftol': 1e-10,
-        },
-    }
-    if optimisation_kwargs is not None:
-        optimisation_settings.update(optimisation_kwargs)
-
-    result = minimize(objective_function, sd.values, **optimisation_settings)
-
-    if not result.success:
-        raise RuntimeError(
-            'Optimization failed for {0} after {1} iterations: "{2}".'.format(
-                XYZ, result.nit, result.message))
+    reflectance = XYZ_to_reflectances_Meng2015(XYZ, cmfs, illuminant,
+                                               optimisation_kwargs)
 
     return SpectralDistribution(
-        from_range_100(result.x * 100),
-        wavelengths,
-        name='{0} (XYZ) - Meng (2015)'.format(XYZ))
+        reflectance,
+        cmfs.wavelengths,
+        name='{0} (XYZ) - Meng (2015)'.format(to_domain_1(XYZ)))
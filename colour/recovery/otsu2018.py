@@ -7,6 +7,7 @@ Defines objects for reflectance recovery, i.e. spectral upsampling, using
 *Otsu et al. (2018)* method:
 
 -   :class:`colour.recovery.Dataset_Otsu2018`
+-   :func:`colour.recovery.XYZ_to_reflectances_Otsu2018`
 -   :func:`colour.recovery.XYZ_to_sd_Otsu2018`
 -   :func:`colour.recovery.NodeTree_Otsu2018`
 
@@ -19,15 +20,17 @@ References
 
 import numpy as np
 from collections import namedtuple
+from functools import partial
 from unittest import mock
 
 from colour.colorimetry import (MSDS_CMFS_STANDARD_OBSERVER, SDS_ILLUMINANTS,
                                 SpectralDistribution, SpectralShape,
-                                msds_to_XYZ, sd_to_XYZ)
+                                msds_to_XYZ)
 from colour.models import XYZ_to_xy
 from colour.recovery import (SPECTRAL_SHAPE_OTSU2018, BASIS_FUNCTIONS_OTSU2018,
                              CLUSTER_MEANS_OTSU2018, SELECTOR_ARRAY_OTSU2018)
-from colour.utilities import (as_float_array, domain_range_scale,
+from colour.utilities import (CACHE_REGISTRY, as_float_array, as_int_array,
+                              domain_range_scale, get_executor,
                               is_tqdm_installed, message_box, runtime_warning,
                               to_domain_1, zeros)
 
@@ -44,10 +47,14 @@ __email__ = 'colour-developers@colour-science.org'
 __status__ = 'Production'
 
 __all__ = [
-    'Dataset_Otsu2018', 'DATASET_REFERENCE_OTSU2018', 'XYZ_to_sd_Otsu2018',
-    'PartitionAxis', 'ColourData', 'Node', 'NodeTree_Otsu2018'
+    'Dataset_Otsu2018', 'DATASET_REFERENCE_OTSU2018',
+    'XYZ_to_reflectances_Otsu2018', 'XYZ_to_sd_Otsu2018', 'PartitionAxis',
+    'ColourData', 'Node', 'NodeTree_Otsu2018'
 ]
 
+_CACHE_RECONSTRUCTION_OTSU2018 = CACHE_REGISTRY.register_cache(
+    '{0}._CACHE_RECONSTRUCTION_OTSU2018'.format(__name__), maximum_size=64)
+
 
 class Dataset_Otsu2018:
     """
@@ -82,6 +89,7 @@ class Dataset_Otsu2018:
     Methods
     -------
     -   :meth:`~colour.recovery.Dataset_Otsu2018.__init__`
+    -   :meth:`~colour.recovery.Dataset_Otsu2018.__hash__`
     -   :meth:`~colour.recovery.Dataset_Otsu2018.select`
     -   :meth:`~colour.recovery.Dataset_Otsu2018.cluster`
     -   :meth:`~colour.recovery.Dataset_Otsu2018.read`
@@ -187,36 +195,71 @@ class Dataset_Otsu2018:
         return '{0}({1} basis functions)'.format(
             self.__class__.__name__, self._basis_functions.shape[0])
 
+    def __hash__(self):
+        """
+        Returns the dataset hash.
+
+        Returns
+        -------
+        int
+            Object hash.
+        """
+
+        return hash((repr(self._shape), self._basis_functions.tobytes(),
+                     self._means.tobytes(),
+                     as_float_array(self._selector_array).tobytes()))
+
     def select(self, xy):
         """
-        Returns the cluster index appropriate for the given *CIE xy*
+        Returns the cluster indexes appropriate for the given *CIE xy*
         coordinates.
 
         Parameters
         ----------
-        xy : array_like, (2,)
+        xy : array_like, (..., 2)
             *CIE xy* chromaticity coordinates.
 
         Returns
         -------
-        int
-            Cluster index.
+        int or ndarray
+            Cluster indexes.
+
+        Notes
+        -----
+        -   The selector array rows are walked for all the *CIE xy*
+            chromaticity coordinates at once, the loop iterations count is
+            the depth of the tree that generated the dataset.
+
+        Examples
+        --------
+        >>> xy = np.array([[0.54369557, 0.32107944], [0.31270, 0.32900]])
+        >>> DATASET_REFERENCE_OTSU2018.select(xy)
+        array([6, 4])
         """
 
-        i = 0
-        while True:
-            row = self._selector_array[i, :]
-            direction, origin, lesser_index, greater_index = row
+        xy = as_float_array(xy)
+        selector_array = np.reshape(self._selector_array, (-1, 4))
 
-            if xy[int(direction)] <= origin:
-                index = int(lesser_index)
-            else:
-                index = int(greater_index)
+        xy_f = np.reshape(xy, (-1, 2))
+        indexes = as_int_array(zeros(xy_f.shape[0]))
+        rows = as_int_array(zeros(xy_f.shape[0]))
+        walking = np.arange(xy_f.shape[0])
+        while walking.size:
+            direction, origin, lesser_index, greater_index = np.transpose(
+                selector_array[rows[walking]])
 
-            if index < 0:
-                i = -index
-            else:
-                return index
+            index = as_int_array(
+                np.where(xy_f[walking, as_int_array(direction)] <= origin,
+                         lesser_index, greater_index))
+
+            is_row = index < 0
+            rows[walking[is_row]] = -index[is_row]
+            indexes[walking[~is_row]] = index[~is_row]
+            walking = walking[is_row]
+
+        indexes = np.reshape(indexes, xy.shape[:-1])
+
+        return int(indexes) if indexes.ndim == 0 else indexes
 
     def cluster(self, xy):
         """
@@ -225,14 +268,14 @@ class Dataset_Otsu2018:
 
         Parameters
         ----------
-        xy : array_like, (2,)
+        xy : array_like, (..., 2)
             *CIE xy* chromaticity coordinates.
 
         Returns
         -------
-        basis_functions : ndarray, (3, n)
+        basis_functions : ndarray, (..., 3, n)
             Three basis functions.
-        mean : ndarray, (n,)
+        mean : ndarray, (..., n)
             Dataset mean.
         """
 
@@ -339,6 +382,135 @@ Builtin *Otsu et al. (2018)* dataset as a
 """
 
 
+def _reconstruction_Otsu2018(cmfs, illuminant, dataset):
+    """
+    Returns the inverse of the matrices converting the basis functions weights
+    to *CIE XYZ* tristimulus values and the *CIE XYZ* tristimulus values of
+    the means for every cluster of given dataset.
+
+    The matrices and tristimulus values are cached for the
+    ``cmfs``, ``illuminant`` and ``dataset`` arguments.
+
+    Parameters
+    ----------
+    cmfs : XYZ_ColourMatchingFunctions
+        Standard observer colour matching functions.
+    illuminant : SpectralDistribution
+        Illuminant spectral distribution.
+    dataset : Dataset_Otsu2018
+        Dataset to use for reconstruction.
+
+    Returns
+    -------
+    M_inverse : ndarray, (n, 3, 3)
+        Inverse of the basis functions weights to *CIE XYZ* tristimulus values
+        matrices.
+    XYZ_mu : ndarray, (n, 3)
+        *CIE XYZ* tristimulus values of the means.
+    """
+
+    hash_key = tuple(hash(arg) for arg in (cmfs, illuminant, dataset))
+    reconstruction = _CACHE_RECONSTRUCTION_OTSU2018.get(hash_key)
+    if reconstruction is not None:
+        return reconstruction
+
+    with domain_range_scale('ignore'):
+        M = np.swapaxes(
+            msds_to_XYZ(
+                dataset.basis_functions,
+                cmfs,
+                illuminant,
+                shape=dataset.shape) / 100, -1, -2)
+        XYZ_mu = msds_to_XYZ(
+            dataset.means, cmfs, illuminant, shape=dataset.shape) / 100
+
+    reconstruction = (np.linalg.inv(M), XYZ_mu)
+
+    _CACHE_RECONSTRUCTION_OTSU2018[hash_key] = reconstruction
+
+    return reconstruction
+
+
+def XYZ_to_reflectances_Otsu2018(
+        XYZ,
+        cmfs=MSDS_CMFS_STANDARD_OBSERVER['CIE 1931 2 Degree Standard Observer']
+        .copy().align(SPECTRAL_SHAPE_OTSU2018),
+        illuminant=SDS_ILLUMINANTS['D65'].copy().align(
+            SPECTRAL_SHAPE_OTSU2018),
+        dataset=DATASET_REFERENCE_OTSU2018,
+        clip=True):
+    """
+    Recovers the reflectances of given *CIE XYZ* tristimulus values array
+    using *Otsu et al. (2018)* method.
+
+    Parameters
+    ----------
+    XYZ : array_like, (..., 3)
+        *CIE XYZ* tristimulus values to recover the reflectances from.
+    cmfs : XYZ_ColourMatchingFunctions, optional
+        Standard observer colour matching functions.
+    illuminant : SpectralDistribution, optional
+        Illuminant spectral distribution.
+    dataset : Dataset_Otsu2018, optional
+        Dataset to use for reconstruction. The default is to use the published
+        data.
+    clip : bool, optional
+        If *True*, the default, values below zero and above unity in the
+        recovered reflectances will be clipped. This ensures that the
+        returned reflectances are physical and conserve energy, but will cause
+        noticeable colour differences in case of very saturated colours.
+
+    Returns
+    -------
+    ndarray, (..., m)
+        Recovered reflectances sampled at the wavelengths of the ``dataset``
+        shape.
+
+    Notes
+    -----
+    -   This definition is the array-oriented counterpart of the
+        :func:`colour.recovery.XYZ_to_sd_Otsu2018` definition: the clusters
+        are selected for all the *CIE XYZ* tristimulus values at once and the
+        reconstruction matrices are computed once per ``cmfs``,
+        ``illuminant`` and ``dataset`` arguments, making it suitable for
+        whole images.
+
+    +------------+-----------------------+---------------+
+    | **Domain** | **Scale - Reference** | **Scale - 1** |
+    +============+=======================+===============+
+    | ``XYZ``    | [0, 1]                | [0, 1]        |
+    +------------+-----------------------+---------------+
+
+    References
+    ----------
+    :cite:`Otsu2018`
+
+    Examples
+    --------
+    >>> from colour.utilities import numpy_print_options
+    >>> XYZ = np.array([[0.20654008, 0.12197225, 0.05136952],
+    ...                 [0.14223892, 0.23042768, 0.10495772]])
+    >>> with numpy_print_options(suppress=True):
+    ...     XYZ_to_reflectances_Otsu2018(XYZ)[:, ::12]  # doctest: +ELLIPSIS
+    array([[ 0.0601939...,  0.0405197...,  0.4885571...],
+           [ 0.0692682...,  0.2704544...,  0.0986511...]])
+    """
+
+    XYZ = to_domain_1(XYZ)
+    xy = XYZ_to_xy(XYZ)
+
+    indexes = dataset.select(xy)
+    M_inverse, XYZ_mu = _reconstruction_Otsu2018(cmfs, illuminant, dataset)
+
+    weights = np.einsum('...ij,...j->...i', M_inverse[indexes],
+                        XYZ - XYZ_mu[indexes])
+    reflectances = (np.einsum('...i,...ij->...j', weights,
+                              dataset.basis_functions[indexes]) +
+                    dataset.means[indexes])
+
+    return np.clip(reflectances, 0, 1) if clip else reflectances
+
+
 def XYZ_to_sd_Otsu2018(
         XYZ,
         cmfs=MSDS_CMFS_STANDARD_OBSERVER['CIE 1931 2 Degree Standard Observer']
@@ -436,31 +608,121 @@ def XYZ_to_sd_Otsu2018(
     array([ 0.2065494...,  0.1219712...,  0.0514002...])
     """
 
-    XYZ = to_domain_1(XYZ)
-    xy = XYZ_to_xy(XYZ)
+    return SpectralDistribution(
+        XYZ_to_reflectances_Otsu2018(XYZ, cmfs, illuminant, dataset, clip),
+        dataset.shape.range())
+
+
+def _reconstruction_error_Otsu2018(reflectances, XYZ, basis_functions, mean,
+                                   XYZ_mu, M_inverse):
+    """
+    Returns the reconstruction errors summation of given reflectances from
+    their *CIE XYZ* tristimulus values using given cluster basis functions,
+    mean and reconstruction matrix.
+
+    Parameters
+    ----------
+    reflectances : ndarray, (n, m)
+        Reflectances to reconstruct.
+    XYZ : ndarray, (n, 3)
+        *CIE XYZ* tristimulus values of the reflectances.
+    basis_functions : ndarray, (3, m)
+        Cluster basis functions.
+    mean : ndarray, (m,)
+        Cluster mean.
+    XYZ_mu : ndarray, (3,)
+        *CIE XYZ* tristimulus values of the cluster mean.
+    M_inverse : ndarray, (3, 3)
+        Inverse of the basis functions weights to *CIE XYZ* tristimulus values
+        matrix.
+
+    Returns
+    -------
+    numeric
+        Reconstruction errors summation.
+    """
 
-    basis_functions, mean = dataset.cluster(xy)
+    # The weights computation and the basis functions combination are folded
+    # into a single matrix, the residuals are computed in-place.
+    M = np.dot(np.transpose(M_inverse), basis_functions)
+    residuals = np.dot(XYZ, M)
+    residuals += mean - np.dot(XYZ_mu, M)
+    np.clip(residuals, 0, 1, out=residuals)
+    residuals -= reflectances
 
-    M = np.empty((3, 3))
-    for i in range(3):
-        sd = SpectralDistribution(basis_functions[i, :], dataset.shape.range())
+    return np.vdot(residuals, residuals)
 
-        with domain_range_scale('ignore'):
-            M[:, i] = sd_to_XYZ(sd, cmfs, illuminant) / 100
 
-    M_inverse = np.linalg.inv(M)
+def _partition_errors_Otsu2018(sizes, reflectances, XYZ, matrix_XYZ):
+    """
+    Returns the reconstruction errors summations of the partitions splitting
+    given reflectances, sorted along the partition direction, after given
+    counts of reflectances.
 
-    sd = SpectralDistribution(mean, dataset.shape.range())
+    The scatter matrices of the lesser parts are updated incrementally from a
+    partition to the next one, those of the greater parts are deduced from the
+    scatter matrix of all the reflectances.
 
-    with domain_range_scale('ignore'):
-        XYZ_mu = sd_to_XYZ(sd, cmfs, illuminant) / 100
+    Parameters
+    ----------
+    sizes : array_like, (k,)
+        Ascending counts of reflectances in the lesser parts of the
+        partitions.
+    reflectances : ndarray, (n, m)
+        Reflectances sorted along the partition direction.
+    XYZ : ndarray, (n, 3)
+        *CIE XYZ* tristimulus values of the reflectances.
+    matrix_XYZ : ndarray, (m, 3)
+        Matrix converting reflectances to *CIE XYZ* tristimulus values.
+
+    Returns
+    -------
+    ndarray, (k,)
+        Reconstruction errors summations, infinite for the partitions whose
+        reconstruction matrices are singular.
+    """
+
+    def reconstruction_error(count, sum_r, sum_rr, slice_):
+        """
+        Returns the reconstruction errors summation of given part.
+        """
+
+        mean = sum_r / count
+        _eigenvalues, eigenvectors = np.linalg.eigh(
+            sum_rr - np.outer(sum_r, mean))
+        basis_functions = np.transpose(eigenvectors[:, -3:])
+
+        M_inverse = np.linalg.inv(
+            np.transpose(np.dot(basis_functions, matrix_XYZ)))
 
-    weights = np.dot(M_inverse, XYZ - XYZ_mu)
-    recovered_sd = np.dot(weights, basis_functions) + mean
+        return _reconstruction_error_Otsu2018(
+            reflectances[slice_], XYZ[slice_], basis_functions, mean,
+            np.dot(mean, matrix_XYZ), M_inverse)
 
-    recovered_sd = np.clip(recovered_sd, 0, 1) if clip else recovered_sd
+    count = reflectances.shape[0]
+    sum_r_t = np.sum(reflectances, axis=0)
+    sum_rr_t = np.dot(np.transpose(reflectances), reflectances)
 
-    return SpectralDistribution(recovered_sd, dataset.shape.range())
+    sum_r = np.zeros(reflectances.shape[1])
+    sum_rr = np.zeros([reflectances.shape[1], reflectances.shape[1]])
+
+    errors = np.full(len(sizes), np.inf)
+    size_p = 0
+    for i, size in enumerate(sizes):
+        increment = reflectances[size_p:size]
+        sum_r += np.sum(increment, axis=0)
+        sum_rr += np.dot(np.transpose(increment), increment)
+        size_p = size
+
+        try:
+            errors[i] = (
+                reconstruction_error(size, sum_r, sum_rr, slice(None, size)) +
+                reconstruction_error(count - size, sum_r_t - sum_r,
+                                     sum_rr_t - sum_rr, slice(size, None)))
+        except np.linalg.LinAlgError:
+            continue
+
+    return errors
 
 
 class PartitionAxis(namedtuple('PartitionAxis', ('origin', 'direction'))):
@@ -1015,12 +1277,9 @@ class Node:
         if self._M is None:
             self.PCA()
 
-        error = 0
-        for i in range(len(self.colour_data)):
-            sd = self.colour_data.reflectances[i, :]
-            XYZ = self.colour_data.XYZ[i, :]
-            recovered_sd = self.reconstruct(XYZ)
-            error += np.sum((sd - recovered_sd.values) ** 2)
+        error = _reconstruction_error_Otsu2018(
+            self.colour_data.reflectances, self.colour_data.XYZ,
+            self._basis_functions, self._mean, self._XYZ_mu, self._M_inverse)
 
         self._cached_leaf_reconstruction_error = error
 
@@ -1095,37 +1354,80 @@ class Node:
             two half-planes.
         partition : tuple
             Nodes created by splitting a node with a given partition.
+
+        Notes
+        -----
+        -   The colours are sorted once per partition direction so that the
+            candidate partitions are evaluated with incrementally updated
+            scatter matrices rather than by partitioning the colour data and
+            performing the *Principal Component Analysis* (PCA) for every
+            candidate.
+        -   The candidate partitions are evaluated concurrently by the
+            *Colour* executor, see :func:`colour.utilities.get_executor`
+            definition.
         """
 
         if self._best_partition is not None:
             return self._best_partition
 
         leaf_error = self.leaf_reconstruction_error()
-        best_error = None
-
-        with tqdm(total=2 * len(self.colour_data)) as progress:
-            for direction in [0, 1]:
-                for i in range(len(self.colour_data)):
-                    progress.update()
-                    origin = self.colour_data.xy[i, direction]
-                    axis = PartitionAxis(origin, direction)
 
-                    try:
-                        partition_error, partition = (
-                            self.partition_reconstruction_error(axis))
-                    except RuntimeError:
-                        continue
+        colour_data = self.colour_data
+        count = len(colour_data)
+        minimum_cluster_size = self._tree.minimum_cluster_size
+        # Identity reflectances tristimulus values form the matrix converting
+        # reflectances to *CIE XYZ* tristimulus values.
+        matrix_XYZ = self._tree.msds_to_XYZ(
+            np.identity(colour_data.reflectances.shape[1]))
 
-                    if partition_error >= leaf_error:
-                        continue
+        executor = get_executor()
 
-                    if best_error is None or partition_error < best_error:
-                        self._best_partition = (partition_error, axis,
-                                                partition)
+        best_error, best_axis = None, None
+        with tqdm(total=2 * count) as progress:
+            for direction in [0, 1]:
+                indexes = np.argsort(
+                    colour_data.xy[:, direction], kind='stable')
+                origins = colour_data.xy[indexes, direction]
+
+                # Every colour defines a partition along the direction whose
+                # lesser part holds the colours not greater than it.
+                sizes = np.unique(np.searchsorted(origins, origins, 'right'))
+                sizes = sizes[np.logical_and(
+                    sizes >= minimum_cluster_size,
+                    count - sizes >= minimum_cluster_size)]
+
+                if len(sizes) == 0:
+                    progress.update(count)
+                    continue
 
-        if self._best_partition is None:
+                partition_errors = partial(
+                    _partition_errors_Otsu2018,
+                    reflectances=colour_data.reflectances[indexes],
+                    XYZ=colour_data.XYZ[indexes],
+                    matrix_XYZ=matrix_XYZ)
+
+                errors = np.concatenate(
+                    executor.map(
+                        partition_errors,
+                        np.array_split(
+                            sizes, min(len(sizes), 4 * executor.workers)),
+                        chunk_size=1))
+                progress.update(count)
+
+                i = np.argmin(errors)
+                if errors[i] < leaf_error and (best_error is None or
+                                               errors[i] < best_error):
+                    best_error = errors[i]
+                    best_axis = PartitionAxis(origins[sizes[i] - 1],
+                                              direction)
+
+        if best_axis is None:
             raise RuntimeError('Could not find a best partition!')
 
+        partition_error, partition = self.partition_reconstruction_error(
+            best_axis)
+        self._best_partition = (partition_error, best_axis, partition)
+
         return self._best_partition
 
 
@@ -1194,49 +1496,49 @@ class NodeTree_Otsu2018(Node):
     >>> sd = XYZ_to_sd_Otsu2018(XYZ, cmfs, illuminant, dataset)
     >>> with numpy_print_options(suppress=True):
     ...     sd  # doctest: +ELLIPSIS
-    SpectralDistribution([[ 360.        ,    0.0651341...],
-                          [ 370.        ,    0.0651341...],
-                          [ 380.        ,    0.0651341...],
-                          [ 390.        ,    0.0749684...],
-                          [ 400.        ,    0.0815578...],
-                          [ 410.        ,    0.0776439...],
-                          [ 420.        ,    0.0721897...],
-                          [ 430.        ,    0.0649064...],
-                          [ 440.        ,    0.0567185...],
-                          [ 450.        ,    0.0484685...],
-                          [ 460.        ,    0.0409768...],
-                          [ 470.        ,    0.0358964...],
-                          [ 480.        ,    0.0307857...],
-                          [ 490.        ,    0.0270148...],
-                          [ 500.        ,    0.0273773...],
-                          [ 510.        ,    0.0303157...],
-                          [ 520.        ,    0.0331285...],
-                          [ 530.        ,    0.0363027...],
-                          [ 540.        ,    0.0425987...],
-                          [ 550.        ,    0.0513442...],
-                          [ 560.        ,    0.0579256...],
-                          [ 570.        ,    0.0653850...],
-                          [ 580.        ,    0.0929522...],
-                          [ 590.        ,    0.1600326...],
-                          [ 600.        ,    0.2586159...],
-                          [ 610.        ,    0.3701242...],
-                          [ 620.        ,    0.4702243...],
-                          [ 630.        ,    0.5396261...],
-                          [ 640.        ,    0.5737561...],
-                          [ 650.        ,    0.590848 ...],
-                          [ 660.        ,    0.5935371...],
-                          [ 670.        ,    0.5923295...],
-                          [ 680.        ,    0.5956326...],
-                          [ 690.        ,    0.5982513...],
-                          [ 700.        ,    0.6017904...],
-                          [ 710.        ,    0.6016419...],
-                          [ 720.        ,    0.5996892...],
-                          [ 730.        ,    0.6000018...],
-                          [ 740.        ,    0.5964443...],
-                          [ 750.        ,    0.5868181...],
-                          [ 760.        ,    0.5860973...],
-                          [ 770.        ,    0.5614878...],
-                          [ 780.        ,    0.5289331...]],
+    SpectralDistribution([[ 360.        ,    0.0677170...],
+                          [ 370.        ,    0.0677170...],
+                          [ 380.        ,    0.0677170...],
+                          [ 390.        ,    0.0741034...],
+                          [ 400.        ,    0.0705992...],
+                          [ 410.        ,    0.0571362...],
+                          [ 420.        ,    0.0491761...],
+                          [ 430.        ,    0.0462002...],
+                          [ 440.        ,    0.0471148...],
+                          [ 450.        ,    0.0478113...],
+                          [ 460.        ,    0.0476942...],
+                          [ 470.        ,    0.0486075...],
+                          [ 480.        ,    0.0463660...],
+                          [ 490.        ,    0.0424104...],
+                          [ 500.        ,    0.0403907...],
+                          [ 510.        ,    0.0399747...],
+                          [ 520.        ,    0.0381523...],
+                          [ 530.        ,    0.036656 ...],
+                          [ 540.        ,    0.0389028...],
+                          [ 550.        ,    0.0448139...],
+                          [ 560.        ,    0.0494312...],
+                          [ 570.        ,    0.0545378...],
+                          [ 580.        ,    0.0836147...],
+                          [ 590.        ,    0.1595926...],
+                          [ 600.        ,    0.2693875...],
+                          [ 610.        ,    0.3852325...],
+                          [ 620.        ,    0.4799022...],
+                          [ 630.        ,    0.5414932...],
+                          [ 640.        ,    0.5704649...],
+                          [ 650.        ,    0.5866223...],
+                          [ 660.        ,    0.5921847...],
+                          [ 670.        ,    0.5937899...],
+                          [ 680.        ,    0.5985738...],
+                          [ 690.        ,    0.6012250...],
+                          [ 700.        ,    0.6038473...],
+                          [ 710.        ,    0.6021798...],
+                          [ 720.        ,    0.5991427...],
+                          [ 730.        ,    0.5983027...],
+                          [ 740.        ,    0.5958498...],
+                          [ 750.        ,    0.5885521...],
+                          [ 760.        ,    0.5927789...],
+                          [ 770.        ,    0.5712452...],
+                          [ 780.        ,    0.5409848...]],
                          interpolator=SpragueInterpolator,
                          interpolator_kwargs={},
                          extrapolator=Extrapolator,
@@ -1464,24 +1766,24 @@ class NodeTree_Otsu2018(Node):
         Optimising "NodeTree_Otsu2018(1 Node)"...
         <BLANKLINE>
         Split "NodeTree_Otsu2018(1 Node)" into \
-"Node#...(ColourData(10 Reflectances))" and \
-"Node#...(ColourData(14 Reflectances))" along "\
-PartitionAxis(horizontal partition at y = 0.3240945...)".
-        Error is reduced by 0.0054840... and is now 4.8650513..., \
-99.9% of the initial error.
+"Node#...(ColourData(15 Reflectances))" and \
+"Node#...(ColourData(9 Reflectances))" along "\
+PartitionAxis(horizontal partition at y = 0.3308236...)".
+        Error is reduced by 1.7835346... and is now 3.0870007..., \
+63.4% of the initial error.
         <BLANKLINE>
         Iteration 2 of 2:
         <BLANKLINE>
-        Optimising "Node#...(ColourData(10 Reflectances))"...
+        Optimising "Node#...(ColourData(15 Reflectances))"...
+        Optimising "Node#...(ColourData(9 Reflectances))"...
         Optimisation failed: Could not find a best partition!
-        Optimising "Node#...(ColourData(14 Reflectances))"...
         <BLANKLINE>
-        Split "Node#...(ColourData(14 Reflectances))" into \
+        Split "Node#...(ColourData(15 Reflectances))" into \
 "Node#...(ColourData(7 Reflectances))" and \
-"Node#...(ColourData(7 Reflectances))" along \
-"PartitionAxis(horizontal partition at y = 0.3600663...)".
-        Error is reduced by 0.9681059... and is now 3.8969453..., \
-80.0% of the initial error.
+"Node#...(ColourData(8 Reflectances))" along \
+"PartitionAxis(vertical partition at x = 0.3077738...)".
+        Error is reduced by 0.9955437... and is now 2.0914569..., \
+42.9% of the initial error.
         Node tree optimisation is complete!
         >>> len(node_tree)
         3
@@ -1544,7 +1846,7 @@ PartitionAxis(horizontal partition at y = 0.3240945...)".
             print_callable(
                 'Error is reduced by {0} and is now {1}, '
                 '{2:.1f}% of the initial error.'.format(
-                    leaf.leaf_reconstruction_error() - partition_error,
+                    total_error - optimised_total_error,
                     optimised_total_error,
                     100 * optimised_total_error / initial_branch_error))
 
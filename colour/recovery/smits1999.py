@@ -15,6 +15,7 @@ References
 import numpy as np
 
 from colour.colorimetry import CCS_ILLUMINANTS
+from colour.constants import DEFAULT_FLOAT_DTYPE
 from colour.models import (XYZ_to_RGB, normalised_primary_matrix,
                            RGB_COLOURSPACE_sRGB)
 from colour.recovery import SDS_SMITS1999
@@ -30,7 +31,7 @@ __status__ = 'Production'
 __all__ = [
     'PRIMARIES_SMITS1999', 'CCS_WHITEPOINT_SMITS1999',
     'MATRIX_XYZ_TO_RGB_SMITS1999', 'XYZ_to_RGB_Smits1999',
-    'RGB_to_sd_Smits1999'
+    'RGB_to_reflectances_Smits1999', 'RGB_to_sd_Smits1999'
 ]
 
 PRIMARIES_SMITS1999 = RGB_COLOURSPACE_sRGB.primaries
@@ -57,6 +58,14 @@ Current *Smits (1999)* method implementation *RGB* colourspace to
 MATRIX_XYZ_TO_RGB_SMITS1999 : array_like, (3, 3)
 """
 
+_TILE_SIZE_SMITS1999 = 2 ** 16
+"""
+Number of pixels processed at once by
+:func:`colour.recovery.RGB_to_reflectances_Smits1999` definition.
+
+_TILE_SIZE_SMITS1999 : int
+"""
+
 
 def XYZ_to_RGB_Smits1999(XYZ):
     """
@@ -89,6 +98,114 @@ def XYZ_to_RGB_Smits1999(XYZ):
     )
 
 
+def RGB_to_reflectances_Smits1999(RGB, tile_size=None, out=None, dtype=None):
+    """
+    Recovers the spectral reflectances of given *RGB* colourspace array, e.g.
+    an image, using *Smits (1999)* method and returns them as an array without
+    creating spectral distributions.
+
+    The *RGB* colourspace array is converted to the weights of the *Smits
+    (1999)* *white*, *cyan*, *magenta*, *yellow*, *red*, *green* and *blue*
+    spectral distributions, whose product with the spectral distributions is
+    computed by tiles of pixels so that the temporary arrays memory is bounded
+    by the tile size, the output array can be a :class:`numpy.memmap` class
+    instance.
+
+    Parameters
+    ----------
+    RGB : array_like, (..., 3)
+        *RGB* colourspace array to recover the spectral reflectances from.
+    tile_size : int, optional
+        Number of pixels processed at once, if *None*,
+        :attr:`colour.recovery.smits1999._TILE_SIZE_SMITS1999` attribute
+        value is used.
+    out : ndarray, optional
+        *C-contiguous* array of shape (..., 10) receiving the spectral
+        reflectances, its dtype supersedes ``dtype``.
+    dtype : type, optional
+        {:class:`numpy.float16`, :class:`numpy.float32`,
+        :class:`numpy.float64`, :class:`numpy.float128`},
+        Floating point dtype of the spectral reflectances, if *None*,
+        :attr:`colour.constants.DEFAULT_FLOAT_DTYPE` attribute value is used.
+
+    Returns
+    -------
+    ndarray, (..., 10)
+        Spectral reflectances sampled at the
+        :attr:`colour.recovery.SDS_SMITS1999` attribute spectral distributions
+        wavelengths along the last axis.
+
+    Raises
+    ------
+    ValueError
+        If the ``out`` array shape is not compatible with the *RGB* colourspace
+        array shape, or if the ``out`` array is not contiguous.
+
+    Notes
+    -----
+
+    +------------+-----------------------+---------------+
+    | **Domain** | **Scale - Reference** | **Scale - 1** |
+    +============+=======================+===============+
+    | ``RGB``    | [0, 1]                | [0, 1]        |
+    +------------+-----------------------+---------------+
+
+    References
+    ----------
+    :cite:`Smits1999a`
+
+    Examples
+    --------
+    >>> RGB = np.array([[[0.40639599, 0.02752894, 0.03982193],
+    ...                  [0.25000000, 0.50000000, 0.75000000]]])
+    >>> RGB_to_reflectances_Smits1999(RGB)[..., ::3]  # doctest: +ELLIPSIS
+    array([[[ 0.0769192...,  0.0302497...,  0.3429898...,  0.4118075...],
+            [ 0.74275   ,  0.583075  ,  0.289175  ,  0.2624    ]]])
+    """
+
+    RGB = to_domain_1(RGB)
+
+    shape_o = RGB.shape[:-1] + SDS_SMITS1999['white'].wavelengths.shape
+    if out is None:
+        out = np.empty(
+            shape_o, DEFAULT_FLOAT_DTYPE if dtype is None else dtype)
+    elif out.shape != shape_o:
+        raise ValueError(
+            '"out" array shape "{0}" is not compatible with "{1}" "RGB" '
+            'colourspace array shape!'.format(out.shape, RGB.shape))
+
+    basis = np.array([
+        SDS_SMITS1999[name].values
+        for name in ('white', 'cyan', 'magenta', 'yellow', 'red', 'green',
+                     'blue')
+    ]).astype(out.dtype)
+
+    RGB_f = np.reshape(RGB, [-1, 3])
+    out_f = np.reshape(out, [-1, basis.shape[-1]])
+    if out.size != 0 and not np.may_share_memory(out_f, out):
+        raise ValueError('"out" array must be contiguous!')
+
+    tile_size = _TILE_SIZE_SMITS1999 if tile_size is None else tile_size
+    for i in range(0, RGB_f.shape[0], tile_size):
+        tile = slice(i, i + tile_size)
+        RGB_t = RGB_f[tile]
+        indexes = np.arange(RGB_t.shape[0])
+        minimum, median, maximum = np.transpose(np.sort(RGB_t, axis=-1))
+
+        # The white spectral distribution is weighted by the minimum, the
+        # secondary complementing the minimum channel by the median minus the
+        # minimum and the primary of the maximum channel by the maximum minus
+        # the median.
+        weights = np.zeros([RGB_t.shape[0], 7], out.dtype)
+        weights[..., 0] = minimum
+        weights[indexes, 1 + np.argmin(RGB_t, axis=-1)] = median - minimum
+        weights[indexes, 4 + np.argmax(RGB_t, axis=-1)] = maximum - median
+
+        np.dot(weights, basis, out=out_f[tile])
+
+    return out
+
+
 def RGB_to_sd_Smits1999(RGB):
     """
     Recovers the spectral distribution of given *RGB* colourspace array using
@@ -152,41 +269,8 @@ def RGB_to_sd_Smits1999(RGB):
     array([ 0.1894770...,  0.1126470...,  0.0474420...])
     """
 
-    white_sd = SDS_SMITS1999['white'].copy()
-    cyan_sd = SDS_SMITS1999['cyan'].copy()
-    magenta_sd = SDS_SMITS1999['magenta'].copy()
-    yellow_sd = SDS_SMITS1999['yellow'].copy()
-    red_sd = SDS_SMITS1999['red'].copy()
-    green_sd = SDS_SMITS1999['green'].copy()
-    blue_sd = SDS_SMITS1999['blue'].copy()
-
-    R, G, B = to_domain_1(RGB)
-    sd = white_sd.copy() * 0
+    sd = SDS_SMITS1999['white'].copy()
+    sd.values = RGB_to_reflectances_Smits1999(RGB)
     sd.name = 'Smits (1999) - {0}'.format(RGB)
 
-    if R <= G and R <= B:
-        sd += white_sd * R
-        if G <= B:
-            sd += cyan_sd * (G - R)
-            sd += blue_sd * (B - G)
-        else:
-            sd += cyan_sd * (B - R)
-            sd += green_sd * (G - B)
-    elif G <= R and G <= B:
-        sd += white_sd * G
-        if R <= B:
-            sd += magenta_sd * (R - G)
-            sd += blue_sd * (B - R)
-        else:
-            sd += magenta_sd * (B - G)
-            sd += red_sd * (R - B)
-    else:
-        sd += white_sd * B
-        if R <= G:
-            sd += yellow_sd * (R - B)
-            sd += green_sd * (G - R)
-        else:
-            sd += yellow_sd * (G - B)
-            sd += red_sd * (R - G)
-
     return sd
@@ -11,13 +11,21 @@ import unittest
 
 from colour.characterisation import SDS_COLOURCHECKERS
 from colour.colorimetry import (CCS_ILLUMINANTS, SDS_ILLUMINANTS,
-                                MSDS_CMFS_STANDARD_OBSERVER, sd_to_XYZ)
+                                MSDS_CMFS_STANDARD_OBSERVER, SpectralShape,
+                                sd_to_XYZ)
 from colour.difference import JND_CIE1976, delta_E_CIE1976
-from colour.models import RGB_COLOURSPACE_sRGB, RGB_to_XYZ, XYZ_to_Lab
+from colour.models import (RGB_COLOURSPACE_sRGB, RGB_to_XYZ, XYZ_to_Lab,
+                           XYZ_to_xy)
 from colour.recovery.jakob2019 import (
     XYZ_to_sd_Jakob2019, sd_Jakob2019, error_function,
-    dimensionalise_coefficients, SPECTRAL_SHAPE_JAKOB2019, LUT3D_Jakob2019)
-from colour.utilities import domain_range_scale, full, ones, zeros
+    dimensionalise_coefficients, find_coefficients_batch_Jakob2019,
+    SPECTRAL_SHAPE_JAKOB2019, LUT3D_Jakob2019)
+from colour.recovery import jakob2019
+from colour.utilities import domain_range_scale, executor, full, ones, zeros
+try:
+    from unittest import mock
+except ImportError:  # pragma: no cover
+    import mock
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2021 - Colour Developers'
@@ -27,7 +35,8 @@ __email__ = 'colour-developers@colour-science.org'
 __status__ = 'Production'
 
 __all__ = [
-    'TestErrorFunction', 'TestXYZ_to_sd_Jakob2019', 'TestLUT3D_Jakob2019'
+    'TestErrorFunction', 'TestFindCoefficientsBatchJakob2019',
+    'TestXYZ_to_sd_Jakob2019', 'TestLUT3D_Jakob2019'
 ]
 
 
@@ -132,6 +141,113 @@ class TestErrorFunction(unittest.TestCase):
                 staggered_derrors, approximate_derrors, atol=1e-3, rtol=1e-2)
 
 
+class TestFindCoefficientsBatchJakob2019(unittest.TestCase):
+    """
+    Defines :func:`colour.recovery.jakob2019.\
+find_coefficients_batch_Jakob2019` definition unit tests methods.
+    """
+
+    def setUp(self):
+        """
+        Initialises common tests attributes.
+        """
+
+        self._shape = SPECTRAL_SHAPE_JAKOB2019
+        self._cmfs = MSDS_CMFS_STANDARD_OBSERVER[
+            'CIE 1931 2 Degree Standard Observer'].copy().align(self._shape)
+        self._sd_D65 = SDS_ILLUMINANTS['D65'].copy().align(self._shape)
+
+        self._XYZ = np.array([
+            sd_to_XYZ(sd, self._cmfs, self._sd_D65) / 100
+            for sd in SDS_COLOURCHECKERS['ColorChecker N Ohta'].values()
+        ])
+
+    def test_find_coefficients_batch_Jakob2019(self):
+        """
+        Tests :func:`colour.recovery.jakob2019.\
+find_coefficients_batch_Jakob2019` definition.
+        """
+
+        coefficients, error = find_coefficients_batch_Jakob2019(
+            self._XYZ, self._cmfs, self._sd_D65)
+
+        self.assertTrue(np.all(error <= JND_CIE1976 / 100))
+
+        # The errors are consistent with the errors computed by the
+        # "colour.recovery.jakob2019.error_function" definition.
+        coefficients_d, _error = find_coefficients_batch_Jakob2019(
+            self._XYZ, self._cmfs, self._sd_D65, dimensionalise=False)
+        xy_n = XYZ_to_xy(sd_to_XYZ(self._sd_D65, self._cmfs))
+        for i, XYZ in enumerate(self._XYZ):
+            error_r, _derror = error_function(
+                coefficients_d[i],
+                XYZ_to_Lab(XYZ, xy_n), self._cmfs, self._sd_D65)
+
+            self.assertAlmostEqual(error[i], error_r, places=10)
+
+            np.testing.assert_allclose(
+                coefficients[i],
+                dimensionalise_coefficients(coefficients_d[i], self._shape),
+                rtol=1e-10)
+
+    def test_n_dimensional_find_coefficients_batch_Jakob2019(self):
+        """
+        Tests :func:`colour.recovery.jakob2019.\
+find_coefficients_batch_Jakob2019` definition n-dimensional arrays support.
+        """
+
+        coefficients, error = find_coefficients_batch_Jakob2019(
+            self._XYZ, self._cmfs, self._sd_D65)
+
+        coefficients_t, error_t = find_coefficients_batch_Jakob2019(
+            np.reshape(self._XYZ, [2, 12, 3]), self._cmfs, self._sd_D65)
+        np.testing.assert_almost_equal(
+            coefficients_t, np.reshape(coefficients, [2, 12, 3]), decimal=7)
+        np.testing.assert_almost_equal(
+            error_t, np.reshape(error, [2, 12]), decimal=7)
+
+        coefficients_t, error_t = find_coefficients_batch_Jakob2019(
+            self._XYZ[0], self._cmfs, self._sd_D65)
+        np.testing.assert_almost_equal(
+            coefficients_t, coefficients[0], decimal=7)
+        self.assertIsInstance(error_t, float)
+
+    def test_coefficients_0_find_coefficients_batch_Jakob2019(self):
+        """
+        Tests :func:`colour.recovery.jakob2019.\
+find_coefficients_batch_Jakob2019` definition starting coefficients.
+        """
+
+        coefficients, error = find_coefficients_batch_Jakob2019(
+            self._XYZ, self._cmfs, self._sd_D65, dimensionalise=False)
+
+        # Converged coefficients are not iterated further.
+        coefficients_t, error_t = find_coefficients_batch_Jakob2019(
+            self._XYZ,
+            self._cmfs,
+            self._sd_D65,
+            coefficients,
+            dimensionalise=False)
+        np.testing.assert_array_equal(coefficients_t, coefficients)
+        np.testing.assert_almost_equal(error_t, error, decimal=12)
+
+        # The error never increases.
+        coefficients_0 = np.roll(coefficients, 1, axis=0)
+        _coefficients, error_0 = find_coefficients_batch_Jakob2019(
+            self._XYZ,
+            self._cmfs,
+            self._sd_D65,
+            coefficients_0,
+            iterations=0)
+        _coefficients, error_t = find_coefficients_batch_Jakob2019(
+            self._XYZ,
+            self._cmfs,
+            self._sd_D65,
+            coefficients_0,
+            iterations=2)
+        self.assertTrue(np.all(error_t <= error_0))
+
+
 class TestXYZ_to_sd_Jakob2019(unittest.TestCase):
     """
     Defines :func:`colour.recovery.jakob2019.XYZ_to_sd_Jakob2019` definition
@@ -233,7 +349,8 @@ class TestLUT3D_Jakob2019(unittest.TestCase):
         """
 
         required_methods = ('__init__', 'generate', 'RGB_to_coefficients',
-                            'RGB_to_sd', 'read', 'write')
+                            'RGB_to_sd', 'RGB_to_reflectances', 'read',
+                            'write')
 
         for method in required_methods:
             self.assertIn(method, dir(LUT3D_Jakob2019))
@@ -276,6 +393,139 @@ class TestLUT3D_Jakob2019(unittest.TestCase):
                 self.fail('Delta E for RGB={0} in colourspace {1} is {2}!'
                           .format(RGB, self._RGB_colourspace.name, error))
 
+    def test_RGB_to_coefficients(self):
+        """
+        Tests :meth:`colour.recovery.jakob2019.\
+LUT3D_Jakob2019.RGB_to_coefficients` method n-dimensional arrays support.
+        """
+
+        cmfs = self._cmfs.copy().align(SpectralShape(360, 780, 10))
+        illuminant = self._sd_D65.copy().align(cmfs.shape)
+
+        LUT = LUT3D_Jakob2019()
+        LUT.generate(self._RGB_colourspace, cmfs, illuminant, 3, lambda x: x)
+
+        RGB = np.random.RandomState(4).random_sample([2, 3, 3])
+        coefficients = LUT.RGB_to_coefficients(RGB)
+
+        self.assertEqual(coefficients.shape, (2, 3, 3))
+        for i in np.ndindex(2, 3):
+            np.testing.assert_almost_equal(
+                coefficients[i], LUT.RGB_to_coefficients(RGB[i]), decimal=7)
+
+        np.testing.assert_almost_equal(
+            LUT.RGB_to_coefficients(RGB[:1, :1]),
+            coefficients[:1, :1],
+            decimal=7)
+
+    def test_RGB_to_reflectances(self):
+        """
+        Tests :meth:`colour.recovery.jakob2019.\
+LUT3D_Jakob2019.RGB_to_reflectances` method.
+        """
+
+        cmfs = self._cmfs.copy().align(SpectralShape(360, 780, 10))
+        illuminant = self._sd_D65.copy().align(cmfs.shape)
+
+        LUT = LUT3D_Jakob2019()
+        LUT.generate(self._RGB_colourspace, cmfs, illuminant, 3, lambda x: x)
+
+        RGB = np.random.RandomState(4).random_sample([4, 5, 3])
+        reflectances = LUT.RGB_to_reflectances(RGB, cmfs.shape)
+
+        self.assertEqual(reflectances.shape, (4, 5, len(cmfs.wavelengths)))
+        for i in np.ndindex(4, 5):
+            np.testing.assert_almost_equal(
+                reflectances[i],
+                LUT.RGB_to_sd(RGB[i], cmfs.shape).values,
+                decimal=7)
+
+        out = np.empty(reflectances.shape)
+        reflectances_t = LUT.RGB_to_reflectances(
+            RGB, cmfs.shape, tile_size=3, out=out)
+        self.assertIs(reflectances_t, out)
+        np.testing.assert_almost_equal(reflectances_t, reflectances, decimal=7)
+
+        self.assertRaises(
+            ValueError,
+            LUT.RGB_to_reflectances,
+            RGB,
+            cmfs.shape,
+            out=np.empty([4, 5, 3]))
+
+        self.assertRaises(
+            ValueError,
+            LUT.RGB_to_reflectances,
+            RGB,
+            cmfs.shape,
+            out=np.empty([5, 4, len(cmfs.wavelengths)]).transpose(1, 0, 2))
+
+    def test_generate(self):
+        """
+        Tests :meth:`colour.recovery.jakob2019.LUT3D_Jakob2019.generate`
+        method with the different executor backends and a checkpoint.
+        """
+
+        cmfs = self._cmfs.copy().align(SpectralShape(360, 780, 10))
+        illuminant = self._sd_D65.copy().align(cmfs.shape)
+
+        LUT_r = LUT3D_Jakob2019()
+        with executor('Serial'):
+            LUT_r.generate(self._RGB_colourspace, cmfs, illuminant, 3,
+                           lambda x: x)
+
+        LUT_t = LUT3D_Jakob2019()
+        with executor('Thread', 2):
+            LUT_t.generate(self._RGB_colourspace, cmfs, illuminant, 3,
+                           lambda x: x)
+
+        np.testing.assert_array_equal(LUT_t.coefficients, LUT_r.coefficients)
+
+        # The generation is interrupted after 4 slices and resumed from the
+        # checkpoint.
+        path = os.path.join(self._temporary_directory, 'Jakob2019.npz')
+        optimise_slice = jakob2019._optimise_slice_Jakob2019
+        slices = []
+
+        def optimise_slice_interrupted(*args, **kwargs):
+            """
+            Optimises a slice and raises an exception after 4 slices.
+            """
+
+            if len(slices) == 4:
+                raise KeyboardInterrupt
+
+            slices.append(args)
+
+            return optimise_slice(*args, **kwargs)
+
+        with mock.patch.object(jakob2019, '_optimise_slice_Jakob2019',
+                               optimise_slice_interrupted):
+            self.assertRaises(KeyboardInterrupt,
+                              LUT3D_Jakob2019().generate,
+                              self._RGB_colourspace, cmfs, illuminant, 3,
+                              lambda x: x, path)
+
+        with np.load(path) as checkpoint:
+            self.assertEqual(np.sum(checkpoint['optimised']), 4)
+
+        with mock.patch.object(jakob2019, '_optimise_slice_Jakob2019',
+                               mock.Mock(wraps=optimise_slice)) as mocked:
+            LUT_t = LUT3D_Jakob2019()
+            LUT_t.generate(self._RGB_colourspace, cmfs, illuminant, 3,
+                           lambda x: x, path)
+
+            self.assertEqual(mocked.call_count, 5)
+
+        np.testing.assert_array_equal(LUT_t.coefficients, LUT_r.coefficients)
+
+        # A checkpoint generated with different inputs is ignored.
+        key = jakob2019._checkpoint_key_Jakob2019(
+            3, self._RGB_colourspace.matrix_RGB_to_XYZ,
+            self._RGB_colourspace.whitepoint, cmfs,
+            SDS_ILLUMINANTS['A'].copy().align(cmfs.shape))
+        self.assertIsNone(jakob2019._read_checkpoint_Jakob2019(path, key))
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -5,6 +5,8 @@ Defines unit tests for :mod:`colour.recovery.mallett2019` module.
 
 import unittest
 import numpy as np
+from scipy.optimize import minimize
+from unittest import mock
 
 from colour.characterisation import SDS_COLOURCHECKERS
 from colour.colorimetry import (SpectralShape, MSDS_CMFS_STANDARD_OBSERVER,
@@ -14,7 +16,9 @@ from colour.models import (RGB_COLOURSPACE_PAL_SECAM, RGB_COLOURSPACE_sRGB,
                            XYZ_to_RGB, XYZ_to_Lab)
 from colour.recovery import (MSDS_BASIS_FUNCTIONS_sRGB_MALLETT2019,
                              spectral_primary_decomposition_Mallett2019,
+                             RGB_to_reflectances_Mallett2019,
                              RGB_to_sd_Mallett2019)
+from colour.utilities import CACHE_REGISTRY, domain_range_scale
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2021 - Colour Developers'
@@ -25,7 +29,7 @@ __status__ = 'Production'
 
 __all__ = [
     'TestMixinMallett2019', 'TestSpectralPrimaryDecompositionMallett2019',
-    'TestRGB_to_sd_Mallett2019'
+    'TestRGB_to_reflectances_Mallett2019', 'TestRGB_to_sd_Mallett2019'
 ]
 
 
@@ -108,12 +112,134 @@ class TestSpectralPrimaryDecompositionMallett2019(unittest.TestCase,
 test_spectral_primary_decomposition_Mallett2019` definition.
         """
 
-        self._basis = spectral_primary_decomposition_Mallett2019(
-            self._RGB_colourspace, self._cmfs, self._sd_D65)
+        CACHE_REGISTRY.clear_cache(
+            'colour.recovery.mallett2019.'
+            '_CACHE_SPECTRAL_PRIMARY_DECOMPOSITION_MALLETT2019')
+
+        with mock.patch(
+                'colour.recovery.mallett2019.minimize',
+                wraps=minimize) as minimize_w:
+            self._basis = spectral_primary_decomposition_Mallett2019(
+                self._RGB_colourspace, self._cmfs, self._sd_D65)
+
+            # The basis functions are cached and returned as copies.
+            self._basis.values *= 0
+            basis = spectral_primary_decomposition_Mallett2019(
+                self._RGB_colourspace, self._cmfs, self._sd_D65)
+
+            self.assertEqual(minimize_w.call_count, 1)
+
+        self.assertNotEqual(basis, self._basis)
+
+        self._basis = basis
 
         self.check_basis_functions()
 
 
+class TestRGB_to_reflectances_Mallett2019(unittest.TestCase):
+    """
+    Defines :func:`colour.recovery.RGB_to_reflectances_Mallett2019` definition
+    unit tests methods.
+    """
+
+    def setUp(self):
+        """
+        Initialises common tests attributes.
+        """
+
+        self._RGB = np.random.RandomState(4).random_sample([4, 5, 3])
+
+    def test_RGB_to_reflectances_Mallett2019(self):
+        """
+        Tests :func:`colour.recovery.RGB_to_reflectances_Mallett2019`
+        definition.
+        """
+
+        reflectances = RGB_to_reflectances_Mallett2019(self._RGB)
+
+        self.assertEqual(
+            reflectances.shape,
+            (4, 5, len(MSDS_BASIS_FUNCTIONS_sRGB_MALLETT2019.wavelengths)))
+        self.assertEqual(reflectances.dtype, np.float64)
+
+        for RGB, reflectance in zip(
+                np.reshape(self._RGB, [-1, 3]),
+                np.reshape(reflectances, [-1, reflectances.shape[-1]])):
+            np.testing.assert_almost_equal(
+                reflectance,
+                RGB_to_sd_Mallett2019(RGB).values,
+                decimal=7)
+
+        np.testing.assert_almost_equal(
+            RGB_to_reflectances_Mallett2019(self._RGB, tile_size=3),
+            reflectances,
+            decimal=7)
+
+        out = np.zeros(reflectances.shape, np.float32)
+        self.assertIs(RGB_to_reflectances_Mallett2019(self._RGB, out=out), out)
+        np.testing.assert_almost_equal(out, reflectances, decimal=5)
+
+        reflectances_f32 = RGB_to_reflectances_Mallett2019(
+            self._RGB, dtype=np.float32)
+        self.assertEqual(reflectances_f32.dtype, np.float32)
+        np.testing.assert_almost_equal(reflectances_f32, reflectances,
+                                       decimal=5)
+
+    def test_n_dimensional_RGB_to_reflectances_Mallett2019(self):
+        """
+        Tests :func:`colour.recovery.RGB_to_reflectances_Mallett2019`
+        definition n-dimensional arrays support.
+        """
+
+        RGB = self._RGB[0, 0]
+        reflectance = RGB_to_reflectances_Mallett2019(RGB)
+
+        RGB = np.tile(RGB, (6, 1))
+        reflectances = np.tile(reflectance, (6, 1))
+        np.testing.assert_almost_equal(
+            RGB_to_reflectances_Mallett2019(RGB), reflectances, decimal=7)
+
+        RGB = np.reshape(RGB, (2, 3, 3))
+        reflectances = np.reshape(reflectances, (2, 3, -1))
+        np.testing.assert_almost_equal(
+            RGB_to_reflectances_Mallett2019(RGB), reflectances, decimal=7)
+
+    def test_raise_exception_RGB_to_reflectances_Mallett2019(self):
+        """
+        Tests :func:`colour.recovery.RGB_to_reflectances_Mallett2019`
+        definition raised exception.
+        """
+
+        self.assertRaises(
+            ValueError,
+            RGB_to_reflectances_Mallett2019,
+            self._RGB,
+            out=np.zeros([4, 5, 3]))
+
+        bands = RGB_to_reflectances_Mallett2019(self._RGB).shape[-1]
+        self.assertRaises(
+            ValueError,
+            RGB_to_reflectances_Mallett2019,
+            self._RGB,
+            out=np.zeros([5, 4, bands]).transpose(1, 0, 2))
+
+    def test_domain_range_scale_RGB_to_reflectances_Mallett2019(self):
+        """
+        Tests :func:`colour.recovery.RGB_to_reflectances_Mallett2019`
+        definition domain and range scale support.
+        """
+
+        reflectances = RGB_to_reflectances_Mallett2019(self._RGB)
+
+        d_r = (('reference', 1), (1, 1), (100, 100))
+        for scale, factor in d_r:
+            with domain_range_scale(scale):
+                np.testing.assert_almost_equal(
+                    RGB_to_reflectances_Mallett2019(self._RGB * factor),
+                    reflectances,
+                    decimal=7)
+
+
 class TestRGB_to_sd_Mallett2019(unittest.TestCase, TestMixinMallett2019):
     """
     Defines :func:`colour.recovery.RGB_to_sd_Mallett2019` definition unit
@@ -5,11 +5,15 @@ Defines unit tests for :mod:`colour.recovery.meng2015` module.
 
 import numpy as np
 import unittest
+from scipy.optimize import minimize
+from unittest import mock
 
+from colour.characterisation import SDS_COLOURCHECKERS
 from colour.colorimetry import (MSDS_CMFS_STANDARD_OBSERVER, SpectralShape,
-                                SDS_ILLUMINANTS, sd_to_XYZ_integration)
-from colour.recovery import XYZ_to_sd_Meng2015
-from colour.utilities import domain_range_scale
+                                SDS_ILLUMINANTS, msds_to_XYZ_integration,
+                                sd_to_XYZ_integration)
+from colour.recovery import XYZ_to_reflectances_Meng2015, XYZ_to_sd_Meng2015
+from colour.utilities import domain_range_scale, executor
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2021 - Colour Developers'
@@ -18,7 +22,144 @@ __maintainer__ = 'Colour Developers'
 __email__ = 'colour-developers@colour-science.org'
 __status__ = 'Production'
 
-__all__ = ['TestXYZ_to_sd_Meng2015']
+__all__ = ['TestXYZ_to_reflectances_Meng2015', 'TestXYZ_to_sd_Meng2015']
+
+
+class TestXYZ_to_reflectances_Meng2015(unittest.TestCase):
+    """
+    Defines :func:`colour.recovery.meng2015.XYZ_to_reflectances_Meng2015`
+    definition unit tests methods.
+    """
+
+    def setUp(self):
+        """
+        Initialises common tests attributes.
+        """
+
+        self._cmfs = MSDS_CMFS_STANDARD_OBSERVER[
+            'CIE 1931 2 Degree Standard Observer'].copy().align(
+                SpectralShape(360, 780, 10))
+        self._sd_D65 = SDS_ILLUMINANTS['D65'].copy().align(self._cmfs.shape)
+
+        self._XYZ = np.array([
+            sd_to_XYZ_integration(sd, self._cmfs, self._sd_D65) / 100
+            for sd in list(SDS_COLOURCHECKERS['ColorChecker N Ohta'].values())
+            [:12]
+        ])
+
+    def test_XYZ_to_reflectances_Meng2015(self):
+        """
+        Tests :func:`colour.recovery.meng2015.XYZ_to_reflectances_Meng2015`
+        definition.
+        """
+
+        reflectances = XYZ_to_reflectances_Meng2015(self._XYZ, self._cmfs,
+                                                    self._sd_D65)
+
+        self.assertEqual(reflectances.shape,
+                         (len(self._XYZ), len(self._cmfs.wavelengths)))
+
+        np.testing.assert_almost_equal(
+            msds_to_XYZ_integration(
+                reflectances, self._cmfs, self._sd_D65,
+                shape=self._cmfs.shape) / 100,
+            self._XYZ,
+            decimal=7)
+
+        for XYZ, reflectance in zip(self._XYZ, reflectances):
+            np.testing.assert_almost_equal(
+                reflectance,
+                XYZ_to_sd_Meng2015(XYZ, self._cmfs, self._sd_D65).values,
+                decimal=3)
+
+        with executor('Thread', 2):
+            np.testing.assert_almost_equal(
+                XYZ_to_reflectances_Meng2015(self._XYZ, self._cmfs,
+                                             self._sd_D65),
+                reflectances,
+                decimal=3)
+
+    def test_executor_XYZ_to_reflectances_Meng2015(self):
+        """
+        Tests :func:`colour.recovery.meng2015.XYZ_to_reflectances_Meng2015`
+        definition reproducibility with the different executor backends.
+        """
+
+        with mock.patch('colour.recovery.meng2015._CHUNK_SIZE_MENG2015', 5):
+            with executor('Serial'):
+                reflectances = XYZ_to_reflectances_Meng2015(
+                    self._XYZ, self._cmfs, self._sd_D65)
+
+            with executor('Thread', 2):
+                np.testing.assert_equal(
+                    XYZ_to_reflectances_Meng2015(self._XYZ, self._cmfs,
+                                                 self._sd_D65), reflectances)
+
+    def test_n_dimensional_XYZ_to_reflectances_Meng2015(self):
+        """
+        Tests :func:`colour.recovery.meng2015.XYZ_to_reflectances_Meng2015`
+        definition n-dimensional arrays support.
+        """
+
+        # The first tristimulus values are recovered in closed form, the second
+        # ones reach the bounds and are optimised.
+        XYZ = np.tile(self._XYZ[9:11], (3, 1))
+
+        with mock.patch(
+                'colour.recovery.meng2015.minimize',
+                wraps=minimize) as minimize_w:
+            reflectances = XYZ_to_reflectances_Meng2015(
+                XYZ, self._cmfs, self._sd_D65)
+
+            # The duplicate tristimulus values are recovered once.
+            self.assertEqual(minimize_w.call_count, 1)
+
+        np.testing.assert_equal(reflectances[2:], reflectances[:-2])
+
+        np.testing.assert_almost_equal(
+            XYZ_to_reflectances_Meng2015(XYZ[0], self._cmfs, self._sd_D65),
+            reflectances[0],
+            decimal=7)
+
+        np.testing.assert_almost_equal(
+            XYZ_to_reflectances_Meng2015(
+                np.reshape(XYZ, [2, 3, 3]), self._cmfs, self._sd_D65),
+            np.reshape(reflectances, [2, 3, -1]),
+            decimal=7)
+
+    def test_raise_exception_XYZ_to_reflectances_Meng2015(self):
+        """
+        Tests :func:`colour.recovery.meng2015.XYZ_to_reflectances_Meng2015`
+        definition raised exception.
+        """
+
+        self.assertRaises(
+            RuntimeError,
+            XYZ_to_reflectances_Meng2015,
+            np.array([self._XYZ[0], [0.0, 0.0, 1.0]]),
+            optimisation_kwargs={
+                'options': {
+                    'maxiter': 10
+                },
+            })
+
+    def test_domain_range_scale_XYZ_to_reflectances_Meng2015(self):
+        """
+        Tests :func:`colour.recovery.meng2015.XYZ_to_reflectances_Meng2015`
+        definition domain and range scale support.
+        """
+
+        reflectances = XYZ_to_reflectances_Meng2015(self._XYZ[:2], self._cmfs,
+                                                    self._sd_D65)
+
+        d_r = (('reference', 1), (1, 1), (100, 100))
+        for scale, factor in d_r:
+            with domain_range_scale(scale):
+                np.testing.assert_almost_equal(
+                    XYZ_to_reflectances_Meng2015(self._XYZ[:2] * factor,
+                                                 self._cmfs, self._sd_D65),
+                    reflectances,
+                    decimal=7)
 
 
 class TestXYZ_to_sd_Meng2015(unittest.TestCase):
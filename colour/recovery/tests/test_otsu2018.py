@@ -11,13 +11,16 @@ import unittest
 
 from colour.characterisation import SDS_COLOURCHECKERS
 from colour.colorimetry import (CCS_ILLUMINANTS, SDS_ILLUMINANTS,
-                                MSDS_CMFS_STANDARD_OBSERVER, sd_to_XYZ)
+                                MSDS_CMFS_STANDARD_OBSERVER, msds_to_XYZ,
+                                sd_to_XYZ)
 from colour.difference import delta_E_CIE1976
 from colour.models import XYZ_to_Lab
-from colour.recovery import (XYZ_to_sd_Otsu2018, SPECTRAL_SHAPE_OTSU2018,
+from colour.recovery import (XYZ_to_reflectances_Otsu2018,
+                             XYZ_to_sd_Otsu2018, SPECTRAL_SHAPE_OTSU2018,
                              Dataset_Otsu2018, NodeTree_Otsu2018)
-from colour.recovery.otsu2018 import ColourData, Node
-from colour.utilities import domain_range_scale, metric_mse
+from colour.recovery.otsu2018 import (DATASET_REFERENCE_OTSU2018, ColourData,
+                                      Node, PartitionAxis)
+from colour.utilities import domain_range_scale, executor, metric_mse
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2021 - Colour Developers'
@@ -27,8 +30,9 @@ __email__ = 'colour-developers@colour-science.org'
 __status__ = 'Production'
 
 __all__ = [
-    'TestDataset_Otsu2018', 'TestXYZ_to_sd_Otsu2018', 'TestColourData',
-    'TestNode', 'TestNodeTree_Otsu2018'
+    'TestDataset_Otsu2018', 'TestXYZ_to_reflectances_Otsu2018',
+    'TestXYZ_to_sd_Otsu2018', 'TestColourData', 'TestNode',
+    'TestNodeTree_Otsu2018'
 ]
 
 
@@ -54,11 +58,134 @@ class TestDataset_Otsu2018(unittest.TestCase):
         Tests presence of required methods.
         """
 
-        required_methods = ('__init__', 'select', 'cluster', 'read', 'write')
+        required_methods = ('__init__', '__hash__', 'select', 'cluster',
+                            'read', 'write')
 
         for method in required_methods:
             self.assertIn(method, dir(Dataset_Otsu2018))
 
+    def test_select(self):
+        """
+        Tests :meth:`colour.recovery.otsu2018.Dataset_Otsu2018.select` method.
+        """
+
+        dataset = DATASET_REFERENCE_OTSU2018
+
+        xy = np.random.RandomState(4).random_sample([64, 2]) * 0.8
+        indexes = dataset.select(xy)
+
+        for xy_i, index in zip(xy, indexes):
+            i = 0
+            while True:
+                direction, origin, lesser_index, greater_index = (
+                    dataset.selector_array[i])
+                index_i = int(lesser_index if xy_i[int(direction)] <= origin
+                              else greater_index)
+                if index_i >= 0:
+                    break
+
+                i = -index_i
+
+            self.assertEqual(index, index_i)
+
+        self.assertIsInstance(dataset.select(xy[0]), int)
+        self.assertEqual(dataset.select(xy[0]), indexes[0])
+
+        np.testing.assert_equal(
+            dataset.select(np.reshape(xy, [4, 16, 2])),
+            np.reshape(indexes, [4, 16]))
+
+
+class TestXYZ_to_reflectances_Otsu2018(unittest.TestCase):
+    """
+    Defines :func:`colour.recovery.otsu2018.XYZ_to_reflectances_Otsu2018`
+    definition unit tests methods.
+    """
+
+    def setUp(self):
+        """
+        Initialises common tests attributes.
+        """
+
+        self._shape = SPECTRAL_SHAPE_OTSU2018
+        self._cmfs = MSDS_CMFS_STANDARD_OBSERVER[
+            'CIE 1931 2 Degree Standard Observer'].copy().align(self._shape)
+
+        self._sd_D65 = SDS_ILLUMINANTS['D65'].copy().align(self._shape)
+
+        self._XYZ = np.array([
+            sd_to_XYZ(sd, self._cmfs, self._sd_D65) / 100
+            for sd in SDS_COLOURCHECKERS['ColorChecker N Ohta'].values()
+        ])
+
+    def test_XYZ_to_reflectances_Otsu2018(self):
+        """
+        Tests :func:`colour.recovery.otsu2018.XYZ_to_reflectances_Otsu2018`
+        definition.
+        """
+
+        for clip in (True, False):
+            reflectances = XYZ_to_reflectances_Otsu2018(
+                self._XYZ, self._cmfs, self._sd_D65, clip=clip)
+
+            self.assertEqual(reflectances.shape,
+                             (len(self._XYZ), len(self._shape.range())))
+
+            for XYZ, reflectance in zip(self._XYZ, reflectances):
+                np.testing.assert_almost_equal(
+                    reflectance,
+                    XYZ_to_sd_Otsu2018(
+                        XYZ, self._cmfs, self._sd_D65, clip=clip).values,
+                    decimal=7)
+
+        reflectances = XYZ_to_reflectances_Otsu2018(
+            self._XYZ, self._cmfs, self._sd_D65, clip=False)
+        np.testing.assert_almost_equal(
+            msds_to_XYZ(
+                reflectances, self._cmfs, self._sd_D65, shape=self._shape) /
+            100,
+            self._XYZ,
+            decimal=7)
+
+    def test_n_dimensional_XYZ_to_reflectances_Otsu2018(self):
+        """
+        Tests :func:`colour.recovery.otsu2018.XYZ_to_reflectances_Otsu2018`
+        definition n-dimensional arrays support.
+        """
+
+        reflectances = XYZ_to_reflectances_Otsu2018(
+            self._XYZ, self._cmfs, self._sd_D65)
+
+        np.testing.assert_almost_equal(
+            XYZ_to_reflectances_Otsu2018(self._XYZ[0], self._cmfs,
+                                         self._sd_D65),
+            reflectances[0],
+            decimal=7)
+
+        np.testing.assert_almost_equal(
+            XYZ_to_reflectances_Otsu2018(
+                np.reshape(self._XYZ, [4, 6, 3]), self._cmfs, self._sd_D65),
+            np.reshape(reflectances, [4, 6, -1]),
+            decimal=7)
+
+    def test_domain_range_scale_XYZ_to_reflectances_Otsu2018(self):
+        """
+        Tests :func:`colour.recovery.otsu2018.XYZ_to_reflectances_Otsu2018`
+        definition domain and range scale support.
+        """
+
+        reflectances = XYZ_to_reflectances_Otsu2018(
+            self._XYZ, self._cmfs, self._sd_D65)
+
+        d_r = (('reference', 1), (1, 1), (100, 100))
+        for scale, factor in d_r:
+            with domain_range_scale(scale):
+                np.testing.assert_almost_equal(
+                    XYZ_to_reflectances_Otsu2018(
+                        self._XYZ * factor, self._cmfs, self._sd_D65),
+                    reflectances,
+                    decimal=7)
+
 
 class TestXYZ_to_sd_Otsu2018(unittest.TestCase):
     """
@@ -185,6 +312,51 @@ class TestNode(unittest.TestCase):
         for method in required_methods:
             self.assertIn(method, dir(Node))
 
+    def test_find_best_partition(self):
+        """
+        Tests :meth:`colour.recovery.otsu2018.Node.find_best_partition`
+        method.
+        """
+
+        shape = SPECTRAL_SHAPE_OTSU2018
+        reflectances = [
+            sd.copy().align(shape).values
+            for sd in SDS_COLOURCHECKERS['ColorChecker N Ohta'].values()
+        ]
+
+        node_tree = NodeTree_Otsu2018(reflectances)
+        node_tree._minimum_cluster_size = 3
+
+        best_error, best_axis = None, None
+        for direction in [0, 1]:
+            for origin in node_tree.colour_data.xy[:, direction]:
+                axis = PartitionAxis(origin, direction)
+                try:
+                    error, _partition = (
+                        node_tree.partition_reconstruction_error(axis))
+                except RuntimeError:
+                    continue
+
+                if best_error is None or error < best_error:
+                    best_error, best_axis = error, axis
+
+        partition_error, axis, partition = node_tree.find_best_partition()
+
+        self.assertAlmostEqual(partition_error, best_error, places=10)
+        self.assertEqual(axis, best_axis)
+        self.assertEqual(
+            len(partition[0].colour_data) + len(partition[1].colour_data),
+            len(reflectances))
+
+        node_tree = NodeTree_Otsu2018(reflectances)
+        node_tree._minimum_cluster_size = 3
+        with executor('Thread', 2):
+            self.assertEqual(node_tree.find_best_partition()[1], axis)
+
+        node_tree = NodeTree_Otsu2018(reflectances)
+        node_tree._minimum_cluster_size = 13
+        self.assertRaises(RuntimeError, node_tree.find_best_partition)
+
 
 class TestNodeTree_Otsu2018(unittest.TestCase):
     """
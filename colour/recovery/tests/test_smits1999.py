@@ -7,7 +7,8 @@ import numpy as np
 import unittest
 
 from colour.colorimetry import sd_to_XYZ_integration
-from colour.recovery import RGB_to_sd_Smits1999
+from colour.recovery import (RGB_to_reflectances_Smits1999,
+                             RGB_to_sd_Smits1999)
 from colour.recovery.smits1999 import XYZ_to_RGB_Smits1999
 from colour.utilities import domain_range_scale
 
@@ -18,7 +19,111 @@ __maintainer__ = 'Colour Developers'
 __email__ = 'colour-developers@colour-science.org'
 __status__ = 'Production'
 
-__all__ = ['TestRGB_to_sd_Smits1999']
+__all__ = ['TestRGB_to_reflectances_Smits1999', 'TestRGB_to_sd_Smits1999']
+
+
+class TestRGB_to_reflectances_Smits1999(unittest.TestCase):
+    """
+    Defines :func:`colour.recovery.smits1999.RGB_to_reflectances_Smits1999`
+    definition unit tests methods.
+    """
+
+    def setUp(self):
+        """
+        Initialises common tests attributes.
+        """
+
+        self._RGB = np.random.RandomState(4).random_sample([4, 5, 3]) * 2 - 0.5
+        # Ties between the channels select the same spectral distributions
+        # than :func:`colour.recovery.RGB_to_sd_Smits1999` definition.
+        self._RGB[0, :, 1] = self._RGB[0, :, 0]
+        self._RGB[1, :, 2] = self._RGB[1, :, 1]
+        self._RGB[2, :, 0] = self._RGB[2, :, 2]
+        self._RGB[3, 0] = 0.5
+
+    def test_RGB_to_reflectances_Smits1999(self):
+        """
+        Tests :func:`colour.recovery.smits1999.RGB_to_reflectances_Smits1999`
+        definition.
+        """
+
+        reflectances = RGB_to_reflectances_Smits1999(self._RGB)
+
+        self.assertEqual(reflectances.shape, (4, 5, 10))
+        self.assertEqual(reflectances.dtype, np.float64)
+
+        for RGB, reflectance in zip(
+                np.reshape(self._RGB, [-1, 3]),
+                np.reshape(reflectances, [-1, 10])):
+            np.testing.assert_almost_equal(
+                reflectance, RGB_to_sd_Smits1999(RGB).values, decimal=7)
+
+        np.testing.assert_almost_equal(
+            RGB_to_reflectances_Smits1999(self._RGB, tile_size=3),
+            reflectances,
+            decimal=7)
+
+        out = np.zeros(reflectances.shape, np.float32)
+        self.assertIs(RGB_to_reflectances_Smits1999(self._RGB, out=out), out)
+        np.testing.assert_almost_equal(out, reflectances, decimal=5)
+
+        reflectances_f32 = RGB_to_reflectances_Smits1999(
+            self._RGB, dtype=np.float32)
+        self.assertEqual(reflectances_f32.dtype, np.float32)
+        np.testing.assert_almost_equal(reflectances_f32, reflectances,
+                                       decimal=5)
+
+    def test_n_dimensional_RGB_to_reflectances_Smits1999(self):
+        """
+        Tests :func:`colour.recovery.smits1999.RGB_to_reflectances_Smits1999`
+        definition n-dimensional arrays support.
+        """
+
+        RGB = self._RGB[0, 0]
+        reflectance = RGB_to_reflectances_Smits1999(RGB)
+
+        RGB = np.tile(RGB, (6, 1))
+        reflectances = np.tile(reflectance, (6, 1))
+        np.testing.assert_almost_equal(
+            RGB_to_reflectances_Smits1999(RGB), reflectances, decimal=7)
+
+        RGB = np.reshape(RGB, (2, 3, 3))
+        reflectances = np.reshape(reflectances, (2, 3, 10))
+        np.testing.assert_almost_equal(
+            RGB_to_reflectances_Smits1999(RGB), reflectances, decimal=7)
+
+    def test_raise_exception_RGB_to_reflectances_Smits1999(self):
+        """
+        Tests :func:`colour.recovery.smits1999.RGB_to_reflectances_Smits1999`
+        definition raised exception.
+        """
+
+        self.assertRaises(
+            ValueError,
+            RGB_to_reflectances_Smits1999,
+            self._RGB,
+            out=np.zeros([4, 5, 3]))
+        self.assertRaises(
+            ValueError,
+            RGB_to_reflectances_Smits1999,
+            self._RGB,
+            out=np.zeros([5, 4, 10]).transpose(1, 0, 2))
+
+    def test_domain_range_scale_RGB_to_reflectances_Smits1999(self):
+        """
+        Tests :func:`colour.recovery.smits1999.RGB_to_reflectances_Smits1999`
+        definition domain and range scale support.
+        """
+
+        reflectances = RGB_to_reflectances_Smits1999(self._RGB)
+
+        d_r = (('reference', 1), (1, 1), (100, 100))
+        for scale, factor in d_r:
+            with domain_range_scale(scale):
+                np.testing.assert_almost_equal(
+                    RGB_to_reflectances_Smits1999(self._RGB * factor),
+                    reflectances,
+                    decimal=7)
 
 
 class TestRGB_to_sd_Smits1999(unittest.TestCase):
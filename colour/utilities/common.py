@@ -19,11 +19,16 @@ import multiprocessing
 import multiprocessing.pool
 import functools
 import numpy as np
+import os
 import re
+import sys
+import threading
 import types
 import warnings
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
 from contextlib import contextmanager
 from collections import OrderedDict
+from collections.abc import MutableMapping
 from copy import copy
 
 from colour.constants import INTEGER_THRESHOLD, DEFAULT_FLOAT_DTYPE
@@ -39,15 +44,18 @@ __status__ = 'Production'
 __all__ = [
     'handle_numpy_errors', 'ignore_numpy_errors', 'raise_numpy_errors',
     'print_numpy_errors', 'warn_numpy_errors', 'ignore_python_warnings',
-    'batch', 'disable_multiprocessing', 'multiprocessing_pool',
-    'is_matplotlib_installed', 'is_networkx_installed',
-    'is_openimageio_installed', 'is_pandas_installed', 'is_tqdm_installed',
-    'required', 'is_iterable', 'is_string', 'is_numeric', 'is_integer',
-    'is_sibling', 'filter_kwargs', 'filter_mapping', 'first_item',
-    'get_domain_range_scale', 'set_domain_range_scale', 'domain_range_scale',
-    'to_domain_1', 'to_domain_10', 'to_domain_100', 'to_domain_degrees',
-    'to_domain_int', 'from_range_1', 'from_range_10', 'from_range_100',
-    'from_range_degrees', 'from_range_int', 'copy_definition'
+    'batch', 'disable_multiprocessing', 'EXECUTOR_BACKENDS', 'Executor',
+    'get_executor', 'set_executor', 'executor', 'multiprocessing_pool',
+    'is_caching_enabled', 'set_caching_enable', 'caching_enable', 'LRUCache',
+    'CacheRegistry', 'CACHE_REGISTRY', 'is_matplotlib_installed',
+    'is_networkx_installed', 'is_openimageio_installed', 'is_pandas_installed',
+    'is_tqdm_installed', 'required', 'is_iterable', 'is_string', 'is_numeric',
+    'is_integer', 'is_sibling', 'filter_kwargs', 'filter_mapping',
+    'first_item', 'get_domain_range_scale', 'set_domain_range_scale',
+    'domain_range_scale', 'to_domain_1', 'to_domain_10', 'to_domain_100',
+    'to_domain_degrees', 'to_domain_int', 'from_range_1', 'from_range_10',
+    'from_range_100', 'from_range_degrees', 'from_range_int',
+    'copy_definition'
 ]
 
 
@@ -212,6 +220,462 @@ class disable_multiprocessing:
         return wrapper
 
 
+EXECUTOR_BACKENDS = CaseInsensitiveMapping({
+    'Process': ProcessPoolExecutor,
+    'Thread': ThreadPoolExecutor,
+    'Serial': None,
+})
+"""
+Supported *Colour* executor backends.
+
+EXECUTOR_BACKENDS : CaseInsensitiveMapping
+    **{'Process', 'Thread', 'Serial'}**
+"""
+
+
+class _ExecutorTask:
+    """
+    Wraps given function so that it is called in a child process with given
+    domain-range scale, float precision and caching enabled state, i.e. those
+    of the parent process when the task was submitted.
+
+    Parameters
+    ----------
+    function : callable
+        Function to wrap, it must be picklable.
+    scale : unicode
+        Domain-range scale to call the function with.
+    float_dtype : type
+        Float precision to call the function with.
+    caching : bool
+        Caching enabled state to call the function with.
+    """
+
+    def __init__(self, function, scale, float_dtype, caching):
+        self._function = function
+        self._scale = scale
+        self._float_dtype = float_dtype
+        self._caching = caching
+
+    def __call__(self, *args, **kwargs):
+        """
+        Calls the wrapped function.
+        """
+
+        # NOTE: No coverage information is available as this code is executed
+        # in sub-processes.
+        if DEFAULT_FLOAT_DTYPE != self._float_dtype:  # pragma: no cover
+            from colour.utilities import set_float_precision
+
+            set_float_precision(self._float_dtype)
+
+        with domain_range_scale(self._scale):  # pragma: no cover
+            with caching_enable(self._caching):
+                return self._function(*args, **kwargs)
+
+
+class Executor:
+    """
+    Defines a *Colour* executor mapping functions over iterables with a pool of
+    processes or threads created on first use and reused across calls.
+
+    Parameters
+    ----------
+    backend : unicode, optional
+        **{'Process', 'Thread', 'Serial'}**,
+        Executor backend, the *Serial* backend calls the functions in the
+        current thread.
+    workers : int, optional
+        Count of workers, if *None*, the count of processors of the machine,
+        the *Serial* backend is used if it is one.
+    chunk_size : int, optional
+        Count of items sent at once to a worker by the *Process* backend, if
+        *None*, the items are split in four chunks per worker.
+
+    Attributes
+    ----------
+    -   :attr:`~colour.utilities.Executor.backend`
+    -   :attr:`~colour.utilities.Executor.workers`
+    -   :attr:`~colour.utilities.Executor.chunk_size`
+
+    Methods
+    -------
+    -   :meth:`~colour.utilities.Executor.__init__`
+    -   :meth:`~colour.utilities.Executor.map`
+    -   :meth:`~colour.utilities.Executor.submit`
+    -   :meth:`~colour.utilities.Executor.shutdown`
+
+    Notes
+    -----
+    -   The functions mapped with the *Process* backend are called with the
+        domain-range scale and float precision of the current process.
+    -   An executor with a single worker, e.g. on a single processor machine,
+        uses the *Serial* backend.
+
+    Examples
+    --------
+    >>> executor = Executor('Thread', 2)
+    >>> executor.map(abs, [-1, -2, 3])
+    [1, 2, 3]
+    >>> executor.submit(abs, -4).result()
+    4
+    >>> executor.shutdown()
+    """
+
+    def __init__(self, backend='Process', workers=None, chunk_size=None):
+        if backend not in EXECUTOR_BACKENDS:
+            raise ValueError(
+                '"{0}" executor backend is invalid, it must be one of {1}!'
+                .format(backend, list(EXECUTOR_BACKENDS.keys())))
+
+        self._backend = [
+            name for name in EXECUTOR_BACKENDS if name.lower() ==
+            backend.lower()
+        ][0]
+        self._workers = (1 if self._backend == 'Serial' else
+                         max(int(workers or os.cpu_count() or 1), 1))
+        if self._workers == 1:
+            self._backend = 'Serial'
+        self._chunk_size = chunk_size
+
+        self._pool = None
+        self._lock = threading.Lock()
+
+    @property
+    def backend(self):
+        """
+        Getter property for the executor backend.
+
+        Returns
+        -------
+        unicode
+            Executor backend.
+        """
+
+        return self._backend
+
+    @property
+    def workers(self):
+        """
+        Getter property for the executor workers count.
+
+        Returns
+        -------
+        int
+            Executor workers count.
+        """
+
+        return self._workers
+
+    @property
+    def chunk_size(self):
+        """
+        Getter property for the executor chunk size.
+
+        Returns
+        -------
+        int
+            Executor chunk size.
+        """
+
+        return self._chunk_size
+
+    def __repr__(self):
+        """
+        Returns an evaluable string representation of the executor.
+
+        Returns
+        -------
+        unicode
+            Evaluable string representation.
+        """
+
+        return '{0}({1!r}, workers={2}, chunk_size={3})'.format(
+            self.__class__.__name__, self._backend, self._workers,
+            self._chunk_size)
+
+    def _get_pool(self):
+        """
+        Returns the pool of the executor, creating it if not existing.
+        """
+
+        with self._lock:
+            if self._pool is None:
+                self._pool = EXECUTOR_BACKENDS[self._backend](self._workers)
+
+            return self._pool
+
+    def _wrap(self, function):
+        """
+        Wraps given function so that the child processes inherit the current
+        domain-range scale and float precision.
+        """
+
+        if self._backend == 'Process':
+            return _ExecutorTask(function, get_domain_range_scale(),
+                                 DEFAULT_FLOAT_DTYPE, is_caching_enabled())
+
+        return function
+
+    def map(self, function, iterable, chunk_size=None):
+        """
+        Applies given function to each element of given iterable.
+
+        Parameters
+        ----------
+        function : callable
+            Function to apply.
+        iterable : iterable
+            Iterable whose elements the function is applied to.
+        chunk_size : int, optional
+            Count of items sent at once to a worker by the *Process* backend,
+            if *None*, the executor chunk size is used.
+
+        Returns
+        -------
+        list
+            Results of the function for each element of the iterable.
+        """
+
+        iterable = list(iterable)
+
+        if self._backend == 'Serial' or len(iterable) <= 1:
+            return [function(a) for a in iterable]
+
+        chunk_size = chunk_size or self._chunk_size
+        if chunk_size is None:
+            chunk_size = max(
+                int(np.ceil(len(iterable) / (self._workers * 4))), 1)
+
+        return list(self._get_pool().map(
+            self._wrap(function), iterable, chunksize=chunk_size))
+
+    def submit(self, function, *args, **kwargs):
+        """
+        Schedules given function to be called with given arguments.
+
+        Parameters
+        ----------
+        function : callable
+            Function to call.
+
+        Other Parameters
+        ----------------
+        \\*args : list, optional
+            Arguments.
+        \\**kwargs : dict, optional
+            Keywords arguments.
+
+        Returns
+        -------
+        Future
+            Future of the function call, it is completed upon return with the
+            *Serial* backend.
+        """
+
+        if self._backend != 'Serial':
+            return self._get_pool().submit(
+                self._wrap(function), *args, **kwargs)
+
+        future = Future()
+        try:
+            future.set_result(function(*args, **kwargs))
+        except Exception as error:
+            future.set_exception(error)
+
+        return future
+
+    def shutdown(self, wait=True):
+        """
+        Shuts down the pool of the executor, a new pool is created on next
+        use.
+
+        Parameters
+        ----------
+        wait : bool, optional
+            Whether to wait for the pending calls to complete.
+        """
+
+        with self._lock:
+            pool, self._pool = self._pool, None
+
+        if pool is not None:
+            pool.shutdown(wait)
+
+
+_EXECUTOR_SETTINGS = {
+    'backend': 'Process',
+    'workers': None,
+    'chunk_size': None
+}
+"""
+*Colour* executor settings.
+
+_EXECUTOR_SETTINGS : dict
+"""
+
+_EXECUTOR = None
+"""
+*Colour* executor, created on first use.
+
+_EXECUTOR : Executor
+"""
+
+_EXECUTOR_SERIAL = Executor('Serial')
+"""
+*Colour* executor used when multiprocessing is disabled.
+
+_EXECUTOR_SERIAL : Executor
+"""
+
+_EXECUTOR_LOCK = threading.Lock()
+"""
+*Colour* executor lock.
+
+_EXECUTOR_LOCK : Lock
+"""
+
+
+def get_executor():
+    """
+    Returns the *Colour* executor, it is created on first use and reused until
+    the executor settings change.
+
+    Returns
+    -------
+    Executor
+        *Colour* executor, a *Serial* executor if multiprocessing is disabled.
+
+    Examples
+    --------
+    >>> with executor('Thread', 2):
+    ...     get_executor()
+    Executor('Thread', workers=2, chunk_size=None)
+    >>> with disable_multiprocessing():
+    ...     get_executor()
+    Executor('Serial', workers=1, chunk_size=None)
+    """
+
+    global _EXECUTOR
+
+    if not _MULTIPROCESSING_ENABLED:
+        return _EXECUTOR_SERIAL
+
+    with _EXECUTOR_LOCK:
+        if _EXECUTOR is None:
+            _EXECUTOR = Executor(**_EXECUTOR_SETTINGS)
+
+        return _EXECUTOR
+
+
+def set_executor(backend='Process', workers=None, chunk_size=None):
+    """
+    Sets the *Colour* executor settings, the current executor is shut down if
+    the settings change.
+
+    Parameters
+    ----------
+    backend : unicode, optional
+        **{'Process', 'Thread', 'Serial'}**,
+        Executor backend.
+    workers : int, optional
+        Count of workers, if *None*, the count of processors of the machine.
+    chunk_size : int, optional
+        Count of items sent at once to a worker by the *Process* backend.
+
+    Examples
+    --------
+    >>> with executor():
+    ...     set_executor('Serial')
+    ...     get_executor()
+    Executor('Serial', workers=1, chunk_size=None)
+    """
+
+    global _EXECUTOR
+
+    if backend not in EXECUTOR_BACKENDS:
+        raise ValueError(
+            '"{0}" executor backend is invalid, it must be one of {1}!'.format(
+                backend, list(EXECUTOR_BACKENDS.keys())))
+
+    settings = {
+        'backend': backend,
+        'workers': workers,
+        'chunk_size': chunk_size
+    }
+
+    with _EXECUTOR_LOCK:
+        if settings == _EXECUTOR_SETTINGS:
+            return
+
+        _EXECUTOR_SETTINGS.update(settings)
+        previous_executor, _EXECUTOR = _EXECUTOR, None
+
+    if previous_executor is not None:
+        previous_executor.shutdown()
+
+
+class executor:
+    """
+    A context manager and decorator temporarily setting the *Colour* executor
+    settings.
+
+    Parameters
+    ----------
+    backend : unicode, optional
+        **{'Process', 'Thread', 'Serial'}**,
+        Executor backend.
+    workers : int, optional
+        Count of workers, if *None*, the count of processors of the machine.
+    chunk_size : int, optional
+        Count of items sent at once to a worker by the *Process* backend.
+
+    Examples
+    --------
+    >>> with executor('Thread', 2):
+    ...     get_executor().map(abs, [-1, -2, 3])
+    [1, 2, 3]
+    """
+
+    def __init__(self, backend='Process', workers=None, chunk_size=None):
+        self._settings = {
+            'backend': backend,
+            'workers': workers,
+            'chunk_size': chunk_size
+        }
+        self._previous_settings = dict(_EXECUTOR_SETTINGS)
+
+    def __enter__(self):
+        """
+        Called upon entering the context manager and decorator.
+        """
+
+        self._previous_settings = dict(_EXECUTOR_SETTINGS)
+
+        set_executor(**self._settings)
+
+        return self
+
+    def __exit__(self, *args):
+        """
+        Called upon exiting the context manager and decorator.
+        """
+
+        set_executor(**self._previous_settings)
+
+    def __call__(self, function):
+        """
+        Calls the wrapped definition.
+        """
+
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            with self:
+                return function(*args, **kwargs)
+
+        return wrapper
+
+
 def _initializer(kwargs):
     """
     Initializer for the multiprocessing pool. It is mainly use to ensure that
@@ -236,6 +700,10 @@ def multiprocessing_pool(*args, **kwargs):
     """
     A context manager providing a multiprocessing pool.
 
+    The pool is a :class:`multiprocessing.pool.Pool` class instance, or a
+    dummy pool that does not perform multiprocessing if multiprocessing is
+    disabled.
+
     Other Parameters
     ----------------
     \\*args : list, optional
@@ -243,6 +711,12 @@ def multiprocessing_pool(*args, **kwargs):
     \\**kwargs : dict, optional
         Keywords arguments.
 
+    Warnings
+    --------
+    This definition is deprecated, the *Colour* executor returned by
+    :func:`colour.utilities.get_executor` definition and configured with
+    :class:`colour.utilities.executor` context manager should be used instead.
+
     Examples
     --------
     >>> from functools import partial
@@ -254,6 +728,13 @@ def multiprocessing_pool(*args, **kwargs):
     [2, 3, 4, 5, 6, 7, 8, 9, 10, 11]
     """
 
+    from colour.utilities import usage_warning
+
+    usage_warning('"colour.utilities.multiprocessing_pool" definition is '
+                  'deprecated, please use "colour.utilities.get_executor" '
+                  'definition and "colour.utilities.executor" context manager '
+                  'instead!')
+
     class _DummyPool:
         """
         A dummy multiprocessing pool that does not perform multiprocessing.
@@ -299,6 +780,680 @@ def multiprocessing_pool(*args, **kwargs):
         pool.terminate()
 
 
+_CACHING_ENABLED = True
+"""
+Global *Colour* caching enabled state, shared by every thread of the process.
+
+_CACHING_ENABLED : bool
+"""
+
+_CACHING_STATE = threading.local()
+"""
+Thread-local *Colour* caching enabled state overriding the global state in the
+thread it is set in.
+
+_CACHING_STATE : local
+"""
+
+
+def is_caching_enabled():
+    """
+    Returns whether *Colour* caching is enabled in the current thread, i.e. the
+    thread-local state if set, the global state otherwise.
+
+    Returns
+    -------
+    bool
+        Whether *Colour* caching is enabled.
+
+    Examples
+    --------
+    >>> with caching_enable(False):
+    ...     is_caching_enabled()
+    False
+    >>> with caching_enable(True):
+    ...     is_caching_enabled()
+    True
+    """
+
+    enabled = getattr(_CACHING_STATE, 'enabled', None)
+
+    return _CACHING_ENABLED if enabled is None else enabled
+
+
+def set_caching_enable(enable, thread_local=False):
+    """
+    Sets *Colour* caching enabled state, globally, i.e. for every thread,
+    including those of :class:`colour.utilities.Executor` class instances, or
+    in the current thread only.
+
+    Parameters
+    ----------
+    enable : bool or None
+        Whether to enable *Colour* caching, *None* removes the thread-local
+        state of the current thread when ``thread_local`` is *True*.
+    thread_local : bool, optional
+        Whether to set the thread-local state of the current thread, which
+        overrides the global state, instead of the global state.
+
+    Examples
+    --------
+    >>> with caching_enable(True):
+    ...     print(is_caching_enabled())
+    ...     set_caching_enable(False)
+    ...     print(is_caching_enabled())
+    True
+    False
+    """
+
+    global _CACHING_ENABLED
+
+    if thread_local:
+        _CACHING_STATE.enabled = enable
+    else:
+        _CACHING_ENABLED = enable
+
+
+class caching_enable:
+    """
+    A context manager and decorator temporarily setting *Colour* caching
+    enabled state, globally or in the current thread only.
+
+    Parameters
+    ----------
+    enable : bool
+        Whether to enable or disable *Colour* caching.
+    thread_local : bool, optional
+        Whether to set the thread-local state of the current thread instead of
+        the global state.
+
+    Examples
+    --------
+    >>> with caching_enable(False):
+    ...     is_caching_enabled()
+    False
+    """
+
+    def __init__(self, enable, thread_local=False):
+        self._enable = enable
+        self._thread_local = thread_local
+        self._previous_state = None
+
+    def __enter__(self):
+        """
+        Called upon entering the context manager and decorator.
+        """
+
+        self._previous_state = (getattr(_CACHING_STATE, 'enabled', None)
+                                if self._thread_local else _CACHING_ENABLED)
+
+        set_caching_enable(self._enable, self._thread_local)
+
+        return self
+
+    def __exit__(self, *args):
+        """
+        Called upon exiting the context manager and decorator.
+        """
+
+        set_caching_enable(self._previous_state, self._thread_local)
+
+    def __call__(self, function):
+        """
+        Calls the wrapped definition.
+        """
+
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            with self:
+                return function(*args, **kwargs)
+
+        return wrapper
+
+
+def _nbytes(value):
+    """
+    Returns an estimate of the memory size of given value in bytes.
+
+    Parameters
+    ----------
+    value : object
+        Value to estimate the memory size of.
+
+    Returns
+    -------
+    int
+        Memory size estimate in bytes.
+
+    Examples
+    --------
+    >>> _nbytes(np.zeros(8))
+    64
+    >>> _nbytes((np.zeros(8), np.zeros(4)))
+    96
+    """
+
+    if isinstance(value, np.ndarray):
+        return value.nbytes
+    elif isinstance(value, (tuple, list)):
+        return sum(_nbytes(item) for item in value)
+    elif isinstance(value, dict):
+        return sum(_nbytes(item) for item in value.values())
+
+    return sys.getsizeof(value)
+
+
+class LRUCache(MutableMapping):
+    """
+    Implements a thread-safe least recently used cache, optionally bounded in
+    entries count and / or memory size.
+
+    The least recently used entries are evicted first whenever a bound is
+    exceeded. The cache is bypassed, i.e. lookups miss and entries are not
+    stored, when *Colour* caching is disabled in the current thread.
+
+    Parameters
+    ----------
+    name : unicode, optional
+        Cache name.
+    maximum_size : int, optional
+        Maximum entries count, unbounded if *None*.
+    maximum_bytes : int, optional
+        Maximum memory size in bytes, estimated from the stored values,
+        unbounded if *None*.
+
+    Attributes
+    ----------
+    -   :attr:`~colour.utilities.LRUCache.name`
+    -   :attr:`~colour.utilities.LRUCache.maximum_size`
+    -   :attr:`~colour.utilities.LRUCache.maximum_bytes`
+    -   :attr:`~colour.utilities.LRUCache.nbytes`
+    -   :attr:`~colour.utilities.LRUCache.statistics`
+
+    Methods
+    -------
+    -   :meth:`~colour.utilities.LRUCache.__init__`
+    -   :meth:`~colour.utilities.LRUCache.__getitem__`
+    -   :meth:`~colour.utilities.LRUCache.__setitem__`
+    -   :meth:`~colour.utilities.LRUCache.__delitem__`
+    -   :meth:`~colour.utilities.LRUCache.__contains__`
+    -   :meth:`~colour.utilities.LRUCache.__iter__`
+    -   :meth:`~colour.utilities.LRUCache.__len__`
+    -   :meth:`~colour.utilities.LRUCache.get`
+    -   :meth:`~colour.utilities.LRUCache.clear`
+
+    Examples
+    --------
+    >>> cache = LRUCache('Cache', maximum_size=2)
+    >>> cache['a'] = 1
+    >>> cache['b'] = 2
+    >>> cache.get('a')
+    1
+    >>> cache['c'] = 3
+    >>> sorted(cache.keys())
+    ['a', 'c']
+    >>> cache.get('b') is None
+    True
+    >>> cache.statistics['hits'], cache.statistics['misses']
+    (1, 1)
+    """
+
+    def __init__(self, name=None, maximum_size=None, maximum_bytes=None):
+        self._name = name
+        self._maximum_size = maximum_size
+        self._maximum_bytes = maximum_bytes
+
+        self._data = OrderedDict()
+        self._data_nbytes = {}
+        self._nbytes = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+        self._lock = threading.RLock()
+
+    @property
+    def name(self):
+        """
+        Getter property for the cache name.
+
+        Returns
+        -------
+        unicode
+            Cache name.
+        """
+
+        return self._name
+
+    @property
+    def maximum_size(self):
+        """
+        Getter and setter property for the maximum entries count.
+
+        Parameters
+        ----------
+        value : int
+            Value to set the maximum entries count with.
+
+        Returns
+        -------
+        int
+            Maximum entries count.
+        """
+
+        return self._maximum_size
+
+    @maximum_size.setter
+    def maximum_size(self, value):
+        """
+        Setter for the **self.maximum_size** property.
+        """
+
+        with self._lock:
+            self._maximum_size = value
+            self._evict()
+
+    @property
+    def maximum_bytes(self):
+        """
+        Getter and setter property for the maximum memory size in bytes.
+
+        Parameters
+        ----------
+        value : int
+            Value to set the maximum memory size in bytes with.
+
+        Returns
+        -------
+        int
+            Maximum memory size in bytes.
+        """
+
+        return self._maximum_bytes
+
+    @maximum_bytes.setter
+    def maximum_bytes(self, value):
+        """
+        Setter for the **self.maximum_bytes** property.
+        """
+
+        with self._lock:
+            self._maximum_bytes = value
+            self._evict()
+
+    @property
+    def nbytes(self):
+        """
+        Getter property for the estimated memory size of the cached values in
+        bytes.
+
+        Returns
+        -------
+        int
+            Estimated memory size in bytes.
+        """
+
+        return self._nbytes
+
+    @property
+    def statistics(self):
+        """
+        Getter property for the cache statistics.
+
+        Returns
+        -------
+        dict
+            Cache statistics: hits, misses, evictions, entries count and
+            estimated memory size in bytes.
+        """
+
+        with self._lock:
+            return {
+                'hits': self._hits,
+                'misses': self._misses,
+                'evictions': self._evictions,
+                'size': len(self._data),
+                'nbytes': self._nbytes,
+            }
+
+    def __getitem__(self, key):
+        """
+        Returns the value of given key and marks it as recently used.
+
+        Parameters
+        ----------
+        key : object
+            Key to retrieve the value of.
+
+        Returns
+        -------
+        object
+            Key value.
+        """
+
+        with self._lock:
+            if not is_caching_enabled() or key not in self._data:
+                self._misses += 1
+
+                raise KeyError(key)
+
+            self._hits += 1
+            self._data.move_to_end(key)
+
+            return self._data[key]
+
+    def __setitem__(self, key, value):
+        """
+        Sets given key with given value and evicts the least recently used
+        entries if a bound is exceeded.
+
+        Parameters
+        ----------
+        key : object
+            Key to set the value of.
+        value : object
+            Value to set.
+        """
+
+        if not is_caching_enabled():
+            return
+
+        nbytes = _nbytes(value)
+
+        with self._lock:
+            if key in self._data:
+                self._nbytes -= self._data_nbytes[key]
+
+            self._data[key] = value
+            self._data.move_to_end(key)
+            self._data_nbytes[key] = nbytes
+            self._nbytes += nbytes
+
+            self._evict()
+
+    def __delitem__(self, key):
+        """
+        Deletes given key.
+
+        Parameters
+        ----------
+        key : object
+            Key to delete.
+        """
+
+        with self._lock:
+            del self._data[key]
+            self._nbytes -= self._data_nbytes.pop(key)
+
+    def __contains__(self, key):
+        """
+        Returns whether the cache contains given key, without affecting the
+        statistics.
+
+        Parameters
+        ----------
+        key : object
+            Key to search for.
+
+        Returns
+        -------
+        bool
+            Whether the cache contains given key.
+        """
+
+        return is_caching_enabled() and key in self._data
+
+    def __iter__(self):
+        """
+        Iterates over the cache keys, from the least to the most recently used.
+
+        Returns
+        -------
+        generator
+            Cache keys iterator.
+        """
+
+        with self._lock:
+            return iter(list(self._data.keys()))
+
+    def __len__(self):
+        """
+        Returns the cache entries count.
+
+        Returns
+        -------
+        int
+            Cache entries count.
+        """
+
+        return len(self._data)
+
+    def __repr__(self):
+        """
+        Returns an evaluable string representation of the cache.
+
+        Returns
+        -------
+        unicode
+            Evaluable string representation.
+        """
+
+        return '{0}({1!r}, maximum_size={2!r}, maximum_bytes={3!r})'.format(
+            self.__class__.__name__, self._name, self._maximum_size,
+            self._maximum_bytes)
+
+    def get(self, key, default=None):
+        """
+        Returns the value of given key if it exists, otherwise given default
+        value.
+
+        Parameters
+        ----------
+        key : object
+            Key to retrieve the value of.
+        default : object, optional
+            Default value.
+
+        Returns
+        -------
+        object
+            Key value or default value.
+        """
+
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def clear(self):
+        """
+        Clears the cache entries, the statistics are preserved.
+        """
+
+        with self._lock:
+            self._data.clear()
+            self._data_nbytes.clear()
+            self._nbytes = 0
+
+    def _evict(self):
+        """
+        Evicts the least recently used entries until the bounds are met.
+        """
+
+        while self._data and (
+            (self._maximum_size is not None and
+             len(self._data) > self._maximum_size) or
+            (self._maximum_bytes is not None and
+             self._nbytes > self._maximum_bytes)):
+            key, _value = self._data.popitem(last=False)
+            self._nbytes -= self._data_nbytes.pop(key)
+            self._evictions += 1
+
+
+class CacheRegistry:
+    """
+    A registry for mapping-based caches.
+
+    Attributes
+    ----------
+    -   :attr:`~colour.utilities.CacheRegistry.registry`
+
+    Methods
+    -------
+    -   :meth:`~colour.utilities.CacheRegistry.__init__`
+    -   :meth:`~colour.utilities.CacheRegistry.register_cache`
+    -   :meth:`~colour.utilities.CacheRegistry.unregister_cache`
+    -   :meth:`~colour.utilities.CacheRegistry.clear_cache`
+    -   :meth:`~colour.utilities.CacheRegistry.clear_all_caches`
+    -   :meth:`~colour.utilities.CacheRegistry.statistics`
+
+    Examples
+    --------
+    >>> cache_registry = CacheRegistry()
+    >>> cache_a = cache_registry.register_cache('Cache A')
+    >>> cache_a['Foo'] = 'Bar'
+    >>> cache_b = cache_registry.register_cache('Cache B', maximum_size=8)
+    >>> cache_b['John'] = 'Doe'
+    >>> cache_b['Luke'] = 'Skywalker'
+    >>> sorted(cache_registry.registry.keys())
+    ['Cache A', 'Cache B']
+    >>> cache_registry.clear_cache('Cache A')
+    >>> len(cache_a), len(cache_b)
+    (0, 2)
+    >>> cache_registry.clear_all_caches()
+    >>> len(cache_a), len(cache_b)
+    (0, 0)
+    """
+
+    def __init__(self):
+        self._registry = {}
+        self._lock = threading.RLock()
+
+    @property
+    def registry(self):
+        """
+        Getter property for the cache registry.
+
+        Returns
+        -------
+        dict
+            Cache registry.
+        """
+
+        return self._registry
+
+    def register_cache(self, name, maximum_size=None, maximum_bytes=None):
+        """
+        Registers a new cache with given name in the registry, if a cache with
+        given name is already registered, e.g. when reloading its module, it is
+        returned unchanged.
+
+        Parameters
+        ----------
+        name : unicode
+            Cache name for the registry.
+        maximum_size : int, optional
+            Maximum entries count, unbounded if *None*.
+        maximum_bytes : int, optional
+            Maximum memory size in bytes, unbounded if *None*.
+
+        Returns
+        -------
+        LRUCache
+            Registered cache.
+
+        Examples
+        --------
+        >>> cache_registry = CacheRegistry()
+        >>> cache_registry.register_cache('Cache A')
+        LRUCache('Cache A', maximum_size=None, maximum_bytes=None)
+        >>> cache_registry.register_cache('Cache A', maximum_size=8)
+        LRUCache('Cache A', maximum_size=None, maximum_bytes=None)
+        """
+
+        with self._lock:
+            if name not in self._registry:
+                self._registry[name] = LRUCache(name, maximum_size,
+                                                maximum_bytes)
+
+            return self._registry[name]
+
+    def unregister_cache(self, name):
+        """
+        Unregisters cache with given name in the registry.
+
+        Parameters
+        ----------
+        name : unicode
+            Cache name in the registry.
+
+        Examples
+        --------
+        >>> cache_registry = CacheRegistry()
+        >>> _cache = cache_registry.register_cache('Cache A')
+        >>> cache_registry.unregister_cache('Cache A')
+        >>> cache_registry.registry
+        {}
+        """
+
+        with self._lock:
+            del self._registry[name]
+
+    def clear_cache(self, name):
+        """
+        Clears the cache with given name.
+
+        Parameters
+        ----------
+        name : unicode
+            Cache name in the registry.
+        """
+
+        self._registry[name].clear()
+
+    def clear_all_caches(self):
+        """
+        Clears all the caches in the registry.
+        """
+
+        with self._lock:
+            for cache in self._registry.values():
+                cache.clear()
+
+    def statistics(self):
+        """
+        Returns the statistics of the caches in the registry.
+
+        Returns
+        -------
+        dict
+            Caches statistics keyed on the cache names.
+
+        Examples
+        --------
+        >>> cache_registry = CacheRegistry()
+        >>> cache_a = cache_registry.register_cache('Cache A')
+        >>> cache_a['Foo'] = np.zeros(8)
+        >>> cache_registry.statistics()['Cache A']['nbytes']
+        64
+        """
+
+        with self._lock:
+            return {
+                name: cache.statistics
+                for name, cache in self._registry.items()
+            }
+
+
+CACHE_REGISTRY = CacheRegistry()
+"""
+*Colour* cache registry referencing all the caches used for repetitive or long
+processes.
+
+CACHE_REGISTRY : CacheRegistry
+"""
+
+
 def is_matplotlib_installed(raise_exception=False):
     """
     Returns if *Matplotlib* is installed and available.
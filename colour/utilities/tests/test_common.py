@@ -3,18 +3,23 @@
 Defines unit tests for :mod:`colour.utilities.common` module.
 """
 
+import multiprocessing
+import multiprocessing.pool
 import numpy as np
+import threading
 import unittest
 from collections import OrderedDict
 from functools import partial
 
 from colour.utilities import (
-    batch, multiprocessing_pool, is_iterable, is_string, is_numeric,
-    is_integer, is_sibling, filter_kwargs, filter_mapping, first_item,
-    get_domain_range_scale, set_domain_range_scale, domain_range_scale,
-    to_domain_1, to_domain_10, to_domain_100, to_domain_int, to_domain_degrees,
-    from_range_1, from_range_10, from_range_100, from_range_int,
-    from_range_degrees)
+    ColourUsageWarning, batch, disable_multiprocessing, Executor, get_executor,
+    set_executor, executor, multiprocessing_pool, is_caching_enabled,
+    set_caching_enable, caching_enable, LRUCache, CacheRegistry, is_iterable,
+    is_string, is_numeric, is_integer, is_sibling, filter_kwargs,
+    filter_mapping, first_item, get_domain_range_scale,
+    set_domain_range_scale, domain_range_scale, to_domain_1, to_domain_10,
+    to_domain_100, to_domain_int, to_domain_degrees, from_range_1,
+    from_range_10, from_range_100, from_range_int, from_range_degrees)
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2021 - Colour Developers'
@@ -24,7 +29,9 @@ __email__ = 'colour-developers@colour-science.org'
 __status__ = 'Production'
 
 __all__ = [
-    'TestBatch', 'TestMultiprocessingPool', 'TestIsIterable', 'TestIsString',
+    'TestBatch', 'TestExecutor', 'TestGetExecutor', 'TestSetExecutor',
+    'TestExecutorContext', 'TestMultiprocessingPool', 'TestCachingEnable',
+    'TestLRUCache', 'TestCacheRegistry', 'TestIsIterable', 'TestIsString',
     'TestIsNumeric', 'TestIsInteger', 'TestIsSibling', 'TestFilterKwargs',
     'TestFilterMapping', 'TestFirstItem', 'TestGetDomainRangeScale',
     'TestSetDomainRangeScale', 'TestDomainRangeScale', 'TestToDomain1',
@@ -81,6 +88,224 @@ def _add(a, b):
     return a + b  # pragma: no cover
 
 
+def _settings(a):
+    """
+    Function to map with an executor returning the domain-range scale and
+    float precision it is called with.
+
+    Parameters
+    ----------
+    a : object
+        Unused.
+
+    Returns
+    -------
+    tuple
+        Domain-range scale and float precision.
+    """
+
+    # NOTE: No coverage information is available as this code is executed in
+    # sub-processes.
+    from colour.utilities import array  # pragma: no cover
+
+    return get_domain_range_scale(), array.DEFAULT_FLOAT_DTYPE
+
+
+class TestExecutor(unittest.TestCase):
+    """
+    Defines :class:`colour.utilities.common.Executor` class units tests
+    methods.
+    """
+
+    def test_required_attributes(self):
+        """
+        Tests presence of required attributes.
+        """
+
+        required_attributes = ('backend', 'workers', 'chunk_size')
+
+        for attribute in required_attributes:
+            self.assertIn(attribute, dir(Executor))
+
+    def test_required_methods(self):
+        """
+        Tests presence of required methods.
+        """
+
+        required_methods = ('__init__', '__repr__', 'map', 'submit',
+                            'shutdown')
+
+        for method in required_methods:
+            self.assertIn(method, dir(Executor))
+
+    def test_map(self):
+        """
+        Tests :meth:`colour.utilities.common.Executor.map` method.
+        """
+
+        for backend in ('Process', 'Thread', 'Serial', 'process'):
+            executor_ = Executor(backend, 2, 3)
+            self.assertListEqual(
+                executor_.map(partial(_add, b=2), range(10)),
+                [2, 3, 4, 5, 6, 7, 8, 9, 10, 11])
+            self.assertListEqual(executor_.map(partial(_add, b=2), []), [])
+            executor_.shutdown()
+
+        self.assertEqual(Executor('process', 2).backend, 'Process')
+        self.assertEqual(Executor('Serial', 4).workers, 1)
+        self.assertEqual(Executor('Process', 1).backend, 'Serial')
+        self.assertEqual(Executor('Thread', 1).backend, 'Serial')
+
+    def test_map_settings(self):
+        """
+        Tests :meth:`colour.utilities.common.Executor.map` method domain-range
+        scale and float precision propagation.
+        """
+
+        executor_ = Executor('Process', 2)
+
+        with domain_range_scale('1'):
+            self.assertListEqual(
+                executor_.map(_settings, range(2)), [('1', np.float64)] * 2)
+
+        from colour.utilities import set_float_precision
+
+        try:
+            set_float_precision(np.float32)
+            self.assertListEqual(
+                executor_.map(_settings, range(2)),
+                [('reference', np.float32)] * 2)
+        finally:
+            set_float_precision(np.float64)
+
+        self.assertListEqual(
+            executor_.map(_settings, range(2)),
+            [('reference', np.float64)] * 2)
+
+        executor_.shutdown()
+
+    def test_submit(self):
+        """
+        Tests :meth:`colour.utilities.common.Executor.submit` method.
+        """
+
+        for backend in ('Process', 'Thread', 'Serial'):
+            executor_ = Executor(backend, 2)
+            self.assertEqual(executor_.submit(_add, 1, b=2).result(), 3)
+            self.assertRaises(TypeError,
+                              executor_.submit(_add, 1, None).result)
+            executor_.shutdown()
+
+    def test_shutdown(self):
+        """
+        Tests :meth:`colour.utilities.common.Executor.shutdown` method.
+        """
+
+        executor_ = Executor('Thread', 2)
+        executor_.map(abs, range(4))
+        executor_.shutdown()
+        # A new pool is created on next use.
+        self.assertListEqual(executor_.map(abs, [-1, -2]), [1, 2])
+        executor_.shutdown()
+
+    def test_raise_exception_Executor(self):
+        """
+        Tests :class:`colour.utilities.common.Executor` class raised
+        exception.
+        """
+
+        self.assertRaises(ValueError, Executor, 'Undefined')
+
+
+class TestGetExecutor(unittest.TestCase):
+    """
+    Defines :func:`colour.utilities.common.get_executor` definition units
+    tests methods.
+    """
+
+    def test_get_executor(self):
+        """
+        Tests :func:`colour.utilities.common.get_executor` definition.
+        """
+
+        with executor('Thread', 2):
+            executor_ = get_executor()
+            self.assertEqual(executor_.backend, 'Thread')
+            self.assertEqual(executor_.workers, 2)
+            # The executor is reused across calls.
+            self.assertIs(get_executor(), executor_)
+
+            with disable_multiprocessing():
+                self.assertEqual(get_executor().backend, 'Serial')
+
+            self.assertIs(get_executor(), executor_)
+
+
+class TestSetExecutor(unittest.TestCase):
+    """
+    Defines :func:`colour.utilities.common.set_executor` definition units
+    tests methods.
+    """
+
+    def test_set_executor(self):
+        """
+        Tests :func:`colour.utilities.common.set_executor` definition.
+        """
+
+        with executor('Thread', 2):
+            executor_ = get_executor()
+            set_executor('Thread', 2)
+            self.assertIs(get_executor(), executor_)
+
+            set_executor('Serial', chunk_size=4)
+            self.assertIsNot(get_executor(), executor_)
+            self.assertEqual(get_executor().backend, 'Serial')
+            self.assertEqual(get_executor().chunk_size, 4)
+
+    def test_raise_exception_set_executor(self):
+        """
+        Tests :func:`colour.utilities.common.set_executor` definition raised
+        exception.
+        """
+
+        self.assertRaises(ValueError, set_executor, 'Undefined')
+
+
+class TestExecutorContext(unittest.TestCase):
+    """
+    Defines :func:`colour.utilities.common.executor` definition units tests
+    methods.
+    """
+
+    def test_executor(self):
+        """
+        Tests :func:`colour.utilities.common.executor` definition.
+        """
+
+        backend = get_executor().backend
+
+        with executor('Serial'):
+            self.assertEqual(get_executor().backend, 'Serial')
+
+            with executor('Thread', 3):
+                self.assertEqual(get_executor().backend, 'Thread')
+                self.assertEqual(get_executor().workers, 3)
+
+            self.assertEqual(get_executor().backend, 'Serial')
+
+        self.assertEqual(get_executor().backend, backend)
+
+        @executor('Thread', 3)
+        def fn_a():
+            """
+            Helper definition performing the test.
+            """
+
+            return get_executor().workers
+
+        self.assertEqual(fn_a(), 3)
+
+
 class TestMultiprocessingPool(unittest.TestCase):
     """
     Defines :func:`colour.utilities.common.multiprocessing_pool` definition
@@ -92,10 +317,336 @@ class TestMultiprocessingPool(unittest.TestCase):
         Tests :func:`colour.utilities.common.multiprocessing_pool` definition.
         """
 
-        with multiprocessing_pool() as pool:
-            self.assertListEqual(
-                pool.map(partial(_add, b=2), range(10)),
-                [2, 3, 4, 5, 6, 7, 8, 9, 10, 11])
+        with self.assertWarns(ColourUsageWarning):
+            with multiprocessing_pool(2) as pool:
+                self.assertIsInstance(pool, multiprocessing.pool.Pool)
+                self.assertListEqual(
+                    pool.map(partial(_add, b=2), range(10)),
+                    [2, 3, 4, 5, 6, 7, 8, 9, 10, 11])
+
+        with disable_multiprocessing():
+            with self.assertWarns(ColourUsageWarning):
+                with multiprocessing_pool() as pool:
+                    self.assertListEqual(
+                        pool.map(partial(_add, b=2), range(10)),
+                        [2, 3, 4, 5, 6, 7, 8, 9, 10, 11])
+
+
+class TestCachingEnable(unittest.TestCase):
+    """
+    Defines :func:`colour.utilities.common.caching_enable` definition unit
+    tests methods.
+    """
+
+    def test_caching_enable(self):
+        """
+        Tests :func:`colour.utilities.common.caching_enable` definition.
+        """
+
+        with caching_enable(True):
+            self.assertTrue(is_caching_enabled())
+
+            with caching_enable(False):
+                self.assertFalse(is_caching_enabled())
+
+            self.assertTrue(is_caching_enabled())
+
+        @caching_enable(False)
+        def fn_a():
+            """
+            :func:`caching_enable` unit tests :func:`fn_a` definition.
+            """
+
+            return is_caching_enabled()
+
+        self.assertFalse(fn_a())
+
+        set_caching_enable(False)
+        self.assertFalse(is_caching_enabled())
+        set_caching_enable(True)
+        self.assertTrue(is_caching_enabled())
+
+        # The global caching enabled state is shared by every thread.
+        def thread_states(states):
+            """
+            Appends the caching enabled state of a new thread to given list.
+            """
+
+            thread = threading.Thread(
+                target=lambda: states.append(is_caching_enabled()))
+            thread.start()
+            thread.join()
+
+            return states
+
+        with caching_enable(False):
+            self.assertListEqual(thread_states([]), [False])
+
+            with executor('Thread', 2):
+                self.assertListEqual(
+                    list(get_executor().map(lambda x: is_caching_enabled(),
+                                            range(4))), [False] * 4)
+
+        self.assertTrue(is_caching_enabled())
+        self.assertListEqual(thread_states([]), [True])
+
+        # The thread-local caching enabled state overrides the global state in
+        # its thread only.
+        with caching_enable(False, thread_local=True):
+            self.assertFalse(is_caching_enabled())
+            self.assertListEqual(thread_states([]), [True])
+
+            with caching_enable(True):
+                self.assertFalse(is_caching_enabled())
+
+        self.assertTrue(is_caching_enabled())
+
+        set_caching_enable(False, thread_local=True)
+        self.assertFalse(is_caching_enabled())
+        set_caching_enable(None, thread_local=True)
+        self.assertTrue(is_caching_enabled())
+
+
+class TestLRUCache(unittest.TestCase):
+    """
+    Defines :class:`colour.utilities.common.LRUCache` class unit tests
+    methods.
+    """
+
+    def test_required_attributes(self):
+        """
+        Tests presence of required attributes.
+        """
+
+        required_attributes = ('name', 'maximum_size', 'maximum_bytes',
+                               'nbytes', 'statistics')
+
+        for attribute in required_attributes:
+            self.assertIn(attribute, dir(LRUCache))
+
+    def test_required_methods(self):
+        """
+        Tests presence of required methods.
+        """
+
+        required_methods = ('__init__', '__getitem__', '__setitem__',
+                            '__delitem__', '__contains__', '__iter__',
+                            '__len__', 'get', 'clear')
+
+        for method in required_methods:
+            self.assertIn(method, dir(LRUCache))
+
+    def test_maximum_size(self):
+        """
+        Tests :attr:`colour.utilities.common.LRUCache.maximum_size` attribute
+        eviction.
+        """
+
+        cache = LRUCache(maximum_size=2)
+        cache['a'] = 1
+        cache['b'] = 2
+        self.assertEqual(cache['a'], 1)
+        cache['c'] = 3
+
+        self.assertListEqual(list(cache), ['a', 'c'])
+
+        cache.maximum_size = 1
+        self.assertListEqual(list(cache), ['c'])
+        self.assertEqual(cache.statistics['evictions'], 2)
+
+    def test_maximum_bytes(self):
+        """
+        Tests :attr:`colour.utilities.common.LRUCache.maximum_bytes` attribute
+        eviction.
+        """
+
+        cache = LRUCache(maximum_bytes=8 * 16)
+        cache['a'] = np.zeros(8)
+        cache['b'] = np.zeros(8)
+        self.assertEqual(cache.nbytes, 8 * 16)
+
+        cache['c'] = np.zeros(8)
+        self.assertListEqual(list(cache), ['b', 'c'])
+        self.assertEqual(cache.nbytes, 8 * 16)
+
+        cache['d'] = np.zeros(32)
+        self.assertEqual(len(cache), 0)
+        self.assertEqual(cache.nbytes, 0)
+
+        cache['a'] = np.zeros(8)
+        del cache['a']
+        self.assertEqual(cache.nbytes, 0)
+
+    def test_statistics(self):
+        """
+        Tests :attr:`colour.utilities.common.LRUCache.statistics` attribute.
+        """
+
+        cache = LRUCache()
+        cache['a'] = np.zeros(8)
+        cache.get('a')
+        cache.get('b')
+        self.assertRaises(KeyError, lambda: cache['b'])
+        self.assertIn('a', cache)
+
+        self.assertDictEqual(cache.statistics, {
+            'hits': 1,
+            'misses': 2,
+            'evictions': 0,
+            'size': 1,
+            'nbytes': 64,
+        })
+
+    def test_caching_disabled(self):
+        """
+        Tests :class:`colour.utilities.common.LRUCache` class behaviour when
+        caching is disabled.
+        """
+
+        cache = LRUCache()
+        cache['a'] = 1
+
+        with caching_enable(False):
+            self.assertNotIn('a', cache)
+            self.assertIsNone(cache.get('a'))
+
+            cache['b'] = 2
+
+        self.assertIn('a', cache)
+        self.assertNotIn('b', cache)
+
+    def test_thread_safety(self):
+        """
+        Tests :class:`colour.utilities.common.LRUCache` class thread safety.
+        """
+
+        cache = LRUCache(maximum_size=16)
+
+        def _fill(offset):
+            """
+            Fills the cache with values.
+            """
+
+            for i in range(1000):
+                cache[offset + i] = np.zeros(1)
+                cache.get(offset + i - 1)
+
+        threads = [
+            threading.Thread(target=_fill, args=(i * 1000, ))
+            for i in range(8)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(len(cache), 16)
+        self.assertEqual(cache.nbytes, 16 * 8)
+
+
+class TestCacheRegistry(unittest.TestCase):
+    """
+    Defines :class:`colour.utilities.common.CacheRegistry` class unit tests
+    methods.
+    """
+
+    def test_required_attributes(self):
+        """
+        Tests presence of required attributes.
+        """
+
+        required_attributes = ('registry', )
+
+        for attribute in required_attributes:
+            self.assertIn(attribute, dir(CacheRegistry))
+
+    def test_required_methods(self):
+        """
+        Tests presence of required methods.
+        """
+
+        required_methods = ('__init__', 'register_cache', 'unregister_cache',
+                            'clear_cache', 'clear_all_caches', 'statistics')
+
+        for method in required_methods:
+            self.assertIn(method, dir(CacheRegistry))
+
+    def test_register_cache(self):
+        """
+        Tests :meth:`colour.utilities.common.CacheRegistry.register_cache`
+        method.
+        """
+
+        cache_registry = CacheRegistry()
+        cache_a = cache_registry.register_cache('Cache A', maximum_size=4)
+
+        self.assertIs(cache_registry.registry['Cache A'], cache_a)
+        self.assertEqual(cache_a.maximum_size, 4)
+
+        cache_a['Foo'] = 'Bar'
+        self.assertIs(
+            cache_registry.register_cache('Cache A', maximum_size=8), cache_a)
+        self.assertEqual(cache_a.maximum_size, 4)
+        self.assertEqual(cache_a['Foo'], 'Bar')
+
+    def test_unregister_cache(self):
+        """
+        Tests :meth:`colour.utilities.common.CacheRegistry.unregister_cache`
+        method.
+        """
+
+        cache_registry = CacheRegistry()
+        cache_registry.register_cache('Cache A')
+        cache_registry.unregister_cache('Cache A')
+
+        self.assertDictEqual(cache_registry.registry, {})
+
+    def test_clear_cache(self):
+        """
+        Tests :meth:`colour.utilities.common.CacheRegistry.clear_cache`
+        method.
+        """
+
+        cache_registry = CacheRegistry()
+        cache_a = cache_registry.register_cache('Cache A')
+        cache_a['Foo'] = 'Bar'
+        cache_b = cache_registry.register_cache('Cache B')
+        cache_b['John'] = 'Doe'
+
+        cache_registry.clear_cache('Cache A')
+        self.assertEqual(len(cache_a), 0)
+        self.assertEqual(len(cache_b), 1)
+
+    def test_clear_all_caches(self):
+        """
+        Tests :meth:`colour.utilities.common.CacheRegistry.clear_all_caches`
+        method.
+        """
+
+        cache_registry = CacheRegistry()
+        cache_a = cache_registry.register_cache('Cache A')
+        cache_a['Foo'] = 'Bar'
+        cache_b = cache_registry.register_cache('Cache B')
+        cache_b['John'] = 'Doe'
+
+        cache_registry.clear_all_caches()
+        self.assertEqual(len(cache_a), 0)
+        self.assertEqual(len(cache_b), 0)
+
+    def test_statistics(self):
+        """
+        Tests :meth:`colour.utilities.common.CacheRegistry.statistics` method.
+        """
+
+        cache_registry = CacheRegistry()
+        cache_a = cache_registry.register_cache('Cache A')
+        cache_a['Foo'] = np.zeros(8)
+        cache_a.get('Foo')
+
+        statistics = cache_registry.statistics()
+        self.assertListEqual(list(statistics.keys()), ['Cache A'])
+        self.assertEqual(statistics['Cache A']['hits'], 1)
+        self.assertEqual(statistics['Cache A']['nbytes'], 64)
 
 
 class TestIsIterable(unittest.TestCase):
@@ -2,27 +2,38 @@
 
 from .datasets import *  # noqa
 from . import datasets
+from .mesh import (MeshVolume_HalfSpaces, mesh_volume_half_spaces,
+                   is_within_mesh_volume, signed_distance_mesh_volume,
+                   mesh_volume)
 from .macadam_limits import is_within_macadam_limits
-from .mesh import is_within_mesh_volume
 from .pointer_gamut import is_within_pointer_gamut
 from .spectrum import (generate_pulse_waves, XYZ_outer_surface,
                        is_within_visible_spectrum)
-from .rgb import (RGB_colourspace_limits, RGB_colourspace_volume_MonteCarlo,
+from .rgb import (RGB_Colourspace_Volume_Specification_MonteCarlo,
+                  RGB_colourspace_limits, RGB_colourspace_volume_MonteCarlo,
+                  RGB_colourspace_volume_analytic,
                   RGB_colourspace_volume_coverage_MonteCarlo,
+                  RGB_colourspace_volume_coverage_analytic,
                   RGB_colourspace_pointer_gamut_coverage_MonteCarlo,
                   RGB_colourspace_visible_spectrum_coverage_MonteCarlo)
 
 __all__ = []
 __all__ += datasets.__all__
 __all__ += ['is_within_macadam_limits']
-__all__ += ['is_within_mesh_volume']
+__all__ += [
+    'MeshVolume_HalfSpaces', 'mesh_volume_half_spaces',
+    'is_within_mesh_volume', 'signed_distance_mesh_volume', 'mesh_volume'
+]
 __all__ += ['is_within_pointer_gamut']
 __all__ += [
     'generate_pulse_waves', 'XYZ_outer_surface', 'is_within_visible_spectrum'
 ]
 __all__ += [
+    'RGB_Colourspace_Volume_Specification_MonteCarlo',
     'RGB_colourspace_limits', 'RGB_colourspace_volume_MonteCarlo',
+    'RGB_colourspace_volume_analytic',
     'RGB_colourspace_volume_coverage_MonteCarlo',
+    'RGB_colourspace_volume_coverage_analytic',
     'RGB_colourspace_pointer_gamut_coverage_MonteCarlo',
     'RGB_colourspace_visible_spectrum_coverage_MonteCarlo'
 ]
@@ -6,11 +6,10 @@ Optimal Colour Stimuli - MacAdam Limits
 Defines objects related to *Optimal Colour Stimuli* computations.
 """
 
-import numpy as np
-from scipy.spatial import Delaunay
-
 from colour.models import xyY_to_XYZ
-from colour.volume import OPTIMAL_COLOUR_STIMULI_ILLUMINANTS
+from colour.volume import (OPTIMAL_COLOUR_STIMULI_ILLUMINANTS,
+                           is_within_mesh_volume)
+from colour.utilities import CACHE_REGISTRY
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2021 - Colour Developers'
@@ -21,8 +20,8 @@ __status__ = 'Production'
 
 __all__ = ['is_within_macadam_limits']
 
-_CACHE_OPTIMAL_COLOUR_STIMULI_XYZ = {}
-_CACHE_OPTIMAL_COLOUR_STIMULI_XYZ_TRIANGULATIONS = {}
+_CACHE_OPTIMAL_COLOUR_STIMULI_XYZ = CACHE_REGISTRY.register_cache(
+    '{0}._CACHE_OPTIMAL_COLOUR_STIMULI_XYZ'.format(__name__), maximum_size=8)
 
 
 def _XYZ_optimal_colour_stimuli(illuminant):
@@ -58,7 +57,7 @@ def _XYZ_optimal_colour_stimuli(illuminant):
     return vertices
 
 
-def is_within_macadam_limits(xyY, illuminant, tolerance=None):
+def is_within_macadam_limits(xyY, illuminant, tolerance=None, distance=None):
     """
     Returns if given *CIE xyY* colourspace array is within MacAdam limits of
     given illuminant.
@@ -71,6 +70,9 @@ def is_within_macadam_limits(xyY, illuminant, tolerance=None):
         Illuminant.
     tolerance : numeric, optional
         Tolerance allowed in the inside-triangle check.
+    distance : numeric, optional
+        Signed distance allowed outside the *Optimal Colour Stimuli* convex
+        hull, see :func:`colour.volume.is_within_mesh_volume` definition.
 
     Returns
     -------
@@ -88,6 +90,7 @@ def is_within_macadam_limits(xyY, illuminant, tolerance=None):
 
     Examples
     --------
+    >>> import numpy as np
     >>> is_within_macadam_limits(np.array([0.3205, 0.4131, 0.51]), 'A')
     array(True, dtype=bool)
     >>> a = np.array([[0.3205, 0.4131, 0.51],
@@ -97,14 +100,6 @@ def is_within_macadam_limits(xyY, illuminant, tolerance=None):
     """
 
     optimal_colour_stimuli = _XYZ_optimal_colour_stimuli(illuminant)
-    triangulation = _CACHE_OPTIMAL_COLOUR_STIMULI_XYZ_TRIANGULATIONS.get(
-        illuminant)
-
-    if triangulation is None:
-        _CACHE_OPTIMAL_COLOUR_STIMULI_XYZ_TRIANGULATIONS[illuminant] = \
-            triangulation = Delaunay(optimal_colour_stimuli)
-
-    simplex = triangulation.find_simplex(xyY_to_XYZ(xyY), tol=tolerance)
-    simplex = np.where(simplex >= 0, True, False)
 
-    return simplex
+    return is_within_mesh_volume(
+        xyY_to_XYZ(xyY), optimal_colour_stimuli, tolerance, distance)
@@ -6,8 +6,12 @@ Mesh Volume Computation Helpers
 Defines helpers objects related to volume computations.
 """
 
+import hashlib
 import numpy as np
-from scipy.spatial import Delaunay
+from collections import namedtuple
+from scipy.spatial import ConvexHull, Delaunay
+
+from colour.utilities import CACHE_REGISTRY, as_float_array
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2021 - Colour Developers'
@@ -16,28 +20,228 @@ __maintainer__ = 'Colour Developers'
 __email__ = 'colour-developers@colour-science.org'
 __status__ = 'Production'
 
-__all__ = ['is_within_mesh_volume']
+__all__ = [
+    'MeshVolume_HalfSpaces', 'mesh_volume_half_spaces',
+    'is_within_mesh_volume', 'signed_distance_mesh_volume', 'mesh_volume'
+]
+
+_CACHE_MESH_VOLUME_HALF_SPACES = CACHE_REGISTRY.register_cache(
+    '{0}._CACHE_MESH_VOLUME_HALF_SPACES'.format(__name__),
+    maximum_bytes=2 ** 26)
+
+_CACHE_MESH_VOLUME_TRIANGULATIONS = CACHE_REGISTRY.register_cache(
+    '{0}._CACHE_MESH_VOLUME_TRIANGULATIONS'.format(__name__), maximum_size=8)
+
+_DIRECTIONS_COUNT_HALF_SPACES = 64
+"""
+Count of the directions used to select the coarse half-spaces.
+
+_DIRECTIONS_COUNT_HALF_SPACES : int
+"""
+
+_ELEMENTS_COUNT_HALF_SPACES = 2 ** 16
+"""
+Maximum count of the elements of the points and half-spaces distances arrays
+computed at once.
+
+_ELEMENTS_COUNT_HALF_SPACES : int
+"""
+
+
+class MeshVolume_HalfSpaces(
+        namedtuple('MeshVolume_HalfSpaces', ('equations', 'equations_outer',
+                                             'equations_inner'))):
+    """
+    Defines the half-spaces bounding the convex hull of a mesh volume.
+
+    The half-spaces are given as hyperplane equations :math:`[n, o]` with
+    outward unit normal :math:`n` and offset :math:`o` so that the points
+    :math:`x` within the volume satisfy :math:`n \\cdot x + o \\leq 0` for
+    every hyperplane.
+
+    Parameters
+    ----------
+    equations : ndarray
+        Hyperplane equations of the convex hull facets.
+    equations_outer : ndarray
+        Subset of the hyperplane equations of the convex hull facets, a point
+        outside any of them is outside the volume.
+    equations_inner : ndarray
+        Hyperplane equations of the convex hull of a subset of the mesh
+        vertices, a point within all of them is within the volume.
+    """
+
+
+def _mesh_key(mesh):
+    """
+    Returns the cache key of given contiguous mesh.
+    """
+
+    return mesh.shape, hashlib.sha1(mesh.view(np.uint8)).hexdigest()
+
+
+def _mesh_triangulation(mesh):
+    """
+    Returns the *Delaunay* triangulation of given mesh and caches it if not
+    existing.
+    """
+
+    mesh = np.ascontiguousarray(as_float_array(mesh))
+
+    key = _mesh_key(mesh)
+    triangulation = _CACHE_MESH_VOLUME_TRIANGULATIONS.get(key)
+
+    if triangulation is None:
+        _CACHE_MESH_VOLUME_TRIANGULATIONS[key] = triangulation = (
+            Delaunay(mesh))
+
+    return triangulation
+
+
+def _directions_fibonacci(count):
+    """
+    Returns given count of unit directions evenly distributed on the sphere
+    using a *Fibonacci* lattice.
+    """
+
+    i = np.arange(count) + 0.5
+    phi = np.arccos(1 - 2 * i / count)
+    theta = np.pi * (1 + 5 ** 0.5) * i
+
+    return np.transpose([
+        np.cos(theta) * np.sin(phi),
+        np.sin(theta) * np.sin(phi),
+        np.cos(phi),
+    ])
+
+
+def mesh_volume_half_spaces(mesh):
+    """
+    Returns the half-spaces bounding the convex hull of given mesh volume and
+    caches them if not existing.
+
+    Alongside the facets hyperplane equations, coarse outer and inner
+    approximations of the convex hull are built with the facets and vertices
+    supporting a set of directions evenly distributed on the sphere: they
+    classify most of the points at a fraction of the cost of testing every
+    facet.
+
+    Parameters
+    ----------
+    mesh : array_like
+        Points of the volume used to generate the convex hull.
+
+    Returns
+    -------
+    MeshVolume_HalfSpaces
+        Mesh volume half-spaces.
+
+    Examples
+    --------
+    >>> mesh = np.array(
+    ...     [[-1.0, -1.0, 1.0],
+    ...       [1.0, -1.0, 1.0],
+    ...       [1.0, -1.0, -1.0],
+    ...       [-1.0, -1.0, -1.0],
+    ...       [0.0, 1.0, 0.0]]
+    ... )
+    >>> mesh_volume_half_spaces(mesh).equations.shape
+    (5, 4)
+    """
+
+    mesh = np.ascontiguousarray(as_float_array(mesh))
+
+    key = _mesh_key(mesh)
+    half_spaces = _CACHE_MESH_VOLUME_HALF_SPACES.get(key)
+
+    if half_spaces is not None:
+        return half_spaces
+
+    hull = ConvexHull(mesh)
+    # Coplanar facets share the same hyperplane equation.
+    equations = np.unique(np.around(hull.equations, 12), axis=0)
 
+    equations_outer = equations_inner = None
+    if (mesh.shape[-1] == 3 and
+            len(equations) > 2 * _DIRECTIONS_COUNT_HALF_SPACES):
+        directions = _directions_fibonacci(_DIRECTIONS_COUNT_HALF_SPACES)
 
-def is_within_mesh_volume(points, mesh, tolerance=None):
+        equations_outer = equations[np.unique(
+            np.argmax(np.dot(equations[:, :-1], np.transpose(directions)),
+                      axis=0))]
+
+        vertices = mesh[hull.vertices]
+        vertices = vertices[np.unique(
+            np.argmax(np.dot(vertices, np.transpose(directions)), axis=0))]
+        equations_inner = ConvexHull(vertices).equations
+
+    half_spaces = MeshVolume_HalfSpaces(equations, equations_outer,
+                                        equations_inner)
+    _CACHE_MESH_VOLUME_HALF_SPACES[key] = half_spaces
+
+    return half_spaces
+
+
+def _half_spaces_distances(points, equations, reduction=np.max):
+    """
+    Reduces the signed distances of given points to given hyperplanes,
+    the points being processed by chunks to bound the memory usage.
+    """
+
+    normals = np.transpose(equations[:, :-1])
+    offsets = equations[:, -1]
+
+    distances = np.empty(points.shape[0])
+    chunk_size = max(_ELEMENTS_COUNT_HALF_SPACES // len(equations), 1)
+    for i in range(0, points.shape[0], chunk_size):
+        chunk = np.dot(points[i:i + chunk_size], normals)
+        chunk += offsets
+        distances[i:i + chunk_size] = reduction(chunk, axis=-1)
+
+    return distances
+
+
+def is_within_mesh_volume(points, mesh, tolerance=None, distance=None):
     """
-    Returns if given points are within given mesh volume using Delaunay
-    triangulation.
+    Returns if given points are within given mesh volume, i.e. within its
+    convex hull.
 
     Parameters
     ----------
     points : array_like
         Points to check if they are within ``mesh`` volume.
     mesh : array_like
-        Points of the volume used to generate the Delaunay triangulation.
+        Points of the volume used to generate the convex hull.
     tolerance : numeric, optional
-        Tolerance allowed in the inside-triangle check.
+        Tolerance allowed in the inside-triangle check, i.e. on the
+        barycentric coordinates of the points in the *Delaunay* triangulation
+        simplices.
+    distance : numeric, optional
+        Signed distance allowed outside the convex hull facets, a negative
+        distance requires the points to be within the volume by that distance.
 
     Returns
     -------
     bool
         Is within mesh volume.
 
+    Raises
+    ------
+    ValueError
+        If both ``tolerance`` and ``distance`` are given.
+
+    Notes
+    -----
+    -   The convex hull half-spaces are computed once per mesh with
+        :func:`colour.volume.mesh_volume_half_spaces` definition. The points
+        are first classified against the coarse outer and inner half-spaces
+        and only the undecided points, i.e. close to the boundary, are tested
+        against every facet with a single matrix product.
+    -   When ``tolerance`` is given, the points are located in the cached
+        *Delaunay* triangulation of the mesh with
+        :meth:`scipy.spatial.Delaunay.find_simplex` method instead, as in
+        previous versions.
+
     Examples
     --------
     >>> mesh = np.array(
@@ -55,9 +259,124 @@ def is_within_mesh_volume(points, mesh, tolerance=None):
     array([ True, False], dtype=bool)
     """
 
-    triangulation = Delaunay(mesh)
+    if tolerance is not None:
+        if distance is not None:
+            raise ValueError(
+                '"tolerance" and "distance" cannot be given together!')
+
+        simplex = _mesh_triangulation(mesh).find_simplex(
+            points, tol=tolerance)
+
+        return np.where(simplex >= 0, True, False)
+
+    half_spaces = mesh_volume_half_spaces(mesh)
+
+    distance = 0 if distance is None else distance
+
+    points = as_float_array(points)
+    shape = points.shape[:-1]
+    points = np.reshape(points, (-1, points.shape[-1]))
+
+    within = np.zeros(points.shape[0], dtype=np.bool_)
+    undecided = np.arange(points.shape[0])
+    if half_spaces.equations_outer is not None:
+        undecided = undecided[_half_spaces_distances(
+            points, half_spaces.equations_outer) <= distance]
+
+        if distance >= 0:
+            inner = _half_spaces_distances(points[undecided],
+                                           half_spaces.equations_inner) <= 0
+            within[undecided[inner]] = True
+            undecided = undecided[~inner]
+
+    within[undecided] = _half_spaces_distances(
+        points[undecided], half_spaces.equations) <= distance
+
+    return np.reshape(within, shape)
+
+
+def signed_distance_mesh_volume(points, mesh):
+    """
+    Returns the signed distance of given points to given mesh volume boundary,
+    i.e. its convex hull boundary, negative within the volume.
+
+    Parameters
+    ----------
+    points : array_like
+        Points to compute the signed distance of.
+    mesh : array_like
+        Points of the volume used to generate the convex hull.
+
+    Returns
+    -------
+    ndarray
+        Signed distance to the mesh volume boundary.
+
+    Notes
+    -----
+    -   The signed distance is the maximum of the signed distances to the
+        convex hull facets hyperplanes: it is exact within the volume and a
+        lower bound of the distance outside the volume, where it is exact for
+        the points facing a facet.
+
+    Examples
+    --------
+    >>> mesh = np.array(
+    ...     [[-1.0, -1.0, 1.0],
+    ...       [1.0, -1.0, 1.0],
+    ...       [1.0, -1.0, -1.0],
+    ...       [-1.0, -1.0, -1.0],
+    ...       [0.0, 1.0, 0.0]]
+    ... )
+    >>> a = np.array([[0.0, -0.5, 0.0],
+    ...               [0.0, -2.0, 0.0]])
+    >>> signed_distance_mesh_volume(a, mesh)
+    array([-0.5,  1. ])
+    """
+
+    half_spaces = mesh_volume_half_spaces(mesh)
+
+    points = as_float_array(points)
+    shape = points.shape[:-1]
+    points = np.reshape(points, (-1, points.shape[-1]))
+
+    return np.reshape(
+        _half_spaces_distances(points, half_spaces.equations), shape)
+
+
+def mesh_volume(triangles):
+    """
+    Returns the signed volume enclosed by given closed triangle mesh using the
+    divergence theorem.
+
+    The volume is the sum of the signed volumes of the tetrahedra formed by
+    the origin and each triangle of the mesh, it is positive when the
+    triangles are oriented counter-clockwise when seen from outside the mesh.
+
+    Parameters
+    ----------
+    triangles : array_like
+        Triangles of the closed mesh, an array of shape (n, 3, 3).
+
+    Returns
+    -------
+    numeric
+        Signed mesh volume.
+
+    Examples
+    --------
+    >>> triangles = np.array(
+    ...     [[[0.0, 0.0, 0.0], [0.0, 1.0, 0.0], [1.0, 0.0, 0.0]],
+    ...      [[0.0, 0.0, 0.0], [1.0, 0.0, 0.0], [0.0, 0.0, 1.0]],
+    ...      [[0.0, 0.0, 0.0], [0.0, 0.0, 1.0], [0.0, 1.0, 0.0]],
+    ...      [[1.0, 0.0, 0.0], [0.0, 1.0, 0.0], [0.0, 0.0, 1.0]]]
+    ... )
+    >>> mesh_volume(triangles)  # doctest: +ELLIPSIS
+    0.1666666...
+    """
 
-    simplex = triangulation.find_simplex(points, tol=tolerance)
-    simplex = np.where(simplex >= 0, True, False)
+    triangles = np.asarray(triangles)
 
-    return simplex
+    return np.sum(
+        np.einsum('...i,...i->...', triangles[..., 0, :],
+                  np.cross(triangles[..., 1, :], triangles[..., 2, :]))) / 6
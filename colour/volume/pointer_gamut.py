@@ -20,7 +20,7 @@ __status__ = 'Production'
 __all__ = ['is_within_pointer_gamut']
 
 
-def is_within_pointer_gamut(XYZ, tolerance=None):
+def is_within_pointer_gamut(XYZ, tolerance=None, distance=None):
     """
     Returns if given *CIE XYZ* tristimulus values are within Pointer's Gamut
     volume.
@@ -31,6 +31,9 @@ def is_within_pointer_gamut(XYZ, tolerance=None):
         *CIE XYZ* tristimulus values.
     tolerance : numeric, optional
         Tolerance allowed in the inside-triangle check.
+    distance : numeric, optional
+        Signed distance allowed outside *Pointer's Gamut* volume convex hull,
+        see :func:`colour.volume.is_within_mesh_volume` definition.
 
     Returns
     -------
@@ -59,4 +62,4 @@ def is_within_pointer_gamut(XYZ, tolerance=None):
     XYZ_p = Lab_to_XYZ(
         LCHab_to_Lab(DATA_POINTER_GAMUT_VOLUME), CCS_ILLUMINANT_POINTER_GAMUT)
 
-    return is_within_mesh_volume(XYZ, XYZ_p, tolerance)
+    return is_within_mesh_volume(XYZ, XYZ_p, tolerance, distance)
@@ -5,23 +5,32 @@ RGB Colourspace Volume Computation
 
 Defines various RGB colourspace volume computation objects:
 
+-   :class:`colour.volume.RGB_Colourspace_Volume_Specification_MonteCarlo`
 -   :func:`colour.RGB_colourspace_limits`
 -   :func:`colour.RGB_colourspace_volume_MonteCarlo`
+-   :func:`colour.RGB_colourspace_volume_analytic`
 -   :func:`colour.RGB_colourspace_volume_coverage_MonteCarlo`
+-   :func:`colour.RGB_colourspace_volume_coverage_analytic`
 -   :func:`colour.RGB_colourspace_pointer_gamut_coverage_MonteCarlo`
 -   :func:`colour.RGB_colourspace_visible_spectrum_coverage_MonteCarlo`
 """
 
 import itertools
-import multiprocessing
 import numpy as np
+from collections import namedtuple
+from functools import partial
+from scipy.stats import norm
 
+from colour.adaptation import matrix_chromatic_adaptation_VonKries
 from colour.algebra import random_triplet_generator
 from colour.colorimetry import CCS_ILLUMINANTS
 from colour.constants import DEFAULT_INT_DTYPE
-from colour.models import (Lab_to_XYZ, RGB_to_XYZ, XYZ_to_Lab, XYZ_to_RGB)
-from colour.volume import is_within_pointer_gamut, is_within_visible_spectrum
-from colour.utilities import as_float_array, multiprocessing_pool
+from colour.geometry import primitive_cube
+from colour.models import (Lab_to_XYZ, RGB_to_XYZ, XYZ_to_Lab, XYZ_to_RGB,
+                           xy_to_xyY, xyY_to_XYZ)
+from colour.volume import (is_within_pointer_gamut, is_within_visible_spectrum,
+                           mesh_volume)
+from colour.utilities import Executor, as_float_array, get_executor
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2021 - Colour Developers'
@@ -31,32 +40,203 @@ __email__ = 'colour-developers@colour-science.org'
 __status__ = 'Production'
 
 __all__ = [
+    'BATCH_SIZE_RGB_COLOURSPACE_VOLUME_MONTECARLO',
+    'BATCHES_MINIMUM_RGB_COLOURSPACE_VOLUME_MONTECARLO',
+    'RGB_Colourspace_Volume_Specification_MonteCarlo',
     'sample_RGB_colourspace_volume_MonteCarlo', 'RGB_colourspace_limits',
-    'RGB_colourspace_volume_MonteCarlo',
+    'RGB_colourspace_volume_MonteCarlo', 'RGB_colourspace_volume_analytic',
     'RGB_colourspace_volume_coverage_MonteCarlo',
+    'RGB_colourspace_volume_coverage_analytic',
     'RGB_colourspace_pointer_gamut_coverage_MonteCarlo',
     'RGB_colourspace_visible_spectrum_coverage_MonteCarlo'
 ]
 
 
-def _wrapper_RGB_colourspace_volume_MonteCarlo(arguments):
+BATCH_SIZE_RGB_COLOURSPACE_VOLUME_MONTECARLO = 2 ** 18
+"""
+Default samples count of the batches streamed by
+:func:`colour.RGB_colourspace_volume_MonteCarlo` definition.
+
+BATCH_SIZE_RGB_COLOURSPACE_VOLUME_MONTECARLO : int
+"""
+
+BATCHES_MINIMUM_RGB_COLOURSPACE_VOLUME_MONTECARLO = 4
+"""
+Minimum batches count used by :func:`colour.RGB_colourspace_volume_MonteCarlo`
+definition before stopping early.
+
+BATCHES_MINIMUM_RGB_COLOURSPACE_VOLUME_MONTECARLO : int
+"""
+
+
+class RGB_Colourspace_Volume_Specification_MonteCarlo(
+        namedtuple('RGB_Colourspace_Volume_Specification_MonteCarlo',
+                   ('volume', 'standard_error', 'samples'))):
     """
-    Convenient wrapper to be able to call
-    :func:`colour.volume.rgb.sample_RGB_colourspace_volume_MonteCarlo`:
-    definition with multiple arguments.
+    Defines the *RGB* colourspace volume estimated using *Monte Carlo* method.
 
     Parameters
     ----------
-    arguments : array_like, optional
-        Arguments.
+    volume : numeric
+        *RGB* colourspace volume estimate.
+    standard_error : numeric
+        Standard error of the *RGB* colourspace volume estimate.
+    samples : integer
+        Samples count used for the estimate.
+    """
 
-    Returns
-    -------
-    integer
-        Inside *RGB* colourspace volume samples count.
+
+def _random_samples(random_generator, samples, limits, random_state):
+    """
+    Returns given samples count from given random triplet generator, legacy
+    generators yielding triplets are supported.
+    """
+
+    triplets = random_generator(samples, limits, random_state)
+
+    if not isinstance(triplets, np.ndarray):
+        triplets = list(triplets)
+
+    return as_float_array(triplets)
+
+
+def _matrix_XYZ_to_RGB(colourspace, illuminant_XYZ,
+                       chromatic_adaptation_transform):
     """
+    Returns the matrix converting *CIE XYZ* tristimulus values under given
+    *illuminant* to given *RGB* colourspace, i.e. the linear part of the
+    conversion of the *CIE L\\*a\\*b\\** colourspace samples.
+    """
+
+    matrix = colourspace.matrix_XYZ_to_RGB
+
+    if chromatic_adaptation_transform is not None:
+        M_CAT = matrix_chromatic_adaptation_VonKries(
+            xyY_to_XYZ(xy_to_xyY(illuminant_XYZ)),
+            xyY_to_XYZ(xy_to_xyY(colourspace.whitepoint)),
+            transform=chromatic_adaptation_transform)
+
+        matrix = np.dot(matrix, M_CAT)
+
+    return matrix
+
+
+def _count_within_RGB_colourspace(Lab, illuminant_Lab, matrix_XYZ_to_RGB):
+    """
+    Returns the count of given *CIE L\\*a\\*b\\** colourspace samples within
+    the *RGB* colourspace unit cube using given matrix.
+    """
+
+    RGB = np.dot(Lab_to_XYZ(Lab, illuminant_Lab), np.transpose(
+        matrix_XYZ_to_RGB))
+
+    return DEFAULT_INT_DTYPE(
+        np.count_nonzero(
+            np.logical_and(
+                np.min(RGB, axis=-1) >= 0,
+                np.max(RGB, axis=-1) <= 1)))
 
-    return sample_RGB_colourspace_volume_MonteCarlo(*arguments)
+
+def _count_within_RGB_colourspace_seeded(task, random_generator, limits,
+                                         illuminant_Lab, matrix_XYZ_to_RGB):
+    """
+    Draws the random samples of given ``(seed, samples)`` task with a
+    *Mersenne Twister* pseudo-random number generator seeded with given
+    :class:`numpy.random.SeedSequence` class instance and returns the count of
+    them within the *RGB* colourspace unit cube using given matrix.
+    """
+
+    seed, samples = task
+
+    Lab = _random_samples(random_generator, samples, limits,
+                          np.random.RandomState(np.random.MT19937(seed)))
+
+    return _count_within_RGB_colourspace(Lab, illuminant_Lab,
+                                         matrix_XYZ_to_RGB)
+
+
+def _RGB_cube_surface(segments):
+    """
+    Returns the triangles tessellating the *RGB* colourspace unit cube surface
+    with given segments count per edge, oriented counter-clockwise when seen
+    from outside the cube.
+
+    The segments follow a cubic progression along the edges, i.e. they are
+    evenly spaced once compressed by the cube root non-linearity of the
+    perceptually uniform colourspace models.
+    """
+
+    segments = DEFAULT_INT_DTYPE(segments)
+
+    vertices, faces, _outline = primitive_cube(1, 1, 1, segments, segments,
+                                               segments)
+    triangles = vertices['position'][faces] + 0.5
+
+    normals = np.cross(triangles[:, 1] - triangles[:, 0],
+                       triangles[:, 2] - triangles[:, 0])
+    inward = np.einsum('...i,...i->...', normals,
+                       np.mean(triangles, axis=1) - 0.5) < 0
+    triangles[inward] = triangles[inward][:, ::-1]
+
+    return triangles ** 3
+
+
+def _clip_triangles(triangles, normals, offsets):
+    """
+    Clips given triangles by the half-spaces defined by given normals and
+    offsets, i.e. keeping the points :math:`x` such as
+    :math:`n \\cdot x + o \\geq 0`, the orientation of the triangles is
+    preserved.
+    """
+
+    for normal, offset in zip(normals, offsets):
+        distances = np.dot(triangles, normal) + offset
+        inside = distances >= 0
+        count = np.sum(inside, axis=-1)
+
+        clipped = [triangles[count == 3]]
+        for count_inside in (1, 2):
+            mask = count == count_inside
+            # Rolling the vertices so that the single inside or outside
+            # vertex comes first.
+            single = inside[mask] if count_inside == 1 else ~inside[mask]
+            roll = (np.argmax(single, axis=-1)[:, np.newaxis] +
+                    np.arange(3)) % 3
+            v_0, v_1, v_2 = np.transpose(
+                np.take_along_axis(triangles[mask], roll[..., np.newaxis],
+                                   axis=1), (1, 0, 2))
+            d_0, d_1, d_2 = np.transpose(
+                np.take_along_axis(distances[mask], roll, axis=1))
+
+            p_01 = v_0 + (d_0 / (d_0 - d_1))[:, np.newaxis] * (v_1 - v_0)
+            p_02 = v_0 + (d_0 / (d_0 - d_2))[:, np.newaxis] * (v_2 - v_0)
+
+            if count_inside == 1:
+                clipped.append(np.stack([v_0, p_01, p_02], axis=1))
+            else:
+                clipped.append(np.stack([p_01, v_1, v_2], axis=1))
+                clipped.append(np.stack([p_01, v_2, p_02], axis=1))
+
+        triangles = np.concatenate(clipped)
+
+    return triangles
+
+
+def _XYZ_to_model(XYZ, illuminant, model, **kwargs):
+    """
+    Converts given *CIE XYZ* tristimulus values to given colourspace model.
+    """
+
+    if model.lower() == 'cie lab':
+        return XYZ_to_Lab(XYZ, illuminant)
+
+    # Avoiding the circular import with the automatic colour conversion graph.
+    from colour.graph import convert
+
+    settings = {'illuminant': illuminant}
+    settings.update(kwargs)
+
+    return convert(XYZ, 'CIE XYZ', model, **settings)
 
 
 def sample_RGB_colourspace_volume_MonteCarlo(
@@ -122,17 +302,12 @@ reproducibility-of-python-pseudo-random-numbers-across-systems-and-versions
     random_state = (random_state
                     if random_state is not None else np.random.RandomState())
 
-    Lab = as_float_array(list(random_generator(samples, limits, random_state)))
-    RGB = XYZ_to_RGB(
-        Lab_to_XYZ(Lab, illuminant_Lab),
-        illuminant_Lab,
-        colourspace.whitepoint,
-        colourspace.matrix_XYZ_to_RGB,
-        chromatic_adaptation_transform=chromatic_adaptation_method)
-    RGB_w = RGB[np.logical_and(
-        np.min(RGB, axis=-1) >= 0,
-        np.max(RGB, axis=-1) <= 1)]
-    return len(RGB_w)
+    Lab = _random_samples(random_generator, samples, limits, random_state)
+
+    return _count_within_RGB_colourspace(
+        Lab, illuminant_Lab,
+        _matrix_XYZ_to_RGB(colourspace, illuminant_Lab,
+                           chromatic_adaptation_method))
 
 
 def RGB_colourspace_limits(colourspace,
@@ -186,17 +361,30 @@ def RGB_colourspace_volume_MonteCarlo(
             'D65'],
         chromatic_adaptation_method='CAT02',
         random_generator=random_triplet_generator,
-        random_state=None):
+        random_state=None,
+        batch_size=BATCH_SIZE_RGB_COLOURSPACE_VOLUME_MONTECARLO,
+        tolerance=None,
+        confidence=0.95,
+        workers=None,
+        additional_data=False):
     """
     Performs given *RGB* colourspace volume computation using *Monte Carlo*
-    method and multiprocessing.
+    method.
+
+    The *CIE L\\*a\\*b\\** colourspace samples are streamed by batches of
+    fixed size converted to the *RGB* colourspace with a transform computed
+    once, the computation stops early once the confidence interval of the
+    volume estimate is narrow enough. The batches are converted concurrently
+    by the *Colour* executor, see :func:`colour.utilities.get_executor`
+    definition, or by a dedicated pool of threads.
 
     Parameters
     ----------
     colourspace : RGB_Colourspace
         *RGB* colourspace to compute the volume of.
     samples : numeric, optional
-        Samples count.
+        Samples count, i.e. the maximum samples count if ``tolerance`` is
+        given.
     limits : array_like, optional
         *CIE L\\*a\\*b\\** colourspace volume.
     illuminant_Lab : array_like, optional
@@ -210,16 +398,48 @@ def RGB_colourspace_volume_MonteCarlo(
         Random triplet generator providing the random samples within the
         *CIE L\\*a\\*b\\** colourspace volume.
     random_state : RandomState, optional
-        Mersenne Twister pseudo-random number generator to use in the random
-        number generator.
+        Mersenne Twister pseudo-random number generator seeding the
+        pseudo-random number generators of the batches.
+    batch_size : integer, optional
+        Samples count of the streamed batches.
+    tolerance : numeric, optional
+        Relative half-width of the confidence interval of the volume estimate
+        under which the computation stops, if *None*, all the samples are
+        used. The computation does not stop before
+        :attr:`colour.volume.rgb.BATCHES_MINIMUM_RGB_COLOURSPACE_VOLUME_MONTECARLO`
+        batches have been used and a sample within the *RGB* colourspace has
+        been found.
+    confidence : numeric, optional
+        Confidence level of the confidence interval.
+    workers : integer, optional
+        Number of threads converting the batches concurrently, if *None*, the
+        *Colour* executor is used.
+    additional_data : bool, optional
+        Whether to output additional data.
 
     Returns
     -------
-    float
+    numeric or RGB_Colourspace_Volume_Specification_MonteCarlo
         *RGB* colourspace volume.
 
+    Raises
+    ------
+    ValueError
+        If the samples count is not strictly positive.
+
     Notes
     -----
+    -   Only a :class:`numpy.random.SeedSequence` class instance and the
+        samples count of each batch are sent to the *Colour* executor, the
+        random samples are drawn by the workers with a *Mersenne Twister*
+        pseudo-random number generator seeded from it, thus
+        ``random_generator`` must be picklable when using the *Process*
+        backend.
+    -   The batches seeds are always spawned in the same order from
+        ``random_state`` and the stopping criterion is evaluated after each
+        batch, in order, so that the result does not depend on the *Colour*
+        executor or ``workers``: the batches converted concurrently past the
+        stopping batch are discarded.
     -   The doctest is assuming that :func:`np.random.RandomState` definition
         will return the same sequence no matter which *OS* or *Python*
         version is used. There is however no formal promise about the *prng*
@@ -232,27 +452,180 @@ reproducibility-of-python-pseudo-random-numbers-across-systems-and-versions
     Examples
     --------
     >>> from colour.models import RGB_COLOURSPACE_sRGB as sRGB
-    >>> from colour.utilities import disable_multiprocessing
     >>> prng = np.random.RandomState(2)
-    >>> with disable_multiprocessing():
-    ...     RGB_colourspace_volume_MonteCarlo(sRGB, 10e3, random_state=prng)
+    >>> RGB_colourspace_volume_MonteCarlo(sRGB, 10e3, random_state=prng)
     ... # doctest: +ELLIPSIS
     8...
+    >>> prng = np.random.RandomState(2)
+    >>> specification = RGB_colourspace_volume_MonteCarlo(
+    ...     sRGB, 10e6, random_state=prng, batch_size=10e3, tolerance=0.01,
+    ...     additional_data=True)
+    >>> specification.volume  # doctest: +ELLIPSIS
+    8...
+    >>> specification.samples
+    390000
     """
 
-    processes = multiprocessing.cpu_count()
-    process_samples = DEFAULT_INT_DTYPE(np.round(samples / processes))
+    random_state = (random_state
+                    if random_state is not None else np.random.RandomState())
+
+    samples = DEFAULT_INT_DTYPE(samples)
+    batch_size = DEFAULT_INT_DTYPE(batch_size)
+
+    if samples < 1:
+        raise ValueError('"samples" must be strictly positive!')
+
+    limits = as_float_array(limits)
+    Lab_volume = np.prod(limits[..., 1] - limits[..., 0])
+
+    matrix_XYZ_to_RGB = _matrix_XYZ_to_RGB(colourspace, illuminant_Lab,
+                                           chromatic_adaptation_method)
 
-    arguments = (colourspace, process_samples, limits, illuminant_Lab,
-                 chromatic_adaptation_method, random_generator, random_state)
+    z = norm.ppf(0.5 + confidence / 2)
 
-    with multiprocessing_pool() as pool:
-        results = pool.map(_wrapper_RGB_colourspace_volume_MonteCarlo,
-                           [arguments for _ in range(processes)])
+    count = partial(
+        _count_within_RGB_colourspace_seeded,
+        random_generator=random_generator,
+        limits=limits,
+        illuminant_Lab=illuminant_Lab,
+        matrix_XYZ_to_RGB=matrix_XYZ_to_RGB)
 
-    Lab_volume = np.product([np.sum(np.abs(x)) for x in limits])
+    executor = (get_executor()
+                if workers is None else Executor('Thread', workers))
+    try:
+        volume, standard_error, samples_used = _volume_MonteCarlo(
+            count, executor, samples, batch_size, Lab_volume, random_state,
+            tolerance, z)
+    finally:
+        if workers is not None:
+            executor.shutdown()
 
-    return Lab_volume * np.sum(results) / (process_samples * processes)
+    if additional_data:
+        return RGB_Colourspace_Volume_Specification_MonteCarlo(
+            volume, standard_error, samples_used)
+    else:
+        return volume
+
+
+def _volume_MonteCarlo(count, executor, samples, batch_size, Lab_volume,
+                       random_state, tolerance, z):
+    """
+    Streams the ``(seed, samples)`` batches tasks of
+    :func:`colour.RGB_colourspace_volume_MonteCarlo` definition to given
+    executor and returns the volume estimate, its standard error and the
+    samples count used.
+    """
+
+    seed_sequence = np.random.SeedSequence(
+        random_state.randint(0, 2 ** 32, 4, dtype=np.uint32).tolist())
+
+    samples_drawn = samples_used = samples_within = batches_used = 0
+    ratio = standard_error = 0
+    stop = False
+    while not stop and samples_drawn < samples:
+        batches = []
+        for _ in range(executor.workers):
+            batch = min(batch_size, samples - samples_drawn)
+            if batch <= 0:
+                break
+
+            batches.append(batch)
+            samples_drawn += batch
+
+        tasks = list(zip(seed_sequence.spawn(len(batches)), batches))
+        for batch, batch_within in zip(
+                batches, executor.map(count, tasks, chunk_size=1)):
+            samples_used += batch
+            samples_within += batch_within
+            batches_used += 1
+
+            ratio = samples_within / samples_used
+            standard_error = Lab_volume * np.sqrt(
+                ratio * (1 - ratio) / samples_used)
+
+            stop = (tolerance is not None and samples_within > 0 and
+                    batches_used >=
+                    BATCHES_MINIMUM_RGB_COLOURSPACE_VOLUME_MONTECARLO and
+                    z * standard_error <= tolerance * Lab_volume * ratio)
+            if stop:
+                break
+
+    return Lab_volume * ratio, standard_error, samples_used
+
+
+def RGB_colourspace_volume_analytic(
+        colourspace,
+        segments=32,
+        illuminant=CCS_ILLUMINANTS['CIE 1931 2 Degree Standard Observer'][
+            'D65'],
+        chromatic_adaptation_method='CAT02',
+        model='CIE Lab',
+        **kwargs):
+    """
+    Computes given *RGB* colourspace volume in given colourspace model by
+    integrating the volume enclosed by its surface mesh.
+
+    The *RGB* colourspace unit cube surface is tessellated with given segments
+    count per edge, converted to the colourspace model and the enclosed volume
+    is integrated with the divergence theorem. The computation is
+    deterministic and the error decreases quadratically with the segments
+    count.
+
+    Parameters
+    ----------
+    colourspace : RGB_Colourspace
+        *RGB* colourspace to compute the volume of.
+    segments : integer, optional
+        Segments count per edge of the *RGB* colourspace unit cube.
+    illuminant : array_like, optional
+        Colourspace model *illuminant* chromaticity coordinates.
+    chromatic_adaptation_method : unicode, optional
+        **{'CAT02', 'XYZ Scaling', 'Von Kries', 'Bradford', 'Sharp',
+        'Fairchild', 'CMCCAT97', 'CMCCAT2000', 'CAT02 Brill 2008',
+        'Bianco 2010', 'Bianco PC 2010'}**,
+        *Chromatic adaptation* method.
+    model : unicode, optional
+        Colourspace model the volume is computed in, any colour
+        representation reachable from *CIE XYZ* tristimulus values with
+        :func:`colour.convert` definition.
+
+    Other Parameters
+    ----------------
+    \\**kwargs : dict, optional
+        Keywords arguments for the :func:`colour.convert` definition.
+
+    Returns
+    -------
+    numeric
+        *RGB* colourspace volume.
+
+    Notes
+    -----
+    -   The *CIE L\\*a\\*b\\** colourspace volume is computed with the
+        current domain-range scale so that it is comparable to the volume
+        returned by :func:`colour.RGB_colourspace_volume_MonteCarlo`
+        definition, the other colourspace models are computed with
+        :func:`colour.convert` definition, i.e. in the **'1'** domain-range
+        scale.
+    -   The colourspace model conversion is expected to be injective on the
+        *RGB* colourspace volume, i.e. the converted surface must not
+        self-intersect.
+
+    Examples
+    --------
+    >>> from colour.models import RGB_COLOURSPACE_sRGB as sRGB
+    >>> RGB_colourspace_volume_analytic(sRGB)  # doctest: +ELLIPSIS
+    820352.4505...
+    """
+
+    matrix_RGB_to_XYZ = np.linalg.inv(
+        _matrix_XYZ_to_RGB(colourspace, illuminant,
+                           chromatic_adaptation_method))
+
+    XYZ = np.dot(_RGB_cube_surface(segments), np.transpose(matrix_RGB_to_XYZ))
+
+    return np.abs(mesh_volume(_XYZ_to_model(XYZ, illuminant, model,
+                                            **kwargs)))
 
 
 def RGB_colourspace_volume_coverage_MonteCarlo(
@@ -311,6 +684,104 @@ def RGB_colourspace_volume_coverage_MonteCarlo(
     return 100 * RGB_c.size / XYZ_vs.size
 
 
+def RGB_colourspace_volume_coverage_analytic(
+        colourspace,
+        colourspace_reference,
+        segments=32,
+        illuminant=CCS_ILLUMINANTS['CIE 1931 2 Degree Standard Observer'][
+            'D65'],
+        chromatic_adaptation_method='CAT02',
+        model='CIE Lab',
+        **kwargs):
+    """
+    Returns given *RGB* colourspace percentage coverage of given reference
+    *RGB* colourspace volume by integrating the volume enclosed by the
+    intersection of their surface meshes.
+
+    Both *RGB* colourspaces being linear transformations of *CIE XYZ*
+    tristimulus values, the surface mesh of each *RGB* colourspace unit cube
+    is exactly clipped by the planes bounding the other *RGB* colourspace
+    before being converted to the colourspace model, the intersection volume
+    is then integrated with the divergence theorem.
+
+    Parameters
+    ----------
+    colourspace : RGB_Colourspace
+        *RGB* colourspace to compute the volume coverage percentage.
+    colourspace_reference : RGB_Colourspace
+        Reference *RGB* colourspace whose volume is covered.
+    segments : integer, optional
+        Segments count per edge of the *RGB* colourspace unit cubes.
+    illuminant : array_like, optional
+        Colourspace model *illuminant* chromaticity coordinates.
+    chromatic_adaptation_method : unicode, optional
+        **{'CAT02', 'XYZ Scaling', 'Von Kries', 'Bradford', 'Sharp',
+        'Fairchild', 'CMCCAT97', 'CMCCAT2000', 'CAT02 Brill 2008',
+        'Bianco 2010', 'Bianco PC 2010'}**,
+        *Chromatic adaptation* method.
+    model : unicode, optional
+        Colourspace model the volumes are computed in, any colour
+        representation reachable from *CIE XYZ* tristimulus values with
+        :func:`colour.convert` definition.
+
+    Other Parameters
+    ----------------
+    \\**kwargs : dict, optional
+        Keywords arguments for the :func:`colour.convert` definition.
+
+    Returns
+    -------
+    float
+        Percentage coverage of reference *RGB* colourspace volume.
+
+    Examples
+    --------
+    >>> from colour.models import (RGB_COLOURSPACE_BT2020 as BT2020,
+    ...                            RGB_COLOURSPACE_sRGB as sRGB)
+    >>> RGB_colourspace_volume_coverage_analytic(sRGB, BT2020)
+    ... # doctest: +ELLIPSIS
+    44.2325912...
+    """
+
+    matrix_XYZ_to_RGB = _matrix_XYZ_to_RGB(colourspace, illuminant,
+                                           chromatic_adaptation_method)
+    matrix_XYZ_to_RGB_r = _matrix_XYZ_to_RGB(
+        colourspace_reference, illuminant, chromatic_adaptation_method)
+    matrix_RGB_to_XYZ = np.linalg.inv(matrix_XYZ_to_RGB)
+    matrix_RGB_to_XYZ_r = np.linalg.inv(matrix_XYZ_to_RGB_r)
+
+    surface = _RGB_cube_surface(segments)
+
+    # The surface coincident with the other *RGB* colourspace surface is
+    # retained once only, from the "colourspace" surface mesh.
+    epsilon = 1e-10
+    offsets = np.array([0, 0, 0, 1, 1, 1])
+
+    def volume(RGB, matrix_RGB_to_XYZ):
+        """
+        Returns the signed volume enclosed by given *RGB* colourspace values
+        mesh in the colourspace model.
+        """
+
+        XYZ = np.dot(RGB, np.transpose(matrix_RGB_to_XYZ))
+
+        return np.sign(np.linalg.det(matrix_RGB_to_XYZ)) * mesh_volume(
+            _XYZ_to_model(XYZ, illuminant, model, **kwargs))
+
+    matrix = np.dot(matrix_XYZ_to_RGB_r, matrix_RGB_to_XYZ)
+    RGB = _clip_triangles(surface, np.vstack([matrix, -matrix]),
+                          offsets + epsilon)
+    volume_intersection = volume(RGB, matrix_RGB_to_XYZ)
+
+    matrix = np.dot(matrix_XYZ_to_RGB, matrix_RGB_to_XYZ_r)
+    RGB = _clip_triangles(surface, np.vstack([matrix, -matrix]),
+                          offsets - epsilon)
+    volume_intersection += volume(RGB, matrix_RGB_to_XYZ_r)
+
+    return 100 * np.abs(volume_intersection) / np.abs(
+        volume(surface, matrix_RGB_to_XYZ_r))
+
+
 def RGB_colourspace_pointer_gamut_coverage_MonteCarlo(
         colourspace,
         samples=10e6,
@@ -20,7 +20,7 @@ import numpy as np
 from colour.colorimetry import (MSDS_CMFS, msds_to_XYZ, SpectralShape, sd_ones)
 from colour.constants import DEFAULT_FLOAT_DTYPE
 from colour.volume import is_within_mesh_volume
-from colour.utilities import zeros
+from colour.utilities import CACHE_REGISTRY, zeros
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2021 - Colour Developers'
@@ -42,8 +42,12 @@ interval of 5.
 SPECTRAL_SHAPE_OUTER_SURFACE_XYZ : SpectralShape
 """
 
-_CACHE_OUTER_SURFACE_XYZ = {}
-_CACHE_OUTER_SURFACE_XYZ_POINTS = {}
+_CACHE_OUTER_SURFACE_XYZ = CACHE_REGISTRY.register_cache(
+    '{0}._CACHE_OUTER_SURFACE_XYZ'.format(__name__), maximum_bytes=2 ** 26)
+
+_CACHE_OUTER_SURFACE_XYZ_POINTS = CACHE_REGISTRY.register_cache(
+    '{0}._CACHE_OUTER_SURFACE_XYZ_POINTS'.format(__name__),
+    maximum_bytes=2 ** 26)
 
 
 def generate_pulse_waves(bins):
@@ -225,6 +229,7 @@ def is_within_visible_spectrum(
         .copy().align(SPECTRAL_SHAPE_OUTER_SURFACE_XYZ),
         illuminant=sd_ones(SPECTRAL_SHAPE_OUTER_SURFACE_XYZ),
         tolerance=None,
+        distance=None,
         **kwargs):
     """
     Returns if given *CIE XYZ* tristimulus values are within visible spectrum
@@ -240,6 +245,9 @@ def is_within_visible_spectrum(
         Illuminant spectral distribution.
     tolerance : numeric, optional
         Tolerance allowed in the inside-triangle check.
+    distance : numeric, optional
+        Signed distance allowed outside the visible spectrum volume convex
+        hull, see :func:`colour.volume.is_within_mesh_volume` definition.
 
     Other Parameters
     ----------------
@@ -279,4 +287,4 @@ def is_within_visible_spectrum(
         _CACHE_OUTER_SURFACE_XYZ_POINTS[key] = vertices = (XYZ_outer_surface(
             cmfs, illuminant, **kwargs))
 
-    return is_within_mesh_volume(XYZ, vertices, tolerance)
+    return is_within_mesh_volume(XYZ, vertices, tolerance, distance)
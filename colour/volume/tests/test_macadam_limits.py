@@ -44,6 +44,19 @@ class TestIsWithinMacadamLimits(unittest.TestCase):
         self.assertFalse(
             is_within_macadam_limits(np.array([0.0025, 0.0088, 0.0340]), 'C'))
 
+    def test_tolerance_is_within_macadam_limits(self):
+        """
+        Tests :func:`colour.volume.macadam_limits.is_within_macadam_limits`
+        definition tolerance and distance.
+        """
+
+        a = np.array([0.1266, 0.6610, 0.2563])
+
+        self.assertFalse(is_within_macadam_limits(a, 'A'))
+        self.assertTrue(is_within_macadam_limits(a, 'A', 0.05))
+        self.assertTrue(is_within_macadam_limits(a, 'A', distance=0.05))
+        self.assertFalse(is_within_macadam_limits(a, 'A', distance=0.0001))
+
     def test_n_dimensional_is_within_macadam_limits(self):
         """
         Tests :func:`colour.volume.macadam_limits.is_within_macadam_limits`
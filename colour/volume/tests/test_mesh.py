@@ -6,8 +6,12 @@ Defines unit tests for :mod:`colour.volume.mesh` module.
 import numpy as np
 import unittest
 from itertools import permutations
+from scipy.spatial import Delaunay
 
-from colour.volume import is_within_mesh_volume
+from colour.geometry import primitive_cube
+from colour.volume import (XYZ_outer_surface, MeshVolume_HalfSpaces,
+                           mesh_volume_half_spaces, is_within_mesh_volume,
+                           signed_distance_mesh_volume, mesh_volume)
 from colour.utilities import ignore_numpy_errors
 
 __author__ = 'Colour Developers'
@@ -17,7 +21,50 @@ __maintainer__ = 'Colour Developers'
 __email__ = 'colour-developers@colour-science.org'
 __status__ = 'Production'
 
-__all__ = ['TestIsWithinMeshVolume']
+__all__ = [
+    'TestMeshVolumeHalfSpaces', 'TestIsWithinMeshVolume',
+    'TestSignedDistanceMeshVolume', 'TestMeshVolume'
+]
+
+
+class TestMeshVolumeHalfSpaces(unittest.TestCase):
+    """
+    Defines :func:`colour.volume.mesh.mesh_volume_half_spaces` definition
+    unit tests methods.
+    """
+
+    def test_mesh_volume_half_spaces(self):
+        """
+        Tests :func:`colour.volume.mesh.mesh_volume_half_spaces` definition.
+        """
+
+        vertices, _faces, _outline = primitive_cube(width_segments=4)
+        half_spaces = mesh_volume_half_spaces(vertices['position'])
+
+        self.assertIsInstance(half_spaces, MeshVolume_HalfSpaces)
+        # The coplanar facets are merged.
+        np.testing.assert_almost_equal(
+            half_spaces.equations,
+            np.array([
+                [-1, 0, 0, -0.5],
+                [0, -1, 0, -0.5],
+                [0, 0, -1, -0.5],
+                [0, 0, 1, -0.5],
+                [0, 1, 0, -0.5],
+                [1, 0, 0, -0.5],
+            ]),
+            decimal=7)
+        self.assertIsNone(half_spaces.equations_outer)
+        self.assertIsNone(half_spaces.equations_inner)
+
+        self.assertIs(
+            mesh_volume_half_spaces(vertices['position']), half_spaces)
+
+        half_spaces = mesh_volume_half_spaces(XYZ_outer_surface())
+        self.assertLess(
+            len(half_spaces.equations_outer), len(half_spaces.equations))
+        self.assertLess(
+            len(half_spaces.equations_inner), len(half_spaces.equations))
 
 
 class TestIsWithinMeshVolume(unittest.TestCase):
@@ -77,6 +124,69 @@ class TestIsWithinMeshVolume(unittest.TestCase):
         b = np.reshape(b, (2, 3))
         np.testing.assert_almost_equal(is_within_mesh_volume(a, self._mesh), b)
 
+    def test_is_within_mesh_volume_Delaunay(self):
+        """
+        Tests :func:`colour.volume.mesh.is_within_mesh_volume` definition
+        agreement with *Delaunay* triangulation.
+        """
+
+        mesh = XYZ_outer_surface()
+        points = np.random.RandomState(4).random_sample([64, 3]) * 1.1
+
+        np.testing.assert_array_equal(
+            is_within_mesh_volume(points, mesh),
+            Delaunay(mesh).find_simplex(points) >= 0)
+
+    def test_tolerance_is_within_mesh_volume(self):
+        """
+        Tests :func:`colour.volume.mesh.is_within_mesh_volume` definition
+        tolerance.
+        """
+
+        a = np.array([[0.0, -1.0005, 0.0], [0.0, -1.05, 0.0],
+                      [0.0, 1.05, 0.0]])
+
+        np.testing.assert_array_equal(
+            is_within_mesh_volume(a, self._mesh), [False, False, False])
+        np.testing.assert_array_equal(
+            is_within_mesh_volume(a, self._mesh, 0.001), [True, False, False])
+        np.testing.assert_array_equal(
+            is_within_mesh_volume(a, self._mesh, 0.1), [True, True, True])
+
+        mesh = XYZ_outer_surface()
+        points = np.random.RandomState(4).random_sample([64, 3]) * 1.1
+        np.testing.assert_array_equal(
+            is_within_mesh_volume(points, mesh, 0.1),
+            Delaunay(mesh).find_simplex(points, tol=0.1) >= 0)
+
+    def test_distance_is_within_mesh_volume(self):
+        """
+        Tests :func:`colour.volume.mesh.is_within_mesh_volume` definition
+        distance.
+        """
+
+        a = np.array([[0.0, -1.0005, 0.0], [0.0, -1.05, 0.0],
+                      [0.0, -0.95, 0.0]])
+
+        np.testing.assert_array_equal(
+            is_within_mesh_volume(a, self._mesh, distance=0.001),
+            [True, False, True])
+        np.testing.assert_array_equal(
+            is_within_mesh_volume(a, self._mesh, distance=0.1),
+            [True, True, True])
+        np.testing.assert_array_equal(
+            is_within_mesh_volume(a, self._mesh, distance=-0.01),
+            [False, False, True])
+
+    def test_raise_exception_is_within_mesh_volume(self):
+        """
+        Tests :func:`colour.volume.mesh.is_within_mesh_volume` definition
+        raised exception.
+        """
+
+        self.assertRaises(ValueError, is_within_mesh_volume,
+                          np.array([0.0, 0.0, 0.0]), self._mesh, 0.1, 0.1)
+
     @ignore_numpy_errors
     def test_nan_is_within_mesh_volume(self):
         """
@@ -90,5 +200,85 @@ class TestIsWithinMeshVolume(unittest.TestCase):
             is_within_mesh_volume(case, self._mesh)
 
 
+class TestSignedDistanceMeshVolume(unittest.TestCase):
+    """
+    Defines :func:`colour.volume.mesh.signed_distance_mesh_volume` definition
+    unit tests methods.
+    """
+
+    def test_signed_distance_mesh_volume(self):
+        """
+        Tests :func:`colour.volume.mesh.signed_distance_mesh_volume`
+        definition.
+        """
+
+        vertices, _faces, _outline = primitive_cube()
+        mesh = vertices['position']
+
+        np.testing.assert_almost_equal(
+            signed_distance_mesh_volume(
+                np.array([
+                    [0.0, 0.0, 0.0],
+                    [0.25, 0.0, 0.1],
+                    [0.0, 0.0, 0.5],
+                    [0.0, 0.0, 1.5],
+                ]), mesh),
+            np.array([-0.5, -0.25, 0.0, 1.0]),
+            decimal=7)
+
+    def test_n_dimensional_signed_distance_mesh_volume(self):
+        """
+        Tests :func:`colour.volume.mesh.signed_distance_mesh_volume`
+        definition n-dimensional arrays support.
+        """
+
+        vertices, _faces, _outline = primitive_cube()
+        mesh = vertices['position']
+
+        a = np.array([0.25, 0.0, 0.1])
+        b = signed_distance_mesh_volume(a, mesh)
+
+        a = np.tile(a, (6, 1))
+        b = np.tile(b, 6)
+        np.testing.assert_almost_equal(
+            signed_distance_mesh_volume(a, mesh), b, decimal=7)
+
+        a = np.reshape(a, (2, 3, 3))
+        b = np.reshape(b, (2, 3))
+        np.testing.assert_almost_equal(
+            signed_distance_mesh_volume(a, mesh), b, decimal=7)
+
+
+class TestMeshVolume(unittest.TestCase):
+    """
+    Defines :func:`colour.volume.mesh.mesh_volume` definition unit tests
+    methods.
+    """
+
+    def test_mesh_volume(self):
+        """
+        Tests :func:`colour.volume.mesh.mesh_volume` definition.
+        """
+
+        triangles = np.array([
+            [[0.0, 0.0, 0.0], [0.0, 1.0, 0.0], [1.0, 0.0, 0.0]],
+            [[0.0, 0.0, 0.0], [1.0, 0.0, 0.0], [0.0, 0.0, 1.0]],
+            [[0.0, 0.0, 0.0], [0.0, 0.0, 1.0], [0.0, 1.0, 0.0]],
+            [[1.0, 0.0, 0.0], [0.0, 1.0, 0.0], [0.0, 0.0, 1.0]],
+        ])
+
+        self.assertAlmostEqual(mesh_volume(triangles), 1 / 6, places=7)
+        self.assertAlmostEqual(
+            mesh_volume(triangles[:, ::-1]), -1 / 6, places=7)
+        self.assertAlmostEqual(
+            mesh_volume(triangles + np.array([1.0, 2.0, 3.0])),
+            1 / 6,
+            places=7)
+
+        vertices, faces, _outline = primitive_cube(2, 3, 4, 3, 3, 3)
+        self.assertAlmostEqual(
+            np.abs(mesh_volume(vertices['position'][faces])), 24, places=7)
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -44,6 +44,19 @@ class TestIsWithinPointerGamut(unittest.TestCase):
         self.assertFalse(
             is_within_pointer_gamut(np.array([0.0025, 0.0088, 0.0340])))
 
+    def test_tolerance_is_within_pointer_gamut(self):
+        """
+        Tests :func:`colour.volume.pointer_gamut.is_within_pointer_gamut`
+        definition tolerance and distance.
+        """
+
+        a = np.array([0.7394, 0.7673, 0.2732])
+
+        self.assertFalse(is_within_pointer_gamut(a))
+        self.assertTrue(is_within_pointer_gamut(a, 0.05))
+        self.assertTrue(is_within_pointer_gamut(a, distance=0.05))
+        self.assertFalse(is_within_pointer_gamut(a, distance=0.001))
+
     def test_n_dimensional_is_within_pointer_gamut(self):
         """
         Tests :func:`colour.volume.pointer_gamut.is_within_pointer_gamut`
@@ -21,16 +21,19 @@ reproducibility-of-python-pseudo-random-numbers-across-systems-and-versions
 
 import numpy as np
 import unittest
+from unittest import mock
 
 from colour.models import (RGB_COLOURSPACE_ACES2065_1, RGB_COLOURSPACE_BT2020,
-                           RGB_COLOURSPACE_BT709)
+                           RGB_COLOURSPACE_BT709, RGB_COLOURSPACE_DCI_P3)
 from colour.volume import (
-    RGB_colourspace_limits, RGB_colourspace_volume_MonteCarlo,
+    RGB_Colourspace_Volume_Specification_MonteCarlo, RGB_colourspace_limits,
+    RGB_colourspace_volume_MonteCarlo, RGB_colourspace_volume_analytic,
     RGB_colourspace_volume_coverage_MonteCarlo,
+    RGB_colourspace_volume_coverage_analytic,
     RGB_colourspace_pointer_gamut_coverage_MonteCarlo,
     RGB_colourspace_visible_spectrum_coverage_MonteCarlo,
     is_within_pointer_gamut)
-from colour.utilities import disable_multiprocessing
+from colour.utilities import Executor, disable_multiprocessing, executor
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2021 - Colour Developers'
@@ -41,7 +44,9 @@ __status__ = 'Production'
 
 __all__ = [
     'TestRGB_colourspaceLimits', 'TestRGB_colourspaceVolumeMonteCarlo',
+    'TestRGB_colourspaceVolumeAnalytic',
     'TestRGB_colourspace_volume_coverage_MonteCarlo',
+    'TestRGB_colourspaceVolumeCoverageAnalytic',
     'TestRGB_colourspacePointerGamutCoverageMonteCarlo',
     'TestRGB_colourspaceVisibleSpectrumCoverageMonteCarlo'
 ]
@@ -111,6 +116,171 @@ class TestRGB_colourspaceVolumeMonteCarlo(unittest.TestCase):
             821700.0 * 1e-6,
             places=1)
 
+    def test_RGB_colourspace_volume_MonteCarlo_batches(self):
+        """
+        Tests :func:`colour.volume.rgb.RGB_colourspace_volume_MonteCarlo`
+        definition streamed batches and early stopping.
+        """
+
+        specification = RGB_colourspace_volume_MonteCarlo(
+            RGB_COLOURSPACE_BT709,
+            10e4,
+            random_state=np.random.RandomState(2),
+            batch_size=10e3,
+            additional_data=True)
+
+        self.assertIsInstance(specification,
+                              RGB_Colourspace_Volume_Specification_MonteCarlo)
+        self.assertEqual(specification.samples, 10e4)
+        self.assertAlmostEqual(
+            specification.volume * 1e-6, 821700.0 * 1e-6, places=1)
+        self.assertLess(specification.standard_error,
+                        specification.volume * 0.02)
+
+        for backend in ('Thread', 'Process'):
+            with executor(backend, 3):
+                self.assertEqual(
+                    RGB_colourspace_volume_MonteCarlo(
+                        RGB_COLOURSPACE_BT709,
+                        10e4,
+                        random_state=np.random.RandomState(2),
+                        batch_size=10e3,
+                        additional_data=True), specification)
+
+        specification = RGB_colourspace_volume_MonteCarlo(
+            RGB_COLOURSPACE_BT709,
+            10e6,
+            random_state=np.random.RandomState(2),
+            batch_size=10e3,
+            tolerance=0.05,
+            additional_data=True)
+
+        self.assertLess(specification.samples, 10e6)
+        self.assertEqual(specification.samples % 10e3, 0)
+        with executor('Thread', 3):
+            self.assertEqual(
+                RGB_colourspace_volume_MonteCarlo(
+                    RGB_COLOURSPACE_BT709,
+                    10e6,
+                    random_state=np.random.RandomState(2),
+                    batch_size=10e3,
+                    tolerance=0.05,
+                    additional_data=True), specification)
+        self.assertEqual(
+            RGB_colourspace_volume_MonteCarlo(
+                RGB_COLOURSPACE_BT709,
+                10e6,
+                random_state=np.random.RandomState(2),
+                batch_size=10e3,
+                tolerance=0.05,
+                workers=2,
+                additional_data=True), specification)
+        self.assertLessEqual(1.96 * specification.standard_error,
+                             0.05 * specification.volume)
+        self.assertAlmostEqual(
+            specification.volume * 1e-6, 821700.0 * 1e-6, places=1)
+
+        # No early stopping until a sample within the colourspace is found.
+        specification = RGB_colourspace_volume_MonteCarlo(
+            RGB_COLOURSPACE_BT709,
+            10e4,
+            limits=np.array([[200, 300], [-150, 150], [-150, 150]]),
+            random_state=np.random.RandomState(2),
+            batch_size=10e3,
+            tolerance=0.05,
+            additional_data=True)
+
+        self.assertEqual(specification.samples, 10e4)
+        self.assertEqual(specification.volume, 0)
+
+    def test_RGB_colourspace_volume_MonteCarlo_tasks(self):
+        """
+        Tests :func:`colour.volume.rgb.RGB_colourspace_volume_MonteCarlo`
+        definition tasks sent to the executor.
+        """
+
+        tasks = []
+        map_ = Executor.map
+
+        def map_tasks(self, function, iterable, chunk_size=None):
+            """
+            Records the tasks sent to the executor.
+            """
+
+            iterable = list(iterable)
+            tasks.extend(iterable)
+
+            return map_(self, function, iterable, chunk_size)
+
+        with mock.patch.object(Executor, 'map', map_tasks):
+            with executor('Thread', 2):
+                RGB_colourspace_volume_MonteCarlo(
+                    RGB_COLOURSPACE_BT709,
+                    10e4,
+                    random_state=np.random.RandomState(2),
+                    batch_size=10e3)
+
+        self.assertEqual(len(tasks), 10)
+        for seed, samples in tasks:
+            self.assertIsInstance(seed, np.random.SeedSequence)
+            self.assertEqual(samples, 10e3)
+
+        self.assertEqual(len(set(seed.spawn_key for seed, _samples in tasks)),
+                         10)
+
+    def test_raise_exception_RGB_colourspace_volume_MonteCarlo(self):
+        """
+        Tests :func:`colour.volume.rgb.RGB_colourspace_volume_MonteCarlo`
+        definition raised exception.
+        """
+
+        self.assertRaises(ValueError, RGB_colourspace_volume_MonteCarlo,
+                          RGB_COLOURSPACE_BT709, 0)
+
+
+class TestRGB_colourspaceVolumeAnalytic(unittest.TestCase):
+    """
+    Defines :func:`colour.volume.rgb.RGB_colourspace_volume_analytic`
+    definition unit tests methods.
+    """
+
+    def test_RGB_colourspace_volume_analytic(self):
+        """
+        Tests :func:`colour.volume.rgb.RGB_colourspace_volume_analytic`
+        definition.
+        """
+
+        self.assertAlmostEqual(
+            RGB_colourspace_volume_analytic(RGB_COLOURSPACE_BT709),
+            820190.025595795,
+            places=4)
+
+        self.assertAlmostEqual(
+            RGB_colourspace_volume_analytic(RGB_COLOURSPACE_BT709) * 1e-6,
+            RGB_colourspace_volume_MonteCarlo(
+                RGB_COLOURSPACE_BT709,
+                10e5,
+                random_state=np.random.RandomState(2)) * 1e-6,
+            places=2)
+
+        # The error decreases with the segments count.
+        self.assertAlmostEqual(
+            RGB_colourspace_volume_analytic(RGB_COLOURSPACE_BT709, 128) *
+            1e-6,
+            RGB_colourspace_volume_analytic(RGB_COLOURSPACE_BT709, 32) * 1e-6,
+            places=3)
+
+        # The "CIE XYZ" colourspace volume is the determinant of the
+        # normalised primary matrix.
+        self.assertAlmostEqual(
+            RGB_colourspace_volume_analytic(
+                RGB_COLOURSPACE_BT709,
+                4,
+                illuminant=RGB_COLOURSPACE_BT709.whitepoint,
+                model='CIE XYZ'),
+            np.linalg.det(RGB_COLOURSPACE_BT709.matrix_RGB_to_XYZ),
+            places=7)
+
 
 class TestRGB_colourspace_volume_coverage_MonteCarlo(unittest.TestCase):
     """
@@ -138,6 +308,49 @@ RGB_colourspace_volume_coverage_MonteCarlo` definition.
             decimal=7)
 
 
+class TestRGB_colourspaceVolumeCoverageAnalytic(unittest.TestCase):
+    """
+    Defines :func:`colour.volume.rgb.RGB_colourspace_volume_coverage_analytic`
+    definition unit tests methods.
+    """
+
+    def test_RGB_colourspace_volume_coverage_analytic(self):
+        """
+        Tests :func:`colour.volume.rgb.\
+RGB_colourspace_volume_coverage_analytic` definition.
+        """
+
+        self.assertAlmostEqual(
+            RGB_colourspace_volume_coverage_analytic(RGB_COLOURSPACE_BT709,
+                                                     RGB_COLOURSPACE_BT2020),
+            44.223833508,
+            places=7)
+
+        self.assertAlmostEqual(
+            RGB_colourspace_volume_coverage_analytic(RGB_COLOURSPACE_BT2020,
+                                                     RGB_COLOURSPACE_BT709),
+            100,
+            places=5)
+
+        self.assertAlmostEqual(
+            RGB_colourspace_volume_coverage_analytic(RGB_COLOURSPACE_BT709,
+                                                     RGB_COLOURSPACE_BT709),
+            100,
+            places=7)
+
+        # The intersection volume is symmetrical.
+        volume_BT709 = RGB_colourspace_volume_analytic(RGB_COLOURSPACE_BT709)
+        volume_DCI_P3 = RGB_colourspace_volume_analytic(RGB_COLOURSPACE_DCI_P3)
+        self.assertAlmostEqual(
+            RGB_colourspace_volume_coverage_analytic(
+                RGB_COLOURSPACE_BT709, RGB_COLOURSPACE_DCI_P3) *
+            volume_DCI_P3 * 1e-6,
+            RGB_colourspace_volume_coverage_analytic(
+                RGB_COLOURSPACE_DCI_P3, RGB_COLOURSPACE_BT709) *
+            volume_BT709 * 1e-6,
+            places=5)
+
+
 class TestRGB_colourspacePointerGamutCoverageMonteCarlo(unittest.TestCase):
     """
     Defines :func:`colour.volume.rgb.\
@@ -146,6 +146,19 @@ class TestIsWithinVisibleSpectrum(unittest.TestCase):
         self.assertFalse(
             is_within_visible_spectrum(np.array([0.0025, 0.0088, 0.0340])))
 
+    def test_tolerance_is_within_visible_spectrum(self):
+        """
+        Tests :func:`colour.volume.spectrum.is_within_visible_spectrum`
+        definition tolerance and distance.
+        """
+
+        a = np.array([-0.01, 0.2, 0.1])
+
+        self.assertFalse(is_within_visible_spectrum(a))
+        self.assertTrue(is_within_visible_spectrum(a, tolerance=0.5))
+        self.assertFalse(is_within_visible_spectrum(a, distance=0.001))
+        self.assertTrue(is_within_visible_spectrum(a, distance=0.05))
+
     def test_n_dimensional_is_within_visible_spectrum(self):
         """
         Tests :func:`colour.volume.spectrum.is_within_visible_spectrum`
@@ -115,7 +115,9 @@ package_data = \
  'colour.characterisation.datasets': ['rawtoaces/*'],
  'colour.examples.io': ['resources/*'],
  'colour.examples.plotting': ['resources/*'],
+ 'colour.graph': ['resources/*'],
  'colour.io.luts.tests': ['resources/cinespace/*',
+                          'resources/colour_binary/*',
                           'resources/iridas_cube/*',
                           'resources/resolve_cube/*',
                           'resources/sony_spi1d/*',
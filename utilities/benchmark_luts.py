@@ -0,0 +1,149 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Benchmark LUTs
+==============
+
+Reports the throughput of :meth:`colour.LUT3D.apply` method optimised engine
+against the generic :func:`colour.algebra.table_interpolation_trilinear` and
+:func:`colour.algebra.table_interpolation_tetrahedral` definitions code path,
+and the runtime and accuracy of :meth:`colour.LUT3D.invert` method.
+"""
+
+import numpy as np
+import os
+import timeit
+
+from colour.algebra import (table_interpolation_trilinear,
+                            table_interpolation_tetrahedral)
+from colour.io import LUT3D
+
+__copyright__ = 'Copyright (C) 2013-2021 - Colour Developers'
+__license__ = 'New BSD License - https://opensource.org/licenses/BSD-3-Clause'
+__maintainer__ = 'Colour Developers'
+__email__ = 'colour-developers@colour-science.org'
+__status__ = 'Production'
+
+__all__ = ['INTERPOLATORS', 'benchmark_LUT3D_apply', 'benchmark_LUT3D_invert']
+
+INTERPOLATORS = {
+    'Trilinear': table_interpolation_trilinear,
+    'Tetrahedral': table_interpolation_tetrahedral,
+}
+
+
+def benchmark_LUT3D_apply(width=1920,
+                          height=1080,
+                          size=33,
+                          repeat=3,
+                          workers=os.cpu_count()):
+    """
+    Benchmarks :meth:`colour.LUT3D.apply` method and prints the throughput in
+    megapixels per second for both the optimised engine and the generic code
+    path, in double and single precision and with multiple workers.
+
+    Parameters
+    ----------
+    width : int, optional
+        Benchmark image width.
+    height : int, optional
+        Benchmark image height.
+    size : int, optional
+        *LUT* size.
+    repeat : int, optional
+        Number of times the timings are repeated, the best one is retained.
+    workers : int, optional
+        Number of threads used by the multi-threaded code path.
+
+    Returns
+    -------
+    list
+        Benchmark rows: interpolator name, code path and throughput in
+        megapixels per second.
+    """
+
+    LUT = LUT3D(LUT3D.linear_table(size) ** (1 / 2.2))
+    RGB = np.random.RandomState(4).random_sample([height, width, 3])
+    RGB_f32 = RGB.astype(np.float32)
+    out = np.empty_like(RGB)
+    megapixels = width * height / 1e6
+
+    rows = []
+    for name, interpolator in INTERPOLATORS.items():
+        code_paths = {
+            'Generic': lambda: interpolator(RGB, LUT.table),
+            'Engine': lambda: LUT.apply(RGB, interpolator),
+            'Engine (out=)': lambda: LUT.apply(RGB, interpolator, out=out),
+            'Engine (float32)': lambda: LUT.apply(RGB_f32, interpolator),
+            'Engine (workers={0})'.format(workers):
+            lambda: LUT.apply(RGB, interpolator, workers=workers),
+        }
+        for code_path, callable_ in code_paths.items():
+            duration = min(timeit.repeat(callable_, number=1, repeat=repeat))
+            rows.append((name, code_path, megapixels / duration))
+
+    print('{0}x{1} image, {2}^3 LUT'.format(width, height, size))
+    print('{0:<12} {1:<20} {2:>8}'.format('Method', 'Code Path', 'MP/s'))
+    for name, code_path, throughput in rows:
+        print('{0:<12} {1:<20} {2:>8.2f}'.format(name, code_path, throughput))
+
+    return rows
+
+
+def benchmark_LUT3D_invert(sizes=(33, 65), samples=100000):
+    """
+    Benchmarks :meth:`colour.LUT3D.invert` method and prints its runtime and
+    the round-trip error of the inverse *LUT* applied to the *LUT* output for
+    random *RGB* colourspace samples.
+
+    The benchmarked *LUT* encodes a colour mixing matrix followed by a gamma
+    function so that its table gamut does not fill its bounding box.
+
+    Parameters
+    ----------
+    sizes : array_like, optional
+        *LUT* sizes to benchmark.
+    samples : int, optional
+        Number of random *RGB* colourspace samples.
+
+    Returns
+    -------
+    list
+        Benchmark rows: *LUT* size, extrapolation, runtime in seconds, maximum
+        and mean round-trip errors.
+    """
+
+    M = np.array([
+        [0.80, 0.15, 0.05],
+        [0.10, 0.80, 0.10],
+        [0.05, 0.15, 0.80],
+    ])
+    RGB = np.random.RandomState(4).random_sample([samples, 3])
+
+    rows = []
+    for size in sizes:
+        LUT = LUT3D(
+            np.einsum('ij,...j->...i', M, LUT3D.linear_table(size)) ** (
+                1 / 2.2))
+        RGB_o = LUT.apply(RGB)
+        for extrapolate in (False, True):
+            start = timeit.default_timer()
+            LUT_i = LUT.invert(extrapolate=extrapolate)
+            duration = timeit.default_timer() - start
+
+            error = np.abs(LUT_i.apply(RGB_o) - RGB)
+            rows.append((size, extrapolate, duration, np.max(error),
+                         np.mean(error)))
+
+    print('{0:<6} {1:<12} {2:>9} {3:>12} {4:>12}'.format(
+        'Size', 'Extrapolate', 'Time (s)', 'Max Error', 'Mean Error'))
+    for size, extrapolate, duration, error_max, error_mean in rows:
+        print('{0:<6} {1!s:<12} {2:>9.2f} {3:>12.2e} {4:>12.2e}'.format(
+            size, extrapolate, duration, error_max, error_mean))
+
+    return rows
+
+
+if __name__ == '__main__':
+    benchmark_LUT3D_apply()
+    benchmark_LUT3D_invert()
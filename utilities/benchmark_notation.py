@@ -0,0 +1,110 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Benchmark Notation
+==================
+
+Reports the throughput and accuracy of
+:func:`colour.notation.xyY_to_munsell_specification` definition
+*Inverse Grid* method against the *Iterative* method code path.
+"""
+
+import numpy as np
+import timeit
+
+from colour.notation.munsell import (maximum_chroma_from_renotation,
+                                     munsell_specification_to_xyY,
+                                     xyY_to_munsell_specification)
+
+__copyright__ = 'Copyright (C) 2013-2021 - Colour Developers'
+__license__ = 'New BSD License - https://opensource.org/licenses/BSD-3-Clause'
+__maintainer__ = 'Colour Developers'
+__email__ = 'colour-developers@colour-science.org'
+__status__ = 'Production'
+
+__all__ = ['benchmark_xyY_to_munsell_specification']
+
+
+def benchmark_xyY_to_munsell_specification(samples=200, repeat=3):
+    """
+    Benchmarks :func:`colour.notation.xyY_to_munsell_specification` definition
+    and prints the throughput in samples per second of both the *Iterative*
+    and *Inverse Grid* methods, the count of *CIE xyY* colourspace arrays they
+    fail to convert, and the maximum and mean absolute difference of the
+    specifications they return.
+
+    The benchmarked *CIE xyY* colourspace arrays are converted from random
+    *Munsell* specifications within the *Munsell Renotation System* data
+    maximum chromas.
+
+    Parameters
+    ----------
+    samples : int, optional
+        Number of random *Munsell* specifications.
+    repeat : int, optional
+        Number of times the *Inverse Grid* method timings are repeated, the
+        best one is retained, the *Iterative* method is timed once.
+
+    Returns
+    -------
+    list
+        Benchmark rows: method, throughput in samples per second, failures
+        count, maximum and mean absolute differences with the *Iterative*
+        method.
+    """
+
+    random_state = np.random.RandomState(4)
+    hue = random_state.uniform(0, 10, samples)
+    value = random_state.uniform(1, 9, samples)
+    code = random_state.randint(1, 11, samples)
+    maximum_chroma = np.array([
+        maximum_chroma_from_renotation(*specification)
+        for specification in zip(hue, value, code)
+    ])
+    chroma = random_state.uniform(0.1, 0.6, samples) * maximum_chroma
+    specification = np.transpose([hue, value, chroma, code])
+    xyY = munsell_specification_to_xyY(specification)
+
+    # The *Iterative* method raises an exception for the *CIE xyY* colourspace
+    # arrays it cannot convert, they are converted one at a time so that the
+    # failures are counted.
+    specification_i = np.full(specification.shape, np.nan)
+    start = timeit.default_timer()
+    for i, xyY_i in enumerate(xyY):
+        try:
+            specification_i[i] = xyY_to_munsell_specification(xyY_i)
+        except (RuntimeError, ValueError):
+            pass
+    duration_i = timeit.default_timer() - start
+
+    # The inverse lookup grid is built, and cached, outside the timings.
+    xyY_to_munsell_specification(xyY[:1], method='Inverse Grid')
+    duration_g = min(
+        timeit.repeat(
+            lambda: xyY_to_munsell_specification(xyY, method='Inverse Grid'),
+            number=1,
+            repeat=repeat))
+    specification_g = xyY_to_munsell_specification(
+        xyY, method='Inverse Grid')
+
+    error = np.abs(specification_g - specification_i)
+    rows = [
+        ('Iterative', samples / duration_i,
+         np.count_nonzero(np.isnan(specification_i[..., 0])), 0, 0),
+        ('Inverse Grid', samples / duration_g,
+         np.count_nonzero(np.isnan(specification_g[..., 0])),
+         np.nanmax(error), np.nanmean(error)),
+    ]
+
+    print('{0} samples'.format(samples))
+    print('{0:<14} {1:>12} {2:>9} {3:>12} {4:>12}'.format(
+        'Method', 'Samples/s', 'Failures', 'Max Error', 'Mean Error'))
+    for method, throughput, failures, error_max, error_mean in rows:
+        print('{0:<14} {1:>12.1f} {2:>9} {3:>12.2e} {4:>12.2e}'.format(
+            method, throughput, failures, error_max, error_mean))
+
+    return rows
+
+
+if __name__ == '__main__':
+    benchmark_xyY_to_munsell_specification()
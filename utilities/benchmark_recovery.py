@@ -0,0 +1,440 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Benchmark Recovery
+==================
+
+Reports the throughput of
+:func:`colour.recovery.find_coefficients_batch_Jakob2019` definition batched
+solver against the :func:`colour.recovery.find_coefficients_Jakob2019`
+definition code path, and of
+:meth:`colour.recovery.LUT3D_Jakob2019.RGB_to_reflectances` method against the
+:meth:`colour.recovery.LUT3D_Jakob2019.RGB_to_sd` method code path, and of
+:func:`colour.recovery.XYZ_to_reflectances_Otsu2018` definition against the
+:func:`colour.recovery.XYZ_to_sd_Otsu2018` definition code path, and the
+training duration of :class:`colour.recovery.NodeTree_Otsu2018` class, and of
+:func:`colour.recovery.XYZ_to_reflectances_Meng2015` definition against the
+:func:`colour.recovery.XYZ_to_sd_Meng2015` definition code path, and of
+:func:`colour.recovery.RGB_to_reflectances_Mallett2019` and
+:func:`colour.recovery.RGB_to_reflectances_Smits1999` definitions against the
+:func:`colour.recovery.RGB_to_sd_Mallett2019` and
+:func:`colour.recovery.RGB_to_sd_Smits1999` definitions code path.
+"""
+
+import numpy as np
+import os
+import timeit
+
+from colour.characterisation import SDS_COLOURCHECKERS
+from colour.difference import JND_CIE1976
+from colour.models import RGB_COLOURSPACE_sRGB, RGB_to_XYZ
+from colour.recovery import (LUT3D_Jakob2019, NodeTree_Otsu2018,
+                             RGB_to_reflectances_Mallett2019,
+                             RGB_to_reflectances_Smits1999,
+                             RGB_to_sd_Mallett2019, RGB_to_sd_Smits1999,
+                             SPECTRAL_SHAPE_OTSU2018,
+                             XYZ_to_reflectances_Meng2015,
+                             XYZ_to_reflectances_Otsu2018, XYZ_to_sd_Meng2015,
+                             XYZ_to_sd_Otsu2018,
+                             find_coefficients_Jakob2019,
+                             find_coefficients_batch_Jakob2019)
+from colour.recovery.otsu2018 import PartitionAxis
+from colour.utilities import executor
+
+__copyright__ = 'Copyright (C) 2013-2021 - Colour Developers'
+__license__ = 'New BSD License - https://opensource.org/licenses/BSD-3-Clause'
+__maintainer__ = 'Colour Developers'
+__email__ = 'colour-developers@colour-science.org'
+__status__ = 'Production'
+
+__all__ = [
+    'benchmark_find_coefficients_Jakob2019',
+    'benchmark_LUT3D_Jakob2019_RGB_to_reflectances',
+    'benchmark_XYZ_to_reflectances_Otsu2018',
+    'benchmark_NodeTree_Otsu2018_optimise',
+    'benchmark_XYZ_to_reflectances_Meng2015',
+    'benchmark_RGB_to_reflectances'
+]
+
+
+def benchmark_find_coefficients_Jakob2019(samples=1000, repeat=3):
+    """
+    Benchmarks :func:`colour.recovery.find_coefficients_batch_Jakob2019` and
+    :func:`colour.recovery.find_coefficients_Jakob2019` definitions and prints
+    the throughput in colours per second for random *sRGB* colourspace
+    colours.
+
+    Parameters
+    ----------
+    samples : int, optional
+        Count of random *sRGB* colourspace colours, the
+        :func:`colour.recovery.find_coefficients_Jakob2019` definition is
+        benchmarked on a tenth of them.
+    repeat : int, optional
+        Number of times the timings are repeated, the best one is retained.
+
+    Returns
+    -------
+    list
+        Benchmark rows: code path, throughput in colours per second, ratio of
+        colours reaching the maximal acceptable error and mean error.
+    """
+
+    RGB = np.random.RandomState(4).random_sample([samples, 3])
+    XYZ = RGB_to_XYZ(RGB, RGB_COLOURSPACE_sRGB.whitepoint,
+                     RGB_COLOURSPACE_sRGB.whitepoint,
+                     RGB_COLOURSPACE_sRGB.matrix_RGB_to_XYZ)
+    XYZ_s = XYZ[:max(samples // 10, 1)]
+
+    code_paths = {
+        'L-BFGS-B': (XYZ_s, lambda: np.array(
+            [find_coefficients_Jakob2019(XYZ_i)[1] for XYZ_i in XYZ_s])),
+        'Gauss-Newton': (XYZ,
+                         lambda: find_coefficients_batch_Jakob2019(XYZ)[1]),
+    }
+
+    rows = []
+    for code_path, (XYZ_c, callable_) in code_paths.items():
+        duration = min(timeit.repeat(callable_, number=1, repeat=repeat))
+        error = callable_()
+        rows.append((code_path, len(XYZ_c) / duration,
+                     np.mean(error <= JND_CIE1976 / 100), np.mean(error)))
+
+    print('{0} colours'.format(samples))
+    print('{0:<14} {1:>12} {2:>10} {3:>12}'.format(
+        'Code Path', 'Colours/s', 'Converged', 'Mean Error'))
+    for code_path, throughput, converged, error in rows:
+        print('{0:<14} {1:>12.1f} {2:>10.3f} {3:>12.2e}'.format(
+            code_path, throughput, converged, error))
+
+    return rows
+
+
+def benchmark_LUT3D_Jakob2019_RGB_to_reflectances(width=1920,
+                                                  height=1080,
+                                                  size=16,
+                                                  repeat=3):
+    """
+    Benchmarks :meth:`colour.recovery.LUT3D_Jakob2019.RGB_to_reflectances`
+    and :meth:`colour.recovery.LUT3D_Jakob2019.RGB_to_sd` methods and prints
+    the throughput in megapixels per second.
+
+    Parameters
+    ----------
+    width : int, optional
+        Benchmark image width.
+    height : int, optional
+        Benchmark image height, the
+        :meth:`colour.recovery.LUT3D_Jakob2019.RGB_to_sd` method is
+        benchmarked on the first row only.
+    size : int, optional
+        *LUT* size.
+    repeat : int, optional
+        Number of times the timings are repeated, the best one is retained.
+
+    Returns
+    -------
+    list
+        Benchmark rows: code path and throughput in megapixels per second.
+    """
+
+    LUT = LUT3D_Jakob2019()
+    LUT.generate(RGB_COLOURSPACE_sRGB, size=size, print_callable=lambda x: x)
+
+    RGB = np.random.RandomState(4).random_sample([height, width, 3])
+
+    code_paths = {
+        'RGB_to_sd': (width, lambda: [LUT.RGB_to_sd(RGB_i)
+                                      for RGB_i in RGB[0]]),
+        'RGB_to_reflectances': (width * height,
+                                lambda: LUT.RGB_to_reflectances(RGB)),
+    }
+
+    rows = []
+    for code_path, (pixels, callable_) in code_paths.items():
+        duration = min(timeit.repeat(callable_, number=1, repeat=repeat))
+        rows.append((code_path, pixels / 1e6 / duration))
+
+    print('{0}x{1} image, {2}^3 LUT'.format(width, height, size))
+    print('{0:<20} {1:>8}'.format('Code Path', 'MP/s'))
+    for code_path, throughput in rows:
+        print('{0:<20} {1:>8.4f}'.format(code_path, throughput))
+
+    return rows
+
+
+def benchmark_XYZ_to_reflectances_Otsu2018(width=1920, height=1080, repeat=3):
+    """
+    Benchmarks :func:`colour.recovery.XYZ_to_reflectances_Otsu2018` and
+    :func:`colour.recovery.XYZ_to_sd_Otsu2018` definitions and prints the
+    throughput in megapixels per second.
+
+    Parameters
+    ----------
+    width : int, optional
+        Benchmark image width.
+    height : int, optional
+        Benchmark image height, the
+        :func:`colour.recovery.XYZ_to_sd_Otsu2018` definition is benchmarked
+        on the first row only.
+    repeat : int, optional
+        Number of times the timings are repeated, the best one is retained.
+
+    Returns
+    -------
+    list
+        Benchmark rows: code path and throughput in megapixels per second.
+    """
+
+    RGB = np.random.RandomState(4).random_sample([height, width, 3])
+    XYZ = RGB_to_XYZ(RGB, RGB_COLOURSPACE_sRGB.whitepoint,
+                     RGB_COLOURSPACE_sRGB.whitepoint,
+                     RGB_COLOURSPACE_sRGB.matrix_RGB_to_XYZ)
+
+    code_paths = {
+        'XYZ_to_sd': (width, lambda: [XYZ_to_sd_Otsu2018(XYZ_i)
+                                      for XYZ_i in XYZ[0]]),
+        'XYZ_to_reflectances': (width * height,
+                                lambda: XYZ_to_reflectances_Otsu2018(XYZ)),
+    }
+
+    rows = []
+    for code_path, (pixels, callable_) in code_paths.items():
+        duration = min(timeit.repeat(callable_, number=1, repeat=repeat))
+        rows.append((code_path, pixels / 1e6 / duration))
+
+    print('{0}x{1} image'.format(width, height))
+    print('{0:<20} {1:>8}'.format('Code Path', 'MP/s'))
+    for code_path, throughput in rows:
+        print('{0:<20} {1:>8.4f}'.format(code_path, throughput))
+
+    return rows
+
+
+def benchmark_NodeTree_Otsu2018_optimise(samples=10000,
+                                         samples_per_candidate=500,
+                                         iterations=8,
+                                         workers=os.cpu_count()):
+    """
+    Benchmarks :meth:`colour.recovery.otsu2018.Node.find_best_partition`
+    method against the
+    :meth:`colour.recovery.otsu2018.Node.partition_reconstruction_error`
+    method evaluating the candidate partitions one at a time and prints the
+    throughput in reflectances reconstructions per second, i.e. the count of
+    candidate partitions times the count of training reflectances per second,
+    then prints the duration of
+    :meth:`colour.recovery.NodeTree_Otsu2018.optimise` method.
+
+    The training reflectances are random convex combinations of the
+    *ColorChecker N Ohta* and *BabelColor Average* reflectances.
+
+    Parameters
+    ----------
+    samples : int, optional
+        Count of training reflectances.
+    samples_per_candidate : int, optional
+        Count of training reflectances the candidate partitions are evaluated
+        one at a time with.
+    iterations : int, optional
+        Maximum number of splits of the optimisation.
+    workers : int, optional
+        Number of processes used by the multi-processed code path.
+
+    Returns
+    -------
+    list
+        Benchmark rows: code path, count of training reflectances, duration
+        in seconds and throughput in reflectances reconstructions per second.
+    """
+
+    reflectances = np.array([
+        sd.copy().align(SPECTRAL_SHAPE_OTSU2018).values
+        for colour_checker in ['ColorChecker N Ohta', 'BabelColor Average']
+        for sd in SDS_COLOURCHECKERS[colour_checker].values()
+    ])
+    reflectances = np.dot(
+        np.random.RandomState(4).dirichlet(
+            np.full(len(reflectances), 0.1), samples), reflectances)
+
+    def node_tree(count):
+        """
+        Returns a node tree for given count of training reflectances.
+        """
+
+        node_tree = NodeTree_Otsu2018(reflectances[:count])
+        node_tree._minimum_cluster_size = max(count / iterations // 2, 3)
+
+        return node_tree
+
+    def candidate_partitions(node_tree):
+        """
+        Evaluates the candidate partitions of given node tree one at a time.
+        """
+
+        for direction in [0, 1]:
+            for origin in node_tree.colour_data.xy[:, direction]:
+                try:
+                    node_tree.partition_reconstruction_error(
+                        PartitionAxis(origin, direction))
+                except RuntimeError:
+                    continue
+
+    code_paths = {
+        'Candidate': (samples_per_candidate, candidate_partitions, 'Serial'),
+        'Engine': (samples, lambda x: x.find_best_partition(), 'Serial'),
+        'Engine (workers={0})'.format(workers):
+        (samples, lambda x: x.find_best_partition(), 'Process'),
+    }
+
+    rows = []
+    for code_path, (count, callable_, backend) in code_paths.items():
+        tree = node_tree(count)
+        with executor(backend, workers):
+            start = timeit.default_timer()
+            callable_(tree)
+            duration = timeit.default_timer() - start
+        rows.append((code_path, count, duration, 2 * count**2 / duration))
+
+    tree = NodeTree_Otsu2018(reflectances)
+    start = timeit.default_timer()
+    tree.optimise(iterations, print_callable=lambda x: x)
+    duration = timeit.default_timer() - start
+
+    print('{0:<20} {1:>12} {2:>10} {3:>18}'.format(
+        'Code Path', 'Reflectances', 'Time (s)', 'Reconstructions/s'))
+    for code_path, count, duration_c, throughput in rows:
+        print('{0:<20} {1:>12} {2:>10.2f} {3:>18.3e}'.format(
+            code_path, count, duration_c, throughput))
+    print('"NodeTree_Otsu2018.optimise" with {0} reflectances and {1} '
+          'iterations: {2:.2f}s, {3}.'.format(samples, iterations, duration,
+                                              tree))
+
+    return rows
+
+
+def benchmark_XYZ_to_reflectances_Meng2015(width=40,
+                                           height=25,
+                                           repeat=1,
+                                           workers=os.cpu_count()):
+    """
+    Benchmarks :func:`colour.recovery.XYZ_to_reflectances_Meng2015` and
+    :func:`colour.recovery.XYZ_to_sd_Meng2015` definitions and prints the
+    throughput in pixels per second for a smooth *sRGB* colourspace gradient
+    image.
+
+    Parameters
+    ----------
+    width : int, optional
+        Benchmark image width.
+    height : int, optional
+        Benchmark image height, the
+        :func:`colour.recovery.XYZ_to_sd_Meng2015` definition is benchmarked
+        on the first row only.
+    repeat : int, optional
+        Number of times the timings are repeated, the best one is retained.
+    workers : int, optional
+        Number of processes used by the multi-processed code path.
+
+    Returns
+    -------
+    list
+        Benchmark rows: code path and throughput in pixels per second.
+    """
+
+    x, y = np.meshgrid(np.linspace(0, 1, width), np.linspace(0, 1, height))
+    RGB = np.stack([x, y, 1 - (x + y) / 2], axis=-1)
+    XYZ = RGB_to_XYZ(RGB, RGB_COLOURSPACE_sRGB.whitepoint,
+                     RGB_COLOURSPACE_sRGB.whitepoint,
+                     RGB_COLOURSPACE_sRGB.matrix_RGB_to_XYZ)
+
+    code_paths = {
+        'XYZ_to_sd': (width, lambda: [XYZ_to_sd_Meng2015(XYZ_i)
+                                      for XYZ_i in XYZ[0]], 'Serial'),
+        'XYZ_to_reflectances': (width * height,
+                                lambda: XYZ_to_reflectances_Meng2015(XYZ),
+                                'Serial'),
+        'XYZ_to_reflectances (workers={0})'.format(workers):
+        (width * height, lambda: XYZ_to_reflectances_Meng2015(XYZ),
+         'Process'),
+    }
+
+    rows = []
+    for code_path, (pixels, callable_, backend) in code_paths.items():
+        with executor(backend, workers):
+            duration = min(timeit.repeat(callable_, number=1, repeat=repeat))
+        rows.append((code_path, pixels / duration))
+
+    print('{0}x{1} image'.format(width, height))
+    print('{0:<36} {1:>10}'.format('Code Path', 'Pixels/s'))
+    for code_path, throughput in rows:
+        print('{0:<36} {1:>10.2f}'.format(code_path, throughput))
+
+    return rows
+
+
+def benchmark_RGB_to_reflectances(width=1920, height=1080, repeat=3):
+    """
+    Benchmarks :func:`colour.recovery.RGB_to_reflectances_Mallett2019` and
+    :func:`colour.recovery.RGB_to_reflectances_Smits1999` definitions against
+    :func:`colour.recovery.RGB_to_sd_Mallett2019` and
+    :func:`colour.recovery.RGB_to_sd_Smits1999` definitions and prints the
+    throughput in megapixels per second, in double and single precision.
+
+    Parameters
+    ----------
+    width : int, optional
+        Benchmark image width.
+    height : int, optional
+        Benchmark image height, the
+        :func:`colour.recovery.RGB_to_sd_Mallett2019` and
+        :func:`colour.recovery.RGB_to_sd_Smits1999` definitions are
+        benchmarked on the first row only.
+    repeat : int, optional
+        Number of times the timings are repeated, the best one is retained.
+
+    Returns
+    -------
+    list
+        Benchmark rows: method, code path and throughput in megapixels per
+        second.
+    """
+
+    RGB = np.random.RandomState(4).random_sample([height, width, 3])
+
+    methods = {
+        'Mallett 2019':
+        (RGB_to_sd_Mallett2019, RGB_to_reflectances_Mallett2019),
+        'Smits 1999': (RGB_to_sd_Smits1999, RGB_to_reflectances_Smits1999),
+    }
+
+    rows = []
+    for method, (RGB_to_sd, RGB_to_reflectances) in methods.items():
+        code_paths = {
+            'RGB_to_sd': (width, lambda: [RGB_to_sd(RGB_i)
+                                          for RGB_i in RGB[0]]),
+            'RGB_to_reflectances': (width * height,
+                                    lambda: RGB_to_reflectances(RGB)),
+            'RGB_to_reflectances (float32)':
+            (width * height,
+             lambda: RGB_to_reflectances(RGB, dtype=np.float32)),
+        }
+        for code_path, (pixels, callable_) in code_paths.items():
+            duration = min(timeit.repeat(callable_, number=1, repeat=repeat))
+            rows.append((method, code_path, pixels / 1e6 / duration))
+
+    print('{0}x{1} image'.format(width, height))
+    print('{0:<14} {1:<30} {2:>8}'.format('Method', 'Code Path', 'MP/s'))
+    for method, code_path, throughput in rows:
+        print('{0:<14} {1:<30} {2:>8.4f}'.format(method, code_path,
+                                                 throughput))
+
+    return rows
+
+
+if __name__ == '__main__':
+    benchmark_find_coefficients_Jakob2019()
+    benchmark_LUT3D_Jakob2019_RGB_to_reflectances()
+    benchmark_XYZ_to_reflectances_Otsu2018()
+    benchmark_NodeTree_Otsu2018_optimise()
+    benchmark_XYZ_to_reflectances_Meng2015()
+    benchmark_RGB_to_reflectances()
@@ -0,0 +1,104 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Benchmark Volume
+================
+
+Reports the throughput of :func:`colour.volume.is_within_mesh_volume`
+definition convex hull half-spaces engine against the
+:meth:`scipy.spatial.Delaunay.find_simplex` method code path for the
+*MacAdam Limits*, *Pointer's Gamut* and visible spectrum volumes.
+"""
+
+import numpy as np
+import timeit
+from scipy.spatial import Delaunay
+
+from colour.models import (CCS_ILLUMINANT_POINTER_GAMUT,
+                           DATA_POINTER_GAMUT_VOLUME, LCHab_to_Lab, Lab_to_XYZ,
+                           xyY_to_XYZ)
+from colour.volume import (OPTIMAL_COLOUR_STIMULI_ILLUMINANTS,
+                           XYZ_outer_surface, is_within_mesh_volume,
+                           signed_distance_mesh_volume)
+
+__copyright__ = 'Copyright (C) 2013-2021 - Colour Developers'
+__license__ = 'New BSD License - https://opensource.org/licenses/BSD-3-Clause'
+__maintainer__ = 'Colour Developers'
+__email__ = 'colour-developers@colour-science.org'
+__status__ = 'Production'
+
+__all__ = ['MESHES', 'benchmark_is_within_mesh_volume']
+
+MESHES = {
+    'MacAdam Limits':
+    lambda: xyY_to_XYZ(OPTIMAL_COLOUR_STIMULI_ILLUMINANTS['D65']) / 100,
+    "Pointer's Gamut":
+    lambda: Lab_to_XYZ(
+        LCHab_to_Lab(DATA_POINTER_GAMUT_VOLUME), CCS_ILLUMINANT_POINTER_GAMUT),
+    'Visible Spectrum':
+    XYZ_outer_surface,
+}
+
+
+def benchmark_is_within_mesh_volume(samples=100000, repeat=3):
+    """
+    Benchmarks :func:`colour.volume.is_within_mesh_volume` and
+    :func:`colour.volume.signed_distance_mesh_volume` definitions against the
+    :meth:`scipy.spatial.Delaunay.find_simplex` method and prints the
+    throughput in megapoints per second.
+
+    Parameters
+    ----------
+    samples : int, optional
+        Count of random points in the mesh volume bounding box.
+    repeat : int, optional
+        Number of times the timings are repeated, the best one is retained.
+
+    Returns
+    -------
+    list
+        Benchmark rows: mesh name, code path, throughput in megapoints per
+        second and count of points classified differently than with the
+        *Delaunay* triangulation.
+    """
+
+    random_state = np.random.RandomState(4)
+    megapoints = samples / 1e6
+
+    rows = []
+    for name, mesh in MESHES.items():
+        mesh = mesh()
+        points = (random_state.random_sample([samples, 3]) *
+                  (np.max(mesh, axis=0) - np.min(mesh, axis=0)) * 1.1 +
+                  np.min(mesh, axis=0))
+
+        # The triangulation and the half-spaces are built, and cached,
+        # outside the timings.
+        triangulation = Delaunay(mesh)
+        within = triangulation.find_simplex(points) >= 0
+        is_within_mesh_volume(points[:1], mesh)
+
+        code_paths = {
+            'Delaunay': lambda: triangulation.find_simplex(points) >= 0,
+            'Half-Spaces': lambda: is_within_mesh_volume(points, mesh),
+            'Signed Distance':
+            lambda: signed_distance_mesh_volume(points, mesh) <= 0,
+        }
+        for code_path, callable_ in code_paths.items():
+            duration = min(timeit.repeat(callable_, number=1, repeat=repeat))
+            mismatches = (0 if code_path == 'Delaunay' else
+                          np.count_nonzero(callable_() != within))
+            rows.append((name, code_path, megapoints / duration, mismatches))
+
+    print('{0} points'.format(samples))
+    print('{0:<18} {1:<16} {2:>8} {3:>10}'.format('Mesh', 'Code Path',
+                                                  'MP/s', 'Mismatches'))
+    for name, code_path, throughput, mismatches in rows:
+        print('{0:<18} {1:<16} {2:>8.3f} {3:>10}'.format(
+            name, code_path, throughput, mismatches))
+
+    return rows
+
+
+if __name__ == '__main__':
+    benchmark_is_within_mesh_volume()